@@ -26,7 +26,9 @@ from src.ui import (
     clear_screen, console,
 )
 from src.evm_wallet import EVMWalletManager
+from src.evm_fees import BaseFeeOracle
 from src.evm_network import BaseNetwork
+from src.evm_nonce import NonceAllocator
 from src.evm_transaction import EVMTransactionManager
 from src.qr_transfer import QRTransfer
 
@@ -53,6 +55,8 @@ class BaseCLI:
         self.testnet = testnet
         self.wallet = EVMWalletManager()
         self.network = BaseNetwork(testnet=testnet)
+        self.nonces = NonceAllocator(self.network)
+        self.fees = BaseFeeOracle(self.network)
         self.tx_manager = EVMTransactionManager(testnet=testnet)
         self.qr = QRTransfer()
         self.address: str | None = None
@@ -276,25 +280,7 @@ class BaseCLI:
             print_error("Invalid amount")
             return
 
-        # Fetch chain params
-        nonce = self.network.get_nonce(self.address)
-        base_fee = self.network.get_base_fee()
-        priority_fee = self.network.get_max_priority_fee()
-
-        if nonce is None or base_fee is None or priority_fee is None:
-            print_error("Could not fetch chain parameters (offline?)")
-            return
-
-        max_fee = base_fee * 2 + priority_fee
-
-        tx = self.tx_manager.create_eth_transfer(
-            from_address=self.address,
-            to_address=to_addr,
-            amount_eth=amount,
-            nonce=nonce,
-            max_fee_per_gas=max_fee,
-            max_priority_fee_per_gas=priority_fee,
-        )
+        tx = self._build_eth_transfer(to_addr, amount, offline=True)
 
         if tx:
             # Save and show QR
@@ -311,6 +297,49 @@ class BaseCLI:
                 "SCAN TO SIGN ON AIR-GAPPED DEVICE",
             )
 
+    def _build_eth_transfer(self, to_addr: str, amount: float, offline: bool = False):
+        """
+        Fetch chain params in one batched round trip (fees from the cached oracle) and build the transfer
+
+        offline: the transaction goes over the QR air gap, so its fee cap
+        must outlast the trip to the signer and back
+        """
+        speed = select_menu_option(["Normal", "Fast", "Slow"], "Fee speed:")
+        if not speed:
+            return None
+
+        value_wei = int(amount * WEI_PER_ETH)
+        ctx = self.network.prepare_transfer_context(
+            self.address, {"to": to_addr, "value": hex(value_wei)},
+            fee_oracle=self.fees, fee_profile=speed.lower(), offline=offline,
+        )
+        if ctx is None:
+            print_error("Could not fetch chain parameters (offline?)")
+            return None
+        if ctx.balance_wei < ctx.max_cost_wei(value_wei):
+            print_error(f"Insufficient balance: {ctx.balance_wei / WEI_PER_ETH:.6f} ETH, "
+                        f"need up to {ctx.max_cost_wei(value_wei) / WEI_PER_ETH:.6f} ETH with gas")
+            return None
+
+        # Local allocation: transactions built back to back get distinct
+        # nonces, and a dropped or abandoned one is reused first
+        nonce = self.nonces.allocate(self.address, chain_nonce=ctx.mined_nonce, pending_nonce=ctx.nonce)
+        if nonce is None:
+            return None
+
+        tx = self.tx_manager.create_eth_transfer(
+            from_address=self.address,
+            to_address=to_addr,
+            amount_eth=amount,
+            nonce=nonce,
+            max_fee_per_gas=ctx.max_fee_per_gas,
+            max_priority_fee_per_gas=ctx.max_priority_fee,
+            gas_limit=ctx.gas_limit,
+        )
+        if not tx:
+            self.nonces.release(self.address, [nonce])
+        return tx
+
     def sign_transaction_offline(self):
         print_section_header("SIGN TRANSACTION (OFFLINE)")
         if not self.wallet_path:
@@ -372,11 +401,14 @@ class BaseCLI:
             print_info(f"Explorer: {self.network.explorer_url(tx_hash)}")
 
             print_info("Waiting for confirmation...")
-            receipt = self.network.wait_for_receipt(tx_hash, max_retries=30)
-            if receipt:
-                print_success("Transaction confirmed!")
+            from src.evm_receipts import wait_for_receipts
+            result = wait_for_receipts([tx_hash], testnet=self.testnet, timeout=30)[tx_hash]
+            if result.confirmed:
+                print_success(f"Transaction confirmed in block {result.block_number}!")
+            elif result.status == "reverted":
+                print_error("Transaction reverted!")
             else:
-                print_warning("Check explorer for status")
+                print_warning(f"Transaction {result.status} - check explorer for status")
 
     def quick_send(self):
         print_section_header("QUICK SEND (INSECURE - TESTING ONLY)")
@@ -398,54 +430,42 @@ class BaseCLI:
             print_error("Invalid amount")
             return
 
-        # Fetch params
-        nonce = self.network.get_nonce(self.address)
-        base_fee = self.network.get_base_fee()
-        priority_fee = self.network.get_max_priority_fee()
-
-        if None in (nonce, base_fee, priority_fee):
-            print_error("Could not fetch chain parameters")
-            return
-
-        max_fee = base_fee * 2 + priority_fee
-
-        tx = self.tx_manager.create_eth_transfer(
-            from_address=self.address,
-            to_address=to_addr,
-            amount_eth=amount,
-            nonce=nonce,
-            max_fee_per_gas=max_fee,
-            max_priority_fee_per_gas=priority_fee,
-        )
+        tx = self._build_eth_transfer(to_addr, amount)
 
         if not tx:
             return
 
-        # Load wallet and sign
+        tx_hash = self._sign_and_broadcast(tx)
+        if tx_hash:
+            self.nonces.mark_sent(self.address, tx["nonce"], tx_hash)
+            print_success(f"Tx hash: {tx_hash}")
+            print_info(f"Explorer: {self.network.explorer_url(tx_hash)}")
+        else:
+            self.nonces.release(self.address, [tx["nonce"]])
+
+    def _sign_and_broadcast(self, tx: dict):
+        """Sign on this device and broadcast; None if cancelled or failed"""
         container = self.wallet.load_encrypted_container()
         if not container:
             print_error("Could not load wallet")
-            return
+            return None
 
         password = get_password_input("Enter wallet password: ")
         if not password:
-            return
+            return None
 
         signed = self.tx_manager.sign_transaction_secure(
             tx, container, password, wallet_manager=self.wallet,
         )
 
         if not signed:
-            return
+            return None
 
         if not confirm_dangerous_action("Broadcast to Base?", "SEND"):
             print_info("Cancelled")
-            return
+            return None
 
-        tx_hash = self.network.send_raw_transaction("0x" + signed.hex())
-        if tx_hash:
-            print_success(f"Tx hash: {tx_hash}")
-            print_info(f"Explorer: {self.network.explorer_url(tx_hash)}")
+        return self.network.send_raw_transaction("0x" + signed.hex())
 
     # ── Helpers ──────────────────────────────────────────────
 
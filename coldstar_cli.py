@@ -18,6 +18,7 @@ Commands:
 """
 
 import argparse
+import base64
 import json
 import sys
 from typing import Optional
@@ -41,6 +42,34 @@ from src.privacy.policy import SigningPolicyEngine
 from src.privacy.validator import PrivacyValidator, ValidationResult
 
 
+def build_unsigned_transfer_b64(from_pubkey: str, to_pubkey: str, amount_lamports: int,
+                                recent_blockhash: str) -> str:
+    """Unsigned SOL transfer bytes (base64) for the given sender, recipient and amount.
+
+    Raises ValueError for a malformed address or blockhash.
+    """
+    from solders.hash import Hash
+    from solders.pubkey import Pubkey
+    from solders.system_program import TransferParams, transfer
+
+    from src.batch_builder import compile_unsigned_transaction
+
+    sender = Pubkey.from_string(from_pubkey)
+    ix = transfer(TransferParams(from_pubkey=sender, to_pubkey=Pubkey.from_string(to_pubkey),
+                                 lamports=amount_lamports))
+    tx_bytes = compile_unsigned_transaction([ix], sender, Hash.from_string(recent_blockhash))
+    return base64.b64encode(tx_bytes).decode()
+
+
+def blockhash_of(unsigned_tx_b64: str) -> str:
+    """Recent blockhash the unsigned transaction was built on ("" if undecodable)."""
+    from src.wire_inspector import WireFormatError, inspect_transaction
+    try:
+        return inspect_transaction(base64.b64decode(unsigned_tx_b64, validate=True)).recent_blockhash
+    except (ValueError, WireFormatError):
+        return ""
+
+
 # ── Rich display helpers ──────────────────────
 
 def display_mode_selection(mode: TransactionMode):
@@ -319,6 +348,22 @@ class ColdstarZkCLI:
             console.print("[red]Invalid amount.[/]")
             return None
 
+        blockhash = console.input("  Recent blockhash (blank to fetch): ").strip()
+        if not blockhash:
+            from src.network import SolanaNetwork
+            latest = SolanaNetwork().get_latest_blockhash()
+            if not latest:
+                console.print("[red]Could not fetch a recent blockhash.[/]")
+                return None
+            blockhash = latest[0]
+
+        # The signing policy decodes these bytes, so they must be the real transfer
+        try:
+            unsigned_tx_b64 = build_unsigned_transfer_b64(from_pk, to_pk, amount, blockhash)
+        except ValueError as e:
+            console.print(f"[red]Cannot build the transfer: {e}[/]")
+            return None
+
         secret_key_hex = None
         if mode == "private":
             console.print("\n[bold]Step 3: Secret key (for proof generation)[/]")
@@ -331,8 +376,8 @@ class ColdstarZkCLI:
             to_pubkey=to_pk,
             amount_lamports=amount,
             fee_lamports=5000,
-            recent_blockhash="placeholder",
-            unsigned_tx_b64="placeholder",
+            recent_blockhash=blockhash,
+            unsigned_tx_b64=unsigned_tx_b64,
             secret_key_hex=secret_key_hex,
         )
 
@@ -353,8 +398,9 @@ def build_parser() -> argparse.ArgumentParser:
     tx_create.add_argument("--to-pubkey", required=True)
     tx_create.add_argument("--amount-lamports", type=int, required=True)
     tx_create.add_argument("--fee-lamports", type=int, default=5000)
-    tx_create.add_argument("--recent-blockhash", default="placeholder")
-    tx_create.add_argument("--unsigned-tx-b64", default="placeholder")
+    tx_create.add_argument("--recent-blockhash", help="Defaults to the blockhash in --unsigned-tx-b64")
+    tx_create.add_argument("--unsigned-tx-b64", required=True,
+                           help="Unsigned transaction the envelope describes (checked by the signing policy)")
     tx_create.add_argument("--secret-key-hex", help="Required for private mode")
 
     tx_inspect = tx_sub.add_parser("inspect", help="Inspect an envelope")
@@ -379,8 +425,8 @@ def build_parser() -> argparse.ArgumentParser:
     zk_prove.add_argument("--to-pubkey", required=True)
     zk_prove.add_argument("--amount-lamports", type=int, required=True)
     zk_prove.add_argument("--fee-lamports", type=int, default=5000)
-    zk_prove.add_argument("--recent-blockhash", default="placeholder")
-    zk_prove.add_argument("--unsigned-tx-b64", default="placeholder")
+    zk_prove.add_argument("--recent-blockhash", help="Defaults to the blockhash in --unsigned-tx-b64")
+    zk_prove.add_argument("--unsigned-tx-b64", required=True)
     zk_prove.add_argument("--secret-key-hex", required=True)
     zk_prove.add_argument("--output", help="Output file")
 
@@ -403,7 +449,7 @@ def main():
                 to_pubkey=args.to_pubkey,
                 amount_lamports=args.amount_lamports,
                 fee_lamports=args.fee_lamports,
-                recent_blockhash=args.recent_blockhash,
+                recent_blockhash=args.recent_blockhash or blockhash_of(args.unsigned_tx_b64),
                 unsigned_tx_b64=args.unsigned_tx_b64,
                 secret_key_hex=args.secret_key_hex,
             )
@@ -428,7 +474,7 @@ def main():
                 to_pubkey=args.to_pubkey,
                 amount_lamports=args.amount_lamports,
                 fee_lamports=args.fee_lamports,
-                recent_blockhash=args.recent_blockhash,
+                recent_blockhash=args.recent_blockhash or blockhash_of(args.unsigned_tx_b64),
                 unsigned_tx_b64=args.unsigned_tx_b64,
                 secret_key_hex=args.secret_key_hex,
             )
@@ -0,0 +1,74 @@
+//! Fixed-base multiplication benchmarks.
+//!
+//! `commit` compares the old per-call path (hash-to-point for H, then two
+//! variable-base multiplications) with the precomputed G/H tables.
+//! `prove_range_64bit` and `verify_range_64bit` time single 64-bit proofs;
+//! to see their speedup, save a baseline on the previous commit and
+//! compare against it:
+//!
+//! ```text
+//! git checkout HEAD~1 && cargo bench --bench fixed_base -- --save-baseline variable_base
+//! git checkout -      && cargo bench --bench fixed_base -- --baseline variable_base
+//! ```
+
+use criterion::{black_box, criterion_group, criterion_main, Criterion};
+use curve25519_dalek::{ristretto::RistrettoPoint, scalar::Scalar};
+use rand_core::OsRng;
+use sha2::Sha512;
+
+use coldstar_zk::commitment::{commit, generator_g};
+use coldstar_zk::domain::DOMAIN_GENERATOR_H;
+use coldstar_zk::proofs::bulletproof::{prove_aggregated_range, verify_aggregated_range};
+use coldstar_zk::proofs::range::{prove_range, verify_range};
+
+const CONTEXT: &[u8] = b"coldstar fixed-base bench";
+const VALUE: u64 = 1_000_000_000;
+
+fn bench_commit(c: &mut Criterion) {
+    let value = Scalar::from(VALUE);
+    let blinding = Scalar::random(&mut OsRng);
+    // Force the lazy H table so its one-off build is not timed
+    commit(&value, &blinding);
+
+    let mut group = c.benchmark_group("commit");
+    group.bench_function("variable_base", |b| {
+        b.iter(|| {
+            let h = RistrettoPoint::hash_from_bytes::<Sha512>(DOMAIN_GENERATOR_H);
+            black_box(&value) * generator_g() + black_box(&blinding) * h
+        })
+    });
+    group.bench_function("fixed_base", |b| {
+        b.iter(|| commit(black_box(&value), black_box(&blinding)))
+    });
+    group.finish();
+}
+
+fn bench_prove_range(c: &mut Criterion) {
+    let mut group = c.benchmark_group("prove_range_64bit");
+    group.sample_size(20);
+    group.bench_function("bit_decomposition", |b| {
+        b.iter(|| prove_range(black_box(VALUE), 64, CONTEXT).unwrap())
+    });
+    group.bench_function("aggregated", |b| {
+        b.iter(|| prove_aggregated_range(black_box(VALUE), 64, CONTEXT).unwrap())
+    });
+    group.finish();
+}
+
+fn bench_verify_range(c: &mut Criterion) {
+    let (proof, _) = prove_range(VALUE, 64, CONTEXT).unwrap();
+    let (aggregated, _) = prove_aggregated_range(VALUE, 64, CONTEXT).unwrap();
+
+    let mut group = c.benchmark_group("verify_range_64bit");
+    group.sample_size(20);
+    group.bench_function("bit_decomposition", |b| {
+        b.iter(|| verify_range(black_box(&proof), CONTEXT).unwrap())
+    });
+    group.bench_function("aggregated", |b| {
+        b.iter(|| verify_aggregated_range(black_box(&aggregated), CONTEXT).unwrap())
+    });
+    group.finish();
+}
+
+criterion_group!(benches, bench_commit, bench_prove_range, bench_verify_range);
+criterion_main!(benches);
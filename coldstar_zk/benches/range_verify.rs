@@ -0,0 +1,47 @@
+//! Range proof verification benchmarks.
+//!
+//! Compares serial `verify_range` calls against `verify_range_batch` for
+//! 1, 10, 100 and 1000 64-bit proofs.
+//!
+//! Run with: `cargo bench --bench range_verify`
+
+use criterion::{black_box, criterion_group, criterion_main, BenchmarkId, Criterion, Throughput};
+
+use coldstar_zk::proofs::range::{prove_range, verify_range, verify_range_batch};
+use coldstar_zk::types::RangeProof;
+
+const CONTEXT: &[u8] = b"coldstar range bench";
+const BATCH_SIZES: [usize; 4] = [1, 10, 100, 1000];
+
+fn bench_range_verification(c: &mut Criterion) {
+    let proofs: Vec<RangeProof> = (0..*BATCH_SIZES.iter().max().unwrap())
+        .map(|i| {
+            prove_range(1_000_000_000 + i as u64, 64, CONTEXT)
+                .unwrap()
+                .0
+        })
+        .collect();
+
+    let mut group = c.benchmark_group("verify_range_64bit");
+    group.sample_size(10);
+    for &n in &BATCH_SIZES {
+        let items: Vec<(&RangeProof, &[u8])> = proofs[..n].iter().map(|p| (p, CONTEXT)).collect();
+        group.throughput(Throughput::Elements(n as u64));
+
+        group.bench_with_input(BenchmarkId::new("serial", n), &items, |b, items| {
+            b.iter(|| {
+                for (proof, context) in items {
+                    verify_range(black_box(proof), context).unwrap();
+                }
+            })
+        });
+
+        group.bench_with_input(BenchmarkId::new("batched", n), &items, |b, items| {
+            b.iter(|| verify_range_batch(black_box(items)).unwrap())
+        });
+    }
+    group.finish();
+}
+
+criterion_group!(benches, bench_range_verification);
+criterion_main!(benches);
@@ -11,16 +11,26 @@
 //! - **Binding**: Given C, no efficient adversary can find (v', r') ≠ (v, r)
 //!   such that v'*G + r'*H = C (computational, assuming DLP hardness)
 //! - **Homomorphic**: C(v1, r1) + C(v2, r2) = C(v1+v2, r1+r2)
+//!
+//! # Performance
+//! Multiplications by G and H use precomputed basepoint tables. G's table
+//! ships with curve25519-dalek; H's is built on first use and shared by the
+//! whole process, so hash-to-point runs once rather than once per commitment.
+
+use std::sync::OnceLock;
 
 use curve25519_dalek::{
-    constants::RISTRETTO_BASEPOINT_POINT,
-    ristretto::{CompressedRistretto, RistrettoPoint},
+    constants::{RISTRETTO_BASEPOINT_POINT, RISTRETTO_BASEPOINT_TABLE},
+    ristretto::{CompressedRistretto, RistrettoBasepointTable, RistrettoPoint},
     scalar::Scalar,
 };
 use sha2::Sha512;
 
 use crate::domain::DOMAIN_GENERATOR_H;
 
+static GENERATOR_H: OnceLock<RistrettoPoint> = OnceLock::new();
+static GENERATOR_H_TABLE: OnceLock<RistrettoBasepointTable> = OnceLock::new();
+
 /// Get the secondary generator H for Pedersen commitments.
 ///
 /// H is derived from G using hash-to-point with a fixed domain tag.
@@ -30,7 +40,7 @@ use crate::domain::DOMAIN_GENERATOR_H;
 /// SECURITY: This function MUST always return the same point.
 /// Changing the domain tag would break all existing commitments.
 pub fn generator_h() -> RistrettoPoint {
-    RistrettoPoint::hash_from_bytes::<Sha512>(DOMAIN_GENERATOR_H)
+    *GENERATOR_H.get_or_init(|| RistrettoPoint::hash_from_bytes::<Sha512>(DOMAIN_GENERATOR_H))
 }
 
 /// The standard basepoint G (Ristretto).
@@ -38,6 +48,26 @@ pub fn generator_g() -> RistrettoPoint {
     RISTRETTO_BASEPOINT_POINT
 }
 
+/// Precomputed multiplication table for G.
+pub fn generator_g_table() -> &'static RistrettoBasepointTable {
+    RISTRETTO_BASEPOINT_TABLE
+}
+
+/// Precomputed multiplication table for H, built on first use.
+pub fn generator_h_table() -> &'static RistrettoBasepointTable {
+    GENERATOR_H_TABLE.get_or_init(|| RistrettoBasepointTable::create(&generator_h()))
+}
+
+/// Fixed-base multiplication s*G.
+pub fn mul_g(scalar: &Scalar) -> RistrettoPoint {
+    generator_g_table() * scalar
+}
+
+/// Fixed-base multiplication s*H.
+pub fn mul_h(scalar: &Scalar) -> RistrettoPoint {
+    generator_h_table() * scalar
+}
+
 /// Create a Pedersen commitment: C = v*G + r*H
 ///
 /// # Arguments
@@ -47,9 +77,7 @@ pub fn generator_g() -> RistrettoPoint {
 /// # Returns
 /// The commitment point C
 pub fn commit(value: &Scalar, blinding: &Scalar) -> RistrettoPoint {
-    let g = generator_g();
-    let h = generator_h();
-    value * g + blinding * h
+    mul_g(value) + mul_h(blinding)
 }
 
 /// Create a Pedersen commitment to a u64 value.
@@ -88,15 +116,16 @@ pub fn commitment_to_hex(point: &RistrettoPoint) -> String {
 pub fn commitment_from_hex(hex_str: &str) -> Result<RistrettoPoint, crate::error::ZkError> {
     let bytes = hex::decode(hex_str)?;
     if bytes.len() != 32 {
-        return Err(crate::error::ZkError::InvalidCommitment(
-            format!("Expected 32 bytes, got {}", bytes.len()),
-        ));
+        return Err(crate::error::ZkError::InvalidCommitment(format!(
+            "Expected 32 bytes, got {}",
+            bytes.len()
+        )));
     }
     let mut arr = [0u8; 32];
     arr.copy_from_slice(&bytes);
-    CompressedRistretto(arr)
-        .decompress()
-        .ok_or_else(|| crate::error::ZkError::InvalidCommitment("Point decompression failed".into()))
+    CompressedRistretto(arr).decompress().ok_or_else(|| {
+        crate::error::ZkError::InvalidCommitment("Point decompression failed".into())
+    })
 }
 
 #[cfg(test)]
@@ -112,7 +141,10 @@ mod tests {
         let r2 = Scalar::random(&mut OsRng);
         let c1 = commit(&v, &r1);
         let c2 = commit(&v, &r2);
-        assert_ne!(c1, c2, "Different blinding factors must produce different commitments");
+        assert_ne!(
+            c1, c2,
+            "Different blinding factors must produce different commitments"
+        );
     }
 
     #[test]
@@ -121,11 +153,17 @@ mod tests {
         let v = Scalar::from(100u64);
         let r = Scalar::random(&mut OsRng);
         let c = commit(&v, &r);
-        assert!(verify_opening(&c, &v, &r), "Commitment must verify with correct opening");
+        assert!(
+            verify_opening(&c, &v, &r),
+            "Commitment must verify with correct opening"
+        );
 
         // Wrong value must fail
         let v_wrong = Scalar::from(101u64);
-        assert!(!verify_opening(&c, &v_wrong, &r), "Commitment must not verify with wrong value");
+        assert!(
+            !verify_opening(&c, &v_wrong, &r),
+            "Commitment must not verify with wrong value"
+        );
     }
 
     #[test]
@@ -142,7 +180,11 @@ mod tests {
         let r_sum = r1 + r2;
         let c_sum = commit(&v_sum, &r_sum);
 
-        assert_eq!(c1 + c2, c_sum, "Pedersen commitments must be additively homomorphic");
+        assert_eq!(
+            c1 + c2,
+            c_sum,
+            "Pedersen commitments must be additively homomorphic"
+        );
     }
 
     #[test]
@@ -163,6 +205,18 @@ mod tests {
         assert_ne!(g, h, "G and H must be different points");
     }
 
+    #[test]
+    fn test_fixed_base_tables_match_variable_base() {
+        let s = Scalar::random(&mut OsRng);
+        assert_eq!(mul_g(&s), s * generator_g());
+        assert_eq!(mul_h(&s), s * generator_h());
+        assert_eq!(
+            generator_h(),
+            RistrettoPoint::hash_from_bytes::<Sha512>(DOMAIN_GENERATOR_H),
+            "Cached H must be the hash-to-point of the domain tag"
+        );
+    }
+
     #[test]
     fn test_generator_h_deterministic() {
         let h1 = generator_h();
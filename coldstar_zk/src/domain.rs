@@ -17,6 +17,12 @@ pub const DOMAIN_RANGE_PROOF: &[u8] = b"coldstar.zk.range.v1";
 /// Domain tag for range proof OR-proof challenges
 pub const DOMAIN_RANGE_OR_PROOF: &[u8] = b"coldstar.zk.range.or.v1";
 
+/// Domain tag for aggregated (Bulletproofs-style) range proof transcripts
+pub const DOMAIN_AGGREGATED_RANGE_PROOF: &[u8] = b"coldstar.zk.range.aggregated.v1";
+
+/// Domain tag for the aggregated range proof vector generators G_i, H_i
+pub const DOMAIN_RANGE_GENERATORS: &[u8] = b"coldstar.zk.range.generators.v1";
+
 /// Domain tag for policy compliance proofs
 pub const DOMAIN_POLICY_PROOF: &[u8] = b"coldstar.zk.policy.v1";
 
@@ -6,6 +6,15 @@
 //! # Format
 //! JSON-serialized TransferEnvelope with HMAC-SHA256 integrity.
 //!
+//! # Versions
+//! The envelope version fixes which range proof type a private envelope
+//! may carry:
+//! - `1.0.0`: bit-decomposition `RangeProof`
+//! - `1.1.0`: logarithmic-size `AggregatedRangeProof`
+//!
+//! Envelopes without a range proof are written as `1.0.0`, which every
+//! signer understands.
+//!
 //! # Security Properties
 //! - Integrity: HMAC detects any modification to envelope contents
 //! - Mode binding: mode is included in the HMAC computation
@@ -16,10 +25,38 @@ use sha2::Sha256;
 
 use crate::domain::DOMAIN_ENVELOPE_HMAC;
 use crate::error::ZkError;
-use crate::types::{ProofBundle, TransactionContext, TransactionMode, TransferEnvelope};
+use crate::types::{
+    ProofBundle, RangeProofKind, TransactionContext, TransactionMode, TransferEnvelope,
+};
 
 type HmacSha256 = Hmac<Sha256>;
 
+/// Envelope version carrying bit-decomposition range proofs
+pub const ENVELOPE_VERSION: &str = "1.0.0";
+
+/// Envelope version carrying aggregated range proofs
+pub const ENVELOPE_VERSION_AGGREGATED: &str = "1.1.0";
+
+/// Envelope versions this library can read
+pub const SUPPORTED_ENVELOPE_VERSIONS: &[&str] = &[ENVELOPE_VERSION, ENVELOPE_VERSION_AGGREGATED];
+
+/// The envelope version needed to carry a proof bundle.
+pub fn envelope_version_for(bundle: &ProofBundle) -> &'static str {
+    match bundle.range_proof {
+        Some(RangeProofKind::Aggregated(_)) => ENVELOPE_VERSION_AGGREGATED,
+        _ => ENVELOPE_VERSION,
+    }
+}
+
+/// Whether a range proof is of the type an envelope version calls for.
+pub fn range_proof_matches_version(range_proof: &RangeProofKind, version: &str) -> bool {
+    matches!(
+        (range_proof, version),
+        (RangeProofKind::BitDecomposition(_), ENVELOPE_VERSION)
+            | (RangeProofKind::Aggregated(_), ENVELOPE_VERSION_AGGREGATED)
+    )
+}
+
 /// Build a transfer envelope for a public transaction.
 ///
 /// # Arguments
@@ -36,7 +73,7 @@ pub fn build_public_envelope(tx_context: TransactionContext) -> Result<TransferE
     }
 
     let mut envelope = TransferEnvelope {
-        version: "1.0.0".to_string(),
+        version: ENVELOPE_VERSION.to_string(),
         mode: TransactionMode::Public,
         created_at: tx_context.created_at.clone(),
         transaction: tx_context,
@@ -75,7 +112,7 @@ pub fn build_private_envelope(
     }
 
     let mut envelope = TransferEnvelope {
-        version: "1.0.0".to_string(),
+        version: envelope_version_for(&proof_bundle).to_string(),
         mode: TransactionMode::Private,
         created_at: tx_context.created_at.clone(),
         transaction: tx_context,
@@ -107,7 +144,15 @@ pub fn verify_envelope_integrity(envelope: &TransferEnvelope) -> Result<(), ZkEr
 /// - Public envelopes must NOT have proof bundles
 /// - Private envelopes MUST have proof bundles
 /// - Mode must match between envelope and transaction context
+/// - The version must be supported and match the range proof type
 pub fn validate_envelope_structure(envelope: &TransferEnvelope) -> Result<(), ZkError> {
+    if !SUPPORTED_ENVELOPE_VERSIONS.contains(&envelope.version.as_str()) {
+        return Err(ZkError::InvalidInput(format!(
+            "Unsupported envelope version {}",
+            envelope.version
+        )));
+    }
+
     // Mode consistency
     if envelope.mode != envelope.transaction.mode {
         return Err(ZkError::ModeMismatch {
@@ -125,10 +170,16 @@ pub fn validate_envelope_structure(envelope: &TransferEnvelope) -> Result<(), Zk
             }
         }
         TransactionMode::Private => {
-            if envelope.proof_bundle.is_none() {
-                return Err(ZkError::MissingProof(
-                    "Private envelope must contain proof bundle".into(),
-                ));
+            let bundle = envelope.proof_bundle.as_ref().ok_or_else(|| {
+                ZkError::MissingProof("Private envelope must contain proof bundle".into())
+            })?;
+            if let Some(ref range_proof) = bundle.range_proof {
+                if !range_proof_matches_version(range_proof, &envelope.version) {
+                    return Err(ZkError::InvalidProof(format!(
+                        "Range proof type does not match envelope version {}",
+                        envelope.version
+                    )));
+                }
             }
         }
     }
@@ -272,7 +323,7 @@ mod tests {
 
     #[test]
     fn test_public_with_proofs_rejected() {
-        let mut envelope = TransferEnvelope {
+        let envelope = TransferEnvelope {
             version: "1.0.0".to_string(),
             mode: TransactionMode::Public,
             created_at: "2026-03-10".to_string(),
@@ -310,4 +361,33 @@ mod tests {
         };
         assert!(validate_envelope_structure(&envelope).is_err());
     }
+
+    #[test]
+    fn test_version_negotiated_from_range_proof_type() {
+        let (aggregated, _) =
+            crate::proofs::bulletproof::prove_aggregated_range(1_000, 16, b"ctx").unwrap();
+        let mut bundle = make_test_bundle();
+        bundle.range_proof = Some(RangeProofKind::Aggregated(Box::new(aggregated)));
+        let envelope = build_private_envelope(make_private_context(), bundle).unwrap();
+        assert_eq!(envelope.version, ENVELOPE_VERSION_AGGREGATED);
+
+        let restored = deserialize_envelope(&serialize_envelope(&envelope).unwrap()).unwrap();
+        assert!(matches!(
+            restored.proof_bundle.as_ref().unwrap().range_proof,
+            Some(RangeProofKind::Aggregated(_))
+        ));
+        assert!(validate_envelope_structure(&restored).is_ok());
+
+        // An aggregated proof inside a 1.0.0 envelope is rejected
+        let mut downgraded = restored;
+        downgraded.version = ENVELOPE_VERSION.to_string();
+        assert!(validate_envelope_structure(&downgraded).is_err());
+    }
+
+    #[test]
+    fn test_unknown_version_rejected() {
+        let mut envelope = build_public_envelope(make_public_context()).unwrap();
+        envelope.version = "9.9.9".to_string();
+        assert!(validate_envelope_structure(&envelope).is_err());
+    }
 }
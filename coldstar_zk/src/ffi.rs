@@ -1,25 +1,49 @@
 //! FFI (Foreign Function Interface) for Python integration.
 //!
 //! Exposes the ZK proof engine to Python via C-compatible functions.
-//! Uses JSON-based parameter passing for simplicity and flexibility.
+//! Two calling conventions are provided.
 //!
-//! # Convention
+//! # JSON Convention
 //! - Input: JSON string (C string, null-terminated)
 //! - Output: JSON string (heap-allocated, caller must free)
 //! - Errors: Returned as JSON with "error" field
 //!
+//! JSON is the interchange format for envelope files written to USB, so
+//! `coldstar_zk_validate_envelope` only exists in this form.
+//!
+//! # Binary Convention (`*_bin` functions)
+//! Proofs travel as raw 32-byte points and scalars instead of hex inside
+//! JSON, and the caller supplies every buffer:
+//! - Ownership proof (160 bytes):
+//!   `public_key || commitment_r || challenge || response || context_hash`
+//! - Range proof (68 + 224*n bytes):
+//!   `[u32 LE n] || value_commitment || context_hash || n * bit_proof`,
+//!   where each bit proof is `commitment || e0 || s0 || e1 || s1 || R0 || R1`
+//! - Context data is passed as a pointer and a length
+//! - Aggregated range proof (356 + 64*log2(n) bytes):
+//!   `[u32 LE n] || value_commitment || context_hash || A || S || T1 || T2
+//!   || tau_x || mu || t_hat || ipa_a || ipa_b || log2(n) * L || log2(n) * R`
+//! - Range proof batch: `count` records of
+//!   `[u32 LE context_len] || context || range_proof`
+//! - Output buffers must be exactly the encoded proof size
+//! - Functions return a status code (`ZK_BIN_*`), never a string
+//!
 //! # Memory Management
 //! All returned strings are heap-allocated with Box::into_raw.
 //! The caller must free them with `coldstar_zk_free_string`.
+//! The binary functions allocate nothing the caller has to free.
 
 use std::ffi::{CStr, CString};
 use std::os::raw::c_char;
 
 use serde::{Deserialize, Serialize};
+use zeroize::Zeroize;
 
+use crate::domain::MAX_RANGE_BITS;
 use crate::envelope;
+use crate::error::ZkError;
 use crate::policy::PolicyEngine;
-use crate::proofs::{ownership, range};
+use crate::proofs::{bulletproof, ownership, range};
 use crate::types::*;
 
 /// FFI response wrapper
@@ -49,7 +73,7 @@ impl FfiResponse {
         }
     }
 
-    fn to_c_string(self) -> *mut c_char {
+    fn into_c_string(self) -> *mut c_char {
         let json = serde_json::to_string(&self).unwrap_or_else(|_| {
             r#"{"success":false,"error":"Failed to serialize response"}"#.to_string()
         });
@@ -90,11 +114,14 @@ unsafe fn parse_c_str<'a>(ptr: *const c_char) -> Result<&'a str, String> {
 ///   "data": { "ownership_proof": { ... } }
 /// }
 /// ```
+///
+/// # Safety
+/// `input_json` must be a valid, null-terminated C string.
 #[no_mangle]
 pub unsafe extern "C" fn coldstar_zk_prove_ownership(input_json: *const c_char) -> *mut c_char {
     let input = match parse_c_str(input_json) {
         Ok(s) => s,
-        Err(e) => return FfiResponse::err(e).to_c_string(),
+        Err(e) => return FfiResponse::err(e).into_c_string(),
     };
 
     #[derive(Deserialize)]
@@ -105,7 +132,7 @@ pub unsafe extern "C" fn coldstar_zk_prove_ownership(input_json: *const c_char)
 
     let params: Input = match serde_json::from_str(input) {
         Ok(p) => p,
-        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).into_c_string(),
     };
 
     let secret_key = match hex::decode(&params.secret_key_hex) {
@@ -116,22 +143,22 @@ pub unsafe extern "C" fn coldstar_zk_prove_ownership(input_json: *const c_char)
         }
         Ok(k) => {
             return FfiResponse::err(format!("Secret key must be 32 bytes, got {}", k.len()))
-                .to_c_string()
+                .into_c_string()
         }
-        Err(e) => return FfiResponse::err(format!("Invalid hex: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid hex: {}", e)).into_c_string(),
     };
 
     let context_data = match hex::decode(&params.context_data_hex) {
         Ok(d) => d,
-        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).into_c_string(),
     };
 
     match ownership::prove_ownership(&secret_key, &context_data) {
         Ok(proof) => {
             let data = serde_json::to_value(&proof).unwrap();
-            FfiResponse::ok(serde_json::json!({ "ownership_proof": data })).to_c_string()
+            FfiResponse::ok(serde_json::json!({ "ownership_proof": data })).into_c_string()
         }
-        Err(e) => FfiResponse::err(format!("Proof generation failed: {}", e)).to_c_string(),
+        Err(e) => FfiResponse::err(format!("Proof generation failed: {}", e)).into_c_string(),
     }
 }
 
@@ -144,11 +171,14 @@ pub unsafe extern "C" fn coldstar_zk_prove_ownership(input_json: *const c_char)
 ///   "context_data_hex": "..."   // context data, hex-encoded
 /// }
 /// ```
+///
+/// # Safety
+/// `input_json` must be a valid, null-terminated C string.
 #[no_mangle]
 pub unsafe extern "C" fn coldstar_zk_verify_ownership(input_json: *const c_char) -> *mut c_char {
     let input = match parse_c_str(input_json) {
         Ok(s) => s,
-        Err(e) => return FfiResponse::err(e).to_c_string(),
+        Err(e) => return FfiResponse::err(e).into_c_string(),
     };
 
     #[derive(Deserialize)]
@@ -159,21 +189,21 @@ pub unsafe extern "C" fn coldstar_zk_verify_ownership(input_json: *const c_char)
 
     let params: Input = match serde_json::from_str(input) {
         Ok(p) => p,
-        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).into_c_string(),
     };
 
     let context_data = match hex::decode(&params.context_data_hex) {
         Ok(d) => d,
-        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).into_c_string(),
     };
 
     match ownership::verify_ownership(&params.proof, &context_data) {
-        Ok(()) => FfiResponse::ok(serde_json::json!({ "valid": true })).to_c_string(),
+        Ok(()) => FfiResponse::ok(serde_json::json!({ "valid": true })).into_c_string(),
         Err(e) => FfiResponse::ok(serde_json::json!({
             "valid": false,
             "error": format!("{}", e)
         }))
-        .to_c_string(),
+        .into_c_string(),
     }
 }
 
@@ -187,11 +217,14 @@ pub unsafe extern "C" fn coldstar_zk_verify_ownership(input_json: *const c_char)
 ///   "context_data_hex": "..."
 /// }
 /// ```
+///
+/// # Safety
+/// `input_json` must be a valid, null-terminated C string.
 #[no_mangle]
 pub unsafe extern "C" fn coldstar_zk_prove_range(input_json: *const c_char) -> *mut c_char {
     let input = match parse_c_str(input_json) {
         Ok(s) => s,
-        Err(e) => return FfiResponse::err(e).to_c_string(),
+        Err(e) => return FfiResponse::err(e).into_c_string(),
     };
 
     #[derive(Deserialize)]
@@ -203,20 +236,20 @@ pub unsafe extern "C" fn coldstar_zk_prove_range(input_json: *const c_char) -> *
 
     let params: Input = match serde_json::from_str(input) {
         Ok(p) => p,
-        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).into_c_string(),
     };
 
     let context_data = match hex::decode(&params.context_data_hex) {
         Ok(d) => d,
-        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).into_c_string(),
     };
 
     match range::prove_range(params.value, params.num_bits, &context_data) {
         Ok((proof, _blinding)) => {
             let data = serde_json::to_value(&proof).unwrap();
-            FfiResponse::ok(serde_json::json!({ "range_proof": data })).to_c_string()
+            FfiResponse::ok(serde_json::json!({ "range_proof": data })).into_c_string()
         }
-        Err(e) => FfiResponse::err(format!("Range proof failed: {}", e)).to_c_string(),
+        Err(e) => FfiResponse::err(format!("Range proof failed: {}", e)).into_c_string(),
     }
 }
 
@@ -229,11 +262,14 @@ pub unsafe extern "C" fn coldstar_zk_prove_range(input_json: *const c_char) -> *
 ///   "context_data_hex": "..."
 /// }
 /// ```
+///
+/// # Safety
+/// `input_json` must be a valid, null-terminated C string.
 #[no_mangle]
 pub unsafe extern "C" fn coldstar_zk_verify_range(input_json: *const c_char) -> *mut c_char {
     let input = match parse_c_str(input_json) {
         Ok(s) => s,
-        Err(e) => return FfiResponse::err(e).to_c_string(),
+        Err(e) => return FfiResponse::err(e).into_c_string(),
     };
 
     #[derive(Deserialize)]
@@ -244,21 +280,21 @@ pub unsafe extern "C" fn coldstar_zk_verify_range(input_json: *const c_char) ->
 
     let params: Input = match serde_json::from_str(input) {
         Ok(p) => p,
-        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).into_c_string(),
     };
 
     let context_data = match hex::decode(&params.context_data_hex) {
         Ok(d) => d,
-        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid context hex: {}", e)).into_c_string(),
     };
 
     match range::verify_range(&params.proof, &context_data) {
-        Ok(()) => FfiResponse::ok(serde_json::json!({ "valid": true })).to_c_string(),
+        Ok(()) => FfiResponse::ok(serde_json::json!({ "valid": true })).into_c_string(),
         Err(e) => FfiResponse::ok(serde_json::json!({
             "valid": false,
             "error": format!("{}", e)
         }))
-        .to_c_string(),
+        .into_c_string(),
     }
 }
 
@@ -270,11 +306,14 @@ pub unsafe extern "C" fn coldstar_zk_verify_range(input_json: *const c_char) ->
 ///   "envelope_json": "..."  // Serialized TransferEnvelope  
 /// }
 /// ```
+///
+/// # Safety
+/// `input_json` must be a valid, null-terminated C string.
 #[no_mangle]
 pub unsafe extern "C" fn coldstar_zk_validate_envelope(input_json: *const c_char) -> *mut c_char {
     let input = match parse_c_str(input_json) {
         Ok(s) => s,
-        Err(e) => return FfiResponse::err(e).to_c_string(),
+        Err(e) => return FfiResponse::err(e).into_c_string(),
     };
 
     #[derive(Deserialize)]
@@ -284,14 +323,12 @@ pub unsafe extern "C" fn coldstar_zk_validate_envelope(input_json: *const c_char
 
     let params: Input = match serde_json::from_str(input) {
         Ok(p) => p,
-        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).to_c_string(),
+        Err(e) => return FfiResponse::err(format!("Invalid input: {}", e)).into_c_string(),
     };
 
     let env = match envelope::deserialize_envelope(&params.envelope_json) {
         Ok(e) => e,
-        Err(e) => {
-            return FfiResponse::err(format!("Invalid envelope: {}", e)).to_c_string()
-        }
+        Err(e) => return FfiResponse::err(format!("Invalid envelope: {}", e)).into_c_string(),
     };
 
     let mut engine = PolicyEngine::new();
@@ -301,12 +338,575 @@ pub unsafe extern "C" fn coldstar_zk_validate_envelope(input_json: *const c_char
                 "verification": serde_json::to_value(&result).unwrap(),
                 "summary": serde_json::to_value(&summary).unwrap(),
             });
-            FfiResponse::ok(data).to_c_string()
+            FfiResponse::ok(data).into_c_string()
         }
-        Err(e) => FfiResponse::err(format!("Validation failed: {}", e)).to_c_string(),
+        Err(e) => FfiResponse::err(format!("Validation failed: {}", e)).into_c_string(),
+    }
+}
+
+// ============================================================================
+// Binary Convention
+// ============================================================================
+
+/// Success (for verify functions: the proof is valid)
+pub const ZK_BIN_OK: i32 = 0;
+/// A required pointer was null
+pub const ZK_BIN_NULL_POINTER: i32 = 1;
+/// The proof buffer is not a well-formed encoding
+pub const ZK_BIN_MALFORMED: i32 = 2;
+/// Invalid parameters (e.g. value does not fit in num_bits)
+pub const ZK_BIN_INVALID_INPUT: i32 = 3;
+/// The output buffer is not the encoded proof size
+pub const ZK_BIN_BUFFER_SIZE: i32 = 4;
+/// The proof was decoded but did not verify
+pub const ZK_BIN_INVALID_PROOF: i32 = 5;
+
+/// Size of a compressed Ristretto point or a canonical scalar
+const ELEMENT_SIZE: usize = 32;
+
+/// Encoded size of an ownership proof
+pub const OWNERSHIP_PROOF_SIZE: usize = 5 * ELEMENT_SIZE;
+
+/// Encoded size of one bit proof inside a range proof
+pub const BIT_PROOF_SIZE: usize = 7 * ELEMENT_SIZE;
+
+/// Encoded size of the range proof header (bit count, commitment, context hash)
+const RANGE_HEADER_SIZE: usize = 4 + 2 * ELEMENT_SIZE;
+
+/// Encoded size of a range proof over `num_bits` bits
+pub fn range_proof_size(num_bits: usize) -> usize {
+    RANGE_HEADER_SIZE + num_bits * BIT_PROOF_SIZE
+}
+
+/// Append a hex-encoded 32-byte element as raw bytes
+fn put_element(out: &mut Vec<u8>, hex_str: &str, name: &str) -> Result<(), ZkError> {
+    let bytes = hex::decode(hex_str)?;
+    if bytes.len() != ELEMENT_SIZE {
+        return Err(ZkError::InvalidProof(format!(
+            "{} must be {} bytes, got {}",
+            name,
+            ELEMENT_SIZE,
+            bytes.len()
+        )));
+    }
+    out.extend_from_slice(&bytes);
+    Ok(())
+}
+
+/// Split the next 32-byte element off `buf` and hex-encode it
+fn take_element(buf: &mut &[u8]) -> String {
+    let (element, rest) = buf.split_at(ELEMENT_SIZE);
+    *buf = rest;
+    hex::encode(element)
+}
+
+/// Encoded size of the aggregated range proof fields before the L/R points
+const AGGREGATED_HEADER_SIZE: usize = 4 + 11 * ELEMENT_SIZE;
+
+/// Encoded size of an aggregated range proof over `num_bits` bits
+pub fn aggregated_range_proof_size(num_bits: usize) -> usize {
+    AGGREGATED_HEADER_SIZE + 2 * (num_bits.trailing_zeros() as usize) * ELEMENT_SIZE
+}
+
+/// Encode an ownership proof in the binary layout
+pub fn encode_ownership_proof(proof: &OwnershipProof) -> Result<Vec<u8>, ZkError> {
+    let mut out = Vec::with_capacity(OWNERSHIP_PROOF_SIZE);
+    put_element(&mut out, &proof.public_key, "public_key")?;
+    put_element(&mut out, &proof.commitment_r, "commitment_r")?;
+    put_element(&mut out, &proof.challenge, "challenge")?;
+    put_element(&mut out, &proof.response, "response")?;
+    put_element(&mut out, &proof.context_hash, "context_hash")?;
+    Ok(out)
+}
+
+/// Decode an ownership proof from the binary layout
+pub fn decode_ownership_proof(mut buf: &[u8]) -> Result<OwnershipProof, ZkError> {
+    if buf.len() != OWNERSHIP_PROOF_SIZE {
+        return Err(ZkError::InvalidProof(format!(
+            "Ownership proof must be {} bytes, got {}",
+            OWNERSHIP_PROOF_SIZE,
+            buf.len()
+        )));
+    }
+    Ok(OwnershipProof {
+        public_key: take_element(&mut buf),
+        commitment_r: take_element(&mut buf),
+        challenge: take_element(&mut buf),
+        response: take_element(&mut buf),
+        context_hash: take_element(&mut buf),
+    })
+}
+
+/// Encode a range proof in the binary layout
+pub fn encode_range_proof(proof: &RangeProof) -> Result<Vec<u8>, ZkError> {
+    if proof.bit_proofs.len() != proof.num_bits || proof.num_bits > MAX_RANGE_BITS {
+        return Err(ZkError::InvalidProof(format!(
+            "Range proof has {} bit proofs for {} bits",
+            proof.bit_proofs.len(),
+            proof.num_bits
+        )));
+    }
+    let mut out = Vec::with_capacity(range_proof_size(proof.num_bits));
+    out.extend_from_slice(&(proof.num_bits as u32).to_le_bytes());
+    put_element(&mut out, &proof.value_commitment, "value_commitment")?;
+    put_element(&mut out, &proof.context_hash, "context_hash")?;
+    for bit_proof in &proof.bit_proofs {
+        put_element(&mut out, &bit_proof.commitment, "commitment")?;
+        put_element(&mut out, &bit_proof.e0, "e0")?;
+        put_element(&mut out, &bit_proof.s0, "s0")?;
+        put_element(&mut out, &bit_proof.e1, "e1")?;
+        put_element(&mut out, &bit_proof.s1, "s1")?;
+        put_element(&mut out, &bit_proof.r0, "r0")?;
+        put_element(&mut out, &bit_proof.r1, "r1")?;
+    }
+    Ok(out)
+}
+
+/// Decode a range proof from the binary layout
+pub fn decode_range_proof(buf: &[u8]) -> Result<RangeProof, ZkError> {
+    if buf.len() < RANGE_HEADER_SIZE {
+        return Err(ZkError::InvalidProof("Range proof buffer too short".into()));
+    }
+    let (count, mut rest) = buf.split_at(4);
+    let num_bits = u32::from_le_bytes(count.try_into().expect("4-byte prefix")) as usize;
+    if num_bits > MAX_RANGE_BITS || buf.len() != range_proof_size(num_bits) {
+        return Err(ZkError::InvalidProof(format!(
+            "Range proof buffer of {} bytes does not hold {} bit proofs",
+            buf.len(),
+            num_bits
+        )));
+    }
+
+    let value_commitment = take_element(&mut rest);
+    let context_hash = take_element(&mut rest);
+    let bit_proofs = (0..num_bits)
+        .map(|_| BitProof {
+            commitment: take_element(&mut rest),
+            e0: take_element(&mut rest),
+            s0: take_element(&mut rest),
+            e1: take_element(&mut rest),
+            s1: take_element(&mut rest),
+            r0: take_element(&mut rest),
+            r1: take_element(&mut rest),
+        })
+        .collect();
+
+    Ok(RangeProof {
+        value_commitment,
+        num_bits,
+        bit_proofs,
+        context_hash,
+    })
+}
+
+/// Encode an aggregated range proof in the binary layout
+pub fn encode_aggregated_range_proof(proof: &AggregatedRangeProof) -> Result<Vec<u8>, ZkError> {
+    let rounds = proof.num_bits.trailing_zeros() as usize;
+    if !proof.num_bits.is_power_of_two()
+        || proof.num_bits > MAX_RANGE_BITS
+        || proof.ipa_l.len() != rounds
+        || proof.ipa_r.len() != rounds
+    {
+        return Err(ZkError::InvalidProof(format!(
+            "Aggregated range proof has {}/{} rounds for {} bits",
+            proof.ipa_l.len(),
+            proof.ipa_r.len(),
+            proof.num_bits
+        )));
+    }
+    let mut out = Vec::with_capacity(aggregated_range_proof_size(proof.num_bits));
+    out.extend_from_slice(&(proof.num_bits as u32).to_le_bytes());
+    for (field, name) in [
+        (&proof.value_commitment, "value_commitment"),
+        (&proof.context_hash, "context_hash"),
+        (&proof.commitment_a, "commitment_a"),
+        (&proof.commitment_s, "commitment_s"),
+        (&proof.commitment_t1, "commitment_t1"),
+        (&proof.commitment_t2, "commitment_t2"),
+        (&proof.tau_x, "tau_x"),
+        (&proof.mu, "mu"),
+        (&proof.t_hat, "t_hat"),
+        (&proof.ipa_a, "ipa_a"),
+        (&proof.ipa_b, "ipa_b"),
+    ] {
+        put_element(&mut out, field, name)?;
+    }
+    for point in proof.ipa_l.iter().chain(&proof.ipa_r) {
+        put_element(&mut out, point, "ipa point")?;
+    }
+    Ok(out)
+}
+
+/// Decode an aggregated range proof from the binary layout
+pub fn decode_aggregated_range_proof(buf: &[u8]) -> Result<AggregatedRangeProof, ZkError> {
+    if buf.len() < AGGREGATED_HEADER_SIZE {
+        return Err(ZkError::InvalidProof(
+            "Aggregated range proof buffer too short".into(),
+        ));
+    }
+    let (count, mut rest) = buf.split_at(4);
+    let num_bits = u32::from_le_bytes(count.try_into().expect("4-byte prefix")) as usize;
+    if !num_bits.is_power_of_two()
+        || num_bits > MAX_RANGE_BITS
+        || buf.len() != aggregated_range_proof_size(num_bits)
+    {
+        return Err(ZkError::InvalidProof(format!(
+            "Aggregated range proof buffer of {} bytes does not match {} bits",
+            buf.len(),
+            num_bits
+        )));
+    }
+    let rounds = num_bits.trailing_zeros() as usize;
+
+    let value_commitment = take_element(&mut rest);
+    let context_hash = take_element(&mut rest);
+    let commitment_a = take_element(&mut rest);
+    let commitment_s = take_element(&mut rest);
+    let commitment_t1 = take_element(&mut rest);
+    let commitment_t2 = take_element(&mut rest);
+    let tau_x = take_element(&mut rest);
+    let mu = take_element(&mut rest);
+    let t_hat = take_element(&mut rest);
+    let ipa_a = take_element(&mut rest);
+    let ipa_b = take_element(&mut rest);
+    let ipa_l = (0..rounds).map(|_| take_element(&mut rest)).collect();
+    let ipa_r = (0..rounds).map(|_| take_element(&mut rest)).collect();
+
+    Ok(AggregatedRangeProof {
+        value_commitment,
+        num_bits,
+        commitment_a,
+        commitment_s,
+        commitment_t1,
+        commitment_t2,
+        tau_x,
+        mu,
+        t_hat,
+        ipa_l,
+        ipa_r,
+        ipa_a,
+        ipa_b,
+        context_hash,
+    })
+}
+
+/// Borrow an input buffer; a null pointer is only accepted with length 0
+unsafe fn input_slice<'a>(ptr: *const u8, len: usize) -> Option<&'a [u8]> {
+    if len == 0 {
+        return Some(&[]);
+    }
+    if ptr.is_null() {
+        return None;
+    }
+    Some(std::slice::from_raw_parts(ptr, len))
+}
+
+/// Copy an encoded proof into a caller-allocated buffer of exactly its size
+unsafe fn write_output(encoded: &[u8], out: *mut u8, out_len: usize) -> i32 {
+    if out.is_null() {
+        return ZK_BIN_NULL_POINTER;
+    }
+    if out_len != encoded.len() {
+        return ZK_BIN_BUFFER_SIZE;
+    }
+    std::slice::from_raw_parts_mut(out, out_len).copy_from_slice(encoded);
+    ZK_BIN_OK
+}
+
+/// Generate an ownership proof (binary convention).
+///
+/// `secret_key` points to a 32-byte seed. `proof_out` must be
+/// `OWNERSHIP_PROOF_SIZE` bytes.
+///
+/// # Safety
+/// `secret_key` must point to 32 readable bytes, `context` to `context_len`
+/// readable bytes and `proof_out` to `proof_out_len` writable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_prove_ownership_bin(
+    secret_key: *const u8,
+    context: *const u8,
+    context_len: usize,
+    proof_out: *mut u8,
+    proof_out_len: usize,
+) -> i32 {
+    if secret_key.is_null() {
+        return ZK_BIN_NULL_POINTER;
+    }
+    let context_data = match input_slice(context, context_len) {
+        Some(c) => c,
+        None => return ZK_BIN_NULL_POINTER,
+    };
+    if proof_out_len != OWNERSHIP_PROOF_SIZE {
+        return ZK_BIN_BUFFER_SIZE;
+    }
+
+    let mut key = [0u8; 32];
+    key.copy_from_slice(std::slice::from_raw_parts(secret_key, 32));
+    let result = ownership::prove_ownership(&key, context_data);
+    key.zeroize();
+
+    match result.and_then(|proof| encode_ownership_proof(&proof)) {
+        Ok(encoded) => write_output(&encoded, proof_out, proof_out_len),
+        Err(_) => ZK_BIN_INVALID_INPUT,
+    }
+}
+
+/// Verify an ownership proof (binary convention).
+///
+/// Returns `ZK_BIN_OK` if the proof is valid.
+///
+/// # Safety
+/// `proof` must point to `proof_len` readable bytes and `context` to
+/// `context_len` readable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_verify_ownership_bin(
+    proof: *const u8,
+    proof_len: usize,
+    context: *const u8,
+    context_len: usize,
+) -> i32 {
+    let (proof_bytes, context_data) = match (
+        input_slice(proof, proof_len),
+        input_slice(context, context_len),
+    ) {
+        (Some(p), Some(c)) => (p, c),
+        _ => return ZK_BIN_NULL_POINTER,
+    };
+    let proof = match decode_ownership_proof(proof_bytes) {
+        Ok(p) => p,
+        Err(_) => return ZK_BIN_MALFORMED,
+    };
+    match ownership::verify_ownership(&proof, context_data) {
+        Ok(()) => ZK_BIN_OK,
+        Err(_) => ZK_BIN_INVALID_PROOF,
     }
 }
 
+/// Generate a range proof (binary convention).
+///
+/// `proof_out` must be `range_proof_size(num_bits)` = 68 + 224*num_bits bytes.
+/// As with the JSON call, the blinding factor is not returned.
+///
+/// # Safety
+/// `context` must point to `context_len` readable bytes and `proof_out` to
+/// `proof_out_len` writable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_prove_range_bin(
+    value: u64,
+    num_bits: u32,
+    context: *const u8,
+    context_len: usize,
+    proof_out: *mut u8,
+    proof_out_len: usize,
+) -> i32 {
+    let context_data = match input_slice(context, context_len) {
+        Some(c) => c,
+        None => return ZK_BIN_NULL_POINTER,
+    };
+    let num_bits = num_bits as usize;
+    if num_bits <= MAX_RANGE_BITS && proof_out_len != range_proof_size(num_bits) {
+        return ZK_BIN_BUFFER_SIZE;
+    }
+
+    match range::prove_range(value, num_bits, context_data)
+        .and_then(|(proof, _blinding)| encode_range_proof(&proof))
+    {
+        Ok(encoded) => write_output(&encoded, proof_out, proof_out_len),
+        Err(_) => ZK_BIN_INVALID_INPUT,
+    }
+}
+
+/// Verify a range proof (binary convention).
+///
+/// Returns `ZK_BIN_OK` if the proof is valid.
+///
+/// # Safety
+/// `proof` must point to `proof_len` readable bytes and `context` to
+/// `context_len` readable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_verify_range_bin(
+    proof: *const u8,
+    proof_len: usize,
+    context: *const u8,
+    context_len: usize,
+) -> i32 {
+    let (proof_bytes, context_data) = match (
+        input_slice(proof, proof_len),
+        input_slice(context, context_len),
+    ) {
+        (Some(p), Some(c)) => (p, c),
+        _ => return ZK_BIN_NULL_POINTER,
+    };
+    let proof = match decode_range_proof(proof_bytes) {
+        Ok(p) => p,
+        Err(_) => return ZK_BIN_MALFORMED,
+    };
+    match range::verify_range(&proof, context_data) {
+        Ok(()) => ZK_BIN_OK,
+        Err(_) => ZK_BIN_INVALID_PROOF,
+    }
+}
+
+/// Generate an aggregated range proof (binary convention).
+///
+/// `num_bits` must be a power of two; `proof_out` must be
+/// `aggregated_range_proof_size(num_bits)` = 356 + 64*log2(num_bits) bytes.
+///
+/// # Safety
+/// `context` must point to `context_len` readable bytes and `proof_out` to
+/// `proof_out_len` writable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_prove_aggregated_range_bin(
+    value: u64,
+    num_bits: u32,
+    context: *const u8,
+    context_len: usize,
+    proof_out: *mut u8,
+    proof_out_len: usize,
+) -> i32 {
+    let context_data = match input_slice(context, context_len) {
+        Some(c) => c,
+        None => return ZK_BIN_NULL_POINTER,
+    };
+    let num_bits = num_bits as usize;
+    if num_bits.is_power_of_two()
+        && num_bits <= MAX_RANGE_BITS
+        && proof_out_len != aggregated_range_proof_size(num_bits)
+    {
+        return ZK_BIN_BUFFER_SIZE;
+    }
+
+    match bulletproof::prove_aggregated_range(value, num_bits, context_data)
+        .and_then(|(proof, _blinding)| encode_aggregated_range_proof(&proof))
+    {
+        Ok(encoded) => write_output(&encoded, proof_out, proof_out_len),
+        Err(_) => ZK_BIN_INVALID_INPUT,
+    }
+}
+
+/// Verify an aggregated range proof (binary convention).
+///
+/// Returns `ZK_BIN_OK` if the proof is valid.
+///
+/// # Safety
+/// `proof` must point to `proof_len` readable bytes and `context` to
+/// `context_len` readable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_verify_aggregated_range_bin(
+    proof: *const u8,
+    proof_len: usize,
+    context: *const u8,
+    context_len: usize,
+) -> i32 {
+    let (proof_bytes, context_data) = match (
+        input_slice(proof, proof_len),
+        input_slice(context, context_len),
+    ) {
+        (Some(p), Some(c)) => (p, c),
+        _ => return ZK_BIN_NULL_POINTER,
+    };
+    let proof = match decode_aggregated_range_proof(proof_bytes) {
+        Ok(p) => p,
+        Err(_) => return ZK_BIN_MALFORMED,
+    };
+    match bulletproof::verify_aggregated_range(&proof, context_data) {
+        Ok(()) => ZK_BIN_OK,
+        Err(_) => ZK_BIN_INVALID_PROOF,
+    }
+}
+
+/// Verify a packed batch of range proofs (binary convention).
+///
+/// `proofs` holds `count` records of `[u32 LE context_len] || context ||
+/// range_proof`. `results_out` must be `count` bytes; each receives
+/// `ZK_BIN_OK` or the status for that proof (`ZK_BIN_MALFORMED` or
+/// `ZK_BIN_INVALID_PROOF`).
+///
+/// Returns `ZK_BIN_OK` if every proof is valid, `ZK_BIN_INVALID_PROOF` if
+/// any failed, or an error code if the buffers themselves are unusable.
+///
+/// # Safety
+/// `proofs` must point to `proofs_len` readable bytes and `results_out` to
+/// `results_out_len` writable bytes.
+#[no_mangle]
+pub unsafe extern "C" fn coldstar_zk_verify_ranges_bin(
+    proofs: *const u8,
+    proofs_len: usize,
+    count: usize,
+    results_out: *mut u8,
+    results_out_len: usize,
+) -> i32 {
+    let mut buf = match input_slice(proofs, proofs_len) {
+        Some(b) => b,
+        None => return ZK_BIN_NULL_POINTER,
+    };
+    if results_out.is_null() && count > 0 {
+        return ZK_BIN_NULL_POINTER;
+    }
+    if results_out_len != count {
+        return ZK_BIN_BUFFER_SIZE;
+    }
+
+    // Split the records; a framing error makes the whole buffer unusable
+    let mut records = Vec::with_capacity(count);
+    for _ in 0..count {
+        let context_len = match read_u32(&mut buf) {
+            Some(n) => n as usize,
+            None => return ZK_BIN_MALFORMED,
+        };
+        if buf.len() < context_len {
+            return ZK_BIN_MALFORMED;
+        }
+        let (context_data, rest) = buf.split_at(context_len);
+        let num_bits = match rest.get(..4) {
+            Some(prefix) => u32::from_le_bytes(prefix.try_into().expect("4-byte prefix")) as usize,
+            None => return ZK_BIN_MALFORMED,
+        };
+        if num_bits > MAX_RANGE_BITS || rest.len() < range_proof_size(num_bits) {
+            return ZK_BIN_MALFORMED;
+        }
+        let (proof_bytes, rest) = rest.split_at(range_proof_size(num_bits));
+        records.push((context_data, proof_bytes));
+        buf = rest;
+    }
+    if !buf.is_empty() {
+        return ZK_BIN_MALFORMED;
+    }
+
+    let results = std::slice::from_raw_parts_mut(results_out, count);
+    let mut decoded = Vec::with_capacity(count);
+    for (index, (context_data, proof_bytes)) in records.iter().enumerate() {
+        match decode_range_proof(proof_bytes) {
+            Ok(proof) => {
+                results[index] = ZK_BIN_OK as u8;
+                decoded.push((index, proof, *context_data));
+            }
+            Err(_) => results[index] = ZK_BIN_MALFORMED as u8,
+        }
+    }
+
+    let items: Vec<(&RangeProof, &[u8])> = decoded.iter().map(|(_, p, c)| (p, *c)).collect();
+    if let Err(failures) = range::verify_range_batch(&items) {
+        for (position, _) in failures {
+            results[decoded[position].0] = ZK_BIN_INVALID_PROOF as u8;
+        }
+    }
+
+    if results.iter().all(|&r| r == ZK_BIN_OK as u8) {
+        ZK_BIN_OK
+    } else {
+        ZK_BIN_INVALID_PROOF
+    }
+}
+
+/// Split a little-endian u32 off the front of `buf`
+fn read_u32(buf: &mut &[u8]) -> Option<u32> {
+    let prefix = buf.get(..4)?;
+    let value = u32::from_le_bytes(prefix.try_into().expect("4-byte prefix"));
+    *buf = &buf[4..];
+    Some(value)
+}
+
 /// Get the library version.
 #[no_mangle]
 pub extern "C" fn coldstar_zk_version() -> *mut c_char {
@@ -327,3 +927,153 @@ pub unsafe extern "C" fn coldstar_zk_free_string(ptr: *mut c_char) {
         drop(CString::from_raw(ptr));
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_range_proof_codec_roundtrip() {
+        let (proof, _) = range::prove_range(1000, 16, b"ctx").unwrap();
+        let encoded = encode_range_proof(&proof).unwrap();
+        assert_eq!(encoded.len(), range_proof_size(16));
+        let decoded = decode_range_proof(&encoded).unwrap();
+        assert_eq!(
+            serde_json::to_value(&decoded).unwrap(),
+            serde_json::to_value(&proof).unwrap()
+        );
+    }
+
+    #[test]
+    fn test_range_proof_decode_rejects_truncated() {
+        let (proof, _) = range::prove_range(7, 8, b"ctx").unwrap();
+        let encoded = encode_range_proof(&proof).unwrap();
+        assert!(decode_range_proof(&encoded[..encoded.len() - 1]).is_err());
+        assert!(decode_range_proof(&encoded[..3]).is_err());
+    }
+
+    #[test]
+    fn test_binary_range_prove_and_verify() {
+        let mut out = vec![0u8; range_proof_size(32)];
+        let ctx = b"binary context";
+        let code = unsafe {
+            coldstar_zk_prove_range_bin(
+                123_456,
+                32,
+                ctx.as_ptr(),
+                ctx.len(),
+                out.as_mut_ptr(),
+                out.len(),
+            )
+        };
+        assert_eq!(code, ZK_BIN_OK);
+        let verify = |context: &[u8]| unsafe {
+            coldstar_zk_verify_range_bin(out.as_ptr(), out.len(), context.as_ptr(), context.len())
+        };
+        assert_eq!(verify(ctx), ZK_BIN_OK);
+        assert_eq!(verify(b"other context"), ZK_BIN_INVALID_PROOF);
+    }
+
+    #[test]
+    fn test_binary_range_rejects_wrong_buffer_size() {
+        let mut out = vec![0u8; range_proof_size(8) - 1];
+        let code = unsafe {
+            coldstar_zk_prove_range_bin(1, 8, std::ptr::null(), 0, out.as_mut_ptr(), out.len())
+        };
+        assert_eq!(code, ZK_BIN_BUFFER_SIZE);
+    }
+
+    #[test]
+    fn test_binary_range_batch_reports_each_proof() {
+        let mut packed = Vec::new();
+        for (value, context) in [(1u64, &b"a"[..]), (2, &b"b"[..]), (3, &b"c"[..])] {
+            let (proof, _) = range::prove_range(value, 8, context).unwrap();
+            // Record 1 is packed with the wrong context
+            let context: &[u8] = if value == 2 { b"wrong" } else { context };
+            packed.extend_from_slice(&(context.len() as u32).to_le_bytes());
+            packed.extend_from_slice(context);
+            packed.extend_from_slice(&encode_range_proof(&proof).unwrap());
+        }
+
+        let mut results = [0xFFu8; 3];
+        let code = unsafe {
+            coldstar_zk_verify_ranges_bin(packed.as_ptr(), packed.len(), 3, results.as_mut_ptr(), 3)
+        };
+        assert_eq!(code, ZK_BIN_INVALID_PROOF);
+        assert_eq!(
+            results,
+            [ZK_BIN_OK as u8, ZK_BIN_INVALID_PROOF as u8, ZK_BIN_OK as u8]
+        );
+
+        let code = unsafe {
+            coldstar_zk_verify_ranges_bin(
+                packed.as_ptr(),
+                packed.len() - 1,
+                3,
+                results.as_mut_ptr(),
+                3,
+            )
+        };
+        assert_eq!(code, ZK_BIN_MALFORMED);
+    }
+
+    #[test]
+    fn test_binary_aggregated_range_prove_and_verify() {
+        let ctx = b"aggregated";
+        let mut out = vec![0u8; aggregated_range_proof_size(64)];
+        assert_eq!(out.len(), 356 + 64 * 6);
+        let code = unsafe {
+            coldstar_zk_prove_aggregated_range_bin(
+                1_000_000_000,
+                64,
+                ctx.as_ptr(),
+                ctx.len(),
+                out.as_mut_ptr(),
+                out.len(),
+            )
+        };
+        assert_eq!(code, ZK_BIN_OK);
+
+        let decoded = decode_aggregated_range_proof(&out).unwrap();
+        assert_eq!(encode_aggregated_range_proof(&decoded).unwrap(), out);
+
+        let verify = |context: &[u8]| unsafe {
+            coldstar_zk_verify_aggregated_range_bin(
+                out.as_ptr(),
+                out.len(),
+                context.as_ptr(),
+                context.len(),
+            )
+        };
+        assert_eq!(verify(ctx), ZK_BIN_OK);
+        assert_eq!(verify(b"other"), ZK_BIN_INVALID_PROOF);
+    }
+
+    #[test]
+    fn test_binary_ownership_prove_and_verify() {
+        let key = [7u8; 32];
+        let ctx = b"ownership context";
+        let mut out = [0u8; OWNERSHIP_PROOF_SIZE];
+        let code = unsafe {
+            coldstar_zk_prove_ownership_bin(
+                key.as_ptr(),
+                ctx.as_ptr(),
+                ctx.len(),
+                out.as_mut_ptr(),
+                out.len(),
+            )
+        };
+        assert_eq!(code, ZK_BIN_OK);
+        let valid = unsafe {
+            coldstar_zk_verify_ownership_bin(out.as_ptr(), out.len(), ctx.as_ptr(), ctx.len())
+        };
+        assert_eq!(valid, ZK_BIN_OK);
+
+        // Flip the low bit of the response s (the challenge is recomputed, not read)
+        out[3 * ELEMENT_SIZE] ^= 0x01;
+        let tampered = unsafe {
+            coldstar_zk_verify_ownership_bin(out.as_ptr(), out.len(), ctx.as_ptr(), ctx.len())
+        };
+        assert_eq!(tampered, ZK_BIN_INVALID_PROOF);
+    }
+}
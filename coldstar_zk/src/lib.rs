@@ -9,6 +9,8 @@
 //!   corresponding to a public key, without revealing the key.
 //! - **Range Proof**: Bit-decomposition proof that a committed value lies
 //!   within a specified range [0, 2^n), using Sigma OR-proofs per bit.
+//! - **Aggregated Range Proof**: Bulletproofs-style range proof whose size
+//!   grows with log2(n) instead of n (envelope version 1.1.0).
 //! - **Policy Proof**: Proof that a transaction satisfies policy constraints
 //!   (e.g., amount limits, authorized destinations) without revealing policy details.
 //!
@@ -45,6 +47,6 @@ mod tests {
 
     #[test]
     fn test_version() {
-        assert!(!VERSION.is_empty());
+        assert_eq!(VERSION.split('.').count(), 3);
     }
 }
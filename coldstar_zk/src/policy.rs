@@ -19,9 +19,10 @@ use std::collections::HashSet;
 use crate::binding;
 use crate::envelope;
 use crate::error::ZkError;
-use crate::proofs::{ownership, range};
+use crate::proofs::{bulletproof, ownership, range};
 use crate::types::{
-    SigningSummary, TransactionMode, TransferEnvelope, VerificationCheck, VerificationResult,
+    RangeProofKind, SigningSummary, TransactionMode, TransferEnvelope, VerificationCheck,
+    VerificationResult,
 };
 
 /// Maximum transaction age in seconds (1 hour)
@@ -182,8 +183,7 @@ impl PolicyEngine {
                 }
 
                 // Check 8: Ownership proof
-                let tx_context_hash =
-                    binding::compute_tx_context_hash(&envelope.transaction);
+                let tx_context_hash = binding::compute_tx_context_hash(&envelope.transaction);
                 let ownership_ok =
                     ownership::verify_ownership(&bundle.ownership_proof, &tx_context_hash).is_ok();
                 checks.push(VerificationCheck {
@@ -201,15 +201,22 @@ impl PolicyEngine {
 
                 // Check 9: Range proof (if present)
                 if let Some(ref range_proof) = bundle.range_proof {
-                    let range_ok =
-                        range::verify_range(range_proof, &tx_context_hash).is_ok();
+                    let range_ok = match range_proof {
+                        RangeProofKind::BitDecomposition(p) => {
+                            range::verify_range(p, &tx_context_hash).is_ok()
+                        }
+                        RangeProofKind::Aggregated(p) => {
+                            bulletproof::verify_aggregated_range(p, &tx_context_hash).is_ok()
+                        }
+                    };
                     checks.push(VerificationCheck {
                         name: "Range proof".to_string(),
                         passed: range_ok,
                         detail: if range_ok {
                             format!(
                                 "Amount proven to be in [0, 2^{}) — {} bits",
-                                range_proof.num_bits, range_proof.num_bits
+                                range_proof.num_bits(),
+                                range_proof.num_bits()
                             )
                         } else {
                             "Range proof verification FAILED".to_string()
@@ -234,8 +241,7 @@ impl PolicyEngine {
                 }
 
                 // Check 11: Proof binding
-                let binding_ok =
-                    binding::verify_binding(&envelope.transaction, bundle).is_ok();
+                let binding_ok = binding::verify_binding(&envelope.transaction, bundle).is_ok();
                 checks.push(VerificationCheck {
                     name: "Proof-to-transaction binding".to_string(),
                     passed: binding_ok,
@@ -265,7 +271,11 @@ impl PolicyEngine {
                 envelope.mode
             )
         } else {
-            let failed: Vec<_> = checks.iter().filter(|c| !c.passed).map(|c| c.name.clone()).collect();
+            let failed: Vec<_> = checks
+                .iter()
+                .filter(|c| !c.passed)
+                .map(|c| c.name.clone())
+                .collect();
             format!("FAILED checks: {}", failed.join(", "))
         };
 
@@ -388,12 +398,20 @@ mod tests {
         // First validation — nonce is fresh
         let (result1, _) = engine.validate_envelope(&envelope).unwrap();
         // Note: other checks may fail, but nonce should pass
-        let nonce_check1 = result1.checks.iter().find(|c| c.name.contains("Nonce")).unwrap();
+        let nonce_check1 = result1
+            .checks
+            .iter()
+            .find(|c| c.name.contains("Nonce"))
+            .unwrap();
         assert!(nonce_check1.passed, "First use of nonce should pass");
 
         // Second validation — replay!
         let (result2, _) = engine.validate_envelope(&envelope).unwrap();
-        let nonce_check2 = result2.checks.iter().find(|c| c.name.contains("Nonce")).unwrap();
+        let nonce_check2 = result2
+            .checks
+            .iter()
+            .find(|c| c.name.contains("Nonce"))
+            .unwrap();
         assert!(!nonce_check2.passed, "Replayed nonce must be detected");
     }
 }
@@ -1,5 +1,6 @@
 //! Zero-knowledge proof implementations.
 
+pub mod bulletproof;
 pub mod ownership;
 pub mod policy;
 pub mod range;
@@ -19,7 +19,6 @@
 //! - Context-bound: challenge includes transaction context data
 
 use curve25519_dalek::{
-    constants::RISTRETTO_BASEPOINT_POINT,
     ristretto::{CompressedRistretto, RistrettoPoint},
     scalar::Scalar,
 };
@@ -27,6 +26,7 @@ use rand_core::OsRng;
 use sha2::{Digest, Sha256};
 use zeroize::Zeroize;
 
+use crate::commitment::mul_g;
 use crate::domain::DOMAIN_OWNERSHIP_PROOF;
 use crate::error::ZkError;
 use crate::transcript::Transcript;
@@ -45,21 +45,22 @@ use crate::types::OwnershipProof;
 /// - The secret key is converted to a Scalar and used only for computing `s = k + c*x`
 /// - The random nonce `k` is generated from OsRng
 /// - Both `k` and the secret scalar are zeroized after use
-pub fn prove_ownership(secret_key: &[u8; 32], context_data: &[u8]) -> Result<OwnershipProof, ZkError> {
-    let g = RISTRETTO_BASEPOINT_POINT;
-
+pub fn prove_ownership(
+    secret_key: &[u8; 32],
+    context_data: &[u8],
+) -> Result<OwnershipProof, ZkError> {
     // Convert secret key to scalar
     // SECURITY: We clamp the key bytes as Ed25519 does, then use as Scalar
     let mut x = Scalar::from_bytes_mod_order(*secret_key);
 
     // Compute public key X = x*G
-    let big_x = x * g;
+    let big_x = mul_g(&x);
 
     // Pick random nonce k
     let mut k = Scalar::random(&mut OsRng);
 
     // Compute commitment R = k*G
-    let big_r = k * g;
+    let big_r = mul_g(&k);
 
     // Build Fiat-Shamir transcript for the challenge
     let mut transcript = Transcript::new(DOMAIN_OWNERSHIP_PROOF);
@@ -108,8 +109,6 @@ pub fn prove_ownership(secret_key: &[u8; 32], context_data: &[u8]) -> Result<Own
 /// 3. Verify s*G == R + c*X
 /// 4. Verify the context hash matches
 pub fn verify_ownership(proof: &OwnershipProof, context_data: &[u8]) -> Result<(), ZkError> {
-    let g = RISTRETTO_BASEPOINT_POINT;
-
     // Deserialize public key
     let x_bytes = hex::decode(&proof.public_key)?;
     if x_bytes.len() != 32 {
@@ -124,7 +123,9 @@ pub fn verify_ownership(proof: &OwnershipProof, context_data: &[u8]) -> Result<(
     // Deserialize commitment R
     let r_bytes = hex::decode(&proof.commitment_r)?;
     if r_bytes.len() != 32 {
-        return Err(ZkError::InvalidProof("Commitment R must be 32 bytes".into()));
+        return Err(ZkError::InvalidProof(
+            "Commitment R must be 32 bytes".into(),
+        ));
     }
     let mut r_arr = [0u8; 32];
     r_arr.copy_from_slice(&r_bytes);
@@ -163,7 +164,7 @@ pub fn verify_ownership(proof: &OwnershipProof, context_data: &[u8]) -> Result<(
     let c = transcript.challenge_scalar(b"ownership_challenge");
 
     // Verify: s*G == R + c*X
-    let lhs = s * g;
+    let lhs = mul_g(&s);
     let rhs = big_r + c * big_x;
 
     if lhs != rhs {
@@ -184,7 +185,7 @@ pub fn verify_ownership(proof: &OwnershipProof, context_data: &[u8]) -> Result<(
 /// For ZK proofs we work in the Ristretto group for clean prime-order arithmetic.
 pub fn derive_ristretto_pubkey(secret_key: &[u8; 32]) -> RistrettoPoint {
     let x = Scalar::from_bytes_mod_order(*secret_key);
-    x * RISTRETTO_BASEPOINT_POINT
+    mul_g(&x)
 }
 
 /// Get the hex-encoded compressed Ristretto public key.
@@ -23,7 +23,7 @@
 //!   - Challenge e = H(transcript || C_i || R0 || R1)
 //!   - e0 = e - e1
 //!   - s0 = k0 - e0*r_i
-//!   - Output: (e0, s0, e1, s1)
+//!   - Output: (R0, R1, e0, s0, e1, s1)
 //!
 //! If b_i = 1 (real branch: C_i - G = r_i*H):
 //!   - Simulate branch 0: pick random e0, s0, compute R0 = s0*H + e0*C_i
@@ -31,25 +31,39 @@
 //!   - Challenge e = H(transcript || C_i || R0 || R1)
 //!   - e1 = e - e0
 //!   - s1 = k1 - e1*r_i
-//!   - Output: (e0, s0, e1, s1)
+//!   - Output: (R0, R1, e0, s0, e1, s1)
 //!
 //! Verification (for each bit):
-//!   - R0 = s0*H + e0*C_i
-//!   - R1 = s1*H + e1*(C_i - G)
-//!   - Check e0 + e1 == H(transcript || C_i || R0 || R1)
+//!   - Check e0 + e1 == H(transcript || C_i || R0 || R1)   (hashing only)
+//!   - Check R0 == s0*H + e0*C_i
+//!   - Check R1 == s1*H + e1*(C_i - G)
+//!
+//! # Batched Group Equations
+//! Because R0 and R1 travel with the proof, the challenge check needs no
+//! curve arithmetic, and the group equations of every bit plus the
+//! consistency equation Σ(2^i * C_i) == C are folded into one random linear
+//! combination with weights w_k = z^k for a fresh random z:
+//!   Σ_k w_k * (equation_k) == identity
+//! checked with a single variable-time multiscalar multiplication (G and H
+//! appear once, with accumulated coefficients). A false equation survives
+//! only if z is a root of a nonzero polynomial of degree at most the number
+//! of equations, which happens with negligible probability. `verify_range`
+//! folds one proof; `verify_range_batch` folds all of them and, only if the
+//! combined check fails, re-checks each proof alone to name the bad ones.
 //!
 //! # Proof Size
-//! O(n) where n = number of bits. Each bit adds ~160 bytes.
-//! For 64-bit values: ~10KB. Acceptable for USB transfer.
+//! O(n) where n = number of bits. Each bit adds 224 bytes (7 elements).
+//! For 64-bit values: ~14KB. Acceptable for USB transfer.
 
 use curve25519_dalek::{
-    ristretto::RistrettoPoint,
+    ristretto::{CompressedRistretto, RistrettoPoint},
     scalar::Scalar,
+    traits::{IsIdentity, VartimeMultiscalarMul},
 };
 use rand_core::OsRng;
 use zeroize::Zeroize;
 
-use crate::commitment::{commit, commitment_from_hex, commitment_to_hex, generator_g, generator_h};
+use crate::commitment::{commit, commitment_to_hex, generator_g, generator_h, mul_h};
 use crate::domain::{DOMAIN_RANGE_OR_PROOF, DOMAIN_RANGE_PROOF, MAX_RANGE_BITS};
 use crate::error::ZkError;
 use crate::transcript::Transcript;
@@ -87,15 +101,13 @@ pub fn prove_range(
     }
 
     let g = generator_g();
-    let h = generator_h();
 
     // Decompose value into bits
     let bits: Vec<u8> = (0..num_bits).map(|i| ((value >> i) & 1) as u8).collect();
 
     // Generate random blinding factors for each bit
-    let mut bit_blindings: Vec<Scalar> = (0..num_bits)
-        .map(|_| Scalar::random(&mut OsRng))
-        .collect();
+    let mut bit_blindings: Vec<Scalar> =
+        (0..num_bits).map(|_| Scalar::random(&mut OsRng)).collect();
 
     // The total blinding factor for the value commitment
     // must satisfy: r = Σ(2^i * r_i) so that Σ(2^i * C_i) = C
@@ -128,9 +140,9 @@ pub fn prove_range(
         let r_i = bit_blindings[i];
 
         // Bit commitment: C_i = b_i*G + r_i*H
-        let c_i = Scalar::from(b_i as u64) * g + r_i * h;
+        let c_i = commit(&Scalar::from(b_i as u64), &r_i);
 
-        let bit_proof = prove_bit(b_i, r_i, c_i, g, h, i, context_data)?;
+        let bit_proof = prove_bit(b_i, r_i, c_i, g, i, context_data)?;
         bit_proofs.push(bit_proof);
     }
 
@@ -160,7 +172,6 @@ fn prove_bit(
     blinding: Scalar,
     c_i: RistrettoPoint,
     g: RistrettoPoint,
-    h: RistrettoPoint,
     bit_index: usize,
     context_data: &[u8],
 ) -> Result<BitProof, ZkError> {
@@ -168,7 +179,7 @@ fn prove_bit(
         return Err(ZkError::RangeError("Bit must be 0 or 1".into()));
     }
 
-    let (e0, s0, e1, s1) = if bit == 0 {
+    let (r0, r1, e0, s0, e1, s1) = if bit == 0 {
         // Real branch: b=0, so C_i = 0*G + r_i*H = r_i*H
         // We know r_i such that C_i = r_i*H
 
@@ -176,11 +187,11 @@ fn prove_bit(
         let e1_sim = Scalar::random(&mut OsRng);
         let s1_sim = Scalar::random(&mut OsRng);
         // R1 = s1*H + e1*(C_i - G) [simulated transcript]
-        let r1_sim = s1_sim * h + e1_sim * (c_i - g);
+        let r1_sim = mul_h(&s1_sim) + e1_sim * (c_i - g);
 
         // Real branch 0: pick random k0
         let mut k0 = Scalar::random(&mut OsRng);
-        let r0_real = k0 * h;
+        let r0_real = mul_h(&k0);
 
         // Compute challenge e = H(transcript)
         let mut transcript = Transcript::new(DOMAIN_RANGE_OR_PROOF);
@@ -198,7 +209,7 @@ fn prove_bit(
 
         k0.zeroize();
 
-        (e0_real, s0_real, e1_sim, s1_sim)
+        (r0_real, r1_sim, e0_real, s0_real, e1_sim, s1_sim)
     } else {
         // Real branch: b=1, so C_i = 1*G + r_i*H = G + r_i*H
         // We know r_i such that C_i - G = r_i*H
@@ -207,11 +218,11 @@ fn prove_bit(
         let e0_sim = Scalar::random(&mut OsRng);
         let s0_sim = Scalar::random(&mut OsRng);
         // R0 = s0*H + e0*C_i [simulated transcript]
-        let r0_sim = s0_sim * h + e0_sim * c_i;
+        let r0_sim = mul_h(&s0_sim) + e0_sim * c_i;
 
         // Real branch 1: pick random k1
         let mut k1 = Scalar::random(&mut OsRng);
-        let r1_real = k1 * h;
+        let r1_real = mul_h(&k1);
 
         // Compute challenge e = H(transcript)
         let mut transcript = Transcript::new(DOMAIN_RANGE_OR_PROOF);
@@ -229,7 +240,7 @@ fn prove_bit(
 
         k1.zeroize();
 
-        (e0_sim, s0_sim, e1_real, s1_real)
+        (r0_sim, r1_real, e0_sim, s0_sim, e1_real, s1_real)
     };
 
     Ok(BitProof {
@@ -238,6 +249,8 @@ fn prove_bit(
         s0: hex::encode(s0.as_bytes()),
         e1: hex::encode(e1.as_bytes()),
         s1: hex::encode(s1.as_bytes()),
+        r0: commitment_to_hex(&r0),
+        r1: commitment_to_hex(&r1),
     })
 }
 
@@ -248,9 +261,135 @@ fn prove_bit(
 /// * `context_data` - The same context data used during proof generation
 ///
 /// # Verification Steps
-/// 1. For each bit proof: verify the Sigma OR-proof
-/// 2. Verify consistency: Σ(2^i * C_i) == C (value commitment)
+/// 1. For each bit proof: check the OR-proof challenge e0 + e1 == e
+/// 2. Check every bit's R0/R1 equations and the consistency equation
+///    Σ(2^i * C_i) == C together, as one multiscalar multiplication
 pub fn verify_range(proof: &RangeProof, context_data: &[u8]) -> Result<(), ZkError> {
+    let parsed = parse_range_proof(proof, context_data)?;
+    if equations_hold(std::slice::from_ref(&parsed)) {
+        Ok(())
+    } else {
+        Err(equations_failed())
+    }
+}
+
+/// Verify many range proofs with one combined multiscalar check.
+///
+/// # Arguments
+/// * `items` - Pairs of (proof, context data used during proof generation)
+///
+/// # Returns
+/// `Ok(())` if every proof is valid, otherwise the index and error of each
+/// failing proof in input order.
+pub fn verify_range_batch(items: &[(&RangeProof, &[u8])]) -> Result<(), Vec<(usize, ZkError)>> {
+    let mut failures = Vec::new();
+    let mut indices = Vec::with_capacity(items.len());
+    let mut parsed = Vec::with_capacity(items.len());
+    for (index, (proof, context_data)) in items.iter().enumerate() {
+        match parse_range_proof(proof, context_data) {
+            Ok(p) => {
+                indices.push(index);
+                parsed.push(p);
+            }
+            Err(e) => failures.push((index, e)),
+        }
+    }
+
+    if !equations_hold(&parsed) {
+        // Some proof's group equations fail; check them one by one to find it
+        for (index, p) in indices.iter().zip(&parsed) {
+            if !equations_hold(std::slice::from_ref(p)) {
+                failures.push((*index, equations_failed()));
+            }
+        }
+    }
+
+    if failures.is_empty() {
+        Ok(())
+    } else {
+        failures.sort_by_key(|(index, _)| *index);
+        Err(failures)
+    }
+}
+
+fn equations_failed() -> ZkError {
+    ZkError::VerificationFailed(
+        "Range proof equations failed: R0/R1 or Σ(2^i * C_i) = C does not hold".into(),
+    )
+}
+
+/// One bit OR-proof with its challenge checked and its points decompressed.
+struct ParsedBitProof {
+    commitment: RistrettoPoint,
+    r0: RistrettoPoint,
+    r1: RistrettoPoint,
+    e0: Scalar,
+    s0: Scalar,
+    e1: Scalar,
+    s1: Scalar,
+}
+
+/// A range proof whose structure, context hash and bit challenges have been
+/// checked; only its group equations remain.
+struct ParsedRangeProof {
+    value_commitment: RistrettoPoint,
+    bits: Vec<ParsedBitProof>,
+}
+
+/// Check every group equation of `proofs` with one multiscalar multiplication.
+///
+/// With w = z, z^2, ... for a random z, sums
+///   w * (s0*H + e0*C_i - R0) + w' * (s1*H + e1*C_i - e1*G - R1)
+/// for every bit, and w'' * (Σ 2^i * C_i - C) for every proof. G and H get a
+/// single accumulated coefficient each.
+fn equations_hold(proofs: &[ParsedRangeProof]) -> bool {
+    if proofs.is_empty() {
+        return true;
+    }
+    let term_count: usize = proofs.iter().map(|p| 3 * p.bits.len() + 1).sum::<usize>() + 2;
+    let mut scalars = Vec::with_capacity(term_count);
+    let mut points = Vec::with_capacity(term_count);
+
+    let z = Scalar::random(&mut OsRng);
+    let two = Scalar::from(2u64);
+    let mut weight = Scalar::ONE;
+    let mut g_coeff = Scalar::ZERO;
+    let mut h_coeff = Scalar::ZERO;
+    for proof in proofs {
+        weight *= z;
+        let w_sum = weight;
+        let mut w_sum_power_of_two = w_sum;
+        for bit in &proof.bits {
+            weight *= z;
+            let w0 = weight;
+            weight *= z;
+            let w1 = weight;
+
+            scalars.push(w0 * bit.e0 + w1 * bit.e1 + w_sum_power_of_two);
+            points.push(bit.commitment);
+            scalars.push(-w0);
+            points.push(bit.r0);
+            scalars.push(-w1);
+            points.push(bit.r1);
+            h_coeff += w0 * bit.s0 + w1 * bit.s1;
+            g_coeff -= w1 * bit.e1;
+
+            w_sum_power_of_two *= two;
+        }
+        scalars.push(-w_sum);
+        points.push(proof.value_commitment);
+    }
+    scalars.push(g_coeff);
+    points.push(generator_g());
+    scalars.push(h_coeff);
+    points.push(generator_h());
+
+    // Everything here is public, so variable-time arithmetic is safe
+    RistrettoPoint::vartime_multiscalar_mul(scalars, points).is_identity()
+}
+
+/// Check the structure, context hash and every bit challenge of a range proof.
+fn parse_range_proof(proof: &RangeProof, context_data: &[u8]) -> Result<ParsedRangeProof, ZkError> {
     if proof.num_bits == 0 || proof.num_bits > MAX_RANGE_BITS {
         return Err(ZkError::RangeError(format!(
             "Invalid num_bits: {}",
@@ -266,18 +405,15 @@ pub fn verify_range(proof: &RangeProof, context_data: &[u8]) -> Result<(), ZkErr
         )));
     }
 
-    let g = generator_g();
-    let h = generator_h();
-
     // Deserialize value commitment
-    let value_commitment = commitment_from_hex(&proof.value_commitment)?;
+    let (value_compressed, value_commitment) = deserialize_point(&proof.value_commitment)?;
 
     // Verify context hash
     let expected_context_hash = {
         let mut t = Transcript::new(DOMAIN_RANGE_PROOF);
         t.append(b"context", context_data);
         t.append(b"num_bits", &(proof.num_bits as u64).to_le_bytes());
-        t.append_point(b"value_commitment", &value_commitment.compress());
+        t.append_point(b"value_commitment", &value_compressed);
         hex::encode(&t.digest()[..32])
     };
     if proof.context_hash != expected_context_hash {
@@ -286,63 +422,42 @@ pub fn verify_range(proof: &RangeProof, context_data: &[u8]) -> Result<(), ZkErr
         ));
     }
 
-    // Verify each bit proof and accumulate bit commitments
-    let mut accumulated = RistrettoPoint::default(); // identity
-    let mut power_of_two = Scalar::ONE;
-    let two = Scalar::from(2u64);
-
-    for (i, bit_proof) in proof.bit_proofs.iter().enumerate() {
-        // Deserialize bit commitment C_i
-        let c_i = commitment_from_hex(&bit_proof.commitment)?;
-
-        // Verify the OR-proof for this bit
-        verify_bit_proof(bit_proof, c_i, g, h, i, context_data)?;
-
-        // Accumulate: sum += 2^i * C_i
-        accumulated += power_of_two * c_i;
-        power_of_two *= two;
-    }
-
-    // Verify consistency: Σ(2^i * C_i) == value_commitment
-    if accumulated != value_commitment {
-        return Err(ZkError::VerificationFailed(
-            "Range proof consistency check failed: Σ(2^i * C_i) ≠ C".into(),
-        ));
-    }
+    let bits = proof
+        .bit_proofs
+        .iter()
+        .enumerate()
+        .map(|(i, bit_proof)| parse_bit_proof(bit_proof, i, context_data))
+        .collect::<Result<Vec<_>, _>>()?;
 
-    Ok(())
+    Ok(ParsedRangeProof {
+        value_commitment,
+        bits,
+    })
 }
 
-/// Verify a single bit OR-proof.
+/// Check a single bit OR-proof's challenge: e0 + e1 == H(C_i || R0 || R1).
 ///
-/// Checks that the committed value is either 0 or 1 using the CDS technique.
-fn verify_bit_proof(
+/// The group equations for R0 and R1 are left to `equations_hold`.
+fn parse_bit_proof(
     proof: &BitProof,
-    c_i: RistrettoPoint,
-    g: RistrettoPoint,
-    h: RistrettoPoint,
     bit_index: usize,
     context_data: &[u8],
-) -> Result<(), ZkError> {
-    // Deserialize scalars
+) -> Result<ParsedBitProof, ZkError> {
+    let (c_i_compressed, commitment) = deserialize_point(&proof.commitment)?;
+    let (r0_compressed, r0) = deserialize_point(&proof.r0)?;
+    let (r1_compressed, r1) = deserialize_point(&proof.r1)?;
     let e0 = deserialize_scalar(&proof.e0, "e0")?;
     let s0 = deserialize_scalar(&proof.s0, "s0")?;
     let e1 = deserialize_scalar(&proof.e1, "e1")?;
     let s1 = deserialize_scalar(&proof.s1, "s1")?;
 
-    // Recompute R0 = s0*H + e0*C_i
-    let r0 = s0 * h + e0 * c_i;
-
-    // Recompute R1 = s1*H + e1*(C_i - G)
-    let r1 = s1 * h + e1 * (c_i - g);
-
     // Recompute challenge
     let mut transcript = Transcript::new(DOMAIN_RANGE_OR_PROOF);
     transcript.append(b"context", context_data);
     transcript.append(b"bit_index", &(bit_index as u64).to_le_bytes());
-    transcript.append_point(b"C_i", &c_i.compress());
-    transcript.append_point(b"R0", &r0.compress());
-    transcript.append_point(b"R1", &r1.compress());
+    transcript.append_point(b"C_i", &c_i_compressed);
+    transcript.append_point(b"R0", &r0_compressed);
+    transcript.append_point(b"R1", &r1_compressed);
     let e = transcript.challenge_scalar(b"bit_challenge");
 
     // Check: e0 + e1 == e
@@ -353,7 +468,27 @@ fn verify_bit_proof(
         )));
     }
 
-    Ok(())
+    Ok(ParsedBitProof {
+        commitment,
+        r0,
+        r1,
+        e0,
+        s0,
+        e1,
+        s1,
+    })
+}
+
+/// Helper to deserialize a point from hex, keeping its compressed form.
+fn deserialize_point(hex_str: &str) -> Result<(CompressedRistretto, RistrettoPoint), ZkError> {
+    let bytes = hex::decode(hex_str)?;
+    let compressed = CompressedRistretto::from_slice(&bytes).map_err(|_| {
+        ZkError::InvalidCommitment(format!("Expected 32 bytes, got {}", bytes.len()))
+    })?;
+    let point = compressed
+        .decompress()
+        .ok_or_else(|| ZkError::InvalidCommitment("Point decompression failed".into()))?;
+    Ok((compressed, point))
 }
 
 /// Helper to deserialize a scalar from hex.
@@ -437,6 +572,84 @@ mod tests {
         assert!(result.is_err(), "Tampered bit proof must fail");
     }
 
+    #[test]
+    fn test_range_proof_tampered_response() {
+        // s0/s1 are not hashed; only the folded group equations catch them
+        let (mut proof, _) = prove_range(42, 8, b"test").unwrap();
+        let mut bytes = hex::decode(&proof.bit_proofs[3].s1).unwrap();
+        bytes[0] ^= 0x01;
+        proof.bit_proofs[3].s1 = hex::encode(&bytes);
+
+        assert!(verify_range(&proof, b"test").is_err());
+    }
+
+    #[test]
+    fn test_range_proof_swapped_announcements() {
+        let (mut proof, _) = prove_range(42, 8, b"test").unwrap();
+        let bp = &mut proof.bit_proofs[0];
+        std::mem::swap(&mut bp.r0, &mut bp.r1);
+        assert!(verify_range(&proof, b"test").is_err());
+
+        // Proofs without R0/R1 are rejected rather than recomputed
+        let (mut legacy, _) = prove_range(42, 8, b"test").unwrap();
+        legacy.bit_proofs[0].r0.clear();
+        assert!(verify_range(&legacy, b"test").is_err());
+    }
+
+    #[test]
+    fn test_batch_verification_accepts_valid_proofs() {
+        let proofs: Vec<RangeProof> = (0..5u64)
+            .map(|v| prove_range(v * 1000, 16, b"batch").unwrap().0)
+            .collect();
+        let items: Vec<(&RangeProof, &[u8])> = proofs.iter().map(|p| (p, &b"batch"[..])).collect();
+        assert!(verify_range_batch(&items).is_ok());
+        assert!(verify_range_batch(&[]).is_ok());
+    }
+
+    #[test]
+    fn test_batch_verification_reports_failing_proofs() {
+        let mut proofs: Vec<RangeProof> = (0..4u64)
+            .map(|v| prove_range(v, 8, b"batch").unwrap().0)
+            .collect();
+        // Break consistency of proof 1 by swapping in another proof's commitment
+        proofs[1].value_commitment = proofs[2].value_commitment.clone();
+        let mut items: Vec<(&RangeProof, &[u8])> =
+            proofs.iter().map(|p| (p, &b"batch"[..])).collect();
+        // Proof 3 is checked against the wrong context
+        items[3].1 = b"other";
+
+        let failures = verify_range_batch(&items).unwrap_err();
+        let indices: Vec<usize> = failures.iter().map(|(i, _)| *i).collect();
+        assert_eq!(indices, vec![1, 3]);
+    }
+
+    #[test]
+    fn test_batch_verification_finds_inconsistent_proof() {
+        let (a, _) = prove_range(5, 8, b"batch").unwrap();
+        let (mut b, _) = prove_range(6, 8, b"batch").unwrap();
+        // Replace one bit proof with a valid bit proof from another proof at the
+        // same index: the OR-proof still verifies, but Σ(2^i * C_i) ≠ C
+        b.bit_proofs[0] = a.bit_proofs[0].clone();
+        let failures = verify_range_batch(&[(&a, b"batch"), (&b, b"batch")]).unwrap_err();
+        assert_eq!(failures.len(), 1);
+        assert_eq!(failures[0].0, 1);
+    }
+
+    #[test]
+    fn test_batch_verification_finds_bad_response() {
+        let mut proofs: Vec<RangeProof> = (0..3u64)
+            .map(|v| prove_range(v + 7, 8, b"batch").unwrap().0)
+            .collect();
+        let mut bytes = hex::decode(&proofs[2].bit_proofs[5].s0).unwrap();
+        bytes[31] ^= 0x01;
+        proofs[2].bit_proofs[5].s0 = hex::encode(&bytes);
+        let items: Vec<(&RangeProof, &[u8])> = proofs.iter().map(|p| (p, &b"batch"[..])).collect();
+
+        let failures = verify_range_batch(&items).unwrap_err();
+        let indices: Vec<usize> = failures.iter().map(|(i, _)| *i).collect();
+        assert_eq!(indices, vec![2]);
+    }
+
     #[test]
     fn test_range_proof_64bit() {
         // Full 64-bit range proof
@@ -81,7 +81,8 @@ pub struct TransactionContext {
 ///   1. Prover picks random k, computes R = k*G
 ///   2. c = H(domain || X || R || context)
 ///   3. s = k + c*x
-///   Verifier checks: s*G == R + c*X
+///
+/// Verifier checks: s*G == R + c*X
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct OwnershipProof {
     /// Public key being proven (compressed Ristretto, hex)
@@ -112,6 +113,13 @@ pub struct BitProof {
     pub e1: String,
     /// Response for branch 1: s1 (scalar, hex)
     pub s1: String,
+    /// Branch 0 announcement R0 (compressed Ristretto, hex); empty in
+    /// proofs from before it was carried, which no longer verify
+    #[serde(default)]
+    pub r0: String,
+    /// Branch 1 announcement R1 (compressed Ristretto, hex)
+    #[serde(default)]
+    pub r1: String,
 }
 
 /// A range proof proving that a committed value lies in [0, 2^n).
@@ -129,6 +137,74 @@ pub struct RangeProof {
     pub context_hash: String,
 }
 
+/// An aggregated range proof proving that a committed value lies in [0, 2^n).
+///
+/// Bulletproofs-style: the bits are committed to as vectors and the range
+/// statement is reduced to one inner-product argument, so the proof holds
+/// 2*log2(n) + 4 points and 5 scalars regardless of how the bits are set.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct AggregatedRangeProof {
+    /// Pedersen commitment to the value: V = v*G + γ*H (compressed Ristretto, hex)
+    pub value_commitment: String,
+    /// Number of bits in the range proof (a power of two)
+    pub num_bits: usize,
+    /// Commitment A to the bit vectors (compressed Ristretto, hex)
+    pub commitment_a: String,
+    /// Commitment S to the blinding vectors (compressed Ristretto, hex)
+    pub commitment_s: String,
+    /// Commitment T1 to the t(X) linear coefficient (compressed Ristretto, hex)
+    pub commitment_t1: String,
+    /// Commitment T2 to the t(X) quadratic coefficient (compressed Ristretto, hex)
+    pub commitment_t2: String,
+    /// Blinding of t(x) (scalar, hex)
+    pub tau_x: String,
+    /// Blinding of A + x*S (scalar, hex)
+    pub mu: String,
+    /// t(x) = <l(x), r(x)> (scalar, hex)
+    pub t_hat: String,
+    /// Inner-product argument L points, one per round (compressed Ristretto, hex)
+    pub ipa_l: Vec<String>,
+    /// Inner-product argument R points, one per round (compressed Ristretto, hex)
+    pub ipa_r: Vec<String>,
+    /// Final folded left scalar (hex)
+    pub ipa_a: String,
+    /// Final folded right scalar (hex)
+    pub ipa_b: String,
+    /// Context hash included in proof generation (hex)
+    pub context_hash: String,
+}
+
+/// The range proof carried by a proof bundle.
+///
+/// Which variant an envelope may carry is fixed by its `version`
+/// (see `envelope::range_proof_matches_version`).
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum RangeProofKind {
+    /// Logarithmic-size aggregated proof (envelope version 1.1.0)
+    Aggregated(Box<AggregatedRangeProof>),
+    /// Per-bit OR-proofs (envelope version 1.0.0)
+    BitDecomposition(RangeProof),
+}
+
+impl RangeProofKind {
+    /// Context hash of the underlying proof
+    pub fn context_hash(&self) -> &str {
+        match self {
+            RangeProofKind::Aggregated(p) => &p.context_hash,
+            RangeProofKind::BitDecomposition(p) => &p.context_hash,
+        }
+    }
+
+    /// Number of bits the value is proven to fit in
+    pub fn num_bits(&self) -> usize {
+        match self {
+            RangeProofKind::Aggregated(p) => p.num_bits,
+            RangeProofKind::BitDecomposition(p) => p.num_bits,
+        }
+    }
+}
+
 /// A policy compliance proof.
 ///
 /// Proves that the transaction satisfies a policy constraint
@@ -157,7 +233,7 @@ pub struct ProofBundle {
     pub ownership_proof: OwnershipProof,
     /// Range proof for the transfer amount (optional — not all private txs need range proofs)
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub range_proof: Option<RangeProof>,
+    pub range_proof: Option<RangeProofKind>,
     /// Policy compliance proofs
     pub policy_proofs: Vec<PolicyProof>,
     /// Binding hash tying all proofs to the transaction (hex)
@@ -236,13 +312,21 @@ impl std::fmt::Display for SigningSummary {
         writeln!(f, "╔══════════════════════════════════════════════════╗")?;
         writeln!(f, "║           TRANSACTION SIGNING SUMMARY            ║")?;
         writeln!(f, "╠══════════════════════════════════════════════════╣")?;
-        writeln!(f, "║ Destination: {}",  &self.destination)?;
+        writeln!(f, "║ Destination: {}", &self.destination)?;
         writeln!(f, "║ Amount:      {:.9} SOL", self.amount_sol)?;
         writeln!(f, "║ Fee:         {:.9} SOL", self.fee_sol)?;
         writeln!(f, "║ Mode:        {}", self.mode.as_str().to_uppercase())?;
         if self.mode.requires_proofs() {
-            let status = if self.proof_verified { "✓ PASSED" } else { "✗ FAILED" };
-            writeln!(f, "║ Proofs:      {} ({} verified)", status, self.proofs_verified_count)?;
+            let status = if self.proof_verified {
+                "✓ PASSED"
+            } else {
+                "✗ FAILED"
+            };
+            writeln!(
+                f,
+                "║ Proofs:      {} ({} verified)",
+                status, self.proofs_verified_count
+            )?;
         }
         for warning in &self.warnings {
             writeln!(f, "║ ⚠ WARNING:   {}", warning)?;
@@ -24,11 +24,17 @@ ACTIVE_CHAIN = "solana"  # "solana" | "base"
 # ── Solana ──────────────────────────────────────────────────
 SOLANA_RPC_URL = os.environ.get("SOLANA_RPC_URL", "https://api.devnet.solana.com")
 SOLANA_MAINNET_RPC_URL = os.environ.get("SOLANA_MAINNET_RPC_URL", "https://api.mainnet-beta.solana.com")
+# Comma-separated endpoint pool; reads go to the fastest healthy node, writes to several
+SOLANA_RPC_URLS = [u.strip() for u in os.environ.get("SOLANA_RPC_URLS", SOLANA_RPC_URL).split(",") if u.strip()]
 LAMPORTS_PER_SOL = 1_000_000_000
 
 # ── Base (Coinbase L2) ─────────────────────────────────────
 BASE_RPC_URL = os.environ.get("BASE_RPC_URL", "https://mainnet.base.org")
 BASE_TESTNET_RPC_URL = os.environ.get("BASE_TESTNET_RPC_URL", "https://sepolia.base.org")
+BASE_RPC_URLS = [u.strip() for u in os.environ.get("BASE_RPC_URLS", BASE_RPC_URL).split(",") if u.strip()]
+BASE_TESTNET_RPC_URLS = [
+    u.strip() for u in os.environ.get("BASE_TESTNET_RPC_URLS", BASE_TESTNET_RPC_URL).split(",") if u.strip()
+]
 BASE_CHAIN_ID = 8453
 BASE_TESTNET_CHAIN_ID = 84532
 WEI_PER_ETH = 10**18
@@ -47,6 +53,16 @@ INFRASTRUCTURE_FEE_WALLET_BASE = os.environ.get(
 WALLET_DIR = "/wallet"
 INBOX_DIR = "/inbox"
 OUTBOX_DIR = "/outbox"
+# Local transaction-history ledgers (online machine only)
+HISTORY_DIR = os.environ.get("COLDSTAR_HISTORY_DIR", os.path.expanduser("~/.coldstar/history"))
+# Addresses of the wallet's address lookup tables (online machine only)
+LOOKUP_TABLE_REGISTRY = os.environ.get(
+    "COLDSTAR_LOOKUP_TABLES", os.path.expanduser("~/.coldstar/lookup_tables.json")
+)
+# Nonce accounts held by unsigned bundles not broadcast yet (online machine only)
+NONCE_RESERVATIONS = os.environ.get(
+    "COLDSTAR_NONCE_RESERVATIONS", os.path.expanduser("~/.coldstar/nonce_reservations.json")
+)
 
 # ── USB / ISO ───────────────────────────────────────────────
 ALPINE_MINIROOTFS_URL = "https://dl-cdn.alpinelinux.org/alpine/v3.19/releases/x86_64/alpine-minirootfs-3.19.1-x86_64.tar.gz"
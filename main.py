@@ -24,7 +24,7 @@ from typing import Optional
 
 from rich.console import Console
 
-from config import APP_NAME, APP_VERSION, SOLANA_RPC_URL, sanitize_error
+from config import APP_NAME, APP_VERSION, LAMPORTS_PER_SOL, SOLANA_RPC_URL, sanitize_error
 
 
 def _validate_file_path(path: str) -> str:
@@ -43,6 +43,8 @@ from src.ui import (
 from src.wallet import WalletManager, create_wallet_structure
 from src.usb import USBManager
 from src.network import SolanaNetwork
+from src.blockhash_cache import get_blockhash_provider
+from src.priority_fees import get_fee_oracle
 from src.transaction import TransactionManager
 from src.iso_builder import ISOBuilder
 from src.backup import WalletBackup
@@ -57,10 +59,17 @@ class SolanaColdWalletCLI:
         self.wallet_manager = WalletManager()
         self.usb_manager = USBManager()
         self.network = SolanaNetwork()
-        self.transaction_manager = TransactionManager()
+        self.blockhash_provider = get_blockhash_provider(pool=self.network.pool)
+        self.transaction_manager = TransactionManager(
+            blockhash_provider=self.blockhash_provider,
+            fee_oracle=get_fee_oracle(pool=self.network.pool)
+        )
         self.iso_builder = ISOBuilder()
         self.backup_manager = WalletBackup()
-        self.jupiter_manager = JupiterSwapManager(slippage_bps=50)  # 0.5% slippage
+        self.jupiter_manager = JupiterSwapManager(
+            slippage_bps=50,  # 0.5% slippage
+            blockhash_provider=self.blockhash_provider
+        )
         self.pyth_client = PythPriceClient()
         self.fairscore_client = FairScoreClient()
         self.sdp_handler = SdpMenuHandler()
@@ -327,8 +336,12 @@ class SolanaColdWalletCLI:
             "1. View Wallet / Balance",
             "2. Send SOL (Create Unsigned Transaction)",
             "3. Sign Transaction (Offline)",
+            "B. Sign All in Inbox (Bulk Session)",
             "4. Broadcast Signed Transaction",
             "5. Quick Send (Create+Sign+Broadcast - INSECURE)",
+            "P. Batch Payout (CSV/JSONL -> Unsigned Bundle)",
+            "N. Durable Nonce Accounts",
+            "L. Address Lookup Tables",
             "6. View Transaction History",
             "7. Backup / Restore Wallet",
             "8. Request Devnet Airdrop",
@@ -359,6 +372,10 @@ class SolanaColdWalletCLI:
             self._draw_header()
             self.sign_transaction()
             self._wait_for_key()
+        elif choice_num.upper() == "B":
+            self._draw_header()
+            self.sign_all_in_inbox()
+            self._wait_for_key()
         elif choice_num == "4":
             self._draw_header()
             self.broadcast_transaction()
@@ -367,6 +384,18 @@ class SolanaColdWalletCLI:
             self._draw_header()
             self.quick_send_transaction()
             self._wait_for_key()
+        elif choice_num.upper() == "P":
+            self._draw_header()
+            self.create_batch_payout()
+            self._wait_for_key()
+        elif choice_num.upper() == "N":
+            self._draw_header()
+            self.manage_nonce_accounts()
+            self._wait_for_key()
+        elif choice_num.upper() == "L":
+            self._draw_header()
+            self.manage_lookup_tables()
+            self._wait_for_key()
         elif choice_num == "6":
             self._draw_header()
             self.view_transaction_history()
@@ -599,17 +628,19 @@ class SolanaColdWalletCLI:
             print_info("Transaction cancelled")
             return
         
-        # Get fresh blockhash
-        blockhash_result = self.network.get_latest_blockhash()
+        # Get fresh blockhash (served from the prefetch cache when possible)
+        blockhash_result = self.blockhash_provider.get_blockhash()
         if not blockhash_result:
             print_error("Failed to get blockhash from network")
             return
         
         blockhash, _ = blockhash_result
         
+        priority = self._select_priority_fee()
+        
         # Create transaction
         tx_bytes = self.transaction_manager.create_transfer_transaction(
-            from_address, to_address, amount, blockhash
+            from_address, to_address, amount, blockhash, priority=priority
         )
         
         if not tx_bytes:
@@ -725,15 +756,17 @@ class SolanaColdWalletCLI:
             print_info("Transaction cancelled")
             return
         
-        blockhash_result = self.network.get_latest_blockhash()
+        blockhash_result = self.blockhash_provider.get_blockhash()
         if not blockhash_result:
             print_error("Failed to get blockhash from network")
             return
         
         blockhash, _ = blockhash_result
         
+        priority = self._select_priority_fee()
+        
         tx_bytes = self.transaction_manager.create_transfer_transaction(
-            from_address, to_address, amount, blockhash
+            from_address, to_address, amount, blockhash, priority=priority
         )
         
         if tx_bytes:
@@ -750,6 +783,8 @@ class SolanaColdWalletCLI:
             output_path = output_dir / filename
             
             if self.transaction_manager.save_unsigned_transaction(tx_bytes, str(output_path)):
+                from src.preflight import run_preflight
+                run_preflight(str(output_path))
                 console.print()
                 print_success("Unsigned transaction created!")
                 print_info(f"File: {output_path}")
@@ -759,6 +794,262 @@ class SolanaColdWalletCLI:
                 else:
                     print_info("Copy this file to your cold wallet's /inbox directory for signing")
     
+    def create_batch_payout(self):
+        """Build a CSV/JSONL payout run into one bundle of unsigned transactions"""
+        print_section_header("BATCH PAYOUT")
+
+        if not self.current_public_key:
+            print_error("No wallet connected. Mount a USB with a cold wallet first.")
+            return
+
+        print_info("Payout file format:")
+        print_info("  CSV:   recipient,amount   (amount in SOL, header optional)")
+        print_info('  JSONL: {"recipient": "...", "amount": "0.5"}')
+        console.print()
+
+        rows_path = get_text_input("Path to payout file (.csv / .jsonl): ")
+        try:
+            rows_path = _validate_file_path(rows_path)
+        except ValueError as e:
+            print_error(str(e))
+            return
+        if not Path(rows_path).is_file():
+            print_error(f"File not found: {rows_path}")
+            return
+
+        mode = select_menu_option(
+            [
+                "Recent blockhash (sign and broadcast within ~60 seconds)",
+                "Durable nonces (no expiry - one nonce account per transaction)",
+            ],
+            "Transaction lifetime:"
+        )
+        if not mode:
+            return
+        nonce_accounts = None
+        if mode.startswith("Durable"):
+            from src.durable_nonce import NonceReservations, get_nonce_accounts
+            found = get_nonce_accounts(self.current_public_key)
+            if found is None:
+                return
+            nonce_accounts, reserved = NonceReservations().split(self.current_public_key, found[0])
+            if reserved:
+                print_warning(f"{len(reserved)} nonce account(s) are held by bundles not broadcast yet - skipped")
+            if not nonce_accounts:
+                print_error("No free nonce accounts - create more under 'Durable Nonce Accounts' "
+                            "or broadcast pending bundles first")
+                return
+            print_info(f"{len(nonce_accounts)} nonce account(s) available")
+
+        from src.lookup_tables import get_lookup_table_cache
+        lookup_tables = None
+        tables = get_lookup_table_cache(pool=self.network.pool).tables_for(self.current_public_key)
+        if tables:
+            tx_format = select_menu_option(
+                [
+                    f"Versioned (v0) - dense, using {len(tables)} lookup table(s)",
+                    "Legacy",
+                ],
+                "Transaction format:"
+            )
+            if not tx_format:
+                return
+            if tx_format.startswith("Versioned"):
+                lookup_tables = tables
+
+        if not confirm_dangerous_action("Build unsigned payout bundle?", "CREATE"):
+            print_info("Batch payout cancelled")
+            return
+
+        if self.usb_manager.mount_point:
+            output_dir = Path(self.usb_manager.mount_point) / "inbox"
+        else:
+            output_dir = Path("./transactions")
+        output_dir.mkdir(exist_ok=True)
+
+        import time
+        from src.batch_builder import read_payout_rows
+        output_path = output_dir / f"unsigned_bundle_{int(time.time())}.jsonl"
+
+        summary = self.transaction_manager.create_batch_transfer_transactions(
+            self.current_public_key,
+            read_payout_rows(rows_path),
+            str(output_path),
+            nonce_accounts=nonce_accounts,
+            lookup_tables=lookup_tables
+        )
+
+        if summary and summary.transactions:
+            from src.preflight import run_preflight
+            print_info("Simulating bundle before signing...")
+            run_preflight(str(output_path))
+            console.print()
+            if self.usb_manager.mount_point:
+                print_info("Bundle saved to USB inbox.")
+                print_info("Boot the USB on an air-gapped computer to sign.")
+            else:
+                print_info("Copy this bundle to your cold wallet's /inbox directory for signing")
+    
+    def manage_nonce_accounts(self):
+        """List the wallet's durable nonce accounts and build unsigned creations"""
+        print_section_header("DURABLE NONCE ACCOUNTS")
+
+        if not self.current_public_key:
+            print_error("No wallet connected. Mount a USB with a cold wallet first.")
+            return
+
+        from src.durable_nonce import NONCE_ACCOUNT_SIZE, get_nonce_accounts, pack_create_nonce_transactions
+        from src.batch_builder import write_unsigned_bundle
+
+        print_info("Transactions built on a durable nonce do not expire, so a batch")
+        print_info("can be signed offline and broadcast hours later.")
+        console.print()
+
+        found = get_nonce_accounts(self.current_public_key)
+        if found is None:
+            return
+        nonce_accounts, free_indexes = found
+
+        if nonce_accounts:
+            from rich.table import Table
+            table = Table(title="Nonce Accounts", show_header=True, header_style="bold cyan")
+            table.add_column("Address", style="white")
+            table.add_column("Nonce", style="dim")
+            for nonce in nonce_accounts:
+                table.add_row(nonce.address, nonce.nonce)
+            console.print(table)
+        else:
+            print_info("No nonce accounts yet")
+        console.print()
+
+        count = int(get_float_input("Nonce accounts to create (0 to skip): ", 0))
+        if count <= 0:
+            return
+        if count > len(free_indexes):
+            print_error(f"At most {len(free_indexes)} more nonce account(s) can be created")
+            return
+
+        rent = self.network.get_minimum_balance_for_rent_exemption(NONCE_ACCOUNT_SIZE)
+        blockhash = self.blockhash_provider.get_blockhash()
+        if rent is None or not blockhash:
+            print_error("Failed to get rent exemption or blockhash from network")
+            return
+        print_info(f"Rent deposit: {rent * count / LAMPORTS_PER_SOL:.9f} SOL "
+                   f"({rent / LAMPORTS_PER_SOL:.9f} SOL each, refundable)")
+
+        if not confirm_dangerous_action(f"Build unsigned creation of {count} nonce account(s)?", "CREATE"):
+            print_info("Cancelled")
+            return
+
+        if self.usb_manager.mount_point:
+            output_dir = Path(self.usb_manager.mount_point) / "inbox"
+        else:
+            output_dir = Path("./transactions")
+        output_dir.mkdir(exist_ok=True)
+
+        import time
+        output_path = output_dir / f"unsigned_bundle_nonces_{int(time.time())}.jsonl"
+        try:
+            packed = pack_create_nonce_transactions(
+                self.current_public_key, free_indexes[:count], rent, blockhash[0]
+            )
+            summary = write_unsigned_bundle(str(output_path), self.current_public_key, blockhash[0], packed)
+        except Exception as e:
+            print_error(f"Failed to build nonce accounts: {sanitize_error(e)}")
+            return
+
+        print_success(f"Built {summary.transactions} unsigned transaction(s) creating {count} nonce account(s)")
+        print_info(f"Bundle: {output_path}")
+        print_info("Sign and broadcast it promptly - creation itself uses a recent blockhash.")
+    
+    def manage_lookup_tables(self):
+        """List the wallet's address lookup tables and build unsigned creations/extensions"""
+        print_section_header("ADDRESS LOOKUP TABLES")
+
+        if not self.current_public_key:
+            print_error("No wallet connected. Mount a USB with a cold wallet first.")
+            return
+
+        from config import INFRASTRUCTURE_FEE_WALLET
+        from src.batch_builder import read_payout_rows, validate_rows, write_unsigned_bundle
+        from src.lookup_tables import get_lookup_table_cache, plan_lookup_tables, recent_block_slots
+
+        print_info("Lookup tables let batch payouts reference recipients by a one-byte")
+        print_info("index (v0 transactions), fitting far more transfers per transaction.")
+        console.print()
+
+        cache = get_lookup_table_cache(pool=self.network.pool)
+        tables = cache.tables_for(self.current_public_key, refresh=True)
+        if tables:
+            from rich.table import Table
+            table_view = Table(title="Lookup Tables", show_header=True, header_style="bold cyan")
+            table_view.add_column("Address", style="white")
+            table_view.add_column("Addresses", justify="right")
+            for table in tables:
+                table_view.add_row(table.address, str(len(table.addresses)))
+            console.print(table_view)
+        else:
+            print_info("No lookup tables yet")
+        console.print()
+
+        rows_path = get_text_input("Payout file whose recipients to add (blank to skip): ")
+        if not rows_path:
+            return
+        try:
+            rows_path = _validate_file_path(rows_path)
+        except ValueError as e:
+            print_error(str(e))
+            return
+        if not Path(rows_path).is_file():
+            print_error(f"File not found: {rows_path}")
+            return
+
+        slots = recent_block_slots(self.network)
+        blockhash = self.blockhash_provider.get_blockhash()
+        if not slots or not blockhash:
+            print_error("Failed to get recent block slots or blockhash from network")
+            return
+
+        try:
+            recipients = [row.recipient for row in validate_rows(read_payout_rows(rows_path))]
+            plan = plan_lookup_tables(
+                self.current_public_key, recipients + [INFRASTRUCTURE_FEE_WALLET],
+                slots, blockhash[0], existing=tables
+            )
+        except Exception as e:
+            print_error(f"Failed to plan lookup tables: {sanitize_error(e)}")
+            return
+        if not plan.added:
+            print_success("Every recipient is already in a lookup table")
+            return
+
+        print_info(f"{plan.added} address(es) to add: {len(plan.new_tables)} new table(s), "
+                   f"{len(plan.create) + len(plan.extend)} transaction(s)")
+        if not confirm_dangerous_action("Build unsigned lookup table transactions?", "CREATE"):
+            print_info("Cancelled")
+            return
+
+        if self.usb_manager.mount_point:
+            output_dir = Path(self.usb_manager.mount_point) / "inbox"
+        else:
+            output_dir = Path("./transactions")
+        output_dir.mkdir(exist_ok=True)
+
+        import time
+        stamp = int(time.time())
+        for name, packed in (("create", plan.create), ("extend", plan.extend)):
+            if not packed:
+                continue
+            output_path = output_dir / f"unsigned_bundle_alt_{name}_{stamp}.jsonl"
+            write_unsigned_bundle(str(output_path), self.current_public_key, blockhash[0], packed)
+            print_success(f"Bundle: {output_path} ({len(packed)} transaction(s))")
+        # Registered once the creation is seen on chain
+        cache.remember_pending(self.current_public_key, plan.creation_slots)
+
+        if plan.create and plan.extend:
+            print_warning("Broadcast the 'alt_create' bundle first - extensions need the new tables to exist.")
+        print_info("Tables are usable for v0 payouts one slot after they land.")
+    
     def sign_transaction(self):
         print_section_header("SIGN TRANSACTION")
         
@@ -852,6 +1143,150 @@ class SolanaColdWalletCLI:
                     tx_path.unlink()
                     print_success("Unsigned transaction removed from inbox.")
     
+    def sign_all_in_inbox(self):
+        """Sign every unsigned transaction and bundle in the inbox with one key derivation"""
+        print_section_header("SIGN ALL IN INBOX")
+
+        if not self.usb_manager.mount_point:
+            print_error("No USB mounted. Mount your cold wallet USB first.")
+            return
+
+        inbox_dir = Path(self.usb_manager.mount_point) / "inbox"
+        outbox_dir = Path(self.usb_manager.mount_point) / "outbox"
+        outbox_dir.mkdir(exist_ok=True)
+
+        from src.batch_builder import read_bundle_header, write_signed_bundle
+        from src.preflight import known_failing
+        from src.wire_inspector import InboxSummary, iter_inbox
+
+        # Stream the inbox once: each transaction is decoded for review and its
+        # bytes kept for signing, so the key is only derived once afterwards
+        singles = []
+        bundle_entries = {}
+        partial = set()  # bundles with entries skipped (failed preflight or undecodable)
+        skipped = {}
+        review = InboxSummary()
+        for item in iter_inbox(str(inbox_dir)):
+            if item.inspected is None or known_failing(item.record):
+                if item.index is None and item.inspected is None:
+                    print_warning(f"Skipping {item.label}: {item.error}")
+                    partial.add(item.path)
+                elif item.index is None:
+                    print_warning(f"Skipping {item.path.name}: fails in preflight simulation "
+                                  f"({item.record['simulation'].get('err')})")
+                else:
+                    skipped[item.path] = skipped.get(item.path, 0) + 1
+                    partial.add(item.path)
+                continue
+            review.add(item)
+            if item.index is None:
+                singles.append((item.path, item.tx_bytes))
+            else:
+                item.record["tx_bytes"] = item.tx_bytes
+                bundle_entries.setdefault(item.path, []).append(item.record)
+        for path, count in skipped.items():
+            print_warning(f"{path.name}: skipping {count} transaction(s) that fail in "
+                          f"preflight simulation or cannot be decoded")
+
+        bundles = []
+        for path, entries in bundle_entries.items():
+            try:
+                bundles.append((path, read_bundle_header(str(path)), entries))
+            except Exception as e:
+                print_warning(f"Skipping {path.name}: {sanitize_error(e)}")
+
+        total = len(singles) + sum(len(entries) for _, _, entries in bundles)
+        if total == 0:
+            print_warning("No unsigned transactions found in USB inbox.")
+            return
+
+        print_success(f"Found {len(singles)} transaction file(s) and {len(bundles)} bundle(s): "
+                      f"{total} transaction(s) to sign")
+        console.print()
+        self._print_inbox_review(review)
+        console.print()
+        print_warning("⚠️  SECURITY NOTICE ⚠️")
+        print_warning("For maximum security, transactions should be signed on an AIR-GAPPED device.")
+        if not confirm_dangerous_action(f"Sign all {total} transaction(s)?", "SIGN"):
+            print_info("Bulk signing cancelled")
+            return
+
+        keypair_path = Path(self.usb_manager.mount_point) / "wallet" / "keypair.json"
+        if not keypair_path.exists():
+            print_error("Keypair not found on USB")
+            return
+
+        container = self._load_container_with_migration(str(keypair_path))
+        if not container:
+            return
+
+        password = get_password_input("Enter wallet password to sign all transactions:")
+        if not password:
+            print_error("Password required for encrypted wallet")
+            return
+
+        unsigned = [tx for _, tx in singles]
+        for _, _, entries in bundles:
+            unsigned.extend(entry["tx_bytes"] for entry in entries)
+
+        signed = self.transaction_manager.sign_transactions_secure(unsigned, container, password)
+        if not any(signed):
+            return
+
+        completed = []
+        cursor = 0
+        for path, _ in singles:
+            signed_tx = signed[cursor]
+            cursor += 1
+            if signed_tx and self.transaction_manager.save_signed_transaction(
+                    signed_tx, str(outbox_dir / path.name.replace("unsigned_", "signed_", 1))):
+                completed.append(path)
+
+        for path, header, entries in bundles:
+            results = signed[cursor:cursor + len(entries)]
+            cursor += len(entries)
+            signed_entries = []
+            for entry, signed_tx in zip(entries, results):
+                if signed_tx:
+                    entry["tx_bytes"] = signed_tx
+                    signed_entries.append(entry)
+            if not signed_entries:
+                continue
+            output_path = outbox_dir / path.name.replace("unsigned_", "signed_", 1)
+            written = write_signed_bundle(str(output_path), header, signed_entries)
+            print_success(f"Signed bundle saved to: {output_path} ({written}/{len(entries)} transactions)")
+            if written == len(entries) and path not in partial:
+                completed.append(path)
+
+        console.print()
+        print_success(f"{sum(1 for tx in signed if tx)} of {total} transaction(s) signed and saved to outbox")
+
+        if completed:
+            delete_choice = select_menu_option(
+                ["Yes", "No"],
+                f"Delete the {len(completed)} fully signed file(s) from inbox?"
+            )
+            if delete_choice and "Yes" in delete_choice:
+                for path in completed:
+                    path.unlink()
+                print_success("Signed inputs removed from inbox.")
+
+    def _print_inbox_review(self, review):
+        """Show what the transactions about to be signed actually move"""
+        print_info(f"SOL out: {review.lamports_out / LAMPORTS_PER_SOL:.9f} SOL "
+                   f"to {len(review.destinations)} address(es)")
+        largest = sorted(review.destinations.items(), key=lambda kv: kv[1], reverse=True)
+        for address, lamports in largest[:5]:
+            print_info(f"  {address}  {lamports / LAMPORTS_PER_SOL:.9f} SOL")
+        if len(largest) > 5:
+            print_info(f"  ... and {len(largest) - 5} more")
+        for mint, amount in review.token_amounts.items():
+            print_info(f"Tokens: {amount} base units of {mint}")
+        if review.priority_fee_lamports:
+            print_info(f"Priority fees: up to {review.priority_fee_lamports / LAMPORTS_PER_SOL:.9f} SOL")
+        for program, count in review.unknown_programs.items():
+            print_warning(f"{count} instruction(s) for unrecognised program {program}")
+
     def broadcast_transaction(self):
         print_section_header("BROADCAST SIGNED TRANSACTION")
         
@@ -862,13 +1297,16 @@ class SolanaColdWalletCLI:
         outbox_dir = Path(self.usb_manager.mount_point) / "outbox"
         
         signed_files = list(outbox_dir.glob("signed_*.json")) if outbox_dir.exists() else []
+        signed_bundles = sorted(outbox_dir.glob("signed_bundle_*.jsonl")) if outbox_dir.exists() else []
         
-        if not signed_files:
+        if not signed_files and not signed_bundles:
             print_warning("No signed transactions found in USB outbox")
             print_info("Sign transactions on the air-gapped device first.")
             return
         
-        file_options = [f.name for f in signed_files]
+        all_option = f"All signed transactions ({len(signed_files) + len(signed_bundles)} file(s))"
+        file_options = [all_option] if len(signed_files) + len(signed_bundles) > 1 else []
+        file_options += [f.name for f in signed_files] + [f.name for f in signed_bundles]
         file_options.append("Cancel")
         
         selection = select_menu_option(file_options, "Select transaction to broadcast:")
@@ -876,6 +1314,10 @@ class SolanaColdWalletCLI:
         if not selection or "Cancel" in selection:
             return
         
+        if selection == all_option or selection.endswith(".jsonl"):
+            self._broadcast_outbox(outbox_dir if selection == all_option else outbox_dir / selection)
+            return
+        
         tx_path = outbox_dir / selection
         
         tx_bytes = self.transaction_manager.load_signed_transaction(str(tx_path))
@@ -886,6 +1328,9 @@ class SolanaColdWalletCLI:
         if tx_info:
             print_info(f"Transaction has {tx_info['num_instructions']} instruction(s)")
             print_info(f"Signed: {'Yes' if tx_info['is_signed'] else 'No'}")
+            if tx_info.get("versioned"):
+                print_info(f"Versioned (v0): {tx_info['num_accounts']} account(s) via "
+                           f"{len(tx_info['address_table_lookups'])} lookup table(s)")
         
         console.print()
         print_warning("This will broadcast the transaction to the Solana network")
@@ -918,36 +1363,138 @@ class SolanaColdWalletCLI:
             
             print_explorer_link(signature, "devnet")
     
+    def _broadcast_outbox(self, path: Path):
+        """Broadcast many signed transactions concurrently until they land"""
+        from src.broadcaster import broadcast_signed_transactions, load_signed_transactions
+        
+        count = len(load_signed_transactions(str(path)))
+        if not count:
+            print_warning("No signed transactions to broadcast")
+            return
+        
+        console.print()
+        print_warning(f"This will broadcast {count} transaction(s) to the Solana network")
+        if not confirm_dangerous_action("Broadcast all of them?", "BROADCAST"):
+            return
+        
+        import time
+        outbox_dir = path if path.is_dir() else path.parent
+        ledger_path = outbox_dir / f"broadcast_ledger_{int(time.time())}.jsonl"
+        report = broadcast_signed_transactions(str(path), ledger_path=str(ledger_path))
+        
+        if report and report.confirmed and self.current_public_key:
+            new_balance = self.network.get_balance(self.current_public_key)
+            if new_balance is not None:
+                print_success(f"Updated balance: {new_balance:.9f} SOL")
+    
+    def _select_priority_fee(self) -> Optional[str]:
+        """Ask for an optional priority fee level; None means base fee only"""
+        choice = select_menu_option(
+            [
+                "Standard (no priority fee)",
+                "p50 - median recent priority fee",
+                "p75 - faster under congestion",
+                "p90 - fastest",
+            ],
+            "Priority fee:"
+        )
+        if not choice or choice.startswith("Standard"):
+            return None
+        return choice.split(" ", 1)[0]
+    
     def view_transaction_history(self):
-        """View recent transaction history for the wallet"""
+        """View transaction history from the wallet's local ledger"""
         print_section_header("TRANSACTION HISTORY")
         
         if not self.current_public_key:
             print_error("No wallet connected. Mount a USB with a cold wallet first.")
             return
         
+        from src.tx_history import TransactionLedger
+        
         public_key = self.current_public_key
         print_info(f"Wallet: {public_key}")
         console.print()
         
-        limit = get_float_input("Number of transactions to show (1-50): ", 10)
-        limit = int(min(max(limit, 1), 50))  # Clamp between 1 and 50
-        
-        print_info(f"Fetching last {limit} transactions...")
-        console.print()
-        
-        transactions = self.network.get_transaction_history(public_key, limit)
-        
-        if not transactions:
-            print_warning("No transaction history found")
-            return
-        
-        print_success(f"Found {len(transactions)} transaction(s)")
-        console.print()
-        
+        with TransactionLedger(public_key) as ledger:
+            # Signatures only, and one page of older history per step; bodies
+            # are fetched when a transaction is opened
+            print_info("Syncing transaction history...")
+            result = ledger.sync_blocking(fetch_bodies=False, max_backfill_pages=1)
+            if not result.ok:
+                print_warning("Sync incomplete - showing locally stored history")
+            elif result.new_signatures:
+                print_success(f"{result.new_signatures} new transaction(s) synced")
+            console.print()
+            
+            total = ledger.count()
+            if not total:
+                print_warning("No transaction history found")
+                return
+            
+            limit = get_float_input(f"Number of transactions per page (1-{total}): ", min(10, total))
+            limit = int(min(max(limit, 1), total))
+            offset = 0
+            transactions = ledger.recent(limit)
+            
+            print_success(f"{total} transaction(s) stored locally")
+            console.print()
+            self._print_transaction_table(transactions, "Recent Transactions")
+            
+            while True:
+                action = select_menu_option(
+                    ["View details", "Older", "Search", "Export CSV", "Back"],
+                    "History options:"
+                )
+                
+                if not action or "Back" in action:
+                    break
+                
+                if "Older" in action:
+                    offset += limit
+                    if offset + limit > ledger.count() and not ledger.backfill_complete:
+                        print_info("Fetching older history...")
+                        if not ledger.sync_blocking(fetch_bodies=False, max_backfill_pages=1).ok:
+                            print_warning("Could not fetch older history")
+                    page = ledger.recent(limit, offset)
+                    if not page:
+                        offset -= limit
+                        print_warning("No older transactions")
+                        continue
+                    transactions = page
+                    self._print_transaction_table(transactions, f"Older Transactions (page {offset // limit + 1})")
+                
+                if "View details" in action:
+                    tx_num = get_float_input(f"Enter transaction number (1-{len(transactions)}): ", 1)
+                    tx_idx = int(tx_num) - 1
+                    
+                    if 0 <= tx_idx < len(transactions):
+                        self._show_transaction_details(transactions[tx_idx]["signature"], ledger)
+                    else:
+                        print_error("Invalid transaction number")
+                
+                elif "Search" in action:
+                    text = get_text_input("Signature prefix, memo or address: ").strip()
+                    transactions = ledger.search(text=text or None)
+                    if not transactions:
+                        print_warning("No matching transactions")
+                        continue
+                    self._print_transaction_table(transactions, f"Matches ({len(transactions)})")
+                
+                elif "Export CSV" in action:
+                    path = get_text_input("Export to: ", f"{public_key[:8]}_history.csv").strip()
+                    try:
+                        written = ledger.export_csv(os.path.expanduser(path))
+                        print_success(f"Exported {written} transaction(s) to {path}")
+                    except OSError as e:
+                        print_error(f"Export failed: {sanitize_error(e)}")
+    
+    def _print_transaction_table(self, transactions: list, title: str):
+        """Render signature info rows as a table"""
         from rich.table import Table
+        import datetime
         
-        table = Table(title="Recent Transactions", show_header=True, header_style="bold cyan")
+        table = Table(title=title, show_header=True, header_style="bold cyan")
         table.add_column("#", style="dim", width=4)
         table.add_column("Signature", style="cyan", width=50)
         table.add_column("Status", width=12)
@@ -968,7 +1515,6 @@ class SolanaColdWalletCLI:
             # Format timestamp
             block_time = tx.get("blockTime")
             if block_time:
-                import datetime
                 dt = datetime.datetime.fromtimestamp(block_time)
                 time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
             else:
@@ -987,29 +1533,15 @@ class SolanaColdWalletCLI:
         
         console.print(table)
         console.print()
-        
-        # Offer to view details of a specific transaction
-        view_details = select_menu_option(
-            ["Yes", "No"],
-            "View details of a specific transaction?"
-        )
-        
-        if view_details and "Yes" in view_details:
-            tx_num = get_float_input(f"Enter transaction number (1-{len(transactions)}): ", 1)
-            tx_idx = int(tx_num) - 1
-            
-            if 0 <= tx_idx < len(transactions):
-                signature = transactions[tx_idx]["signature"]
-                self._show_transaction_details(signature)
-            else:
-                print_error("Invalid transaction number")
     
-    def _show_transaction_details(self, signature: str):
+    def _show_transaction_details(self, signature: str, ledger=None):
         """Show detailed information about a specific transaction"""
         console.print()
-        print_info(f"Fetching details for transaction: {signature[:20]}...")
         
-        details = self.network.get_transaction_details(signature)
+        details = ledger.get_transaction(signature) if ledger else None
+        if not details:
+            print_info(f"Fetching details for transaction: {signature[:20]}...")
+            details = self.network.get_transaction_details(signature)
         
         if not details:
             print_error("Could not fetch transaction details")
@@ -1537,6 +2069,7 @@ class SolanaColdWalletCLI:
     
     def cleanup(self):
         try:
+            self.blockhash_provider.stop()
             self.network.close()
             self.fairscore_client.close()
             if self.usb_manager.mount_point:
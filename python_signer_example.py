@@ -17,7 +17,7 @@ import subprocess
 import sys
 from ctypes import *
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 import base64
 import base58
 
@@ -130,6 +130,38 @@ class SolanaSecureSigner:
         # signer_check_mlock_support
         self.lib.signer_check_mlock_support.argtypes = []
         self.lib.signer_check_mlock_support.restype = c_int
+
+        # Bulk signing sessions (absent from libraries built before sessions)
+        self.supports_sessions = hasattr(self.lib, "signer_session_open")
+        if self.supports_sessions:
+            self.lib.signer_session_open.argtypes = [
+                c_char_p,  # container_json
+                c_char_p,  # passphrase
+                c_uint32,  # ttl_seconds
+            ]
+            self.lib.signer_session_open.restype = SignerResultStruct
+
+            self.lib.signer_session_sign_batch.argtypes = [
+                c_uint64,  # session_id
+                c_char_p,  # messages_json
+            ]
+            self.lib.signer_session_sign_batch.restype = SignerResultStruct
+
+            self.lib.signer_session_close.argtypes = [c_uint64]
+            self.lib.signer_session_close.restype = c_int32
+
+        # Packed session signing: no JSON/base64, signatures written in place
+        self.supports_packed = hasattr(self.lib, "signer_session_sign_packed")
+        if self.supports_packed:
+            self.lib.signer_session_sign_packed.argtypes = [
+                c_uint64,          # session_id
+                POINTER(c_uint8),  # messages
+                c_size_t,          # messages_len
+                c_size_t,          # message_count
+                POINTER(c_uint8),  # signatures_out
+                c_size_t,          # signatures_out_len
+            ]
+            self.lib.signer_session_sign_packed.restype = c_int32
     
     def get_version(self) -> str:
         """Get the library version."""
@@ -234,6 +266,54 @@ class SolanaSecureSigner:
         
         return signature, signed_tx
 
+    def open_session(
+        self,
+        encrypted_container: dict,
+        passphrase: str,
+        ttl_seconds: int = 300
+    ) -> "SigningSession":
+        """
+        Open a bulk signing session.
+
+        The passphrase is run through Argon2id once and the decrypted key
+        stays in Rust's locked memory until the session is closed or
+        `ttl_seconds` elapse; Rust zeroizes it in both cases.
+
+        Args:
+            encrypted_container: Encrypted key container (from create_encrypted_container)
+            passphrase: Passphrase for decryption
+            ttl_seconds: Session lifetime (capped at 3600 by the library)
+
+        Returns:
+            SigningSession usable as a context manager
+
+        Raises:
+            RuntimeError: If the library lacks session support or decryption fails
+        """
+        if not self.supports_sessions:
+            raise RuntimeError(
+                "Signer library does not support sessions; rebuild it: "
+                "cd secure_signer && cargo build --release --features ffi"
+            )
+
+        if isinstance(encrypted_container, dict):
+            container_json = json.dumps(encrypted_container)
+        else:
+            container_json = encrypted_container
+
+        result = self.lib.signer_session_open(
+            container_json.encode('utf-8'),
+            passphrase.encode('utf-8'),
+            ttl_seconds
+        )
+
+        if result.error_code != 0:
+            error_msg = result.result.decode('utf-8') if result.result else "Unknown error"
+            raise RuntimeError(f"Session open failed: {error_msg}")
+
+        info = json.loads(result.result.decode('utf-8'))
+        return SigningSession(self, info['session_id'], info['public_key'], info['ttl_seconds'])
+
     def decrypt_private_key(
         self,
         encrypted_container: dict,
@@ -284,6 +364,102 @@ class SolanaSecureSigner:
         return list(plaintext[:32])
 
 
+class SigningSession:
+    """
+    Handle to a Rust-side signing session.
+
+    Only the numeric session id crosses the FFI boundary; the key stays in
+    Rust's locked memory. Use as a context manager so the key is zeroized
+    as soon as the batch is done:
+
+        with signer.open_session(container, passphrase) as session:
+            signatures = session.sign_messages(messages)
+    """
+
+    def __init__(self, signer: SolanaSecureSigner, session_id: int, public_key: str, ttl_seconds: int):
+        self._lib = signer.lib
+        self._packed = getattr(signer, "supports_packed", False)
+        self.session_id = session_id
+        self.public_key = public_key
+        self.ttl_seconds = ttl_seconds
+        self.closed = False
+
+    def sign_messages(self, messages: Sequence[bytes]) -> List[bytes]:
+        """
+        Sign every message in one FFI call.
+
+        Args:
+            messages: Serialized transaction messages
+
+        Returns:
+            64-byte signatures in input order
+
+        Raises:
+            RuntimeError: If the session is closed/expired or signing fails
+        """
+        if self.closed:
+            raise RuntimeError("Signing failed: Signing session is closed")
+        if not messages:
+            return []
+
+        if self._packed:
+            return self._sign_packed(messages)
+
+        messages_json = json.dumps([base64.b64encode(m).decode('utf-8') for m in messages])
+        result = self._lib.signer_session_sign_batch(self.session_id, messages_json.encode('utf-8'))
+
+        if result.error_code != 0:
+            error_msg = result.result.decode('utf-8') if result.result else "Unknown error"
+            raise RuntimeError(f"Signing failed: {error_msg}")
+
+        result_json = json.loads(result.result.decode('utf-8'))
+        return [base58.b58decode(sig) for sig in result_json['signatures']]
+
+    def _sign_packed(self, messages: Sequence[bytes]) -> List[bytes]:
+        """Sign through the packed entry point: one buffer in, 64-byte slots out."""
+        packed = bytearray(sum(4 + len(m) for m in messages))
+        offset = 0
+        for message in messages:
+            packed[offset:offset + 4] = len(message).to_bytes(4, 'little')
+            packed[offset + 4:offset + 4 + len(message)] = message
+            offset += 4 + len(message)
+        out = bytearray(64 * len(messages))
+
+        code = self._lib.signer_session_sign_packed(
+            self.session_id,
+            (c_uint8 * len(packed)).from_buffer(packed),
+            len(packed),
+            len(messages),
+            (c_uint8 * len(out)).from_buffer(out),
+            len(out)
+        )
+        if code == 7:
+            raise RuntimeError("Signing failed: Signing session is closed or expired")
+        if code != 0:
+            raise RuntimeError(f"Signing failed: error code {code}")
+
+        view = memoryview(out)
+        return [bytes(view[i:i + 64]) for i in range(0, len(out), 64)]
+
+    def close(self):
+        """Zeroize the session key in Rust. Safe to call more than once."""
+        if not self.closed:
+            self._lib.signer_session_close(self.session_id)
+            self.closed = True
+
+    def __enter__(self) -> "SigningSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
 # ============================================================================
 # Method 2: CLI Subprocess Integration
 # ============================================================================
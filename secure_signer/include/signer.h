@@ -20,6 +20,7 @@
 #ifndef SOLANA_SECURE_SIGNER_H
 #define SOLANA_SECURE_SIGNER_H
 
+#include <stddef.h>
 #include <stdint.h>
 
 #ifdef __cplusplus
@@ -106,6 +107,110 @@ SignerResult signer_sign_direct(
     const char* message_b64
 );
 
+/**
+ * Open a bulk signing session.
+ *
+ * Derives the decryption key once and keeps the private key in locked
+ * memory until signer_session_close() is called or the time-to-live
+ * expires (capped at 3600 seconds). The key is zeroized in both cases.
+ *
+ * @param container_json JSON-serialized encrypted key container
+ * @param passphrase     Passphrase for decryption
+ * @param ttl_seconds    Session lifetime in seconds
+ * @return SignerResult with session info on success
+ *
+ * The returned JSON has the format:
+ * {
+ *   "session_id": <integer>,
+ *   "public_key": "<base58>",
+ *   "ttl_seconds": <integer>
+ * }
+ */
+SignerResult signer_session_open(
+    const char* container_json,
+    const char* passphrase,
+    uint32_t ttl_seconds
+);
+
+/**
+ * Sign a batch of messages with an open session.
+ *
+ * @param session_id    Handle returned by signer_session_open()
+ * @param messages_json JSON array of base64-encoded messages
+ * @return SignerResult with signatures on success (error code 4 if the
+ *         session is closed or expired)
+ *
+ * The returned JSON has the format:
+ * {
+ *   "public_key": "<base58>",
+ *   "signatures": ["<base58>", ...]
+ * }
+ */
+SignerResult signer_session_sign_batch(
+    uint64_t session_id,
+    const char* messages_json
+);
+
+/**
+ * Close a signing session and zeroize its key.
+ *
+ * @param session_id Handle returned by signer_session_open()
+ * @return 0 if closed, 1 if the handle was unknown or already closed
+ */
+int32_t signer_session_close(uint64_t session_id);
+
+/**
+ * Decrypt a key container once and sign a packed batch of messages.
+ *
+ * No JSON or base64 is involved. `messages` holds `message_count` records,
+ * each a 4-byte little-endian length followed by the message bytes.
+ * Signatures are written to `signatures_out` in input order, 64 bytes each.
+ *
+ * @param container_json     JSON-serialized encrypted key container
+ * @param passphrase         Passphrase for decryption
+ * @param messages           Packed length-prefixed messages
+ * @param messages_len       Size of `messages` in bytes
+ * @param message_count      Number of messages in the buffer
+ * @param signatures_out     Caller-allocated output buffer
+ * @param signatures_out_len Must equal 64 * message_count
+ * @param public_key_out     Optional 32-byte buffer for the public key (may be NULL)
+ * @return 0 on success; 1 null pointer, 2 invalid UTF-8, 3 malformed
+ *         message buffer, 4 crypto error, 6 wrong output buffer size
+ */
+int32_t signer_sign_batch_packed(
+    const char* container_json,
+    const char* passphrase,
+    const uint8_t* messages,
+    size_t messages_len,
+    size_t message_count,
+    uint8_t* signatures_out,
+    size_t signatures_out_len,
+    uint8_t* public_key_out
+);
+
+/**
+ * Sign a packed batch of messages with an open session.
+ *
+ * Same buffer layout as signer_sign_batch_packed().
+ *
+ * @param session_id         Handle returned by signer_session_open()
+ * @param messages           Packed length-prefixed messages
+ * @param messages_len       Size of `messages` in bytes
+ * @param message_count      Number of messages in the buffer
+ * @param signatures_out     Caller-allocated output buffer
+ * @param signatures_out_len Must equal 64 * message_count
+ * @return 0 on success; 1 null pointer, 3 malformed message buffer,
+ *         4 crypto error, 6 wrong output buffer size, 7 session closed or expired
+ */
+int32_t signer_session_sign_packed(
+    uint64_t session_id,
+    const uint8_t* messages,
+    size_t messages_len,
+    size_t message_count,
+    uint8_t* signatures_out,
+    size_t signatures_out_len
+);
+
 /**
  * Free a SignerResult structure.
  * 
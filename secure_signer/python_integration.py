@@ -19,11 +19,12 @@ import base64
 import ctypes
 import json
 import os
+import struct
 import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 
 # =============================================================================
@@ -169,6 +170,38 @@ class FFISignerResult(ctypes.Structure):
     ]
 
 
+# Packed batch signing: messages go in as [u32 LE length][bytes] records and
+# signatures come back as consecutive 64-byte slots in a caller-owned buffer.
+SIGNATURE_SIZE = 64
+
+PACKED_ERRORS = {
+    1: "Null pointer argument",
+    2: "Invalid UTF-8",
+    3: "Malformed message buffer",
+    4: "Crypto operation failed (wrong passphrase or corrupted container)",
+    6: "Signature buffer has the wrong size",
+    7: "Signing session is closed or expired",
+}
+
+
+def pack_messages(messages: Sequence[bytes]) -> bytearray:
+    """Pack messages into one length-prefixed buffer for the batch FFI calls."""
+    packed = bytearray(sum(4 + len(m) for m in messages))
+    offset = 0
+    for message in messages:
+        size = len(message)
+        struct.pack_into("<I", packed, offset, size)
+        offset += 4
+        packed[offset:offset + size] = message
+        offset += size
+    return packed
+
+
+def _ubyte_view(buffer: bytearray, size: int):
+    """A ctypes array over the first `size` bytes of `buffer`, without copying."""
+    return (ctypes.c_uint8 * size).from_buffer(buffer)
+
+
 class FFISigner:
     """
     Secure signer using FFI to call the Rust library directly.
@@ -253,6 +286,44 @@ class FFISigner:
         # signer_check_mlock_support
         self.lib.signer_check_mlock_support.argtypes = []
         self.lib.signer_check_mlock_support.restype = ctypes.c_int32
+        
+        # Batch and session calls (absent from older library builds)
+        byte_ptr = ctypes.POINTER(ctypes.c_uint8)
+        self.supports_batch = hasattr(self.lib, "signer_sign_batch_packed")
+        if self.supports_batch:
+            self.lib.signer_sign_batch_packed.argtypes = [
+                ctypes.c_char_p,  # container_json
+                ctypes.c_char_p,  # passphrase
+                byte_ptr,         # messages
+                ctypes.c_size_t,  # messages_len
+                ctypes.c_size_t,  # message_count
+                byte_ptr,         # signatures_out
+                ctypes.c_size_t,  # signatures_out_len
+                byte_ptr          # public_key_out (nullable)
+            ]
+            self.lib.signer_sign_batch_packed.restype = ctypes.c_int32
+        
+        self.supports_sessions = hasattr(self.lib, "signer_session_sign_packed")
+        if self.supports_sessions:
+            self.lib.signer_session_open.argtypes = [
+                ctypes.c_char_p,  # container_json
+                ctypes.c_char_p,  # passphrase
+                ctypes.c_uint32   # ttl_seconds
+            ]
+            self.lib.signer_session_open.restype = FFISignerResult
+            
+            self.lib.signer_session_sign_packed.argtypes = [
+                ctypes.c_uint64,  # session_id
+                byte_ptr,         # messages
+                ctypes.c_size_t,  # messages_len
+                ctypes.c_size_t,  # message_count
+                byte_ptr,         # signatures_out
+                ctypes.c_size_t   # signatures_out_len
+            ]
+            self.lib.signer_session_sign_packed.restype = ctypes.c_int32
+            
+            self.lib.signer_session_close.argtypes = [ctypes.c_uint64]
+            self.lib.signer_session_close.restype = ctypes.c_int32
     
     def _process_result(self, ffi_result: FFISignerResult) -> dict:
         """Process FFI result and free memory."""
@@ -299,6 +370,93 @@ class FFISigner:
         )
         return self._process_result(result)
     
+    def sign_batch(
+        self,
+        container_json: str,
+        passphrase: str,
+        messages: Sequence[bytes],
+        out: Optional[bytearray] = None
+    ) -> dict:
+        """
+        Sign many messages with one key derivation and one FFI call.
+        
+        Messages are packed once into a single buffer and the signatures are
+        written by Rust straight into `out` (allocated if not given; it may
+        be reused across calls). On success `data["signatures"]` is a
+        memoryview over `out` holding 64 bytes per message, in input order.
+        """
+        if not self.supports_batch:
+            return {"success": False, "error": "Library built without batch signing support"}
+        if not messages:
+            return {"success": True, "data": {"signatures": memoryview(b""), "public_key": None}}
+        
+        packed = pack_messages(messages)
+        size = len(messages) * SIGNATURE_SIZE
+        out = out if out is not None and len(out) >= size else bytearray(size)
+        public_key = bytearray(32)
+        
+        code = self.lib.signer_sign_batch_packed(
+            container_json.encode('utf-8'),
+            passphrase.encode('utf-8'),
+            _ubyte_view(packed, len(packed)),
+            len(packed),
+            len(messages),
+            _ubyte_view(out, size),
+            size,
+            _ubyte_view(public_key, 32)
+        )
+        if code != 0:
+            return {"success": False, "error": PACKED_ERRORS.get(code, f"Error code {code}")}
+        
+        import base58
+        return {"success": True, "data": {
+            "signatures": memoryview(out)[:size],
+            "public_key": base58.b58encode(bytes(public_key)).decode('ascii'),
+        }}
+    
+    def open_session(self, container_json: str, passphrase: str, ttl_seconds: int = 300) -> dict:
+        """Open a signing session; data holds session_id, public_key and ttl_seconds."""
+        if not self.supports_sessions:
+            return {"success": False, "error": "Library built without session support"}
+        result = self.lib.signer_session_open(
+            container_json.encode('utf-8'),
+            passphrase.encode('utf-8'),
+            ttl_seconds
+        )
+        return self._process_result(result)
+    
+    def session_sign_batch(
+        self,
+        session_id: int,
+        messages: Sequence[bytes],
+        out: Optional[bytearray] = None
+    ) -> dict:
+        """Sign many messages with an open session; same buffers as sign_batch()."""
+        if not self.supports_sessions:
+            return {"success": False, "error": "Library built without session support"}
+        if not messages:
+            return {"success": True, "data": {"signatures": memoryview(b"")}}
+        
+        packed = pack_messages(messages)
+        size = len(messages) * SIGNATURE_SIZE
+        out = out if out is not None and len(out) >= size else bytearray(size)
+        
+        code = self.lib.signer_session_sign_packed(
+            session_id,
+            _ubyte_view(packed, len(packed)),
+            len(packed),
+            len(messages),
+            _ubyte_view(out, size),
+            size
+        )
+        if code != 0:
+            return {"success": False, "error": PACKED_ERRORS.get(code, f"Error code {code}")}
+        return {"success": True, "data": {"signatures": memoryview(out)[:size]}}
+    
+    def close_session(self, session_id: int) -> bool:
+        """Zeroize a session's key. Returns False if it was already closed."""
+        return self.lib.signer_session_close(session_id) == 0
+    
     def get_version(self) -> str:
         """Get the library version."""
         return self.lib.signer_version().decode('utf-8')
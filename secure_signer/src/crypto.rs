@@ -130,9 +130,10 @@ impl EncryptedKeyContainer {
 
         // Get public key for verification
         let signing_key = SigningKey::from_bytes(
-            secure_key.as_slice().try_into().map_err(|_| {
-                SignerError::InvalidKeyFormat(secure_key.len())
-            })?,
+            secure_key
+                .as_slice()
+                .try_into()
+                .map_err(|_| SignerError::InvalidKeyFormat(secure_key.len()))?,
         );
         let public_key = bs58::encode(signing_key.verifying_key().as_bytes()).into_string();
 
@@ -144,7 +145,10 @@ impl EncryptedKeyContainer {
             version: 1,
             salt: base64::Engine::encode(&base64::engine::general_purpose::STANDARD, salt),
             nonce: base64::Engine::encode(&base64::engine::general_purpose::STANDARD, nonce),
-            ciphertext: base64::Engine::encode(&base64::engine::general_purpose::STANDARD, ciphertext),
+            ciphertext: base64::Engine::encode(
+                &base64::engine::general_purpose::STANDARD,
+                ciphertext,
+            ),
             public_key: Some(public_key),
         })
     }
@@ -160,6 +164,48 @@ impl EncryptedKeyContainer {
     }
 }
 
+/// Decrypt a key container into a secure buffer
+///
+/// Runs the Argon2id derivation and AES-256-GCM decryption, moves the
+/// plaintext seed straight into locked memory, and zeroizes every
+/// intermediate copy. The caller owns the returned buffer.
+pub(crate) fn decrypt_key_container(
+    container_json: &str,
+    passphrase: &str,
+) -> Result<SecureBuffer, SignerError> {
+    // Parse the container
+    let container = EncryptedKeyContainer::from_json(container_json)?;
+
+    // Decode base64 fields
+    let salt = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.salt)?;
+    let nonce =
+        base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.nonce)?;
+    let ciphertext = base64::Engine::decode(
+        &base64::engine::general_purpose::STANDARD,
+        &container.ciphertext,
+    )?;
+
+    // Derive decryption key
+    let mut derived_key = derive_key(passphrase.as_bytes(), &salt)?;
+
+    // Decrypt the private key into secure buffer
+    let cipher = Aes256Gcm::new_from_slice(derived_key.as_slice())
+        .map_err(|e| SignerError::KeyDerivationFailed(e.to_string()))?;
+
+    let mut plaintext = cipher
+        .decrypt(Nonce::from_slice(&nonce), ciphertext.as_slice())
+        .map_err(|_| SignerError::DecryptionFailed)?;
+
+    // Immediately move to secure buffer
+    let secure_key = SecureBuffer::from_slice_with_mode(&plaintext, get_locking_mode());
+
+    // Zeroize all intermediate sensitive data
+    plaintext.zeroize();
+    derived_key.zeroize();
+
+    secure_key
+}
+
 /// Result of a signing operation
 #[derive(Serialize, Deserialize)]
 pub struct SigningResult {
@@ -197,31 +243,8 @@ pub fn decrypt_and_sign(
     passphrase: &str,
     transaction_bytes: &[u8],
 ) -> Result<SigningResult, SignerError> {
-    // Parse the container
-    let container = EncryptedKeyContainer::from_json(container_json)?;
-
-    // Decode base64 fields
-    let salt = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.salt)?;
-    let nonce = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.nonce)?;
-    let ciphertext = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.ciphertext)?;
-
-    // Derive decryption key
-    let mut derived_key = derive_key(passphrase.as_bytes(), &salt)?;
-
-    // Decrypt the private key into secure buffer
-    let cipher = Aes256Gcm::new_from_slice(derived_key.as_slice())
-        .map_err(|e| SignerError::KeyDerivationFailed(e.to_string()))?;
-
-    let mut plaintext = cipher
-        .decrypt(Nonce::from_slice(&nonce), ciphertext.as_slice())
-        .map_err(|_| SignerError::DecryptionFailed)?;
-
-    // Immediately move to secure buffer
-    let mut secure_key = SecureBuffer::from_slice_with_mode(&plaintext, get_locking_mode())?;
-
-    // Zeroize all intermediate sensitive data
-    plaintext.zeroize();
-    derived_key.zeroize();
+    // Derive, decrypt, and move the key into a secure buffer
+    let mut secure_key = decrypt_key_container(container_json, passphrase)?;
 
     // Create signing key from secure buffer
     // MEMORY LIFECYCLE: The signing key is created from our secure buffer
@@ -250,9 +273,10 @@ fn sign_with_secure_key(
 
     // Create signing key - ed25519-dalek's SigningKey implements Zeroize
     let signing_key = SigningKey::from_bytes(
-        secure_key.as_slice().try_into().map_err(|_| {
-            SignerError::InvalidKeyFormat(secure_key.len())
-        })?,
+        secure_key
+            .as_slice()
+            .try_into()
+            .map_err(|_| SignerError::InvalidKeyFormat(secure_key.len()))?,
     );
 
     // Get the public key
@@ -314,6 +338,78 @@ pub fn sign_transaction(
     result
 }
 
+/// Size of an Ed25519 signature in a packed signature buffer
+pub const SIGNATURE_SIZE: usize = 64;
+
+/// Build an Ed25519 signing key from a seed held in a secure buffer
+///
+/// The returned key zeroizes itself on drop (ed25519-dalek zeroize feature).
+pub(crate) fn signing_key_from_buffer(
+    secure_key: &SecureBuffer,
+) -> Result<SigningKey, SignerError> {
+    let seed: &[u8; ED25519_SEED_SIZE] = secure_key
+        .as_slice()
+        .try_into()
+        .map_err(|_| SignerError::InvalidKeyFormat(secure_key.len()))?;
+    Ok(SigningKey::from_bytes(seed))
+}
+
+/// Check that `out` holds exactly one signature slot per message
+pub(crate) fn check_signature_buffer(message_count: usize, out: &[u8]) -> Result<(), SignerError> {
+    let expected = message_count * SIGNATURE_SIZE;
+    if out.len() != expected {
+        return Err(SignerError::InvalidTransaction(format!(
+            "signature buffer must be {} bytes, got {}",
+            expected,
+            out.len()
+        )));
+    }
+    Ok(())
+}
+
+/// Sign each message into consecutive 64-byte slots of `out`
+pub(crate) fn sign_messages_into<M: AsRef<[u8]>>(
+    signing_key: &SigningKey,
+    messages: &[M],
+    out: &mut [u8],
+) -> Result<(), SignerError> {
+    check_signature_buffer(messages.len(), out)?;
+    for (message, slot) in messages.iter().zip(out.chunks_exact_mut(SIGNATURE_SIZE)) {
+        slot.copy_from_slice(&signing_key.sign(message.as_ref()).to_bytes());
+    }
+    Ok(())
+}
+
+/// Decrypt a key container once and sign a batch of messages
+///
+/// Signatures are written to `out` in input order, 64 bytes each, so the
+/// caller can hand in a preallocated buffer and avoid per-message
+/// allocations and encoding.
+///
+/// # Returns
+/// The signer's 32-byte public key
+pub fn decrypt_and_sign_batch<M: AsRef<[u8]>>(
+    container_json: &str,
+    passphrase: &str,
+    messages: &[M],
+    out: &mut [u8],
+) -> Result<[u8; 32], SignerError> {
+    // Reject a bad buffer before paying for key derivation
+    check_signature_buffer(messages.len(), out)?;
+
+    let mut secure_key = decrypt_key_container(container_json, passphrase)?;
+
+    let result = signing_key_from_buffer(&secure_key).and_then(|signing_key| {
+        sign_messages_into(&signing_key, messages, out)?;
+        Ok(signing_key.verifying_key().to_bytes())
+    });
+
+    // Explicit zeroization (also happens on drop)
+    secure_key.zeroize();
+
+    result
+}
+
 /// Create an encrypted key container from a private key
 ///
 /// Convenience function for creating containers.
@@ -364,9 +460,8 @@ fn sign_evm_with_secure_key(
     }
 
     // Create secp256k1 signing key
-    let signing_key = K256SigningKey::from_bytes(
-        secure_key.as_slice().into(),
-    ).map_err(|e| SignerError::SigningFailed(format!("Invalid secp256k1 key: {}", e)))?;
+    let signing_key = K256SigningKey::from_bytes(secure_key.as_slice().into())
+        .map_err(|e| SignerError::SigningFailed(format!("Invalid secp256k1 key: {}", e)))?;
 
     let verifying_key = signing_key.verifying_key();
     let address = evm_address_from_pubkey(verifying_key);
@@ -407,33 +502,13 @@ pub fn decrypt_and_sign_evm(
     message_hash: &[u8],
 ) -> Result<EVMSigningResult, SignerError> {
     if message_hash.len() != 32 {
-        return Err(SignerError::InvalidTransaction(
-            format!("EVM message hash must be 32 bytes, got {}", message_hash.len())
-        ));
+        return Err(SignerError::InvalidTransaction(format!(
+            "EVM message hash must be 32 bytes, got {}",
+            message_hash.len()
+        )));
     }
 
-    // Parse the container
-    let container = EncryptedKeyContainer::from_json(container_json)?;
-
-    // Decode base64 fields
-    let salt = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.salt)?;
-    let nonce = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.nonce)?;
-    let ciphertext = base64::Engine::decode(&base64::engine::general_purpose::STANDARD, &container.ciphertext)?;
-
-    // Derive decryption key
-    let mut derived_key = derive_key(passphrase.as_bytes(), &salt)?;
-
-    // Decrypt the private key into secure buffer
-    let cipher = Aes256Gcm::new_from_slice(derived_key.as_slice())
-        .map_err(|e| SignerError::KeyDerivationFailed(e.to_string()))?;
-
-    let mut plaintext = cipher
-        .decrypt(Nonce::from_slice(&nonce), ciphertext.as_slice())
-        .map_err(|_| SignerError::DecryptionFailed)?;
-
-    let mut secure_key = SecureBuffer::from_slice_with_mode(&plaintext, get_locking_mode())?;
-    plaintext.zeroize();
-    derived_key.zeroize();
+    let mut secure_key = decrypt_key_container(container_json, passphrase)?;
 
     let result = sign_evm_with_secure_key(&mut secure_key, message_hash);
     secure_key.zeroize();
@@ -492,7 +567,7 @@ mod tests {
     #[test]
     fn test_encrypt_decrypt_roundtrip() {
         enable_permissive_mode();
-        
+
         // Generate a test key
         let mut seed = [0u8; 32];
         OsRng.fill_bytes(&mut seed);
@@ -518,10 +593,38 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_decrypt_and_sign_batch() {
+        enable_permissive_mode();
+
+        let mut seed = [0u8; 32];
+        OsRng.fill_bytes(&mut seed);
+        let json = EncryptedKeyContainer::encrypt(&seed, "batch_pass")
+            .unwrap()
+            .to_json()
+            .unwrap();
+
+        let messages: Vec<Vec<u8>> = (0..4u8).map(|i| vec![i; 40 + i as usize]).collect();
+        let mut out = vec![0u8; messages.len() * SIGNATURE_SIZE];
+        let public_key = decrypt_and_sign_batch(&json, "batch_pass", &messages, &mut out).unwrap();
+
+        let signing_key = SigningKey::from_bytes(&seed);
+        assert_eq!(public_key, signing_key.verifying_key().to_bytes());
+        for (message, signature) in messages.iter().zip(out.chunks_exact(SIGNATURE_SIZE)) {
+            assert_eq!(signature, signing_key.sign(message).to_bytes().as_slice());
+        }
+
+        let mut short = vec![0u8; SIGNATURE_SIZE];
+        assert!(matches!(
+            decrypt_and_sign_batch(&json, "batch_pass", &messages, &mut short),
+            Err(SignerError::InvalidTransaction(_))
+        ));
+    }
+
     #[test]
     fn test_wrong_passphrase_fails() {
         enable_permissive_mode();
-        
+
         let mut seed = [0u8; 32];
         OsRng.fill_bytes(&mut seed);
 
@@ -549,7 +652,10 @@ mod tests {
         let signature_bytes = bs58::decode(&result.signature).into_vec().unwrap();
         let signature = Signature::from_slice(&signature_bytes).unwrap();
 
-        assert!(signing_key.verifying_key().verify(message, &signature).is_ok());
+        assert!(signing_key
+            .verifying_key()
+            .verify(message, &signature)
+            .is_ok());
     }
 
     // ── EVM (secp256k1) tests ──────────────────────────────
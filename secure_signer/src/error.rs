@@ -50,6 +50,14 @@ pub enum SignerError {
     /// I/O error
     #[error("I/O error: {0}")]
     IoError(String),
+
+    /// Signing session outlived its time-to-live; the key has been zeroized
+    #[error("Signing session expired")]
+    SessionExpired,
+
+    /// Signing session was closed or the handle is unknown
+    #[error("Signing session is closed")]
+    SessionClosed,
 }
 
 impl From<std::io::Error> for SignerError {
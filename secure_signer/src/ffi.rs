@@ -8,14 +8,30 @@
 //! All strings returned by FFI functions are allocated by Rust and must be
 //! freed by calling the corresponding `free_*` functions.
 //!
+//! # Packed Batch Calls
+//!
+//! `signer_sign_batch_packed` and `signer_session_sign_packed` skip JSON and
+//! base64 entirely. Messages arrive as one buffer of records, each a 4-byte
+//! little-endian length followed by the message bytes, and signatures are
+//! written into a caller-allocated buffer of `64 * message_count` bytes.
+//! They return a bare error code: 0 success, 1 null pointer, 2 invalid
+//! UTF-8, 3 malformed message buffer, 4 crypto error, 6 wrong output buffer
+//! size, 7 session closed or expired.
+//!
 //! # Thread Safety
 //!
 //! These functions are thread-safe and can be called from multiple threads.
 
 use std::ffi::{CStr, CString};
 use std::os::raw::c_char;
+use std::time::Duration;
 
-use crate::crypto::{create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_evm};
+use crate::crypto::{
+    create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch, decrypt_and_sign_evm,
+    SIGNATURE_SIZE,
+};
+use crate::error::SignerError;
+use crate::session::{close_session, get_session, register_session, SigningSession};
 
 /// Result code for FFI operations
 #[repr(C)]
@@ -256,6 +272,290 @@ pub unsafe extern "C" fn signer_sign_evm_transaction(
     }
 }
 
+/// Open a bulk signing session
+///
+/// Runs the key derivation once and keeps the decrypted key in locked
+/// memory until signer_session_close is called or `ttl_seconds` elapse
+/// (capped at one hour), whichever comes first.
+///
+/// # Arguments
+/// * `container_json` - JSON-serialized encrypted key container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `ttl_seconds` - Session lifetime in seconds
+///
+/// # Returns
+/// SignerResult with JSON `{"session_id", "public_key", "ttl_seconds"}` on success
+///
+/// # Safety
+/// All pointers must be valid, null-terminated C strings.
+#[no_mangle]
+pub unsafe extern "C" fn signer_session_open(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    ttl_seconds: u32,
+) -> SignerResult {
+    if container_json.is_null() || passphrase.is_null() {
+        return SignerResult::error(1, "Null pointer argument");
+    }
+
+    let container_str = match CStr::from_ptr(container_json).to_str() {
+        Ok(s) => s,
+        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in container"),
+    };
+
+    let passphrase_str = match CStr::from_ptr(passphrase).to_str() {
+        Ok(s) => s,
+        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in passphrase"),
+    };
+
+    let ttl = Duration::from_secs(u64::from(ttl_seconds));
+    match SigningSession::open(container_str, passphrase_str, ttl) {
+        Ok(session) => {
+            let response = serde_json::json!({
+                "public_key": session.public_key(),
+                "ttl_seconds": session.remaining().as_secs(),
+                "session_id": register_session(session),
+            });
+            SignerResult::success(response.to_string())
+        }
+        Err(e) => SignerResult::error(4, &e.to_string()),
+    }
+}
+
+/// Sign a batch of messages with an open session
+///
+/// # Arguments
+/// * `session_id` - Handle returned by signer_session_open
+/// * `messages_json` - JSON array of base64-encoded messages
+///
+/// # Returns
+/// SignerResult with JSON `{"public_key", "signatures": [base58, ...]}` on
+/// success; signatures are in input order
+///
+/// # Safety
+/// `messages_json` must be a valid, null-terminated C string.
+#[no_mangle]
+pub unsafe extern "C" fn signer_session_sign_batch(
+    session_id: u64,
+    messages_json: *const c_char,
+) -> SignerResult {
+    if messages_json.is_null() {
+        return SignerResult::error(1, "Null pointer argument");
+    }
+
+    let messages_str = match CStr::from_ptr(messages_json).to_str() {
+        Ok(s) => s,
+        Err(_) => return SignerResult::error(2, "Invalid UTF-8 in messages"),
+    };
+
+    let encoded: Vec<String> = match serde_json::from_str(messages_str) {
+        Ok(m) => m,
+        Err(e) => return SignerResult::error(3, &format!("Invalid messages array: {}", e)),
+    };
+
+    let mut messages = Vec::with_capacity(encoded.len());
+    for message in &encoded {
+        match base64::Engine::decode(&base64::engine::general_purpose::STANDARD, message) {
+            Ok(bytes) => messages.push(bytes),
+            Err(e) => return SignerResult::error(3, &format!("Base64 decode error: {}", e)),
+        }
+    }
+
+    let session = match get_session(session_id) {
+        Some(s) => s,
+        None => return SignerResult::error(4, &SignerError::SessionClosed.to_string()),
+    };
+
+    match session.sign_batch(&messages) {
+        Ok(signatures) => {
+            let response = serde_json::json!({
+                "public_key": session.public_key(),
+                "signatures": signatures
+                    .iter()
+                    .map(|sig| bs58::encode(sig).into_string())
+                    .collect::<Vec<_>>(),
+            });
+            SignerResult::success(response.to_string())
+        }
+        Err(e) => SignerResult::error(4, &e.to_string()),
+    }
+}
+
+/// Close a signing session and zeroize its key
+///
+/// # Returns
+/// 0 if the session was closed, 1 if the handle is unknown (already closed)
+#[no_mangle]
+pub extern "C" fn signer_session_close(session_id: u64) -> i32 {
+    if close_session(session_id) {
+        0
+    } else {
+        1
+    }
+}
+
+/// Split a packed buffer of length-prefixed messages into borrowed slices
+fn unpack_messages(packed: &[u8], message_count: usize) -> Option<Vec<&[u8]>> {
+    let mut messages = Vec::with_capacity(message_count);
+    let mut offset = 0usize;
+    for _ in 0..message_count {
+        let prefix = packed.get(offset..offset.checked_add(4)?)?;
+        let len = u32::from_le_bytes(prefix.try_into().ok()?) as usize;
+        offset += 4;
+        messages.push(packed.get(offset..offset.checked_add(len)?)?);
+        offset += len;
+    }
+    // Trailing bytes mean the count and the buffer disagree
+    if offset != packed.len() {
+        return None;
+    }
+    Some(messages)
+}
+
+/// Borrow the packed input and output buffers, validating sizes
+///
+/// # Safety
+/// `messages` must point to `messages_len` readable bytes and
+/// `signatures_out` to `signatures_out_len` writable bytes.
+unsafe fn packed_buffers<'a>(
+    messages: *const u8,
+    messages_len: usize,
+    message_count: usize,
+    signatures_out: *mut u8,
+    signatures_out_len: usize,
+) -> Result<(Vec<&'a [u8]>, &'a mut [u8]), i32> {
+    if messages.is_null() || signatures_out.is_null() {
+        return Err(1);
+    }
+    if message_count.checked_mul(SIGNATURE_SIZE) != Some(signatures_out_len) {
+        return Err(6);
+    }
+    let packed = std::slice::from_raw_parts(messages, messages_len);
+    let out = std::slice::from_raw_parts_mut(signatures_out, signatures_out_len);
+    match unpack_messages(packed, message_count) {
+        Some(slices) => Ok((slices, out)),
+        None => Err(3),
+    }
+}
+
+fn packed_error_code(error: &SignerError) -> i32 {
+    match error {
+        SignerError::SessionExpired | SignerError::SessionClosed => 7,
+        _ => 4,
+    }
+}
+
+/// Decrypt a key container once and sign a packed batch of messages
+///
+/// # Arguments
+/// * `container_json` - JSON-serialized encrypted key container
+/// * `passphrase` - Null-terminated passphrase string
+/// * `messages` / `messages_len` - Packed length-prefixed messages
+/// * `message_count` - Number of messages in the buffer
+/// * `signatures_out` / `signatures_out_len` - Output buffer, 64 bytes per message
+/// * `public_key_out` - Optional 32-byte buffer for the signer's public key (may be null)
+///
+/// # Returns
+/// 0 on success, otherwise a packed-call error code (see module docs)
+///
+/// # Safety
+/// String pointers must be valid, null-terminated C strings; buffers must
+/// be valid for the given lengths.
+#[no_mangle]
+pub unsafe extern "C" fn signer_sign_batch_packed(
+    container_json: *const c_char,
+    passphrase: *const c_char,
+    messages: *const u8,
+    messages_len: usize,
+    message_count: usize,
+    signatures_out: *mut u8,
+    signatures_out_len: usize,
+    public_key_out: *mut u8,
+) -> i32 {
+    if container_json.is_null() || passphrase.is_null() {
+        return 1;
+    }
+
+    let container_str = match CStr::from_ptr(container_json).to_str() {
+        Ok(s) => s,
+        Err(_) => return 2,
+    };
+
+    let passphrase_str = match CStr::from_ptr(passphrase).to_str() {
+        Ok(s) => s,
+        Err(_) => return 2,
+    };
+
+    let (slices, out) = match packed_buffers(
+        messages,
+        messages_len,
+        message_count,
+        signatures_out,
+        signatures_out_len,
+    ) {
+        Ok(buffers) => buffers,
+        Err(code) => return code,
+    };
+
+    match decrypt_and_sign_batch(container_str, passphrase_str, &slices, out) {
+        Ok(public_key) => {
+            if !public_key_out.is_null() {
+                std::ptr::copy_nonoverlapping(
+                    public_key.as_ptr(),
+                    public_key_out,
+                    public_key.len(),
+                );
+            }
+            0
+        }
+        Err(e) => packed_error_code(&e),
+    }
+}
+
+/// Sign a packed batch of messages with an open session
+///
+/// # Arguments
+/// * `session_id` - Handle returned by signer_session_open
+/// * `messages` / `messages_len` - Packed length-prefixed messages
+/// * `message_count` - Number of messages in the buffer
+/// * `signatures_out` / `signatures_out_len` - Output buffer, 64 bytes per message
+///
+/// # Returns
+/// 0 on success, otherwise a packed-call error code (see module docs)
+///
+/// # Safety
+/// Buffers must be valid for the given lengths.
+#[no_mangle]
+pub unsafe extern "C" fn signer_session_sign_packed(
+    session_id: u64,
+    messages: *const u8,
+    messages_len: usize,
+    message_count: usize,
+    signatures_out: *mut u8,
+    signatures_out_len: usize,
+) -> i32 {
+    let (slices, out) = match packed_buffers(
+        messages,
+        messages_len,
+        message_count,
+        signatures_out,
+        signatures_out_len,
+    ) {
+        Ok(buffers) => buffers,
+        Err(code) => return code,
+    };
+
+    let session = match get_session(session_id) {
+        Some(s) => s,
+        None => return 7,
+    };
+
+    match session.sign_into(&slices, out) {
+        Ok(()) => 0,
+        Err(e) => packed_error_code(&e),
+    }
+}
+
 /// Free a string allocated by Rust
 ///
 /// # Safety
@@ -333,6 +633,129 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_ffi_session_sign_batch() {
+        std::env::set_var("SIGNER_ALLOW_INSECURE_MEMORY", "1");
+        let mut seed = [0u8; 32];
+        rand::RngCore::fill_bytes(&mut rand::rngs::OsRng, &mut seed);
+        let container = create_encrypted_key_container(&seed, "test_password").unwrap();
+
+        let container_cstr = CString::new(container).unwrap();
+        let pass_cstr = CString::new("test_password").unwrap();
+        let messages = serde_json::json!(["AQID", "BAUG"]).to_string();
+        let messages_cstr = CString::new(messages).unwrap();
+
+        unsafe {
+            let opened = signer_session_open(container_cstr.as_ptr(), pass_cstr.as_ptr(), 60);
+            assert_eq!(opened.error_code, 0);
+            let info: serde_json::Value =
+                serde_json::from_str(CStr::from_ptr(opened.result).to_str().unwrap()).unwrap();
+            let session_id = info["session_id"].as_u64().unwrap();
+            signer_free_result(opened);
+
+            let signed = signer_session_sign_batch(session_id, messages_cstr.as_ptr());
+            assert_eq!(signed.error_code, 0);
+            let body: serde_json::Value =
+                serde_json::from_str(CStr::from_ptr(signed.result).to_str().unwrap()).unwrap();
+            assert_eq!(body["signatures"].as_array().unwrap().len(), 2);
+            signer_free_result(signed);
+
+            assert_eq!(signer_session_close(session_id), 0);
+            assert_eq!(signer_session_close(session_id), 1);
+
+            let rejected = signer_session_sign_batch(session_id, messages_cstr.as_ptr());
+            assert_eq!(rejected.error_code, 4);
+            signer_free_result(rejected);
+        }
+    }
+
+    fn pack(messages: &[&[u8]]) -> Vec<u8> {
+        let mut packed = Vec::new();
+        for message in messages {
+            packed.extend_from_slice(&(message.len() as u32).to_le_bytes());
+            packed.extend_from_slice(message);
+        }
+        packed
+    }
+
+    #[test]
+    fn test_unpack_messages() {
+        let packed = pack(&[b"abc", b"", b"defg"]);
+        let messages = unpack_messages(&packed, 3).unwrap();
+        assert_eq!(messages, vec![&b"abc"[..], &b""[..], &b"defg"[..]]);
+
+        assert!(unpack_messages(&packed, 2).is_none());
+        assert!(unpack_messages(&packed, 4).is_none());
+        assert!(unpack_messages(&packed[..packed.len() - 1], 3).is_none());
+    }
+
+    #[test]
+    fn test_ffi_sign_batch_packed() {
+        std::env::set_var("SIGNER_ALLOW_INSECURE_MEMORY", "1");
+        let mut seed = [0u8; 32];
+        rand::RngCore::fill_bytes(&mut rand::rngs::OsRng, &mut seed);
+        let container = create_encrypted_key_container(&seed, "test_password").unwrap();
+        let container_cstr = CString::new(container).unwrap();
+        let pass_cstr = CString::new("test_password").unwrap();
+
+        let messages: [&[u8]; 3] = [b"first", b"second message", b"third"];
+        let packed = pack(&messages);
+        let mut signatures = vec![0u8; messages.len() * SIGNATURE_SIZE];
+        let mut public_key = [0u8; 32];
+
+        let code = unsafe {
+            signer_sign_batch_packed(
+                container_cstr.as_ptr(),
+                pass_cstr.as_ptr(),
+                packed.as_ptr(),
+                packed.len(),
+                messages.len(),
+                signatures.as_mut_ptr(),
+                signatures.len(),
+                public_key.as_mut_ptr(),
+            )
+        };
+        assert_eq!(code, 0);
+
+        let signing_key = ed25519_dalek::SigningKey::from_bytes(&seed);
+        assert_eq!(public_key, signing_key.verifying_key().to_bytes());
+        for (message, signature) in messages.iter().zip(signatures.chunks_exact(SIGNATURE_SIZE)) {
+            let expected = ed25519_dalek::Signer::sign(&signing_key, message).to_bytes();
+            assert_eq!(signature, expected.as_slice());
+        }
+
+        let code = unsafe {
+            signer_sign_batch_packed(
+                container_cstr.as_ptr(),
+                pass_cstr.as_ptr(),
+                packed.as_ptr(),
+                packed.len(),
+                messages.len(),
+                signatures.as_mut_ptr(),
+                SIGNATURE_SIZE,
+                std::ptr::null_mut(),
+            )
+        };
+        assert_eq!(code, 6);
+    }
+
+    #[test]
+    fn test_ffi_session_sign_packed_unknown_session() {
+        let packed = pack(&[b"msg"]);
+        let mut signatures = vec![0u8; SIGNATURE_SIZE];
+        let code = unsafe {
+            signer_session_sign_packed(
+                u64::MAX,
+                packed.as_ptr(),
+                packed.len(),
+                1,
+                signatures.as_mut_ptr(),
+                signatures.len(),
+            )
+        };
+        assert_eq!(code, 7);
+    }
+
     #[test]
     fn test_ffi_version() {
         let version_ptr = signer_version();
@@ -20,28 +20,29 @@
 //! - Leaves the locked memory buffer
 //! - Gets logged or written to disk
 //! - Gets swapped to disk (memory is locked)
-//! - Survives beyond the signing function scope
+//! - Survives beyond the signing function scope, or the time-to-live of an
+//!   explicitly opened `SigningSession` used for bulk signing
 
 pub mod crypto;
 pub mod error;
 pub mod secure_buffer;
+pub mod session;
 
 #[cfg(feature = "ffi")]
 pub mod ffi;
 
 // Solana (Ed25519)
 pub use crypto::{
-    create_encrypted_key_container, decrypt_and_sign, sign_transaction, EncryptedKeyContainer,
-    SigningResult,
+    create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch, sign_transaction,
+    EncryptedKeyContainer, SigningResult, SIGNATURE_SIZE,
 };
 
 // EVM (secp256k1)
-pub use crypto::{
-    decrypt_and_sign_evm, sign_evm_transaction, EVMSigningResult,
-};
+pub use crypto::{decrypt_and_sign_evm, sign_evm_transaction, EVMSigningResult};
 
 pub use error::SignerError;
 pub use secure_buffer::{LockingMode, SecureBuffer};
+pub use session::SigningSession;
 
 /// Library version
 pub const VERSION: &str = env!("CARGO_PKG_VERSION");
@@ -49,11 +50,12 @@ pub const VERSION: &str = env!("CARGO_PKG_VERSION");
 /// Re-export for convenience
 pub mod prelude {
     pub use crate::crypto::{
-        create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_evm,
-        EncryptedKeyContainer, EVMSigningResult,
+        create_encrypted_key_container, decrypt_and_sign, decrypt_and_sign_batch,
+        decrypt_and_sign_evm, EVMSigningResult, EncryptedKeyContainer,
     };
     pub use crate::error::SignerError;
     pub use crate::secure_buffer::SecureBuffer;
+    pub use crate::session::SigningSession;
 }
 
 #[cfg(test)]
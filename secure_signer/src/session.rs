@@ -0,0 +1,350 @@
+//! Signing sessions for bulk offline signing
+//!
+//! Decrypting a key container runs Argon2id (256 MB, 4 iterations), which
+//! costs far more than the Ed25519 signature itself. A session pays that
+//! cost once: the seed is decrypted into a locked SecureBuffer and kept
+//! there while any number of messages are signed.
+//!
+//! # Security Model
+//!
+//! - The seed only ever lives in the session's locked buffer
+//! - Every session has a hard time-to-live; a watchdog thread zeroizes the
+//!   seed when it expires, even if the caller never signs again
+//! - `close()` (or dropping the last reference) zeroizes immediately
+//! - FFI callers receive a numeric session id, never a pointer to key memory
+
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Condvar, Mutex, MutexGuard, OnceLock};
+use std::thread;
+use std::time::{Duration, Instant};
+
+use ed25519_dalek::SigningKey;
+
+use crate::crypto::{
+    check_signature_buffer, decrypt_key_container, sign_messages_into, signing_key_from_buffer,
+    SIGNATURE_SIZE,
+};
+use crate::error::SignerError;
+use crate::secure_buffer::SecureBuffer;
+
+/// Upper bound on a session's lifetime, whatever the caller asks for
+pub const MAX_SESSION_TTL: Duration = Duration::from_secs(3600);
+
+/// Session state guarded by the session mutex
+struct SessionState {
+    /// Decrypted Ed25519 seed; `None` once the session is closed or expired
+    key: Option<SecureBuffer>,
+    /// Instant after which the seed is zeroized
+    deadline: Instant,
+}
+
+impl SessionState {
+    fn wipe(&mut self) {
+        if let Some(mut key) = self.key.take() {
+            // Explicit zeroization (also happens on drop)
+            key.zeroize();
+        }
+    }
+}
+
+/// State shared between a session handle and its watchdog thread
+///
+/// The watchdog holds only this, never the `SigningSession`, so dropping the
+/// last handle runs `SigningSession::drop` and wipes the seed right away.
+struct SessionShared {
+    state: Mutex<SessionState>,
+    wake: Condvar,
+}
+
+impl SessionShared {
+    fn lock(&self) -> MutexGuard<'_, SessionState> {
+        // A poisoned lock still guards valid state; keep wiping possible
+        self.state.lock().unwrap_or_else(|e| e.into_inner())
+    }
+
+    /// Zeroize the seed and wake the watchdog so it exits
+    fn close(&self) {
+        self.lock().wipe();
+        self.wake.notify_all();
+    }
+
+    /// Sleep until the deadline (or close) and zeroize the seed
+    fn watchdog(&self) {
+        let mut state = self.lock();
+        loop {
+            if state.key.is_none() {
+                return;
+            }
+            let now = Instant::now();
+            if now >= state.deadline {
+                state.wipe();
+                return;
+            }
+            let wait = state.deadline - now;
+            state = match self.wake.wait_timeout(state, wait) {
+                Ok((guard, _)) => guard,
+                Err(e) => e.into_inner().0,
+            };
+        }
+    }
+}
+
+/// A decrypted signing key held in locked memory for a bounded time
+pub struct SigningSession {
+    shared: Arc<SessionShared>,
+    public_key: String,
+}
+
+impl SigningSession {
+    /// Decrypt a key container once and keep the seed for `ttl`
+    ///
+    /// # Arguments
+    /// * `container_json` - JSON-serialized EncryptedKeyContainer
+    /// * `passphrase` - The passphrase for decryption
+    /// * `ttl` - Session lifetime (capped at MAX_SESSION_TTL)
+    pub fn open(
+        container_json: &str,
+        passphrase: &str,
+        ttl: Duration,
+    ) -> Result<Arc<Self>, SignerError> {
+        let mut secure_key = decrypt_key_container(container_json, passphrase)?;
+
+        let public_key = match signing_key_from_buffer(&secure_key) {
+            Ok(signing_key) => bs58::encode(signing_key.verifying_key().as_bytes()).into_string(),
+            Err(e) => {
+                secure_key.zeroize();
+                return Err(e);
+            }
+        };
+
+        let shared = Arc::new(SessionShared {
+            state: Mutex::new(SessionState {
+                key: Some(secure_key),
+                deadline: Instant::now() + ttl.min(MAX_SESSION_TTL),
+            }),
+            wake: Condvar::new(),
+        });
+
+        let watched = Arc::clone(&shared);
+        if let Err(e) = thread::Builder::new()
+            .name("signer-session-watchdog".into())
+            .spawn(move || watched.watchdog())
+        {
+            shared.close();
+            return Err(SignerError::IoError(e.to_string()));
+        }
+
+        Ok(Arc::new(Self { shared, public_key }))
+    }
+
+    /// Base58 public key of the session's signing key
+    pub fn public_key(&self) -> &str {
+        &self.public_key
+    }
+
+    /// Whether the session still holds a usable key
+    pub fn is_open(&self) -> bool {
+        let state = self.lock();
+        state.key.is_some() && Instant::now() < state.deadline
+    }
+
+    /// Time left before the seed is zeroized
+    pub fn remaining(&self) -> Duration {
+        let state = self.lock();
+        if state.key.is_none() {
+            return Duration::ZERO;
+        }
+        state.deadline.saturating_duration_since(Instant::now())
+    }
+
+    /// Sign every message with the session key
+    ///
+    /// Signatures are returned in input order.
+    pub fn sign_batch<M: AsRef<[u8]>>(&self, messages: &[M]) -> Result<Vec<[u8; 64]>, SignerError> {
+        let mut out = vec![0u8; messages.len() * SIGNATURE_SIZE];
+        self.sign_into(messages, &mut out)?;
+        Ok(out
+            .chunks_exact(SIGNATURE_SIZE)
+            .map(|chunk| chunk.try_into().expect("chunk is 64 bytes"))
+            .collect())
+    }
+
+    /// Sign every message into consecutive 64-byte slots of `out`
+    ///
+    /// The signing key is expanded from the seed once per batch and zeroized
+    /// when the batch completes.
+    pub fn sign_into<M: AsRef<[u8]>>(
+        &self,
+        messages: &[M],
+        out: &mut [u8],
+    ) -> Result<(), SignerError> {
+        check_signature_buffer(messages.len(), out)?;
+
+        let mut state = self.lock();
+        if Instant::now() >= state.deadline {
+            state.wipe();
+            self.shared.wake.notify_all();
+            return Err(SignerError::SessionExpired);
+        }
+        let key = state.key.as_ref().ok_or(SignerError::SessionClosed)?;
+
+        // ed25519-dalek's SigningKey zeroizes itself on drop
+        let signing_key: SigningKey = signing_key_from_buffer(key)?;
+        sign_messages_into(&signing_key, messages, out)
+    }
+
+    /// Zeroize the seed and end the session
+    pub fn close(&self) {
+        self.shared.close();
+    }
+
+    fn lock(&self) -> MutexGuard<'_, SessionState> {
+        self.shared.lock()
+    }
+}
+
+impl Drop for SigningSession {
+    fn drop(&mut self) {
+        self.shared.close();
+    }
+}
+
+// ════════════════════════════════════════════════════════════
+//  Session registry (used by the FFI layer)
+// ════════════════════════════════════════════════════════════
+
+static NEXT_SESSION_ID: AtomicU64 = AtomicU64::new(1);
+
+fn registry() -> &'static Mutex<HashMap<u64, Arc<SigningSession>>> {
+    static SESSIONS: OnceLock<Mutex<HashMap<u64, Arc<SigningSession>>>> = OnceLock::new();
+    SESSIONS.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+/// Register a session and return its handle
+pub fn register_session(session: Arc<SigningSession>) -> u64 {
+    let id = NEXT_SESSION_ID.fetch_add(1, Ordering::Relaxed);
+    registry()
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .insert(id, session);
+    id
+}
+
+/// Look up a registered session by handle
+pub fn get_session(id: u64) -> Option<Arc<SigningSession>> {
+    registry()
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .get(&id)
+        .cloned()
+}
+
+/// Close a session and drop it from the registry
+///
+/// Returns false if the handle is unknown.
+pub fn close_session(id: u64) -> bool {
+    let session = registry()
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .remove(&id);
+    match session {
+        Some(session) => {
+            session.close();
+            true
+        }
+        None => false,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::crypto::EncryptedKeyContainer;
+    use ed25519_dalek::{Signature, Verifier};
+    use rand::rngs::OsRng;
+    use rand::RngCore;
+
+    fn test_container() -> ([u8; 32], String) {
+        std::env::set_var("SIGNER_ALLOW_INSECURE_MEMORY", "1");
+        let mut seed = [0u8; 32];
+        OsRng.fill_bytes(&mut seed);
+        let json = EncryptedKeyContainer::encrypt(&seed, "session_pass")
+            .unwrap()
+            .to_json()
+            .unwrap();
+        (seed, json)
+    }
+
+    #[test]
+    fn test_session_signs_batch() {
+        let (seed, json) = test_container();
+        let session = SigningSession::open(&json, "session_pass", Duration::from_secs(60)).unwrap();
+
+        let messages: Vec<Vec<u8>> = (0..5u8).map(|i| vec![i; 100]).collect();
+        let signatures = session.sign_batch(&messages).unwrap();
+
+        let verifying_key = SigningKey::from_bytes(&seed).verifying_key();
+        assert_eq!(
+            session.public_key(),
+            bs58::encode(verifying_key.as_bytes()).into_string()
+        );
+        assert_eq!(signatures.len(), 5);
+        for (message, signature) in messages.iter().zip(&signatures) {
+            assert!(verifying_key
+                .verify(message, &Signature::from_bytes(signature))
+                .is_ok());
+        }
+        session.close();
+    }
+
+    #[test]
+    fn test_closed_session_rejects_signing() {
+        let (_, json) = test_container();
+        let session = SigningSession::open(&json, "session_pass", Duration::from_secs(60)).unwrap();
+        session.close();
+        assert!(!session.is_open());
+        assert!(matches!(
+            session.sign_batch(&[b"msg"]),
+            Err(SignerError::SessionClosed)
+        ));
+    }
+
+    #[test]
+    fn test_dropping_last_handle_wipes_seed() {
+        let (_, json) = test_container();
+        let session = SigningSession::open(&json, "session_pass", Duration::from_secs(60)).unwrap();
+        let shared = Arc::clone(&session.shared);
+        drop(session);
+        assert!(shared.lock().key.is_none());
+    }
+
+    #[test]
+    fn test_session_expires() {
+        let (_, json) = test_container();
+        let session =
+            SigningSession::open(&json, "session_pass", Duration::from_millis(50)).unwrap();
+        thread::sleep(Duration::from_millis(150));
+        assert!(!session.is_open());
+        assert_eq!(session.remaining(), Duration::ZERO);
+        assert!(session.sign_batch(&[b"msg"]).is_err());
+    }
+
+    #[test]
+    fn test_wrong_passphrase_fails() {
+        let (_, json) = test_container();
+        let result = SigningSession::open(&json, "wrong", Duration::from_secs(60));
+        assert!(matches!(result, Err(SignerError::DecryptionFailed)));
+    }
+
+    #[test]
+    fn test_registry_roundtrip() {
+        let (_, json) = test_container();
+        let session = SigningSession::open(&json, "session_pass", Duration::from_secs(60)).unwrap();
+        let id = register_session(session);
+        assert!(get_session(id).is_some());
+        assert!(close_session(id));
+        assert!(get_session(id).is_none());
+        assert!(!close_session(id));
+    }
+}
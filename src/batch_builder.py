@@ -0,0 +1,511 @@
+"""
+Batch Transaction Builder - Pack payout runs into dense unsigned transactions
+
+Reads (recipient, amount) rows from CSV or JSONL, packs as many System
+transfer instructions into each legacy transaction as the 1232-byte packet
+limit allows (always leaving room for the infrastructure-fee transfer), and
+streams the unsigned transactions into a single JSONL bundle file.
+
+Given address lookup tables holding the recipients, transactions are built
+as v0 messages instead: each recipient found in a table costs a one-byte
+index rather than a 32-byte key, so roughly three times as many transfers
+fit, up to the runtime's per-transaction account lock limit.
+
+Bundle layout (one JSON object per line):
+    {"type": "unsigned_bundle", ...header...}
+    {"type": "unsigned_transaction", "index": 0, "data": <base64>, ...}
+    ...
+
+Signing a bundle produces the same layout with "signed_bundle" and
+"signed_transaction" records, each carrying its base58 signature.
+
+B - Love U 3000
+"""
+
+import base64
+import csv
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import Message, MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import transfer, TransferParams
+from solders.transaction import Transaction, VersionedTransaction
+
+from config import LAMPORTS_PER_SOL, INFRASTRUCTURE_FEE_PERCENTAGE, INFRASTRUCTURE_FEE_WALLET
+
+
+# Maximum serialized transaction size (IPv6 MTU minus headers)
+PACKET_DATA_SIZE = 1232
+
+# Accounts a single transaction may reference (static plus looked-up)
+MAX_TX_ACCOUNT_LOCKS = 64
+
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+
+# Serialized size of a System transfer instruction inside a message:
+# program index (1) + account count (1) + 2 account indexes + data length (1) + 12 data bytes
+TRANSFER_IX_SIZE = 17
+
+# AdvanceNonceAccount in durable-nonce mode: 3 account indexes + 4 data bytes,
+# adding the nonce account and the RecentBlockhashes sysvar as keys
+ADVANCE_NONCE_IX_SIZE = 10
+ADVANCE_NONCE_EXTRA_KEYS = 2
+
+BUNDLE_TYPE = "unsigned_bundle"
+SIGNED_BUNDLE_TYPE = "signed_bundle"
+BUNDLE_VERSION = "1.0"
+
+
+@dataclass
+class PayoutRow:
+    """One validated payout line"""
+    recipient: str
+    lamports: int
+    line: int = 0
+
+
+@dataclass
+class PackedTransaction:
+    """An unsigned transaction and the payouts packed into it"""
+    tx_bytes: bytes
+    recipients: List[Tuple[str, int]]
+    fee_lamports: int
+    nonce_account: Optional[str] = None
+
+    @property
+    def total_lamports(self) -> int:
+        return sum(lamports for _, lamports in self.recipients)
+
+
+@dataclass
+class BatchBuildSummary:
+    """Result of a batch build run"""
+    bundle_path: str
+    transactions: int = 0
+    transfers: int = 0
+    total_lamports: int = 0
+    fee_lamports: int = 0
+    elapsed: float = 0.0
+    skipped: List[Tuple[int, str]] = field(default_factory=list)
+    nonce_accounts: List[str] = field(default_factory=list)  # consumed by the bundle, in order
+
+    @property
+    def transfers_per_second(self) -> float:
+        return self.transfers / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def transactions_per_second(self) -> float:
+        return self.transactions / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def compact_u16_len(value: int) -> int:
+    """Length of Solana's compact-u16 (shortvec) encoding"""
+    if value < 0x80:
+        return 1
+    if value < 0x4000:
+        return 2
+    return 3
+
+
+def legacy_transaction_size(num_signers: int, num_keys: int, instruction_sizes: Iterable[int]) -> int:
+    """Serialized size of a legacy transaction with the given shape"""
+    instruction_sizes = list(instruction_sizes)
+    message = (
+        3                                   # header
+        + compact_u16_len(num_keys) + 32 * num_keys
+        + 32                                # recent blockhash
+        + compact_u16_len(len(instruction_sizes)) + sum(instruction_sizes)
+    )
+    return compact_u16_len(num_signers) + 64 * num_signers + message
+
+
+def v0_transaction_size(
+    num_signers: int,
+    num_static_keys: int,
+    instruction_sizes: Iterable[int],
+    lookups: Iterable[Tuple[int, int]] = ()
+) -> int:
+    """
+    Serialized size of a v0 transaction; `lookups` holds (writable,
+    readonly) index counts for each lookup table the message uses
+    """
+    instruction_sizes = list(instruction_sizes)
+    lookups = list(lookups)
+    message = (
+        1                                   # version prefix
+        + 3                                 # header
+        + compact_u16_len(num_static_keys) + 32 * num_static_keys
+        + 32                                # recent blockhash
+        + compact_u16_len(len(instruction_sizes)) + sum(instruction_sizes)
+        + compact_u16_len(len(lookups))
+        + sum(32 + compact_u16_len(w) + w + compact_u16_len(r) + r for w, r in lookups)
+    )
+    return compact_u16_len(num_signers) + 64 * num_signers + message
+
+
+def compile_unsigned_transaction(
+    instructions: Sequence[Instruction],
+    payer: Pubkey,
+    blockhash: Hash,
+    lookup_tables: Optional[Sequence[AddressLookupTableAccount]] = None
+) -> bytes:
+    """
+    Serialize an unsigned transaction: legacy, or v0 when lookup tables
+    are given (accounts found in a table are referenced by index)
+    """
+    if lookup_tables is None:
+        return bytes(Transaction.new_unsigned(Message.new_with_blockhash(instructions, payer, blockhash)))
+    message = MessageV0.try_compile(payer, instructions, lookup_tables, blockhash)
+    signatures = [Signature.default()] * message.header.num_required_signatures
+    return bytes(VersionedTransaction.populate(message, signatures))
+
+
+def to_lamports(amount: Union[str, float, int, Decimal]) -> int:
+    """Convert a SOL amount to lamports without float rounding errors"""
+    try:
+        value = Decimal(str(amount).strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {amount!r}")
+    if not value.is_finite():
+        raise ValueError(f"Invalid amount: {amount!r}")
+    lamports = value * LAMPORTS_PER_SOL
+    if lamports != lamports.to_integral_value():
+        raise ValueError(f"Amount has more than 9 decimal places: {amount}")
+    return int(lamports)
+
+
+# ── Row input ───────────────────────────────────────────────
+
+def read_payout_rows(path: str) -> Iterator[Tuple[int, str, str]]:
+    """
+    Stream raw (line, recipient, amount) rows from a CSV or JSONL file
+
+    CSV files use columns recipient,amount (a header row is optional).
+    JSONL files hold one {"recipient": ..., "amount": ...} object per line;
+    lines that are not JSON objects come through with empty fields.
+    """
+    filepath = Path(path)
+    with open(filepath, "r", newline="") as f:
+        if filepath.suffix.lower() in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if not isinstance(record, dict):
+                    # Empty fields: validate_rows() skips the line, keeping its number
+                    yield line_no, "", ""
+                    continue
+                yield line_no, str(record.get("recipient", "")), str(record.get("amount", ""))
+        else:
+            for line_no, record in enumerate(csv.reader(f), start=1):
+                if not record or record[0].strip().startswith("#"):
+                    continue
+                if line_no == 1 and record[0].strip().lower() in ("recipient", "address", "to"):
+                    continue
+                amount = record[1] if len(record) > 1 else ""
+                yield line_no, record[0].strip(), amount.strip()
+
+
+def validate_rows(
+    rows: Iterable,
+    skipped: Optional[List[Tuple[int, str]]] = None
+) -> Iterator[PayoutRow]:
+    """
+    Validate (recipient, amount) or (line, recipient, amount) rows
+
+    Invalid rows are not raised; they are appended to `skipped` as
+    (line, reason) so one bad line does not abort a payroll run.
+    """
+    for index, row in enumerate(rows, start=1):
+        if isinstance(row, PayoutRow):
+            yield row
+            continue
+        if len(row) == 3:
+            line, recipient, amount = row
+        else:
+            line, (recipient, amount) = index, row
+        try:
+            Pubkey.from_string(recipient)
+        except Exception:
+            if skipped is not None:
+                skipped.append((line, "Invalid recipient address"))
+            continue
+        try:
+            lamports = to_lamports(amount)
+            if lamports <= 0:
+                raise ValueError("Amount must be greater than 0")
+        except ValueError as e:
+            if skipped is not None:
+                skipped.append((line, str(e)))
+            continue
+        yield PayoutRow(recipient=recipient, lamports=lamports, line=line)
+
+
+# ── Packing ─────────────────────────────────────────────────
+
+def pack_transfer_transactions(
+    from_pubkey: str,
+    rows: Iterable[PayoutRow],
+    recent_blockhash: str,
+    fee_percentage: float = INFRASTRUCTURE_FEE_PERCENTAGE,
+    fee_wallet: str = INFRASTRUCTURE_FEE_WALLET,
+    max_transfers_per_tx: Optional[int] = None,
+    packet_size: int = PACKET_DATA_SIZE,
+    nonces: Optional[Iterable] = None,
+    lookup_tables: Optional[Sequence[AddressLookupTableAccount]] = None
+) -> Iterator[PackedTransaction]:
+    """
+    Greedily pack payout rows into as few unsigned transactions as possible
+
+    Each transaction carries one infrastructure-fee transfer covering the
+    payouts packed into it; space for it is reserved whenever fees apply.
+
+    With `nonces` (NonceAccount objects, one consumed per transaction) the
+    transactions start with AdvanceNonceAccount and use the nonce value
+    instead of `recent_blockhash`, so they do not expire. The rows are then
+    grouped before anything is yielded, so running out of nonce accounts
+    raises ValueError up front instead of partway through a bundle.
+
+    With `lookup_tables` the transactions are v0 messages that reference
+    recipients (and the fee wallet) held in the tables by index.
+    """
+    from_pk = Pubkey.from_string(from_pubkey)
+    fee_pk = Pubkey.from_string(fee_wallet)
+    charge_fee = fee_percentage > 0
+    nonces = list(nonces) if nonces is not None else None
+    extra_keys = ADVANCE_NONCE_EXTRA_KEYS if nonces is not None else 0
+    extra_ix = [ADVANCE_NONCE_IX_SIZE] if nonces is not None else []
+
+    base_keys = {from_pk, SYSTEM_PROGRAM_ID}
+    if charge_fee:
+        base_keys.add(fee_pk)
+
+    # Payer and invoked program must stay static keys; anything else found in
+    # a table is loaded through it (first table wins, as in MessageV0.try_compile)
+    table_of = {}
+    for table_index, table in enumerate(lookup_tables or ()):
+        for address in table.addresses:
+            table_of.setdefault(address, table_index)
+    for static in (from_pk, SYSTEM_PROGRAM_ID):
+        table_of.pop(static, None)
+
+    def fits(keys: set, transfers: int) -> bool:
+        if len(keys) + extra_keys > MAX_TX_ACCOUNT_LOCKS:
+            return False
+        ix_sizes = extra_ix + [TRANSFER_IX_SIZE] * (transfers + (1 if charge_fee else 0))
+        if lookup_tables is None:
+            return legacy_transaction_size(1, len(keys) + extra_keys, ix_sizes) <= packet_size
+        loaded = {}
+        for key in keys:
+            if key in table_of:
+                loaded[table_of[key]] = loaded.get(table_of[key], 0) + 1
+        num_static = len(keys) - sum(loaded.values()) + extra_keys
+        lookups = [(count, 0) for count in loaded.values()]  # transfer accounts are writable
+        return v0_transaction_size(1, num_static, ix_sizes, lookups) <= packet_size
+
+    def build(batch: List[PayoutRow]) -> PackedTransaction:
+        instructions = [
+            transfer(TransferParams(
+                from_pubkey=from_pk,
+                to_pubkey=Pubkey.from_string(row.recipient),
+                lamports=row.lamports
+            ))
+            for row in batch
+        ]
+        fee_lamports = sum(int(row.lamports * fee_percentage) for row in batch) if charge_fee else 0
+        if fee_lamports > 0:
+            instructions.append(transfer(TransferParams(
+                from_pubkey=from_pk, to_pubkey=fee_pk, lamports=fee_lamports
+            )))
+        nonce = None
+        if nonces is not None:
+            nonce = nonces.pop(0)
+            instructions.insert(0, nonce.advance_instruction())
+            blockhash = Hash.from_string(nonce.nonce)
+        else:
+            blockhash = Hash.from_string(recent_blockhash)
+        tx_bytes = compile_unsigned_transaction(instructions, from_pk, blockhash, lookup_tables)
+        if len(tx_bytes) > packet_size:
+            raise ValueError(f"Packed transaction is {len(tx_bytes)} bytes (limit {packet_size})")
+        return PackedTransaction(
+            tx_bytes=tx_bytes,
+            recipients=[(row.recipient, row.lamports) for row in batch],
+            fee_lamports=fee_lamports,
+            nonce_account=nonce.address if nonce is not None else None
+        )
+
+    def batches() -> Iterator[List[PayoutRow]]:
+        batch: List[PayoutRow] = []
+        keys = set(base_keys)
+        for row in rows:
+            recipient_pk = Pubkey.from_string(row.recipient)
+            candidate = keys | {recipient_pk}
+            full = max_transfers_per_tx is not None and len(batch) >= max_transfers_per_tx
+            if batch and (full or not fits(candidate, len(batch) + 1)):
+                yield batch
+                batch = []
+                candidate = base_keys | {recipient_pk}
+            batch.append(row)
+            keys = candidate
+        if batch:
+            yield batch
+
+    grouped: Iterable[List[PayoutRow]] = batches()
+    if nonces is not None:
+        grouped = list(grouped)
+        if len(grouped) > len(nonces):
+            raise ValueError(f"Not enough nonce accounts: {len(grouped)} transactions need one each, "
+                             f"{len(nonces)} available")
+    for batch in grouped:
+        yield build(batch)
+
+
+# ── Bundle files ────────────────────────────────────────────
+
+@contextmanager
+def _atomic_open(filepath: Path):
+    """
+    Write through a temporary file that replaces `filepath` only on success
+
+    A build that fails halfway leaves no partial bundle behind for the
+    signer to pick up.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            yield f
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_unsigned_bundle(
+    path: str,
+    from_pubkey: str,
+    recent_blockhash: str,
+    packed: Iterable[PackedTransaction],
+    summary: Optional[BatchBuildSummary] = None,
+    durable_nonce: bool = False
+) -> BatchBuildSummary:
+    """
+    Stream packed transactions into a JSONL bundle as they are built
+
+    The bundle only appears at `path` once every transaction is written;
+    if building fails, nothing is left at `path`.
+    """
+    filepath = Path(path)
+    summary = summary or BatchBuildSummary(bundle_path=str(filepath))
+    summary.bundle_path = str(filepath)
+
+    with _atomic_open(filepath) as f:
+        f.write(json.dumps({
+            "type": BUNDLE_TYPE,
+            "version": BUNDLE_VERSION,
+            "from": from_pubkey,
+            "recent_blockhash": recent_blockhash,
+            "durable_nonce": durable_nonce,
+            "created_at": int(time.time()),
+        }) + "\n")
+
+        for index, ptx in enumerate(packed):
+            record = {
+                "type": "unsigned_transaction",
+                "index": index,
+                "data": base64.b64encode(ptx.tx_bytes).decode("utf-8"),
+                "recipients": ptx.recipients,
+                "fee_lamports": ptx.fee_lamports,
+            }
+            if ptx.nonce_account:
+                record["nonce_account"] = ptx.nonce_account
+                summary.nonce_accounts.append(ptx.nonce_account)
+            f.write(json.dumps(record) + "\n")
+            summary.transactions += 1
+            summary.transfers += len(ptx.recipients)
+            summary.total_lamports += ptx.total_lamports
+            summary.fee_lamports += ptx.fee_lamports
+
+    return summary
+
+
+def write_signed_bundle(path: str, header: dict, entries: Iterable[dict]) -> int:
+    """
+    Write signed transactions as a signed bundle mirroring an unsigned one
+
+    Args:
+        path: Output path
+        header: Header of the unsigned bundle the entries came from
+        entries: Bundle entries whose "tx_bytes" now hold signed transactions
+
+    Returns:
+        Number of transactions written
+    """
+    filepath = Path(path)
+    written = 0
+
+    with _atomic_open(filepath) as f:
+        f.write(json.dumps({
+            "type": SIGNED_BUNDLE_TYPE,
+            "version": BUNDLE_VERSION,
+            "from": header.get("from"),
+            "recent_blockhash": header.get("recent_blockhash"),
+            "durable_nonce": header.get("durable_nonce", False),
+            "created_at": int(time.time()),
+        }) + "\n")
+
+        for entry in entries:
+            tx_bytes = entry["tx_bytes"]
+            record = {
+                "type": "signed_transaction",
+                "index": entry["index"],
+                "data": base64.b64encode(tx_bytes).decode("utf-8"),
+                "signature": str(VersionedTransaction.from_bytes(tx_bytes).signatures[0]),
+                "recipients": entry.get("recipients", []),
+                "fee_lamports": entry.get("fee_lamports", 0),
+            }
+            if entry.get("nonce_account"):
+                record["nonce_account"] = entry["nonce_account"]
+            f.write(json.dumps(record) + "\n")
+            written += 1
+
+    return written
+
+
+def read_bundle_header(path: str, bundle_type: str = BUNDLE_TYPE) -> dict:
+    """Read and validate the header line of a bundle file"""
+    with open(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+    if header.get("type") != bundle_type:
+        raise ValueError("Not a transaction bundle file")
+    return header
+
+
+def iter_bundle_transactions(path: str, bundle_type: str = BUNDLE_TYPE) -> Iterator[dict]:
+    """Stream transaction entries from a bundle; entry["tx_bytes"] holds the decoded bytes"""
+    with open(path, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("type") != bundle_type:
+            raise ValueError("Not a transaction bundle file")
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            entry["tx_bytes"] = base64.b64decode(entry["data"])
+            yield entry
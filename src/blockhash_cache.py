@@ -0,0 +1,203 @@
+"""
+Blockhash Prefetch Cache - Shared recent blockhash for transaction builders
+
+A blockhash stays valid until the chain passes its lastValidBlockHeight
+(about 150 blocks after it was produced). Builders in a burst can all use
+the same hash, so the provider keeps one cached and only refreshes it once
+the estimated block height comes within a safety margin of expiry.
+
+After the first request a daemon thread keeps the cache warm: it re-anchors
+the block height estimate and refreshes the hash ahead of expiry, so builds
+stay off the RPC round trip entirely.
+
+B - Love U 3000
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.network import SolanaNetwork, endpoints_key
+from src.rpc_pool import RpcPool
+
+
+# A blockhash is accepted for this many blocks after it was produced
+BLOCKHASH_VALID_BLOCKS = 150
+
+# getLatestBlockhash is requested at finalized commitment, which trails the
+# tip by roughly this many blocks
+FINALIZED_LAG_BLOCKS = 32
+
+# Target slot time; used to extrapolate block height between anchors
+SLOT_DURATION_SECONDS = 0.4
+
+
+@dataclass
+class CachedBlockhash:
+    """A fetched blockhash and the block height anchor it was seen at"""
+    blockhash: str
+    last_valid_block_height: int
+    anchor_block_height: int
+    anchored_at: float
+
+    def estimated_block_height(self, now: float = None) -> int:
+        elapsed = (now if now is not None else time.monotonic()) - self.anchored_at
+        return self.anchor_block_height + int(elapsed / SLOT_DURATION_SECONDS)
+
+    def blocks_remaining(self, now: float = None) -> int:
+        return self.last_valid_block_height - self.estimated_block_height(now)
+
+
+class BlockhashProvider:
+    """
+    Serve a fresh-enough cached blockhash to every transaction builder
+
+    Args:
+        network: SolanaNetwork used for fetches (a private one is created if omitted)
+        refresh_margin: Refresh once fewer than this many blocks of validity remain
+        prefetch_interval: Seconds between background re-anchor/refresh checks
+    """
+
+    def __init__(
+        self,
+        network: SolanaNetwork = None,
+        refresh_margin: int = 60,
+        prefetch_interval: float = 5.0
+    ):
+        self.network = network or SolanaNetwork()
+        self.refresh_margin = refresh_margin
+        self.prefetch_interval = prefetch_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+        self._cached: Optional[CachedBlockhash] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ── Cache ───────────────────────────────────────────────
+
+    def _is_fresh(self, cached: Optional[CachedBlockhash]) -> bool:
+        return cached is not None and cached.blocks_remaining() > self.refresh_margin
+
+    def refresh(self) -> Optional[CachedBlockhash]:
+        """Fetch a new blockhash from the network and cache it"""
+        result = self.network.get_latest_blockhash()
+        if not result:
+            return None
+
+        blockhash, last_valid_block_height = result
+        cached = CachedBlockhash(
+            blockhash=blockhash,
+            last_valid_block_height=last_valid_block_height,
+            anchor_block_height=(
+                last_valid_block_height - BLOCKHASH_VALID_BLOCKS + FINALIZED_LAG_BLOCKS
+            ),
+            anchored_at=time.monotonic()
+        )
+        with self._lock:
+            self._cached = cached
+            self.refreshes += 1
+        return cached
+
+    def get_blockhash(self) -> Optional[Tuple[str, int]]:
+        """
+        Get a recent blockhash, same shape as SolanaNetwork.get_latest_blockhash
+
+        Returns:
+            (blockhash, lastValidBlockHeight) or None if the network is unreachable
+        """
+        with self._lock:
+            cached = self._cached
+            if self._is_fresh(cached):
+                self.hits += 1
+                return cached.blockhash, cached.last_valid_block_height
+            self.misses += 1
+
+        # Concurrent misses share one fetch instead of each hitting the RPC
+        with self._refresh_lock:
+            with self._lock:
+                cached = self._cached
+            if not self._is_fresh(cached):
+                cached = self.refresh()
+        self.start()
+        if cached is None:
+            return None
+        return cached.blockhash, cached.last_valid_block_height
+
+    def blocks_remaining(self, last_valid_block_height: int) -> Optional[int]:
+        """Estimate how many blocks remain before a given lastValidBlockHeight"""
+        with self._lock:
+            cached = self._cached
+        if cached is None:
+            return None
+        return last_valid_block_height - cached.estimated_block_height()
+
+    def invalidate(self):
+        with self._lock:
+            self._cached = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "refreshes": self.refreshes}
+
+    # ── Background prefetch ─────────────────────────────────
+
+    def _reanchor(self):
+        # The anchor estimates the tip (see refresh()), so read the height at
+        # confirmed commitment; the RPC default, finalized, trails it by
+        # FINALIZED_LAG_BLOCKS and would overstate the blocks remaining
+        height = self.network.get_block_height(commitment="confirmed")
+        if height is None:
+            return
+        with self._lock:
+            if self._cached is not None:
+                self._cached.anchor_block_height = height
+                self._cached.anchored_at = time.monotonic()
+
+    def _prefetch_loop(self):
+        while not self._stop.wait(self.prefetch_interval):
+            try:
+                self._reanchor()
+                with self._lock:
+                    fresh = self._is_fresh(self._cached)
+                if not fresh:
+                    self.refresh()
+            except Exception:
+                # Offline or flaky RPC: builders fall back to a synchronous fetch
+                pass
+
+    def start(self):
+        """Start the background prefetch thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._prefetch_loop, name="blockhash-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.prefetch_interval + 1)
+            self._thread = None
+
+
+_shared_providers: Dict[str, BlockhashProvider] = {}
+_shared_lock = threading.Lock()
+
+
+def get_blockhash_provider(rpc_url: str = None, pool: RpcPool = None) -> BlockhashProvider:
+    """Get the process-wide provider for an RPC URL or pool (default: the SOLANA_RPC_URLS pool)"""
+    key = endpoints_key(rpc_url, pool)
+    with _shared_lock:
+        provider = _shared_providers.get(key)
+        if provider is None:
+            provider = BlockhashProvider(SolanaNetwork(rpc_url, pool=pool))
+            _shared_providers[key] = provider
+        return provider
@@ -0,0 +1,399 @@
+"""
+Outbox Broadcaster - Land a signing session's transactions concurrently
+
+Loads every signed transaction from an outbox directory (single
+signed_*.json files and signed_bundle_*.jsonl bundles), submits them
+concurrently under a rate limit, and keeps re-sending the unconfirmed ones
+every few hundred milliseconds until they confirm or their blockhash
+expires (for durable-nonce transactions: until their nonce is advanced).
+Leaders drop transactions under load, and a re-send is the only
+retry a signed transaction gets, so rebroadcasting is what turns "sent"
+into "landed".
+
+The first send runs preflight so a transaction that can never succeed
+(insufficient funds, bad instruction) fails fast; re-sends skip it.
+Each outcome is appended to a JSONL result ledger as soon as it is known.
+
+B - Love U 3000
+"""
+
+import asyncio
+import base64
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+
+from config import sanitize_error
+from src.batch_builder import SIGNED_BUNDLE_TYPE, iter_bundle_transactions
+from src.confirmation import ConfirmationEngine, ConfirmationResult
+from src.durable_nonce import fetch_nonces, nonce_account_of
+from src.network import AsyncSolanaNetwork
+from src.ui import print_error, print_info, print_success, print_warning
+
+
+# Item states
+PENDING = "pending"
+CONFIRMED = "confirmed"
+FAILED = "failed"
+EXPIRED = "expired"
+TIMED_OUT = "timeout"
+
+# Preflight errors that do not mean the transaction itself is bad
+TRANSIENT_PREFLIGHT_ERRORS = {"BlockhashNotFound", "AlreadyProcessed"}
+
+_UNSIGNED = Signature.default()
+
+
+@dataclass
+class BroadcastItem:
+    """One signed transaction and what happened to it"""
+    signature: str
+    tx_base64: str
+    blockhash: str
+    source: str
+    index: int = 0
+    nonce_account: Optional[str] = None  # durable nonce advanced instead of a blockhash
+    status: str = PENDING
+    landed: bool = False  # seen by the cluster; no more re-sends needed
+    sends: int = 0
+    err: Optional[Any] = None
+    slot: Optional[int] = None
+    first_sent_at: Optional[float] = None
+    resolved_at: Optional[float] = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        if self.first_sent_at is None or self.resolved_at is None:
+            return None
+        return self.resolved_at - self.first_sent_at
+
+    def to_record(self) -> dict:
+        return {
+            "type": "broadcast_result",
+            "signature": self.signature,
+            "source": self.source,
+            "index": self.index,
+            "status": self.status,
+            "sends": self.sends,
+            "slot": self.slot,
+            "err": self.err,
+            "latency_ms": round(self.latency * 1000) if self.latency is not None else None,
+            "recorded_at": int(time.time()),
+        }
+
+
+@dataclass
+class BroadcastReport:
+    """Outcome of a broadcast run"""
+    items: List[BroadcastItem] = field(default_factory=list)
+    elapsed: float = 0.0
+    ledger_path: Optional[str] = None
+
+    def count(self, status: str) -> int:
+        return sum(1 for item in self.items if item.status == status)
+
+    @property
+    def confirmed(self) -> int:
+        return self.count(CONFIRMED)
+
+    @property
+    def sends(self) -> int:
+        return sum(item.sends for item in self.items)
+
+
+def _item_from_bytes(tx_bytes: bytes, source: str, index: int) -> Optional[BroadcastItem]:
+    tx = VersionedTransaction.from_bytes(tx_bytes)
+    if not tx.signatures or tx.signatures[0] == _UNSIGNED:
+        return None
+    return BroadcastItem(
+        signature=str(tx.signatures[0]),
+        tx_base64=base64.b64encode(tx_bytes).decode("utf-8"),
+        blockhash=str(tx.message.recent_blockhash),
+        source=source,
+        index=index,
+        nonce_account=nonce_account_of(tx.message),
+    )
+
+
+def load_signed_transactions(path: str) -> List[BroadcastItem]:
+    """
+    Load signed transactions from an outbox directory, a signed_*.json
+    file or a signed bundle
+
+    Unreadable files and unsigned entries are skipped with a warning;
+    duplicate signatures are loaded once.
+    """
+    path = Path(path)
+    if path.is_dir():
+        files = sorted(path.glob("signed_*.json")) + sorted(path.glob("signed_bundle_*.jsonl"))
+    else:
+        files = [path]
+
+    items: Dict[str, BroadcastItem] = {}
+    for filepath in files:
+        try:
+            if filepath.suffix == ".jsonl":
+                entries = [
+                    (entry.get("index", n), entry["tx_bytes"])
+                    for n, entry in enumerate(iter_bundle_transactions(str(filepath), SIGNED_BUNDLE_TYPE))
+                ]
+            else:
+                with open(filepath, "r") as f:
+                    tx_data = json.load(f)
+                if tx_data.get("type") != "signed_transaction":
+                    raise ValueError("Invalid signed transaction file format")
+                entries = [(0, base64.b64decode(tx_data["data"]))]
+
+            for index, tx_bytes in entries:
+                item = _item_from_bytes(tx_bytes, filepath.name, index)
+                if item is None:
+                    print_warning(f"{filepath.name} #{index}: not signed, skipped")
+                    continue
+                items.setdefault(item.signature, item)
+        except Exception as e:
+            print_warning(f"Skipping {filepath.name}: {sanitize_error(e)}")
+    return list(items.values())
+
+
+class RateLimiter:
+    """Token bucket: `rate` acquisitions per second, bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class OutboxBroadcaster:
+    """
+    Submit and rebroadcast many signed transactions until they land
+
+    Args:
+        network: Async RPC client (its endpoint pool fans each send out)
+        rate_limit: Sends per second across all transactions
+        max_in_flight: Concurrent sendTransaction requests
+        rebroadcast_interval: Seconds between re-send rounds
+        expiry_check_interval: Seconds between blockhash/nonce validity sweeps
+        max_duration: Give up on anything still pending after this long
+        ledger_path: JSONL file that receives one record per outcome
+    """
+
+    def __init__(
+        self,
+        network: AsyncSolanaNetwork,
+        rate_limit: float = 100.0,
+        max_in_flight: int = 32,
+        rebroadcast_interval: float = 0.4,
+        expiry_check_interval: float = 2.0,
+        max_duration: float = 180.0,
+        commitment: str = "confirmed",
+        use_websocket: bool = True,
+        ledger_path: Optional[str] = None
+    ):
+        self.network = network
+        self.limiter = RateLimiter(rate_limit)
+        self.max_in_flight = max_in_flight
+        self.rebroadcast_interval = rebroadcast_interval
+        self.expiry_check_interval = expiry_check_interval
+        self.max_duration = max_duration
+        self.commitment = commitment
+        self.use_websocket = use_websocket
+        self.ledger_path = ledger_path
+
+        self._pending: Dict[str, BroadcastItem] = {}
+        self._ledger = None
+
+    # ── Outcomes ────────────────────────────────────────────
+
+    def _finish(self, item: BroadcastItem, status: str, err: Any = None, slot: Optional[int] = None):
+        if item.status != PENDING:
+            return
+        item.status = status
+        item.err = err
+        item.slot = slot if slot is not None else item.slot
+        item.resolved_at = time.monotonic()
+        self._pending.pop(item.signature, None)
+        if self._ledger is not None:
+            self._ledger.write(json.dumps(item.to_record()) + "\n")
+            self._ledger.flush()
+
+    def _on_confirmation(self, item: BroadcastItem, result: ConfirmationResult):
+        if result.source == "timeout":
+            return
+        item.landed = True
+        if result.confirmed:
+            self._finish(item, CONFIRMED, slot=result.slot)
+        elif result.err is not None:
+            self._finish(item, FAILED, err=result.err, slot=result.slot)
+
+    # ── Sending ─────────────────────────────────────────────
+
+    async def _send(self, item: BroadcastItem, semaphore: asyncio.Semaphore, preflight: bool):
+        await self.limiter.acquire()
+        if item.status != PENDING or item.landed:
+            return
+        async with semaphore:
+            if item.first_sent_at is None:
+                item.first_sent_at = time.monotonic()
+            item.sends += 1
+            try:
+                response = await self.network.submit_transaction(
+                    item.tx_base64, skip_preflight=not preflight, max_retries=0
+                )
+            except Exception:
+                return  # transport trouble; the next round retries
+
+        error = response.get("error")
+        if not error:
+            return
+        err = (error.get("data") or {}).get("err")
+        reason = next(iter(err), None) if isinstance(err, dict) else err
+        if reason == "AlreadyProcessed":
+            item.landed = True
+        elif preflight and err is not None and reason not in TRANSIENT_PREFLIGHT_ERRORS:
+            self._finish(item, FAILED, err=err)
+
+    async def _send_round(self, items: Iterable[BroadcastItem], preflight: bool):
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        await asyncio.gather(*(self._send(item, semaphore, preflight) for item in items))
+
+    async def _expire(self):
+        """
+        Drop pending items that can no longer land: a blockhash that has
+        expired, or a durable nonce that has moved past the signed value
+        """
+        pending = list(self._pending.values())
+        by_blockhash = [item for item in pending if item.nonce_account is None]
+        by_nonce = [item for item in pending if item.nonce_account is not None]
+
+        stale = []
+        if by_blockhash:
+            validity = await self.network.are_blockhashes_valid({item.blockhash for item in by_blockhash})
+            stale += [(item, "BlockhashExpired") for item in by_blockhash
+                      if validity.get(item.blockhash) is False]
+        if by_nonce:
+            nonces = await fetch_nonces(self.network, [item.nonce_account for item in by_nonce])
+            for item in by_nonce:
+                if item.nonce_account not in nonces:
+                    continue  # lookup failed; check again next round
+                nonce = nonces[item.nonce_account]
+                if nonce is None or nonce.nonce != item.blockhash:
+                    stale.append((item, "NonceAdvanced"))
+        if not stale:
+            return
+        # Last look: a stale transaction may still have landed (landing is
+        # also what advances its own nonce)
+        statuses = await self.network.get_signature_statuses([item.signature for item, _ in stale])
+        for item, reason in stale:
+            if statuses.get(item.signature):
+                item.landed = True
+            elif item.signature in statuses:
+                self._finish(item, EXPIRED, err=reason)
+
+    # ── Run ─────────────────────────────────────────────────
+
+    async def run(self, items: Iterable[BroadcastItem]) -> BroadcastReport:
+        """Broadcast items until each is confirmed, failed, expired or timed out"""
+        items = list({item.signature: item for item in items}.values())
+        report = BroadcastReport(items=items, ledger_path=self.ledger_path)
+        if not items:
+            return report
+        started = time.monotonic()
+        self._pending = {item.signature: item for item in items if item.status == PENDING}
+
+        if self.ledger_path:
+            Path(self.ledger_path).parent.mkdir(parents=True, exist_ok=True)
+            self._ledger = open(self.ledger_path, "a")
+        try:
+            # Transactions from an earlier, interrupted run may already be on chain
+            statuses = await self.network.get_signature_statuses(list(self._pending))
+            for signature, status in statuses.items():
+                if status:
+                    self._pending[signature].landed = True
+
+            async with ConfirmationEngine(
+                self.network, commitment=self.commitment, use_websocket=self.use_websocket
+            ) as engine:
+                for item in list(self._pending.values()):
+                    engine.track(item.signature).add_done_callback(
+                        lambda future, item=item: self._on_confirmation(item, future.result())
+                    )
+
+                await self._send_round(list(self._pending.values()), preflight=True)
+                last_expiry_check = time.monotonic()
+
+                while self._pending and time.monotonic() - started < self.max_duration:
+                    await asyncio.sleep(self.rebroadcast_interval)
+                    if not self._pending:
+                        break
+                    if time.monotonic() - last_expiry_check >= self.expiry_check_interval:
+                        last_expiry_check = time.monotonic()
+                        await self._expire()
+                    await self._send_round(list(self._pending.values()), preflight=False)
+
+                for item in list(self._pending.values()):
+                    self._finish(item, TIMED_OUT)
+        finally:
+            if self._ledger is not None:
+                self._ledger.close()
+                self._ledger = None
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+
+def broadcast_signed_transactions(
+    path: str,
+    rpc_url: str = None,
+    ledger_path: Optional[str] = None,
+    **kwargs
+) -> Optional[BroadcastReport]:
+    """
+    Broadcast every signed transaction under `path` and print a summary
+
+    Returns:
+        BroadcastReport, or None if nothing could be loaded or the run failed
+    """
+    items = load_signed_transactions(path)
+    if not items:
+        print_warning("No signed transactions to broadcast")
+        return None
+
+    print_info(f"Broadcasting {len(items)} transaction(s)...")
+
+    async def run() -> BroadcastReport:
+        async with AsyncSolanaNetwork(rpc_url) as network:
+            return await OutboxBroadcaster(network, ledger_path=ledger_path, **kwargs).run(items)
+
+    try:
+        report = asyncio.run(run())
+    except Exception as e:
+        print_error(f"Broadcast failed: {sanitize_error(e)}")
+        return None
+
+    print_success(f"{report.confirmed}/{len(items)} confirmed in {report.elapsed:.1f}s "
+                  f"({report.sends} sends)")
+    for status, label in ((FAILED, "failed"), (EXPIRED, "expired"), (TIMED_OUT, "still pending")):
+        if report.count(status):
+            print_warning(f"{report.count(status)} {label}")
+    if ledger_path:
+        print_info(f"Result ledger: {ledger_path}")
+    return report
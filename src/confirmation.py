@@ -0,0 +1,299 @@
+"""
+Transaction Confirmation Engine - Track many in-flight signatures together
+
+Uses a websocket signatureSubscribe feed when the RPC node offers one, and
+batch-polls every pending signature in a single getSignatureStatuses call
+per tick otherwise. The poll interval backs off while nothing changes and
+snaps back as soon as a signature resolves or a new one is tracked.
+
+B - Love U 3000
+"""
+
+import asyncio
+import itertools
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from src.network import AsyncSolanaNetwork
+from src.rpc_pool import AsyncRpcPool
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+
+# confirmationStatus values that satisfy each requested commitment level
+COMMITMENT_LEVELS = {
+    "processed": {"processed", "confirmed", "finalized"},
+    "confirmed": {"confirmed", "finalized"},
+    "finalized": {"finalized"},
+}
+
+
+@dataclass
+class ConfirmationResult:
+    """Outcome of tracking a single signature"""
+    signature: str
+    confirmed: bool
+    err: Optional[Any] = None
+    slot: Optional[int] = None
+    source: str = "poll"  # "websocket" | "poll" | "timeout"
+
+
+def derive_ws_url(rpc_url: str) -> str:
+    """
+    Derive the pubsub websocket URL for an HTTP RPC URL
+
+    Follows the Solana convention: http -> ws, https -> wss, and an
+    explicit port is bumped by one (8899 -> 8900 on a local validator).
+    """
+    parts = urlsplit(rpc_url)
+    scheme = {"https": "wss", "http": "ws"}.get(parts.scheme, parts.scheme)
+    netloc = parts.netloc
+    if parts.port:
+        host = netloc.rsplit(":", 1)[0]
+        netloc = f"{host}:{parts.port + 1}"
+    return urlunsplit((scheme, netloc, parts.path, parts.query, parts.fragment))
+
+
+class ConfirmationEngine:
+    """
+    Confirm many signatures concurrently over one feed and one poller
+
+    Usage:
+        async with ConfirmationEngine(network) as engine:
+            results = await engine.wait(signatures, timeout=30)
+    """
+
+    def __init__(
+        self,
+        network: AsyncSolanaNetwork,
+        ws_url: Optional[str] = None,
+        commitment: str = "confirmed",
+        use_websocket: bool = True,
+        min_poll_interval: float = 0.25,
+        max_poll_interval: float = 2.0,
+        backoff_factor: float = 1.5,
+    ):
+        if commitment not in COMMITMENT_LEVELS:
+            raise ValueError(f"Invalid commitment: {commitment}")
+
+        self.network = network
+        self.ws_url = ws_url or derive_ws_url(network.rpc_url)
+        self.commitment = commitment
+        self.use_websocket = use_websocket and WEBSOCKETS_AVAILABLE
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._wake = asyncio.Event()
+        self._ws_queue: asyncio.Queue = asyncio.Queue()
+        self._ws_connected = False
+        self._ws_ids = itertools.count(1)
+        self._tasks = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+        return False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def websocket_connected(self) -> bool:
+        return self._ws_connected
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._poll_loop()))
+        if self.use_websocket:
+            self._tasks.append(asyncio.create_task(self._ws_loop()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for signature in list(self._pending):
+            self._resolve(ConfirmationResult(signature, confirmed=False, source="timeout"))
+
+    # ── Public API ──────────────────────────────────────────
+
+    def track(self, signature: str) -> asyncio.Future:
+        """Start tracking a signature; the future resolves to a ConfirmationResult"""
+        future = self._pending.get(signature)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[signature] = future
+            self._ws_queue.put_nowait(signature)
+            self._wake.set()
+        return future
+
+    async def wait(
+        self,
+        signatures: Iterable[str],
+        timeout: float = 30.0
+    ) -> Dict[str, ConfirmationResult]:
+        """Track signatures and wait until all resolve or the timeout expires"""
+        futures = {sig: self.track(sig) for sig in dict.fromkeys(signatures)}
+        if futures:
+            await asyncio.wait(futures.values(), timeout=timeout)
+
+        results = {}
+        for sig, future in futures.items():
+            if not future.done():
+                self._resolve(ConfirmationResult(sig, confirmed=False, source="timeout"))
+            results[sig] = future.result()
+        return results
+
+    # ── Resolution ──────────────────────────────────────────
+
+    def _resolve(self, result: ConfirmationResult):
+        future = self._pending.pop(result.signature, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def _resolve_status(self, signature: str, status: Optional[dict]) -> bool:
+        if not status:
+            return False
+        if status.get("err"):
+            self._resolve(ConfirmationResult(
+                signature, confirmed=False, err=status["err"], slot=status.get("slot")
+            ))
+            return True
+        if status.get("confirmationStatus") in COMMITMENT_LEVELS[self.commitment]:
+            self._resolve(ConfirmationResult(
+                signature, confirmed=True, slot=status.get("slot")
+            ))
+            return True
+        return False
+
+    # ── Batch polling ───────────────────────────────────────
+
+    async def _poll_loop(self):
+        interval = self.min_poll_interval
+        while True:
+            self._wake.clear()
+            resolved = 0
+
+            if self._pending:
+                statuses = await self.network.get_signature_statuses(list(self._pending))
+                for signature, status in statuses.items():
+                    if self._resolve_status(signature, status):
+                        resolved += 1
+
+            if resolved:
+                interval = self.min_poll_interval
+            else:
+                interval = min(interval * self.backoff_factor, self.max_poll_interval)
+
+            # With a live feed the poller is only a backstop for signatures
+            # that landed before their subscription was registered
+            sleep_for = self.max_poll_interval if self._ws_connected else interval
+            woken = asyncio.ensure_future(self._wake.wait())
+            try:
+                done, _ = await asyncio.wait({woken}, timeout=sleep_for)
+            finally:
+                woken.cancel()
+            if done:
+                interval = self.min_poll_interval
+
+    # ── Websocket feed ──────────────────────────────────────
+
+    async def _ws_loop(self):
+        try:
+            async with websockets.connect(self.ws_url) as ws:
+                self._ws_connected = True
+                requests: Dict[int, str] = {}
+                subscriptions: Dict[int, str] = {}
+
+                for signature in list(self._pending):
+                    self._ws_queue.put_nowait(signature)
+
+                reader = asyncio.create_task(self._ws_reader(ws, requests, subscriptions))
+                writer = asyncio.create_task(self._ws_writer(ws, requests))
+                try:
+                    await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    reader.cancel()
+                    writer.cancel()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # No pubsub endpoint: the poller carries on at full speed
+            pass
+        finally:
+            self._ws_connected = False
+            self._wake.set()
+
+    async def _ws_writer(self, ws, requests: Dict[int, str]):
+        subscribed = set()
+        while True:
+            signature = await self._ws_queue.get()
+            if signature not in self._pending or signature in subscribed:
+                continue
+            subscribed.add(signature)
+            request_id = next(self._ws_ids)
+            requests[request_id] = signature
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "signatureSubscribe",
+                "params": [signature, {"commitment": self.commitment}],
+            }))
+
+    async def _ws_reader(self, ws, requests: Dict[int, str], subscriptions: Dict[int, str]):
+        async for raw in ws:
+            message = json.loads(raw)
+
+            if "id" in message and message["id"] in requests:
+                signature = requests.pop(message["id"])
+                if "result" in message:
+                    subscriptions[message["result"]] = signature
+                continue
+
+            if message.get("method") != "signatureNotification":
+                continue
+
+            params = message.get("params", {})
+            signature = subscriptions.pop(params.get("subscription"), None)
+            if signature is None:
+                continue
+
+            result = params.get("result", {})
+            value = result.get("value") or {}
+            if not isinstance(value, dict) or "err" not in value:
+                # receivedSignature notifications carry no outcome yet
+                continue
+            self._resolve(ConfirmationResult(
+                signature,
+                confirmed=value.get("err") is None,
+                err=value.get("err"),
+                slot=result.get("context", {}).get("slot"),
+                source="websocket",
+            ))
+
+
+async def confirm_signatures(
+    rpc_url: Optional[str],
+    signatures: Iterable[str],
+    timeout: float = 30.0,
+    commitment: str = "confirmed",
+    ws_url: Optional[str] = None,
+    pool: Optional[AsyncRpcPool] = None,
+) -> Dict[str, ConfirmationResult]:
+    """Confirm a set of signatures with a short-lived engine (rpc_url None: the SOLANA_RPC_URLS pool)"""
+    async with AsyncSolanaNetwork(rpc_url, pool=pool) as network:
+        async with ConfirmationEngine(network, ws_url=ws_url, commitment=commitment) as engine:
+            return await engine.wait(signatures, timeout=timeout)
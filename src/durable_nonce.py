@@ -0,0 +1,336 @@
+"""
+Durable Nonce - Transactions that do not expire before they are broadcast
+
+A transaction built on a recent blockhash is dead after ~150 slots (60-90
+seconds), which a batch carried by USB to the air-gapped signer and back
+routinely outlives. A durable nonce account stores a nonce value that
+stands in for the blockhash; a transaction whose first instruction is
+AdvanceNonceAccount stays valid until that nonce is advanced, so a whole
+batch can be built, signed offline and broadcast hours later.
+
+Nonce accounts are derived from the wallet with createAccountWithSeed
+("nonce-0", "nonce-1", ...), so creating them needs only the wallet's own
+signature (no extra keypairs to carry around) and they can be found again
+from the wallet address alone. Each nonce is consumed by one transaction:
+a batch of N transactions needs N nonce accounts.
+
+A bundle holds its nonce accounts from the moment it is built until it is
+broadcast, so the accounts (and the nonce values they held) are recorded
+in a small local reservation file. A reservation lapses by itself once the
+account's nonce moves on, i.e. once the bundle's transaction has landed.
+
+B - Love U 3000
+"""
+
+import asyncio
+import base64
+import json
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import (
+    AdvanceNonceAccountParams,
+    advance_nonce_account,
+    create_nonce_account_with_seed,
+)
+from solders.transaction import Transaction
+
+from config import NONCE_RESERVATIONS, sanitize_error
+from src.batch_builder import PACKET_DATA_SIZE, SYSTEM_PROGRAM_ID, PackedTransaction
+from src.network import AsyncSolanaNetwork
+from src.ui import print_error, print_warning
+
+
+# Serialized nonce account: version (4) + state (4) + authority (32)
+# + nonce (32) + lamports per signature (8)
+NONCE_ACCOUNT_SIZE = 80
+
+NONCE_STATE_INITIALIZED = 1
+
+# System program instruction tag of AdvanceNonceAccount
+ADVANCE_NONCE_TAG = 4
+
+NONCE_SEED_PREFIX = "nonce-"
+
+# Derived addresses scanned when looking for a wallet's nonce accounts
+MAX_NONCE_ACCOUNTS = 256
+
+
+@dataclass
+class NonceAccount:
+    """An initialized durable nonce account"""
+    address: str
+    authority: str
+    nonce: str  # base58, used in place of the recent blockhash
+    lamports_per_signature: int
+
+    def advance_instruction(self) -> Instruction:
+        """AdvanceNonceAccount, signed by the authority"""
+        return advance_nonce_account(AdvanceNonceAccountParams(
+            nonce_pubkey=Pubkey.from_string(self.address),
+            authorized_pubkey=Pubkey.from_string(self.authority),
+        ))
+
+
+def decode_nonce_account(address: str, data: bytes) -> Optional[NonceAccount]:
+    """Decode nonce account data; None if it is not an initialized nonce"""
+    if len(data) != NONCE_ACCOUNT_SIZE:
+        return None
+    _version, state = struct.unpack_from("<II", data, 0)
+    if state != NONCE_STATE_INITIALIZED:
+        return None
+    return NonceAccount(
+        address=address,
+        authority=str(Pubkey.from_bytes(data[8:40])),
+        nonce=str(Hash(data[40:72])),
+        lamports_per_signature=struct.unpack_from("<Q", data, 72)[0],
+    )
+
+
+def nonce_account_from_rpc(address: str, account: Optional[dict]) -> Optional[NonceAccount]:
+    """Decode a base64 account object from getAccountInfo/getMultipleAccounts"""
+    if not account or account.get("owner") != str(SYSTEM_PROGRAM_ID):
+        return None
+    data = account.get("data")
+    if not isinstance(data, list) or not data:
+        return None
+    try:
+        return decode_nonce_account(address, base64.b64decode(data[0]))
+    except (ValueError, struct.error):
+        return None
+
+
+def derive_nonce_address(authority: str, index: int) -> str:
+    """Address of the wallet's index-th seed-derived nonce account"""
+    return str(Pubkey.create_with_seed(
+        Pubkey.from_string(authority), f"{NONCE_SEED_PREFIX}{index}", SYSTEM_PROGRAM_ID
+    ))
+
+
+def nonce_account_of(message) -> Optional[str]:
+    """
+    Nonce account a (legacy or v0) message advances, or None if it is an
+    ordinary recent-blockhash transaction
+    """
+    if not message.instructions:
+        return None
+    ix = message.instructions[0]
+    keys = message.account_keys
+    if ix.program_id_index >= len(keys) or keys[ix.program_id_index] != SYSTEM_PROGRAM_ID:
+        return None
+    if len(ix.data) < 4 or struct.unpack_from("<I", bytes(ix.data), 0)[0] != ADVANCE_NONCE_TAG:
+        return None
+    accounts = bytes(ix.accounts)
+    if not accounts or accounts[0] >= len(keys):
+        return None
+    return str(keys[accounts[0]])
+
+
+def with_advance_nonce(instructions: Sequence[Instruction], nonce: NonceAccount) -> List[Instruction]:
+    """Put AdvanceNonceAccount first, as the runtime requires"""
+    return [nonce.advance_instruction(), *instructions]
+
+
+# ── Reservations ────────────────────────────────────────────
+
+class NonceReservations:
+    """
+    Nonce accounts held by bundles that have not been broadcast yet
+
+    Two bundles built on the same nonce value cannot both land: whichever is
+    broadcast second fails with the nonce already advanced. Each reservation
+    records the nonce value the bundle was built on; it is dropped as soon
+    as the account's current value differs (the bundle landed, or the nonce
+    was advanced some other way).
+
+    Args:
+        path: JSON file of authority -> {address: {"nonce": ..., "bundle": ...}}
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or NONCE_RESERVATIONS)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                reservations = json.load(f)
+            return reservations if isinstance(reservations, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print_warning(f"Ignoring unreadable nonce reservations: {sanitize_error(e)}")
+            return {}
+
+    def _write(self, reservations: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(reservations, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def split(self, authority: str, nonces: Sequence[NonceAccount]) -> Tuple[List[NonceAccount], List[NonceAccount]]:
+        """
+        Separate freshly fetched nonces into (available, held by a pending bundle)
+
+        Reservations whose account has moved to a new nonce value are released.
+        """
+        with self._lock:
+            reservations = self._read()
+            held = dict(reservations.get(authority, {}))
+            current = {nonce.address: nonce.nonce for nonce in nonces}
+            for address, entry in list(held.items()):
+                if address in current and current[address] != entry.get("nonce"):
+                    del held[address]
+            if held != reservations.get(authority, {}):
+                reservations[authority] = held
+                self._write(reservations)
+        available = [nonce for nonce in nonces if nonce.address not in held]
+        reserved = [nonce for nonce in nonces if nonce.address in held]
+        return available, reserved
+
+    def held(self, authority: str) -> Dict[str, str]:
+        """Reserved account -> bundle path, as last recorded"""
+        with self._lock:
+            return {address: entry.get("bundle", "")
+                    for address, entry in self._read().get(authority, {}).items()}
+
+    def reserve(self, authority: str, nonces: Iterable[NonceAccount], bundle: str):
+        """Record that `bundle` was built on these nonce values"""
+        with self._lock:
+            reservations = self._read()
+            held = reservations.setdefault(authority, {})
+            for nonce in nonces:
+                held[nonce.address] = {"nonce": nonce.nonce, "bundle": bundle}
+            self._write(reservations)
+
+    def release(self, authority: str, addresses: Iterable[str]):
+        """Drop reservations, e.g. for a bundle that was discarded unsent"""
+        with self._lock:
+            reservations = self._read()
+            held = reservations.get(authority, {})
+            for address in addresses:
+                held.pop(address, None)
+            self._write(reservations)
+
+
+# ── Creating nonce accounts ─────────────────────────────────
+
+def create_nonce_instructions(payer: str, index: int, lamports: int) -> List[Instruction]:
+    """CreateAccountWithSeed + InitializeNonceAccount for one derived nonce"""
+    payer_pk = Pubkey.from_string(payer)
+    return list(create_nonce_account_with_seed(
+        payer_pk,
+        Pubkey.from_string(derive_nonce_address(payer, index)),
+        payer_pk,
+        f"{NONCE_SEED_PREFIX}{index}",
+        payer_pk,
+        lamports,
+    ))
+
+
+def pack_create_nonce_transactions(
+    payer: str,
+    indexes: Iterable[int],
+    rent_lamports: int,
+    recent_blockhash: str,
+    packet_size: int = PACKET_DATA_SIZE
+) -> List[PackedTransaction]:
+    """
+    Unsigned transactions creating the given nonce accounts, as many per
+    transaction as fit; the wallet is payer, base and nonce authority
+    """
+    payer_pk = Pubkey.from_string(payer)
+    blockhash = Hash.from_string(recent_blockhash)
+
+    def build(batch: List[int]) -> bytes:
+        instructions = [ix for index in batch for ix in create_nonce_instructions(payer, index, rent_lamports)]
+        return bytes(Transaction.new_unsigned(Message.new_with_blockhash(instructions, payer_pk, blockhash)))
+
+    def packed(batch: List[int], tx_bytes: bytes) -> PackedTransaction:
+        return PackedTransaction(
+            tx_bytes=tx_bytes,
+            recipients=[(derive_nonce_address(payer, index), rent_lamports) for index in batch],
+            fee_lamports=0,
+        )
+
+    transactions = []
+    batch: List[int] = []
+    current = b""
+    for index in indexes:
+        candidate = build(batch + [index])
+        if batch and len(candidate) > packet_size:
+            transactions.append(packed(batch, current))
+            batch, candidate = [], build([index])
+        batch.append(index)
+        current = candidate
+    if batch:
+        transactions.append(packed(batch, current))
+    return transactions
+
+
+# ── Fetching nonce values ───────────────────────────────────
+
+async def fetch_nonces(
+    network: AsyncSolanaNetwork,
+    addresses: Sequence[str]
+) -> Dict[str, Optional[NonceAccount]]:
+    """
+    Current nonce values for many accounts in one batched request
+
+    Returns:
+        Mapping of address to its nonce, None for accounts that do not
+        exist or are not initialized nonces. Failed lookups are left out.
+    """
+    accounts = await network.get_multiple_accounts(addresses)
+    return {address: nonce_account_from_rpc(address, account) for address, account in accounts.items()}
+
+
+async def scan_nonce_accounts(
+    network: AsyncSolanaNetwork,
+    authority: str,
+    limit: int = MAX_NONCE_ACCOUNTS
+) -> Tuple[List[NonceAccount], List[int]]:
+    """
+    Find the wallet's seed-derived nonce accounts
+
+    Returns:
+        (initialized nonce accounts authorized to the wallet, indexes whose
+        address is still free for a new nonce account)
+    """
+    addresses = {derive_nonce_address(authority, index): index for index in range(limit)}
+    accounts = await network.get_multiple_accounts(list(addresses))
+
+    nonces, free = [], []
+    for address, index in addresses.items():
+        if address not in accounts:
+            continue  # lookup failed; neither usable nor known to be free
+        account = accounts[address]
+        if account is None:
+            free.append(index)
+            continue
+        nonce = nonce_account_from_rpc(address, account)
+        if nonce is not None and nonce.authority == authority:
+            nonces.append(nonce)
+    return nonces, free
+
+
+def get_nonce_accounts(authority: str, rpc_url: str = None) -> Optional[Tuple[List[NonceAccount], List[int]]]:
+    """Blocking scan_nonce_accounts() (rpc_url None: the SOLANA_RPC_URLS pool); None if the lookup failed"""
+    async def run():
+        async with AsyncSolanaNetwork(rpc_url) as network:
+            return await scan_nonce_accounts(network, authority)
+
+    try:
+        return asyncio.run(run())
+    except Exception as e:
+        print_error(f"Failed to fetch nonce accounts: {sanitize_error(e)}")
+        return None
@@ -3,32 +3,127 @@ EVM Network Operations - RPC communication with Base (Coinbase L2)
 
 Supports Base mainnet and Sepolia testnet via standard JSON-RPC.
 
+BaseNetwork is the blocking client used by the menus; AsyncBaseNetwork is
+its asyncio counterpart over a pooled connection. Both can pack several
+calls into one JSON-RPC batch array, and prepare_transfer_context() uses
+that to fetch everything a transfer needs (nonce, fees, gas estimate,
+balance) in a single HTTP round trip.
+
 B - Love U 3000
 """
 
-from typing import Optional
+import asyncio
+import itertools
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
 import httpx
 
 from config import (
-    BASE_RPC_URL, BASE_TESTNET_RPC_URL,
+    BASE_RPC_URLS, BASE_TESTNET_RPC_URLS,
     BASE_CHAIN_ID, BASE_TESTNET_CHAIN_ID,
     WEI_PER_ETH,
 )
 from config import sanitize_error
+from src.evm_multicall import (
+    CHUNKS_PER_REQUEST,
+    BalanceMatrix,
+    fill_balance_matrix,
+    plan_balance_chunks,
+)
+from src.rpc_pool import AsyncRpcPool, RpcPool
 from src.ui import print_success, print_error, print_info, print_warning
 
 
+@dataclass
+class TransferContext:
+    """Chain state needed to build one EIP-1559 transaction"""
+    nonce: int  # "pending" transaction count (includes the mempool)
+    base_fee: int
+    max_priority_fee: int
+    gas_limit: int
+    balance_wei: int
+    fee_cap: Optional[int] = None  # maxFeePerGas from a fee oracle, if one priced the transfer
+    mined_nonce: Optional[int] = None  # "latest" transaction count (mined only)
+
+    @property
+    def max_fee_per_gas(self) -> int:
+        if self.fee_cap is not None:
+            return self.fee_cap
+        # Headroom for the base fee to double before inclusion
+        return self.base_fee * 2 + self.max_priority_fee
+
+    def max_cost_wei(self, value_wei: int = 0) -> int:
+        """Most the transaction can debit: value plus gas at max fee"""
+        return value_wei + self.gas_limit * self.max_fee_per_gas
+
+
+def _transfer_context_calls(address: str, tx_params: dict, with_fees: bool = True) -> List[Tuple[str, list]]:
+    calls = [
+        ("eth_getTransactionCount", [address, "pending"]),
+        ("eth_estimateGas", [{"from": address, **tx_params}]),
+        ("eth_getBalance", [address, "latest"]),
+        ("eth_getTransactionCount", [address, "latest"]),
+    ]
+    if with_fees:
+        calls += [("eth_getBlockByNumber", ["latest", False]), ("eth_maxPriorityFeePerGas", [])]
+    return calls
+
+
+def _parse_transfer_context(responses: Sequence[dict], fees=None) -> Optional[TransferContext]:
+    """
+    Turn the answers to _transfer_context_calls() into a TransferContext
+
+    Args:
+        fees: FeeEstimate to use instead of the block / tip answers
+    """
+    nonce, gas, balance, mined = responses[:4]
+    checks = [("nonce", nonce), ("gas estimate", gas), ("balance", balance), ("mined nonce", mined)]
+    if fees is None:
+        block, tip = responses[4:6]
+        checks += [("base fee", block), ("priority fee", tip)]
+    for name, response in checks:
+        if "error" in response:
+            print_error(f"Could not fetch {name}: {response['error'].get('message', 'Unknown error')}")
+            return None
+    if fees is None and not block.get("result"):
+        print_error("Could not fetch base fee: no latest block")
+        return None
+    return TransferContext(
+        nonce=int(nonce["result"], 16),
+        base_fee=fees.base_fee if fees else int(block["result"]["baseFeePerGas"], 16),
+        max_priority_fee=fees.max_priority_fee if fees else int(tip["result"], 16),
+        gas_limit=int(gas["result"], 16),
+        balance_wei=int(balance["result"], 16),
+        fee_cap=fees.max_fee_per_gas if fees else None,
+        mined_nonce=int(mined["result"], 16),
+    )
+
+
+def _match_batch(payload: List[dict], body) -> List[dict]:
+    """One response per request of a batch, matched by id"""
+    # Nodes with batching disabled answer the whole array with one error
+    if isinstance(body, dict):
+        return [body] * len(payload)
+    by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+    missing = {"error": {"message": "No response for request in batch"}}
+    return [by_id.get(request["id"], missing) for request in payload]
+
+
 class BaseNetwork:
     """JSON-RPC client for Base (Coinbase L2)."""
 
-    def __init__(self, rpc_url: str = None, testnet: bool = False):
-        if rpc_url:
-            self.rpc_url = rpc_url
-        else:
-            self.rpc_url = BASE_TESTNET_RPC_URL if testnet else BASE_RPC_URL
+    def __init__(self, rpc_url: str = None, testnet: bool = False, pool: RpcPool = None):
+        if pool is None:
+            if rpc_url:
+                urls = [rpc_url]
+            else:
+                urls = BASE_TESTNET_RPC_URLS if testnet else BASE_RPC_URLS
+            pool = RpcPool(urls)
+        self.pool = pool
+        self.rpc_url = rpc_url or pool.primary_url
         self.chain_id = BASE_TESTNET_CHAIN_ID if testnet else BASE_CHAIN_ID
         self.testnet = testnet
-        self.client = httpx.Client(timeout=30.0)
         self._request_id = 0
 
     def __enter__(self):
@@ -48,13 +143,52 @@ class BaseNetwork:
             "method": method,
             "params": params or [],
         }
-        response = self.client.post(
-            self.rpc_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
-        response.raise_for_status()
-        return response.json()
+        return self.pool.post(payload)
+
+    def _make_batch_request(self, calls: Sequence[Tuple[str, list]]) -> List[dict]:
+        """Send (method, params) calls as one JSON-RPC batch; responses in call order"""
+        payload = []
+        for method, params in calls:
+            self._request_id += 1
+            payload.append({"jsonrpc": "2.0", "id": self._request_id, "method": method, "params": params})
+        return _match_batch(payload, self.pool.post(payload))
+
+    def prepare_transfer_context(
+        self,
+        address: str,
+        tx_params: dict,
+        fee_oracle=None,
+        fee_profile: str = "normal",
+        offline: bool = False
+    ) -> Optional[TransferContext]:
+        """
+        Nonce, fees, gas estimate and balance for a transfer in one round trip
+
+        Args:
+            address: Sending address (also used as "from" for the estimate)
+            tx_params: eth_estimateGas fields ("to", "value", "data" as hex)
+            fee_oracle: Optional BaseFeeOracle pricing the transfer; its
+                eth_feeHistory lookup joins the batch only when its cached
+                sample is stale
+            fee_profile: "slow", "normal" or "fast" when a fee oracle is given
+            offline: Price for signing on another device (see BaseFeeOracle.estimate)
+        """
+        calls = _transfer_context_calls(address, tx_params, with_fees=fee_oracle is None)
+        sample = fee_oracle.fresh_sample() if fee_oracle is not None else None
+        if fee_oracle is not None and sample is None:
+            calls.append(fee_oracle.fee_history_call())
+        try:
+            responses = self._make_batch_request(calls)
+        except Exception as e:
+            print_error(f"Error fetching chain parameters: {sanitize_error(e)}")
+            return None
+        fees = None
+        if fee_oracle is not None:
+            sample = sample or fee_oracle.ingest(responses[-1])
+            if sample is None:
+                return None
+            fees = fee_oracle.estimate(fee_profile, sample, offline=offline)
+        return _parse_transfer_context(responses, fees)
 
     # ── Balance ─────────────────────────────────────────────
 
@@ -127,10 +261,10 @@ class BaseNetwork:
 
     # ── Nonce ───────────────────────────────────────────────
 
-    def get_nonce(self, address: str) -> Optional[int]:
-        """Get the transaction count (nonce) for an address."""
+    def get_nonce(self, address: str, block: str = "latest") -> Optional[int]:
+        """Get the transaction count (nonce) for an address ("pending" includes the mempool)."""
         try:
-            result = self._make_rpc_request("eth_getTransactionCount", [address, "latest"])
+            result = self._make_rpc_request("eth_getTransactionCount", [address, block])
             if "error" in result:
                 return None
             return int(result["result"], 16)
@@ -202,6 +336,33 @@ class BaseNetwork:
         except Exception:
             return None
 
+    def get_erc20_balance_matrix(self, tokens: Sequence[str], wallets: Sequence[str]) -> BalanceMatrix:
+        """
+        Balances of every token for every wallet via Multicall3 aggregate3
+
+        balanceOf calls are packed into as few eth_calls as calldata and gas
+        allow, sent CHUNKS_PER_REQUEST per HTTP request.
+
+        Returns:
+            BalanceMatrix; cells are None where a lookup failed
+        """
+        matrix = BalanceMatrix(list(tokens), list(wallets))
+        chunks = plan_balance_chunks(matrix.tokens, matrix.wallets)
+        failed = 0
+        for start in range(0, len(chunks), CHUNKS_PER_REQUEST):
+            group = chunks[start:start + CHUNKS_PER_REQUEST]
+            try:
+                responses = self._make_batch_request([("eth_call", chunk.params) for chunk in group])
+            except Exception as e:
+                print_warning(f"Multicall request failed: {sanitize_error(e)}")
+                failed += len(group)
+                continue
+            failed += sum(not fill_balance_matrix(matrix, chunk, response)
+                          for chunk, response in zip(group, responses))
+        if failed:
+            print_warning(f"{failed} of {len(chunks)} multicall chunk(s) failed; their balances are unknown")
+        return matrix
+
     # ── Chain info ──────────────────────────────────────────
 
     def get_block_number(self) -> Optional[int]:
@@ -237,6 +398,7 @@ class BaseNetwork:
                 "block_number": block,
                 "gas_price_gwei": gas_price / 10**9,
                 "rpc_url": self.rpc_url,
+                "endpoints": self.pool.stats(),
             }
         except Exception:
             return {"error": "Could not fetch network info"}
@@ -262,4 +424,186 @@ class BaseNetwork:
     # ── Cleanup ─────────────────────────────────────────────
 
     def close(self):
-        self.client.close()
+        self.pool.close()
+
+
+class AsyncBaseNetwork:
+    """
+    Asyncio JSON-RPC client for Base with a pooled connection.
+
+    Same reads as BaseNetwork, routed through an AsyncRpcPool
+    (BASE_RPC_URLS unless rpc_url is given); independent lookups are
+    packed into JSON-RPC batch arrays.
+    """
+
+    def __init__(
+        self,
+        rpc_url: str = None,
+        testnet: bool = False,
+        max_connections: int = 10,
+        max_batch_size: int = 100,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport = None,
+        pool: AsyncRpcPool = None
+    ):
+        if pool is None:
+            if rpc_url:
+                urls = [rpc_url]
+            else:
+                urls = BASE_TESTNET_RPC_URLS if testnet else BASE_RPC_URLS
+            pool = AsyncRpcPool(
+                urls,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                ),
+                transport=transport
+            )
+        self.pool = pool
+        self.rpc_url = rpc_url or pool.primary_url
+        self.chain_id = BASE_TESTNET_CHAIN_ID if testnet else BASE_CHAIN_ID
+        self.testnet = testnet
+        self.max_batch_size = max_batch_size
+        self._request_ids = itertools.count(1)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    # ── Low-level RPC ───────────────────────────────────────
+
+    def _build_payload(self, method: str, params: list = None) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": method,
+            "params": params or []
+        }
+
+    async def _make_rpc_request(self, method: str, params: list = None) -> dict:
+        return await self.pool.post(self._build_payload(method, params))
+
+    async def _send_batch(self, calls: Sequence[Tuple[str, list]]) -> List[dict]:
+        payload = [self._build_payload(method, params) for method, params in calls]
+        return _match_batch(payload, await self.pool.post(payload))
+
+    async def _make_batch_request(self, calls: Sequence[Tuple[str, list]]) -> List[dict]:
+        """
+        Send (method, params) calls as JSON-RPC batch arrays
+
+        Calls are split into batches of at most max_batch_size, sent
+        concurrently over the connection pool.
+
+        Returns:
+            One response object per call, in call order
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+        chunks = [
+            calls[start:start + self.max_batch_size]
+            for start in range(0, len(calls), self.max_batch_size)
+        ]
+        batches = await asyncio.gather(*(self._send_batch(chunk) for chunk in chunks))
+        return [response for batch in batches for response in batch]
+
+    async def _read_int(self, method: str, params: list = None) -> Optional[int]:
+        try:
+            result = await self._make_rpc_request(method, params)
+            if "error" in result:
+                return None
+            return int(result["result"], 16)
+        except Exception:
+            return None
+
+    # ── Reads ───────────────────────────────────────────────
+
+    async def get_balance_wei(self, address: str) -> Optional[int]:
+        """Get raw balance in wei."""
+        return await self._read_int("eth_getBalance", [address, "latest"])
+
+    async def get_nonce(self, address: str, block: str = "latest") -> Optional[int]:
+        """Get the transaction count (nonce) for an address ("pending" includes the mempool)."""
+        return await self._read_int("eth_getTransactionCount", [address, block])
+
+    async def get_max_priority_fee(self) -> Optional[int]:
+        """Get suggested max priority fee (tip) for EIP-1559."""
+        return await self._read_int("eth_maxPriorityFeePerGas")
+
+    async def get_base_fee(self) -> Optional[int]:
+        """Get current base fee from latest block."""
+        try:
+            result = await self._make_rpc_request("eth_getBlockByNumber", ["latest", False])
+            if "error" in result or not result.get("result"):
+                return None
+            return int(result["result"]["baseFeePerGas"], 16)
+        except Exception:
+            return None
+
+    async def estimate_gas(self, tx_params: dict) -> Optional[int]:
+        """Estimate gas for a transaction."""
+        try:
+            result = await self._make_rpc_request("eth_estimateGas", [tx_params])
+            if "error" in result:
+                print_error(f"Gas estimation error: {result['error']['message']}")
+                return None
+            return int(result["result"], 16)
+        except Exception as e:
+            print_error(f"Gas estimation failed: {sanitize_error(e)}")
+            return None
+
+    async def prepare_transfer_context(
+        self,
+        address: str,
+        tx_params: dict,
+        fee_oracle=None,
+        fee_profile: str = "normal",
+        offline: bool = False
+    ) -> Optional[TransferContext]:
+        """Nonce, fees, gas estimate and balance for a transfer in one round trip; see BaseNetwork"""
+        calls = _transfer_context_calls(address, tx_params, with_fees=fee_oracle is None)
+        sample = fee_oracle.fresh_sample() if fee_oracle is not None else None
+        if fee_oracle is not None and sample is None:
+            calls.append(fee_oracle.fee_history_call())
+        try:
+            responses = await self._make_batch_request(calls)
+        except Exception as e:
+            print_error(f"Error fetching chain parameters: {sanitize_error(e)}")
+            return None
+        fees = None
+        if fee_oracle is not None:
+            sample = sample or fee_oracle.ingest(responses[-1])
+            if sample is None:
+                return None
+            fees = fee_oracle.estimate(fee_profile, sample, offline=offline)
+        return _parse_transfer_context(responses, fees)
+
+    async def get_erc20_balance_matrix(self, tokens: Sequence[str], wallets: Sequence[str]) -> BalanceMatrix:
+        """Balances of every token for every wallet via Multicall3; see BaseNetwork"""
+        matrix = BalanceMatrix(list(tokens), list(wallets))
+        chunks = plan_balance_chunks(matrix.tokens, matrix.wallets)
+        groups = [chunks[start:start + CHUNKS_PER_REQUEST] for start in range(0, len(chunks), CHUNKS_PER_REQUEST)]
+
+        async def send(group):
+            try:
+                return await self._send_batch([("eth_call", chunk.params) for chunk in group])
+            except Exception as e:
+                print_warning(f"Multicall request failed: {sanitize_error(e)}")
+                return [{"error": {"message": "request failed"}}] * len(group)
+
+        failed = 0
+        for group, responses in zip(groups, await asyncio.gather(*(send(g) for g in groups))):
+            failed += sum(not fill_balance_matrix(matrix, chunk, response)
+                          for chunk, response in zip(group, responses))
+        if failed:
+            print_warning(f"{failed} of {len(chunks)} multicall chunk(s) failed; their balances are unknown")
+        return matrix
+
+    # ── Cleanup ─────────────────────────────────────────────
+
+    async def close(self):
+        await self.pool.close()
@@ -0,0 +1,279 @@
+"""
+EVM Nonce Allocator - Local nonce bookkeeping for bursts of Base transactions
+
+Every EVM transaction from an address carries the next nonce, and a node
+only mines nonce N+1 after N. Asking the node for the transaction count
+before each build costs a round trip per transaction and hands the same
+nonce to two transactions built before either is broadcast.
+
+The allocator fetches the count once per address and then hands out
+nonces locally: a batch reserves a contiguous range, broadcasts are
+recorded with their hash, and refresh() reconciles everything against the
+chain in one batched request (transaction count plus receipts). A sent
+transaction that has vanished from the node, or a reservation that was
+released, leaves a gap that stalls every later nonce; gaps are reported
+and handed out again before new nonces.
+
+Only the mined ("latest") count moves the allocator forward: the
+"pending" count already includes our own mempool transactions, and
+treating those as confirmed would hide them from drop detection. The
+pending count only seeds an address seen for the first time, so
+transactions other tools have in flight are not reused. Reservations
+never expire - an unsigned transaction may be waiting on the air-gapped
+signer for hours - and stay held until release() is called.
+
+B - Love U 3000
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from config import sanitize_error
+from src.evm_network import BaseNetwork
+from src.ui import print_error
+
+
+# Nonce entry states
+RESERVED = "reserved"  # handed out, not broadcast yet
+SENT = "sent"          # broadcast, waiting to be mined
+DROPPED = "dropped"    # broadcast, but the node no longer knows the transaction
+RELEASED = "released"  # handed back unused by the caller
+
+
+@dataclass
+class NonceEntry:
+    """One nonce above the address's confirmed transaction count"""
+    nonce: int
+    status: str = RESERVED
+    tx_hash: Optional[str] = None
+    updated_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class NonceReport:
+    """What a refresh() learned from the chain"""
+    chain_nonce: int
+    confirmed: List[int] = field(default_factory=list)
+    dropped: List[int] = field(default_factory=list)
+    gaps: List[int] = field(default_factory=list)
+
+
+@dataclass
+class _AddressNonces:
+    chain_nonce: int  # transaction count the chain has accepted
+    next_nonce: int   # first nonce never handed out
+    entries: Dict[int, NonceEntry] = field(default_factory=dict)
+
+
+class NonceAllocator:
+    """
+    Hand out nonces for Base addresses without a round trip per transaction
+
+    Args:
+        network: BaseNetwork used for chain lookups (a private one is created if omitted)
+        drop_after: Seconds a sent transaction may be unknown to the node
+            before it counts as dropped (allows for mempool propagation)
+    """
+
+    def __init__(self, network: BaseNetwork = None, drop_after: float = 60.0):
+        self.network = network or BaseNetwork()
+        self.drop_after = drop_after
+        self._addresses: Dict[str, _AddressNonces] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(address: str) -> str:
+        return address.lower()
+
+    def _state(self, address: str, chain_nonce: Optional[int],
+               pending_nonce: Optional[int] = None) -> Optional[_AddressNonces]:
+        """
+        Per-address state, advanced to the mined count `chain_nonce`; caller holds the lock
+
+        A new address starts at the pending count (`pending_nonce`, fetched
+        if not given) so transactions sent by other tools are not reused.
+        """
+        state = self._addresses.get(self._key(address))
+        if state is None:
+            if pending_nonce is None:
+                pending_nonce = self.network.get_nonce(address, "pending")
+                if pending_nonce is None:
+                    print_error("Could not fetch nonce from Base")
+                    return None
+            start = max(pending_nonce, chain_nonce or 0)
+            state = _AddressNonces(chain_nonce=start, next_nonce=start)
+            self._addresses[self._key(address)] = state
+        elif chain_nonce is not None:
+            self._advance(state, chain_nonce)
+        return state
+
+    @staticmethod
+    def _advance(state: _AddressNonces, chain_nonce: int) -> List[int]:
+        """Move the confirmed count forward and forget nonces below it"""
+        if chain_nonce <= state.chain_nonce:
+            return []
+        state.chain_nonce = chain_nonce
+        state.next_nonce = max(state.next_nonce, chain_nonce)
+        done = sorted(n for n in state.entries if n < chain_nonce)
+        for nonce in done:
+            del state.entries[nonce]
+        return done
+
+    @staticmethod
+    def _gaps(state: _AddressNonces) -> List[int]:
+        gaps = []
+        for nonce in range(state.chain_nonce, state.next_nonce):
+            entry = state.entries.get(nonce)
+            if entry is None or entry.status in (DROPPED, RELEASED):
+                gaps.append(nonce)
+        return gaps
+
+    # ── Handing out nonces ──────────────────────────────────
+
+    def reserve(self, address: str, count: int = 1, chain_nonce: int = None,
+                pending_nonce: int = None) -> Optional[range]:
+        """
+        Reserve `count` contiguous new nonces for a batch
+
+        Args:
+            chain_nonce: The address's mined ("latest") transaction count if
+                the caller already has it (TransferContext.mined_nonce)
+            pending_nonce: Its "pending" count (TransferContext.nonce); saves
+                the lookup on first use
+
+        Returns:
+            The reserved nonces, or None if the starting nonce could not be fetched
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        with self._lock:
+            state = self._state(address, chain_nonce, pending_nonce)
+            if state is None:
+                return None
+            nonces = range(state.next_nonce, state.next_nonce + count)
+            for nonce in nonces:
+                state.entries[nonce] = NonceEntry(nonce)
+            state.next_nonce += count
+            return nonces
+
+    def allocate(self, address: str, chain_nonce: int = None, pending_nonce: int = None) -> Optional[int]:
+        """One nonce for a single transaction: the lowest gap if any, else a new one (see reserve())"""
+        with self._lock:
+            state = self._state(address, chain_nonce, pending_nonce)
+            if state is None:
+                return None
+            gaps = self._gaps(state)
+            if gaps:
+                state.entries[gaps[0]] = NonceEntry(gaps[0])
+                return gaps[0]
+        nonces = self.reserve(address)
+        return nonces[0] if nonces else None
+
+    def claim_gaps(self, address: str) -> List[int]:
+        """Reserve every current gap so replacement transactions can be built for them"""
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            if state is None:
+                return []
+            gaps = self._gaps(state)
+            for nonce in gaps:
+                state.entries[nonce] = NonceEntry(nonce)
+            return gaps
+
+    def release(self, address: str, nonces: Iterable[int]):
+        """
+        Hand back reserved nonces that will not be broadcast
+
+        Released nonces at the top of the range are simply reused; lower
+        ones become gaps.
+        """
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            if state is None:
+                return
+            for nonce in nonces:
+                entry = state.entries.get(nonce)
+                if entry is not None and entry.status == RESERVED:
+                    entry.status, entry.updated_at = RELEASED, time.monotonic()
+            while state.next_nonce > state.chain_nonce:
+                top = state.entries.get(state.next_nonce - 1)
+                if top is None or top.status != RELEASED:
+                    break
+                del state.entries[state.next_nonce - 1]
+                state.next_nonce -= 1
+
+    def mark_sent(self, address: str, nonce: int, tx_hash: str):
+        """Record that the transaction using `nonce` was broadcast"""
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            if state is None or nonce < state.chain_nonce:
+                return
+            state.entries[nonce] = NonceEntry(nonce, SENT, tx_hash)
+            state.next_nonce = max(state.next_nonce, nonce + 1)
+
+    # ── Reconciling with the chain ──────────────────────────
+
+    def gaps(self, address: str) -> List[int]:
+        """Nonces below the highest handed out that nothing will fill (no RPC)"""
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            return self._gaps(state) if state else []
+
+    def pending(self, address: str) -> Dict[int, NonceEntry]:
+        """Nonces handed out and not yet confirmed, by nonce"""
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            return dict(state.entries) if state else {}
+
+    def refresh(self, address: str) -> Optional[NonceReport]:
+        """
+        Reconcile with the chain in one batched request
+
+        Fetches the mined transaction count plus a receipt and mempool
+        lookup for every sent transaction. Nonces below the count are
+        confirmed; a sent transaction that is neither mined nor known to
+        the node after drop_after seconds is dropped and its nonce a gap.
+
+        Returns:
+            NonceReport, or None if the lookup failed
+        """
+        with self._lock:
+            state = self._addresses.get(self._key(address))
+            sent = [] if state is None else [e for e in state.entries.values() if e.status == SENT]
+
+        calls = [("eth_getTransactionCount", [address, "latest"])]
+        for entry in sent:
+            calls.append(("eth_getTransactionReceipt", [entry.tx_hash]))
+            calls.append(("eth_getTransactionByHash", [entry.tx_hash]))
+        try:
+            responses = self.network._make_batch_request(calls)
+            if "error" in responses[0]:
+                print_error(f"Could not fetch nonce: {responses[0]['error'].get('message', 'Unknown error')}")
+                return None
+            chain_nonce = int(responses[0]["result"], 16)
+        except Exception as e:
+            print_error(f"Error refreshing nonces: {sanitize_error(e)}")
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._addresses.setdefault(
+                self._key(address), _AddressNonces(chain_nonce=chain_nonce, next_nonce=chain_nonce)
+            )
+            report = NonceReport(chain_nonce=chain_nonce, confirmed=self._advance(state, chain_nonce))
+            for i, entry in enumerate(sent):
+                receipt, known = responses[1 + 2 * i], responses[2 + 2 * i]
+                current = state.entries.get(entry.nonce)
+                if current is not entry:
+                    continue  # confirmed above, or re-reserved meanwhile
+                if receipt.get("result"):
+                    report.confirmed.append(entry.nonce)
+                    continue
+                unknown = "error" not in known and known.get("result") is None
+                if unknown and now - entry.updated_at > self.drop_after:
+                    entry.status, entry.updated_at = DROPPED, now
+                    report.dropped.append(entry.nonce)
+            report.gaps = self._gaps(state)
+            return report
@@ -0,0 +1,234 @@
+"""
+Receipt Tracker - Follow many Base transaction hashes together
+
+Instead of one eth_getTransactionReceipt loop per hash, the tracker polls
+eth_blockNumber and, once per new block, sends a single JSON-RPC batch
+with a receipt query for every pending hash. Futures resolve as receipts
+appear, so a batch send confirms in roughly one block of latency for one
+request per block.
+
+When a hash's sender and nonce are known, the same batch reads the
+sender's mined transaction count. If the count has passed the nonce but
+the hash has no receipt on two consecutive blocks, another transaction
+took that nonce (replaced). A hash the node has not heard of for several
+blocks while its nonce is still open was dropped from the mempool.
+
+B - Love U 3000
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from config import sanitize_error
+from src.evm_network import AsyncBaseNetwork
+from src.ui import print_warning
+
+
+# ReceiptResult.status values
+CONFIRMED = "confirmed"
+REVERTED = "reverted"
+REPLACED = "replaced"
+DROPPED = "dropped"
+TIMEOUT = "timeout"
+
+
+@dataclass
+class ReceiptResult:
+    """Outcome of tracking a single transaction hash"""
+    tx_hash: str
+    status: str
+    receipt: Optional[dict] = None
+    block_number: Optional[int] = None
+
+    @property
+    def confirmed(self) -> bool:
+        return self.status == CONFIRMED
+
+
+@dataclass
+class _Tracked:
+    future: asyncio.Future
+    sender: Optional[str]
+    nonce: Optional[int]
+    first_block: Optional[int] = None  # first block checked while tracked
+    replaced_seen_at: Optional[int] = None  # block where the nonce was first seen used
+
+
+# Either a bare hash or (hash, sender, nonce)
+TrackItem = Union[str, Tuple[str, str, int]]
+
+
+class ReceiptTracker:
+    """
+    Resolve many transaction hashes from one batched check per block
+
+    Usage:
+        async with ReceiptTracker(network) as tracker:
+            results = await tracker.wait([(tx_hash, sender, nonce), ...], timeout=60)
+
+    Args:
+        network: AsyncBaseNetwork for the lookups
+        poll_interval: Seconds between eth_blockNumber polls (Base blocks are 2s)
+        drop_after_blocks: Blocks a hash may be unknown to the node before it
+            counts as dropped
+    """
+
+    def __init__(self, network: AsyncBaseNetwork, poll_interval: float = 0.5, drop_after_blocks: int = 15):
+        self.network = network
+        self.poll_interval = poll_interval
+        self.drop_after_blocks = drop_after_blocks
+        self.blocks_checked = 0
+        self._pending: Dict[str, _Tracked] = {}
+        self._last_block: Optional[int] = None
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+        return False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for tx_hash in list(self._pending):
+            self._resolve(ReceiptResult(tx_hash, TIMEOUT))
+
+    # ── Public API ──────────────────────────────────────────
+
+    def track(self, tx_hash: str, sender: str = None, nonce: int = None) -> asyncio.Future:
+        """Start tracking a hash; the future resolves to a ReceiptResult"""
+        tracked = self._pending.get(tx_hash)
+        if tracked is None:
+            tracked = _Tracked(asyncio.get_running_loop().create_future(), sender, nonce)
+            self._pending[tx_hash] = tracked
+            # Check on the current block too: the hash may already be mined
+            self._last_block = None
+            self._wake.set()
+        return tracked.future
+
+    async def wait(self, items: Iterable[TrackItem], timeout: float = 60.0) -> Dict[str, ReceiptResult]:
+        """Track hashes (optionally with sender and nonce) until all resolve or the timeout expires"""
+        futures = {}
+        for item in items:
+            tx_hash, sender, nonce = (item, None, None) if isinstance(item, str) else item
+            futures[tx_hash] = self.track(tx_hash, sender, nonce)
+        if futures:
+            await asyncio.wait(futures.values(), timeout=timeout)
+
+        results = {}
+        for tx_hash, future in futures.items():
+            if not future.done():
+                self._resolve(ReceiptResult(tx_hash, TIMEOUT))
+            results[tx_hash] = future.result()
+        return results
+
+    # ── Resolution ──────────────────────────────────────────
+
+    def _resolve(self, result: ReceiptResult):
+        tracked = self._pending.pop(result.tx_hash, None)
+        if tracked is not None and not tracked.future.done():
+            tracked.future.set_result(result)
+
+    async def _check_block(self, block: int):
+        """One batch: a receipt per pending hash, plus nonce and mempool lookups"""
+        hashes = list(self._pending)
+        senders = sorted({t.sender for t in self._pending.values() if t.sender and t.nonce is not None})
+        for tx_hash in hashes:
+            if self._pending[tx_hash].first_block is None:
+                self._pending[tx_hash].first_block = block
+        aging = [h for h in hashes if block - self._pending[h].first_block >= self.drop_after_blocks]
+
+        calls: List[Tuple[str, list]] = [("eth_getTransactionReceipt", [h]) for h in hashes]
+        calls += [("eth_getTransactionCount", [sender, "latest"]) for sender in senders]
+        calls += [("eth_getTransactionByHash", [h]) for h in aging]
+        responses = await self.network._make_batch_request(calls)
+        self.blocks_checked += 1
+
+        receipts = dict(zip(hashes, responses[:len(hashes)]))
+        counts = {}
+        for sender, response in zip(senders, responses[len(hashes):len(hashes) + len(senders)]):
+            if "error" not in response and response.get("result"):
+                counts[sender] = int(response["result"], 16)
+        known = {h: r for h, r in zip(aging, responses[len(hashes) + len(senders):])}
+
+        for tx_hash in hashes:
+            tracked = self._pending.get(tx_hash)
+            if tracked is None:
+                continue
+            receipt = receipts[tx_hash].get("result")
+            if receipt:
+                status = CONFIRMED if int(receipt.get("status", "0x0"), 16) == 1 else REVERTED
+                block_number = int(receipt["blockNumber"], 16) if receipt.get("blockNumber") else block
+                self._resolve(ReceiptResult(tx_hash, status, receipt, block_number))
+                continue
+
+            count = counts.get(tracked.sender)
+            if count is not None and count > tracked.nonce:
+                # Confirm on a later block, in case the receipt lagged the count
+                if tracked.replaced_seen_at is None:
+                    tracked.replaced_seen_at = block
+                elif block > tracked.replaced_seen_at:
+                    self._resolve(ReceiptResult(tx_hash, REPLACED, block_number=block))
+                continue
+
+            lookup = known.get(tx_hash)
+            if lookup is not None and "error" not in lookup and lookup.get("result") is None:
+                self._resolve(ReceiptResult(tx_hash, DROPPED, block_number=block))
+
+    async def _poll_loop(self):
+        while True:
+            self._wake.clear()
+            if self._pending:
+                try:
+                    result = await self.network._make_rpc_request("eth_blockNumber")
+                    block = int(result["result"], 16) if "result" in result else None
+                    if block is not None and block != self._last_block:
+                        await self._check_block(block)
+                        self._last_block = block
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print_warning(f"Receipt check failed: {sanitize_error(e)}")
+
+            woken = asyncio.ensure_future(self._wake.wait())
+            try:
+                await asyncio.wait({woken}, timeout=self.poll_interval)
+            finally:
+                woken.cancel()
+
+
+def wait_for_receipts(
+    items: Iterable[TrackItem],
+    rpc_url: str = None,
+    testnet: bool = False,
+    timeout: float = 60.0
+) -> Dict[str, ReceiptResult]:
+    """Blocking ReceiptTracker.wait() over a private connection"""
+    items = list(items)
+
+    async def run():
+        async with AsyncBaseNetwork(rpc_url, testnet=testnet) as network:
+            async with ReceiptTracker(network) as tracker:
+                return await tracker.wait(items, timeout=timeout)
+
+    try:
+        return asyncio.run(run())
+    except Exception as e:
+        print_warning(f"Receipt tracking failed: {sanitize_error(e)}")
+        hashes = [item if isinstance(item, str) else item[0] for item in items]
+        return {tx_hash: ReceiptResult(tx_hash, TIMEOUT) for tx_hash in hashes}
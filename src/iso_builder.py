@@ -435,7 +435,7 @@ def main():
     
     try:
         from solders.keypair import Keypair
-        from solders.transaction import Transaction
+        from solders.transaction import VersionedTransaction
         
         # Try importing secure memory handler
         try:
@@ -470,9 +470,9 @@ def main():
             tx_data = json.load(f)
         
         tx_bytes = base64.b64decode(tx_data['data'])
-        tx = Transaction.from_bytes(tx_bytes)
-        
-        tx.sign([keypair], tx.message.recent_blockhash)
+        # Legacy and v0 transactions alike
+        tx = VersionedTransaction.from_bytes(tx_bytes)
+        tx = VersionedTransaction(tx.message, [keypair])
         
         # Clear keypair from memory immediately after signing
         del keypair
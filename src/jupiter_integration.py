@@ -39,15 +39,19 @@ TOKENS = {
 class JupiterSwapManager:
     """Manages Jupiter swap operations for air-gapped cold wallets"""
 
-    def __init__(self, slippage_bps: int = 50):
+    def __init__(self, slippage_bps: int = 50, blockhash_provider=None):
         """
         Initialize Jupiter swap manager
 
         Args:
             slippage_bps: Slippage tolerance in basis points (50 = 0.5%)
+            blockhash_provider: Shared BlockhashProvider used to track how long
+                Jupiter-built transactions stay valid
         """
         self.slippage_bps = slippage_bps
         self.client = httpx.Client(timeout=30.0)
+        self.blockhash_provider = blockhash_provider
+        self.last_valid_block_height: Optional[int] = None
 
     def get_token_address(self, symbol: str) -> Optional[str]:
         """Get token mint address from symbol"""
@@ -181,9 +185,20 @@ class JupiterSwapManager:
             # Decode the transaction
             tx_bytes = base64.b64decode(swap_tx_base64)
 
+            # Jupiter stamps its own blockhash; track its expiry against the
+            # shared provider's block height estimate
+            self.last_valid_block_height = swap_data.get("lastValidBlockHeight")
+
             print_success("Unsigned swap transaction created!")
             print_info(f"  Transaction size: {len(tx_bytes)} bytes")
 
+            if self.blockhash_provider and self.last_valid_block_height:
+                remaining = self.blockhash_provider.blocks_remaining(self.last_valid_block_height)
+                if remaining is not None:
+                    print_info(f"  Blockhash valid for ~{max(remaining, 0)} more blocks")
+                    if remaining < self.blockhash_provider.refresh_margin:
+                        print_warning("Swap blockhash expires soon - sign and broadcast promptly")
+
             return tx_bytes
 
         except httpx.HTTPError as e:
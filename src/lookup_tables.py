@@ -0,0 +1,392 @@
+"""
+Address Lookup Tables - On-chain address lists for dense v0 transactions
+
+A v0 transaction can reference accounts stored in an address lookup table
+by a one-byte index instead of a 32-byte key, which is what lets a payout
+transaction carry ~50 transfers instead of ~20. Tables are owned by the
+wallet (it is authority and payer), so creating and extending them is
+signed offline like any other transaction.
+
+A new table only becomes usable once its creation has landed, so creation
+(with the first batch of addresses) and later extensions are built as two
+separate bundles: broadcast the creation bundle first, then the extensions.
+
+Table addresses are derived from the wallet and a recent slot, which must
+be a slot that produced a block (CreateLookupTable checks it against the
+SlotHashes sysvar, where skipped slots never appear), so each new table
+takes its own slot from getBlocks. The addresses cannot be found again
+from the wallet alone: a planned table is remembered as pending with its
+slot, moves into the local registry once it exists on chain, and is
+forgotten once its slot is too old for the creation to ever land. Table
+contents are cached in memory for a short time.
+
+B - Love U 3000
+"""
+
+import base64
+import json
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from solders.address_lookup_table_account import (
+    ADDRESS_LOOKUP_TABLE_ID,
+    AddressLookupTable,
+    AddressLookupTableAccount,
+    derive_lookup_table_address,
+)
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.pubkey import Pubkey
+
+from config import LOOKUP_TABLE_REGISTRY, sanitize_error
+from src.batch_builder import (
+    PACKET_DATA_SIZE,
+    SYSTEM_PROGRAM_ID,
+    PackedTransaction,
+    compile_unsigned_transaction,
+)
+from src.network import SolanaNetwork, endpoints_key
+from src.rpc_pool import RpcPool
+from src.ui import print_warning
+
+
+# Addresses one table can hold
+LOOKUP_TABLE_MAX_ADDRESSES = 256
+
+# Addresses per ExtendLookupTable that still fit in one legacy transaction
+# alongside a CreateLookupTable instruction
+MAX_EXTEND_ADDRESSES = 27
+
+# Deactivation slot of a table that has not been deactivated
+ACTIVE_SLOT = 2 ** 64 - 1
+
+# Slots the SlotHashes sysvar covers; a creation whose slot is older can no longer land
+SLOT_HASHES_MAX_ENTRIES = 512
+
+# Slots back from the finalized tip searched for blocks to derive new tables from
+RECENT_SLOT_WINDOW = 150
+
+# Address lookup table program instruction tags
+_CREATE_TAG = 0
+_EXTEND_TAG = 2
+
+
+@dataclass
+class LookupTable:
+    """A decoded address lookup table"""
+    address: str
+    authority: Optional[str]
+    addresses: List[str] = field(default_factory=list)
+    last_extended_slot: int = 0
+    deactivation_slot: int = ACTIVE_SLOT
+
+    @property
+    def active(self) -> bool:
+        return self.deactivation_slot == ACTIVE_SLOT
+
+    @property
+    def free_slots(self) -> int:
+        return LOOKUP_TABLE_MAX_ADDRESSES - len(self.addresses)
+
+    def account(self) -> AddressLookupTableAccount:
+        """The table in the form MessageV0 compilation takes"""
+        return AddressLookupTableAccount(
+            key=Pubkey.from_string(self.address),
+            addresses=[Pubkey.from_string(a) for a in self.addresses],
+        )
+
+
+def decode_lookup_table(address: str, data: bytes) -> Optional[LookupTable]:
+    """Decode lookup table account data; None if it is not a table"""
+    try:
+        table = AddressLookupTable.deserialize(data)
+    except Exception:
+        return None
+    meta = table.meta
+    return LookupTable(
+        address=address,
+        authority=str(meta.authority) if meta.authority is not None else None,
+        addresses=[str(a) for a in table.addresses],
+        last_extended_slot=meta.last_extended_slot,
+        deactivation_slot=meta.deactivation_slot,
+    )
+
+
+# ── Instructions ────────────────────────────────────────────
+
+def create_lookup_table_instruction(authority: str, recent_slot: int) -> Tuple[Instruction, str]:
+    """
+    CreateLookupTable with the wallet as authority and payer
+
+    Returns:
+        (instruction, derived table address)
+    """
+    authority_pk = Pubkey.from_string(authority)
+    table_pk, bump = derive_lookup_table_address(authority_pk, recent_slot)
+    ix = Instruction(
+        ADDRESS_LOOKUP_TABLE_ID,
+        struct.pack("<IQB", _CREATE_TAG, recent_slot, bump),
+        [
+            AccountMeta(table_pk, is_signer=False, is_writable=True),
+            AccountMeta(authority_pk, is_signer=True, is_writable=False),
+            AccountMeta(authority_pk, is_signer=True, is_writable=True),  # payer
+            AccountMeta(SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
+        ],
+    )
+    return ix, str(table_pk)
+
+
+def extend_lookup_table_instruction(table: str, authority: str, addresses: Sequence[str]) -> Instruction:
+    """ExtendLookupTable, paying for the extra space from the wallet"""
+    authority_pk = Pubkey.from_string(authority)
+    data = struct.pack("<IQ", _EXTEND_TAG, len(addresses)) + b"".join(
+        bytes(Pubkey.from_string(a)) for a in addresses
+    )
+    return Instruction(
+        ADDRESS_LOOKUP_TABLE_ID,
+        data,
+        [
+            AccountMeta(Pubkey.from_string(table), is_signer=False, is_writable=True),
+            AccountMeta(authority_pk, is_signer=True, is_writable=False),
+            AccountMeta(authority_pk, is_signer=True, is_writable=True),  # payer
+            AccountMeta(SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
+        ],
+    )
+
+
+@dataclass
+class LookupTablePlan:
+    """Unsigned transactions that put a set of addresses into tables"""
+    create: List[PackedTransaction] = field(default_factory=list)
+    extend: List[PackedTransaction] = field(default_factory=list)
+    new_tables: List[str] = field(default_factory=list)
+    creation_slots: Dict[str, int] = field(default_factory=dict)  # new table -> slot it derives from
+    added: int = 0
+
+
+def recent_block_slots(network: SolanaNetwork, window: int = RECENT_SLOT_WINDOW) -> Optional[List[int]]:
+    """
+    Distinct recent slots that produced a finalized block, newest first
+
+    These are the slots CreateLookupTable accepts; None if the RPC fails.
+    """
+    tip = network.get_slot("finalized")
+    if tip is None:
+        return None
+    blocks = network.get_blocks(max(tip - window, 0), tip, commitment="finalized")
+    if blocks is None:
+        return None
+    return sorted(set(blocks), reverse=True)
+
+
+def plan_lookup_tables(
+    authority: str,
+    addresses: Iterable[str],
+    recent_slots: Sequence[int],
+    recent_blockhash: str,
+    existing: Sequence[LookupTable] = ()
+) -> LookupTablePlan:
+    """
+    Build the transactions that make `addresses` available through tables
+
+    Addresses already in one of `existing` are skipped; free space in the
+    wallet's own active tables is used before new tables are created.
+    Each new table is derived from its own entry of `recent_slots`, which
+    must be distinct slots that produced a block (see recent_block_slots()).
+
+    Raises:
+        ValueError: More new tables are needed than `recent_slots` provides
+    """
+    payer = Pubkey.from_string(authority)
+    blockhash = Hash.from_string(recent_blockhash)
+    known = {a for table in existing for a in table.addresses}
+    pending = [a for a in dict.fromkeys(addresses) if a not in known]
+    plan = LookupTablePlan()
+
+    def packed(instructions: List[Instruction]) -> PackedTransaction:
+        tx_bytes = compile_unsigned_transaction(instructions, payer, blockhash)
+        if len(tx_bytes) > PACKET_DATA_SIZE:
+            raise ValueError(f"Lookup table transaction is {len(tx_bytes)} bytes (limit {PACKET_DATA_SIZE})")
+        return PackedTransaction(tx_bytes=tx_bytes, recipients=[], fee_lamports=0)
+
+    def extend(table: str, chunk: List[str]):
+        plan.extend.append(packed([extend_lookup_table_instruction(table, authority, chunk)]))
+        plan.added += len(chunk)
+
+    # Top up the wallet's own tables first
+    for table in existing:
+        if not pending:
+            break
+        if table.authority != authority or not table.active or table.free_slots <= 0:
+            continue
+        take, pending = pending[:table.free_slots], pending[table.free_slots:]
+        for start in range(0, len(take), MAX_EXTEND_ADDRESSES):
+            extend(table.address, take[start:start + MAX_EXTEND_ADDRESSES])
+
+    slots = list(dict.fromkeys(recent_slots))
+    needed = -(-len(pending) // LOOKUP_TABLE_MAX_ADDRESSES)
+    if needed > len(slots):
+        raise ValueError(f"{needed} new lookup table(s) need as many recent block slots; got {len(slots)}")
+    for slot in slots[:needed]:
+        take, pending = pending[:LOOKUP_TABLE_MAX_ADDRESSES], pending[LOOKUP_TABLE_MAX_ADDRESSES:]
+        create_ix, table = create_lookup_table_instruction(authority, slot)
+        first = take[:MAX_EXTEND_ADDRESSES]
+        plan.create.append(packed([create_ix, extend_lookup_table_instruction(table, authority, first)]))
+        plan.added += len(first)
+        plan.new_tables.append(table)
+        plan.creation_slots[table] = slot
+        for start in range(MAX_EXTEND_ADDRESSES, len(take), MAX_EXTEND_ADDRESSES):
+            extend(table, take[start:start + MAX_EXTEND_ADDRESSES])
+    return plan
+
+
+# ── Cache ───────────────────────────────────────────────────
+
+class LookupTableCache:
+    """
+    Registry of the wallet's lookup tables plus a short-lived cache of
+    their contents
+
+    Args:
+        network: SolanaNetwork used for lookups (a private one is created if omitted)
+        registry_path: JSON file remembering table addresses per wallet
+        ttl: Seconds a fetched table is reused before it is read again
+    """
+
+    def __init__(self, network: SolanaNetwork = None, registry_path: str = None, ttl: float = 60.0):
+        self.network = network or SolanaNetwork()
+        self.registry_path = Path(registry_path or LOOKUP_TABLE_REGISTRY)
+        self.ttl = ttl
+        self.fetches = 0
+        self._tables: Dict[str, Tuple[LookupTable, float]] = {}
+        self._lock = threading.Lock()
+
+    def _read_registry(self) -> dict:
+        try:
+            with open(self.registry_path, "r") as f:
+                registry = json.load(f)
+            return registry if isinstance(registry, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print_warning(f"Ignoring unreadable lookup table registry: {sanitize_error(e)}")
+            return {}
+
+    @staticmethod
+    def _entry(registry: dict, authority: str) -> Tuple[List[str], Dict[str, int]]:
+        """(tables, pending table -> creation slot); older registries hold a bare list"""
+        entry = registry.get(authority, [])
+        if isinstance(entry, list):
+            return list(entry), {}
+        return list(entry.get("tables", [])), dict(entry.get("pending", {}))
+
+    def _update(self, authority: str, update):
+        """Apply update(tables, pending) to the wallet's entry and write the registry"""
+        with self._lock:
+            registry = self._read_registry()
+            tables, pending = self._entry(registry, authority)
+            update(tables, pending)
+            registry[authority] = {"tables": list(dict.fromkeys(tables)), "pending": pending}
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.registry_path.with_name(self.registry_path.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(registry, f, indent=2)
+            os.replace(tmp_path, self.registry_path)
+
+    def known_tables(self, authority: str) -> List[str]:
+        """Addresses of the tables remembered for a wallet"""
+        with self._lock:
+            return self._entry(self._read_registry(), authority)[0]
+
+    def pending_tables(self, authority: str) -> Dict[str, int]:
+        """Planned tables not seen on chain yet, with the slot each derives from"""
+        with self._lock:
+            return self._entry(self._read_registry(), authority)[1]
+
+    def remember(self, authority: str, tables: Iterable[str]):
+        """Add table addresses to the wallet's registry entry"""
+        tables = list(tables)
+
+        def update(known, pending):
+            known.extend(tables)
+            for table in tables:
+                pending.pop(table, None)
+        self._update(authority, update)
+
+    def remember_pending(self, authority: str, creation_slots: Dict[str, int]):
+        """Record planned tables; tables_for() registers them once their creation lands"""
+        self._update(authority, lambda known, pending: pending.update(creation_slots))
+
+    def forget_pending(self, authority: str, tables: Iterable[str]):
+        """Drop planned tables whose creation can no longer land"""
+        tables = list(tables)
+
+        def update(known, pending):
+            for table in tables:
+                pending.pop(table, None)
+        self._update(authority, update)
+
+    def _settle_pending(self, authority: str):
+        """Register pending tables that now exist; drop those that can no longer be created"""
+        pending = self.pending_tables(authority)
+        if not pending:
+            return
+        landed, expired, tip = [], [], None
+        for address, slot in pending.items():
+            if self.get_table(address, refresh=True) is not None:
+                landed.append(address)
+                continue
+            if tip is None:
+                tip = self.network.get_slot("finalized")
+                if tip is None:
+                    return
+            if tip - slot > SLOT_HASHES_MAX_ENTRIES:
+                expired.append(address)
+        if landed:
+            self.remember(authority, landed)
+        if expired:
+            self.forget_pending(authority, expired)
+
+    def get_table(self, address: str, refresh: bool = False) -> Optional[LookupTable]:
+        """A table's current contents; None if it does not exist (yet)"""
+        with self._lock:
+            cached = self._tables.get(address)
+            if cached is not None and not refresh and time.monotonic() - cached[1] < self.ttl:
+                return cached[0]
+
+        account = self.network.get_account_info(address)
+        if not account or account.get("owner") != str(ADDRESS_LOOKUP_TABLE_ID):
+            return None
+        table = decode_lookup_table(address, base64.b64decode(account["data"][0]))
+        if table is None:
+            return None
+        with self._lock:
+            self.fetches += 1
+            self._tables[address] = (table, time.monotonic())
+        return table
+
+    def tables_for(self, authority: str, refresh: bool = False) -> List[LookupTable]:
+        """The wallet's remembered tables that exist and are still active"""
+        self._settle_pending(authority)
+        tables = [self.get_table(address, refresh) for address in self.known_tables(authority)]
+        return [table for table in tables if table is not None and table.active]
+
+
+_shared_caches: Dict[str, LookupTableCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_lookup_table_cache(rpc_url: str = None, pool: RpcPool = None) -> LookupTableCache:
+    """Get the process-wide lookup table cache for an RPC URL or pool (default: the SOLANA_RPC_URLS pool)"""
+    key = endpoints_key(rpc_url, pool)
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = LookupTableCache(SolanaNetwork(rpc_url, pool=pool))
+            _shared_caches[key] = cache
+        return cache
@@ -5,21 +5,57 @@ B - Love U 3000
 """
 
 import asyncio
-from typing import Optional, Tuple
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 import httpx
 
 from solders.pubkey import Pubkey
 from solders.hash import Hash
 from solders.transaction import VersionedTransaction
 
-from config import SOLANA_RPC_URL, LAMPORTS_PER_SOL
+from config import SOLANA_RPC_URLS, LAMPORTS_PER_SOL
+from src.rpc_pool import AsyncRpcPool, RpcPool
 from src.ui import print_success, print_error, print_info, print_warning, create_spinner
 
 
+# getSignatureStatuses accepts at most this many signatures per call
+MAX_SIGNATURE_STATUSES = 256
+
+# getMultipleAccounts accepts at most this many pubkeys per call
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# getSignaturesForAddress returns at most this many signatures per page
+MAX_SIGNATURES_PER_PAGE = 1000
+
+
+def endpoints_key(rpc_url: str = None, pool: RpcPool = None) -> str:
+    """Shared-cache key for the endpoint(s) a SolanaNetwork(rpc_url, pool) would use"""
+    if pool is not None:
+        return ",".join(pool.urls)
+    return rpc_url or ",".join(SOLANA_RPC_URLS)
+
+
+def run_blocking(make_coro):
+    """asyncio.run(make_coro()); on a worker thread if this thread already runs a loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(make_coro())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(lambda: asyncio.run(make_coro())).result()
+
+
 class SolanaNetwork:
-    def __init__(self, rpc_url: str = None):
-        self.rpc_url = rpc_url or SOLANA_RPC_URL
-        self.client = httpx.Client(timeout=30.0)
+    def __init__(self, rpc_url: str = None, pool: RpcPool = None):
+        """
+        Args:
+            rpc_url: Single endpoint; defaults to the SOLANA_RPC_URLS pool
+            pool: Shared endpoint pool (overrides rpc_url)
+        """
+        self.pool = pool or RpcPool([rpc_url] if rpc_url else SOLANA_RPC_URLS)
+        self.rpc_url = rpc_url or self.pool.primary_url
+        self._request_ids = itertools.count(1)
     
     def __enter__(self):
         return self
@@ -31,18 +67,11 @@ class SolanaNetwork:
     def _make_rpc_request(self, method: str, params: list = None) -> dict:
         payload = {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._request_ids),
             "method": method,
             "params": params or []
         }
-        
-        response = self.client.post(
-            self.rpc_url,
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        response.raise_for_status()
-        return response.json()
+        return self.pool.post(payload)
     
     def get_balance(self, public_key: str) -> Optional[float]:
         try:
@@ -87,6 +116,41 @@ class SolanaNetwork:
             print_error(f"Error getting blockhash: {sanitize_error(e)}")
             return None
     
+    def get_block_height(self, commitment: Optional[str] = None) -> Optional[int]:
+        try:
+            params = [{"commitment": commitment}] if commitment else None
+            result = self._make_rpc_request("getBlockHeight", params)
+            
+            if "error" in result:
+                return None
+            
+            return result.get("result")
+        except Exception:
+            return None
+    
+    def get_slot(self, commitment: str = "finalized") -> Optional[int]:
+        try:
+            result = self._make_rpc_request("getSlot", [{"commitment": commitment}])
+            
+            if "error" in result:
+                return None
+            
+            return result.get("result")
+        except Exception:
+            return None
+    
+    def get_blocks(self, start_slot: int, end_slot: int, commitment: str = "finalized") -> Optional[List[int]]:
+        """Slots between start_slot and end_slot (inclusive) that produced a block"""
+        try:
+            result = self._make_rpc_request("getBlocks", [start_slot, end_slot, {"commitment": commitment}])
+            
+            if "error" in result:
+                return None
+            
+            return result.get("result")
+        except Exception:
+            return None
+    
     def get_minimum_balance_for_rent_exemption(self, data_size: int = 0) -> Optional[int]:
         try:
             result = self._make_rpc_request(
@@ -128,33 +192,87 @@ class SolanaNetwork:
             print_error(f"Error sending transaction: {sanitize_error(e)}")
             return None
     
+    def get_recent_prioritization_fees(self, accounts: Sequence[str] = ()) -> Optional[List[dict]]:
+        """
+        Get recent per-slot minimum priority fees for transactions that
+        write-lock all of the given accounts
+
+        Returns:
+            List of {"slot", "prioritizationFee"} (micro-lamports per CU),
+            or None if the lookup failed
+        """
+        try:
+            result = self._make_rpc_request("getRecentPrioritizationFees", [list(accounts)])
+            
+            if "error" in result:
+                print_error(f"RPC Error: {result['error']['message']}")
+                return None
+            
+            return result.get("result") or []
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting priority fees: {sanitize_error(e)}")
+            return None
+    
+    def simulate_transaction(self, tx_base64: str) -> Optional[dict]:
+        """
+        Simulate an (unsigned) transaction
+        
+        Signatures are not verified and the blockhash is replaced with a
+        recent one, so transactions can be simulated before signing.
+        
+        Returns:
+            Simulation value ({"err", "logs", "unitsConsumed", ...}), or None
+            if the RPC call failed
+        """
+        try:
+            result = self._make_rpc_request(
+                "simulateTransaction",
+                [
+                    tx_base64,
+                    {
+                        "encoding": "base64",
+                        "sigVerify": False,
+                        "replaceRecentBlockhash": True,
+                        "commitment": "confirmed"
+                    }
+                ]
+            )
+            
+            if "error" in result:
+                print_error(f"Simulation failed: {result['error']['message']}")
+                return None
+            
+            return result.get("result", {}).get("value")
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error simulating transaction: {sanitize_error(e)}")
+            return None
+    
     def confirm_transaction(self, signature: str, max_retries: int = 30) -> bool:
-        for i in range(max_retries):
-            try:
-                result = self._make_rpc_request(
-                    "getSignatureStatuses",
-                    [[signature]]
-                )
-                
-                if "error" in result:
-                    continue
-                
-                statuses = result.get("result", {}).get("value", [])
-                if statuses and statuses[0]:
-                    status = statuses[0]
-                    if status.get("confirmationStatus") in ["confirmed", "finalized"]:
-                        return True
-                    if status.get("err"):
-                        print_error(f"Transaction error: {status['err']}")
-                        return False
-                
-                import time
-                time.sleep(1)
-            except Exception:
-                import time
-                time.sleep(1)
+        """Wait up to roughly max_retries seconds for a signature to confirm"""
+        return self.confirm_transactions([signature], timeout=float(max_retries)).get(signature, False)
+    
+    def confirm_transactions(self, signatures: list, timeout: float = 30.0) -> Dict[str, bool]:
+        """Confirm many signatures together (websocket feed, batch-poll fallback)"""
+        from src.confirmation import confirm_signatures
+        urls = self.pool.urls
+
+        async def run():
+            # Same endpoints as this client, on an asyncio pool
+            return await confirm_signatures(None, signatures, timeout=timeout, pool=AsyncRpcPool(urls))
+
+        try:
+            results = run_blocking(run)
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error confirming transactions: {sanitize_error(e)}")
+            return {sig: False for sig in signatures}
         
-        return False
+        for result in results.values():
+            if result.err:
+                print_error(f"Transaction error: {result.err}")
+        return {sig: result.confirmed for sig, result in results.items()}
     
     def request_airdrop(self, public_key: str, amount_sol: float = 1.0) -> Optional[str]:
         try:
@@ -209,7 +327,8 @@ class SolanaNetwork:
                 "version": version.get("result", {}).get("solana-core", "Unknown"),
                 "slot": slot.get("result", 0),
                 "epoch": epoch.get("result", {}).get("epoch", 0),
-                "rpc_url": self.rpc_url
+                "rpc_url": self.rpc_url,
+                "endpoints": self.pool.stats()
             }
         except Exception:
             return {"error": "Could not fetch network info"}
@@ -249,4 +368,418 @@ class SolanaNetwork:
             return None
     
     def close(self):
-        self.client.close()
+        self.pool.close()
+
+
+class AsyncSolanaNetwork:
+    """
+    Asyncio JSON-RPC client for Solana with a pooled connection.
+
+    Every request carries its own id, and bulk lookups are packed into
+    JSON-RPC batch arrays so a sweep over hundreds of pubkeys costs a
+    handful of HTTP round trips instead of one per key. Requests are
+    routed through an AsyncRpcPool (SOLANA_RPC_URLS unless rpc_url is given).
+    """
+
+    def __init__(
+        self,
+        rpc_url: str = None,
+        max_connections: int = 10,
+        max_batch_size: int = 100,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport = None,
+        pool: AsyncRpcPool = None
+    ):
+        self.pool = pool or AsyncRpcPool(
+            [rpc_url] if rpc_url else SOLANA_RPC_URLS,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+        self.rpc_url = rpc_url or self.pool.primary_url
+        self.max_batch_size = max_batch_size
+        self._request_ids = itertools.count(1)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    # ── Low-level RPC ───────────────────────────────────────
+
+    def _build_payload(self, method: str, params: list = None) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": method,
+            "params": params or []
+        }
+
+    async def _post(self, payload) -> object:
+        return await self.pool.post(payload)
+
+    async def _make_rpc_request(self, method: str, params: list = None) -> dict:
+        return await self._post(self._build_payload(method, params))
+
+    async def _send_batch(self, calls: Sequence[Tuple[str, list]]) -> List[dict]:
+        payload = [self._build_payload(method, params) for method, params in calls]
+        body = await self._post(payload)
+
+        # Nodes with batching disabled answer the whole array with one error
+        if isinstance(body, dict):
+            return [body] * len(payload)
+
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        missing = {"error": {"message": "No response for request in batch"}}
+        return [by_id.get(request["id"], missing) for request in payload]
+
+    async def _make_batch_request(self, calls: Sequence[Tuple[str, list]]) -> List[dict]:
+        """
+        Send (method, params) calls as JSON-RPC batch arrays
+
+        Calls are split into batches of at most max_batch_size, and the
+        batches are sent concurrently over the connection pool.
+
+        Returns:
+            One response object per call, in call order
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+
+        chunks = [
+            calls[start:start + self.max_batch_size]
+            for start in range(0, len(calls), self.max_batch_size)
+        ]
+        batches = await asyncio.gather(*(self._send_batch(chunk) for chunk in chunks))
+        return [response for batch in batches for response in batch]
+
+    # ── Single lookups ──────────────────────────────────────
+
+    async def get_balance(self, public_key: str) -> Optional[float]:
+        try:
+            result = await self._make_rpc_request("getBalance", [public_key])
+
+            if "error" in result:
+                print_error(f"RPC Error: {result['error']['message']}")
+                return None
+
+            lamports = result.get("result", {}).get("value", 0)
+            return lamports / LAMPORTS_PER_SOL
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting balance: {sanitize_error(e)}")
+            return None
+
+    async def get_latest_blockhash(self) -> Optional[Tuple[str, int]]:
+        try:
+            result = await self._make_rpc_request(
+                "getLatestBlockhash",
+                [{"commitment": "finalized"}]
+            )
+
+            if "error" in result:
+                print_error(f"RPC Error: {result['error']['message']}")
+                return None
+
+            value = result.get("result", {}).get("value", {})
+            blockhash = value.get("blockhash")
+            if blockhash:
+                return blockhash, value.get("lastValidBlockHeight")
+            return None
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting blockhash: {sanitize_error(e)}")
+            return None
+
+    async def send_transaction(self, signed_tx_base64: str) -> Optional[str]:
+        try:
+            result = await self._make_rpc_request(
+                "sendTransaction",
+                [
+                    signed_tx_base64,
+                    {"encoding": "base64", "preflightCommitment": "finalized"}
+                ]
+            )
+
+            if "error" in result:
+                error_msg = result['error'].get('message', 'Unknown error')
+                print_error(f"Transaction failed: {error_msg}")
+                return None
+
+            return result.get("result")
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error sending transaction: {sanitize_error(e)}")
+            return None
+
+    async def submit_transaction(
+        self,
+        signed_tx_base64: str,
+        skip_preflight: bool = False,
+        max_retries: Optional[int] = None
+    ) -> dict:
+        """
+        Send a signed transaction and return the raw JSON-RPC response
+
+        Unlike send_transaction this prints nothing, so bulk senders can
+        classify errors themselves. Transport failures are raised.
+        """
+        options = {
+            "encoding": "base64",
+            "skipPreflight": skip_preflight,
+            "preflightCommitment": "confirmed"
+        }
+        if max_retries is not None:
+            options["maxRetries"] = max_retries
+        return await self._make_rpc_request("sendTransaction", [signed_tx_base64, options])
+
+    async def get_signatures_for_address(
+        self,
+        address: str,
+        before: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = MAX_SIGNATURES_PER_PAGE,
+        commitment: str = "finalized"
+    ) -> Optional[List[dict]]:
+        """
+        Get one page of signatures for an address, newest first
+
+        Args:
+            before: Start searching backwards from this signature
+            until: Stop when this signature is reached (exclusive)
+            limit: Page size (at most MAX_SIGNATURES_PER_PAGE)
+
+        Returns:
+            List of signature info objects, or None if the lookup failed
+        """
+        options = {"limit": min(limit, MAX_SIGNATURES_PER_PAGE), "commitment": commitment}
+        if before:
+            options["before"] = before
+        if until:
+            options["until"] = until
+        try:
+            result = await self._make_rpc_request("getSignaturesForAddress", [address, options])
+
+            if "error" in result:
+                print_error(f"Failed to get transaction history: {result['error']['message']}")
+                return None
+
+            return result.get("result") or []
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting transaction history: {sanitize_error(e)}")
+            return None
+
+    # ── Bulk lookups ────────────────────────────────────────
+
+    async def get_balances(self, public_keys: Sequence[str]) -> Dict[str, Optional[float]]:
+        """
+        Get SOL balances for many addresses
+
+        Returns:
+            Mapping of address to balance in SOL (None where the lookup failed)
+        """
+        public_keys = list(dict.fromkeys(public_keys))
+        try:
+            responses = await self._make_batch_request(
+                [("getBalance", [pk]) for pk in public_keys]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting balances: {sanitize_error(e)}")
+            return {pk: None for pk in public_keys}
+
+        balances = {}
+        for pk, response in zip(public_keys, responses):
+            if "error" in response or "result" not in response:
+                balances[pk] = None
+                continue
+            lamports = response["result"].get("value", 0)
+            balances[pk] = lamports / LAMPORTS_PER_SOL
+        return balances
+
+    async def get_signature_statuses(
+        self,
+        signatures: Sequence[str],
+        search_transaction_history: bool = False
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Get confirmation status for many signatures
+
+        Signatures are grouped MAX_SIGNATURE_STATUSES per getSignatureStatuses
+        call, and all calls go out together in one batch.
+
+        Returns:
+            Mapping of signature to its status object (None if unknown or failed)
+        """
+        signatures = list(dict.fromkeys(signatures))
+        groups = [
+            signatures[start:start + MAX_SIGNATURE_STATUSES]
+            for start in range(0, len(signatures), MAX_SIGNATURE_STATUSES)
+        ]
+        options = {"searchTransactionHistory": search_transaction_history}
+        try:
+            responses = await self._make_batch_request(
+                [("getSignatureStatuses", [group, options]) for group in groups]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting signature statuses: {sanitize_error(e)}")
+            return {sig: None for sig in signatures}
+
+        statuses = {}
+        for group, response in zip(groups, responses):
+            values = []
+            if "error" not in response:
+                values = (response.get("result") or {}).get("value") or []
+            for index, sig in enumerate(group):
+                statuses[sig] = values[index] if index < len(values) else None
+        return statuses
+
+    async def get_multiple_accounts(
+        self,
+        public_keys: Sequence[str],
+        commitment: str = "confirmed"
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Get account info (base64 data) for many addresses
+
+        Addresses are grouped MAX_MULTIPLE_ACCOUNTS per getMultipleAccounts
+        call, and all calls go out together in one batch.
+
+        Returns:
+            Mapping of address to its account object, None for accounts that
+            do not exist. Addresses whose lookup failed are left out.
+        """
+        public_keys = list(dict.fromkeys(public_keys))
+        groups = [
+            public_keys[start:start + MAX_MULTIPLE_ACCOUNTS]
+            for start in range(0, len(public_keys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        options = {"encoding": "base64", "commitment": commitment}
+        try:
+            responses = await self._make_batch_request(
+                [("getMultipleAccounts", [group, options]) for group in groups]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting accounts: {sanitize_error(e)}")
+            return {}
+
+        accounts = {}
+        for group, response in zip(groups, responses):
+            values = None
+            if "error" not in response:
+                values = (response.get("result") or {}).get("value")
+            if not isinstance(values, list) or len(values) != len(group):
+                continue
+            accounts.update(zip(group, values))
+        return accounts
+
+    async def simulate_transactions(
+        self,
+        transactions_base64: Sequence[str],
+        commitment: str = "confirmed"
+    ) -> List[Optional[dict]]:
+        """
+        Simulate many (possibly unsigned) transactions in JSON-RPC batches
+
+        Signatures are not verified and each blockhash is replaced with a
+        recent one, so transactions can be checked before they are signed.
+
+        Returns:
+            One simulation value ({"err", "logs", "unitsConsumed", ...}) per
+            transaction, in order; None where the call itself failed
+        """
+        options = {
+            "encoding": "base64",
+            "sigVerify": False,
+            "replaceRecentBlockhash": True,
+            "commitment": commitment
+        }
+        try:
+            responses = await self._make_batch_request(
+                [("simulateTransaction", [tx, options]) for tx in transactions_base64]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error simulating transactions: {sanitize_error(e)}")
+            return [None] * len(transactions_base64)
+
+        return [
+            response["result"].get("value")
+            if "error" not in response and isinstance(response.get("result"), dict) else None
+            for response in responses
+        ]
+
+    async def are_blockhashes_valid(
+        self,
+        blockhashes: Sequence[str],
+        commitment: str = "confirmed"
+    ) -> Dict[str, bool]:
+        """
+        Check many blockhashes with isBlockhashValid in one round trip
+
+        Returns:
+            Mapping of blockhash to validity; failed lookups are left out
+        """
+        blockhashes = list(dict.fromkeys(blockhashes))
+        try:
+            responses = await self._make_batch_request(
+                [("isBlockhashValid", [blockhash, {"commitment": commitment}]) for blockhash in blockhashes]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error checking blockhashes: {sanitize_error(e)}")
+            return {}
+
+        return {
+            blockhash: bool(response["result"].get("value"))
+            for blockhash, response in zip(blockhashes, responses)
+            if "error" not in response and isinstance(response.get("result"), dict)
+        }
+
+    async def get_transactions(
+        self,
+        signatures: Sequence[str],
+        commitment: str = "finalized"
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Get transaction bodies (jsonParsed) for many signatures
+
+        All getTransaction calls go out together as JSON-RPC batches.
+
+        Returns:
+            Mapping of signature to transaction, None where it is not
+            available at this commitment. Signatures whose lookup failed
+            are left out.
+        """
+        signatures = list(dict.fromkeys(signatures))
+        options = {
+            "encoding": "jsonParsed",
+            "maxSupportedTransactionVersion": 0,
+            "commitment": commitment,
+        }
+        try:
+            responses = await self._make_batch_request(
+                [("getTransaction", [sig, options]) for sig in signatures]
+            )
+        except Exception as e:
+            from config import sanitize_error
+            print_error(f"Error getting transactions: {sanitize_error(e)}")
+            return {}
+
+        return {
+            sig: response["result"]
+            for sig, response in zip(signatures, responses)
+            if "error" not in response and "result" in response
+        }
+
+    async def close(self):
+        await self.pool.close()
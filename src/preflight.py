@@ -0,0 +1,191 @@
+"""
+Preflight Simulator - Simulate unsigned transactions before they are signed
+
+Runs simulateTransaction (sigVerify=false, replaceRecentBlockhash=true)
+concurrently over whole bundles of unsigned transactions on the online
+machine, and writes the outcome - compute units, logs and error - into
+each transaction's own record as a "simulation" field. The air-gapped
+signer reads that field to skip transactions that are known to fail, and
+the recorded compute units size compute budgets.
+
+B - Love U 3000
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from config import sanitize_error
+from src.batch_builder import BUNDLE_TYPE
+from src.network import AsyncSolanaNetwork
+from src.priority_fees import compute_unit_limit
+from src.ui import print_error, print_info, print_success, print_warning
+
+
+# Program logs kept per transaction (the tail, where errors are reported)
+MAX_LOG_LINES = 50
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of simulating one transaction"""
+    err: Optional[Any]
+    units_consumed: Optional[int]
+    logs: List[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.err is None
+
+    @classmethod
+    def from_value(cls, value: dict) -> "SimulationResult":
+        return cls(
+            err=value.get("err"),
+            units_consumed=value.get("unitsConsumed"),
+            logs=list(value.get("logs") or [])[-MAX_LOG_LINES:],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "ok": self.ok,
+            "err": self.err,
+            "units_consumed": self.units_consumed,
+            "compute_unit_limit": compute_unit_limit(self.units_consumed) if self.units_consumed else None,
+            "logs": self.logs,
+            "simulated_at": int(time.time()),
+        }
+
+
+@dataclass
+class PreflightSummary:
+    """Counts from one preflight run"""
+    simulated: int = 0
+    failed: int = 0
+    unavailable: int = 0  # RPC gave no answer; left unannotated
+    files: int = 0
+    elapsed: float = 0.0
+
+
+def known_failing(record: dict) -> bool:
+    """True if a transaction record carries a failed preflight simulation"""
+    simulation = record.get("simulation")
+    return isinstance(simulation, dict) and simulation.get("ok") is False
+
+
+async def simulate_transactions(
+    network: AsyncSolanaNetwork,
+    transactions: Sequence[bytes]
+) -> List[Optional[SimulationResult]]:
+    """Simulate serialized transactions concurrently; None where the RPC failed"""
+    values = await network.simulate_transactions(
+        [base64.b64encode(tx).decode("utf-8") for tx in transactions]
+    )
+    return [SimulationResult.from_value(value) if value is not None else None for value in values]
+
+
+def _write_atomic(path: Path, lines: List[str]):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+def _annotate(record: dict, result: Optional[SimulationResult], summary: PreflightSummary):
+    if result is None:
+        summary.unavailable += 1
+        return
+    record["simulation"] = result.to_dict()
+    summary.simulated += 1
+    if not result.ok:
+        summary.failed += 1
+
+
+async def preflight_bundle(network: AsyncSolanaNetwork, path: str,
+                           summary: Optional[PreflightSummary] = None) -> PreflightSummary:
+    """Simulate every transaction of an unsigned bundle and annotate it in place"""
+    summary = summary or PreflightSummary()
+    filepath = Path(path)
+    with open(filepath, "r") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("type") != BUNDLE_TYPE:
+            raise ValueError("Not a transaction bundle file")
+        records = [json.loads(line) for line in f if line.strip()]
+
+    results = await simulate_transactions(network, [base64.b64decode(r["data"]) for r in records])
+    for record, result in zip(records, results):
+        _annotate(record, result, summary)
+
+    _write_atomic(filepath, [json.dumps(header) + "\n"] + [json.dumps(r) + "\n" for r in records])
+    summary.files += 1
+    return summary
+
+
+async def preflight_file(network: AsyncSolanaNetwork, path: str,
+                         summary: Optional[PreflightSummary] = None) -> PreflightSummary:
+    """Simulate a single unsigned_*.json transaction and annotate it in place"""
+    summary = summary or PreflightSummary()
+    filepath = Path(path)
+    with open(filepath, "r") as f:
+        tx_data = json.load(f)
+    if tx_data.get("type") != "unsigned_transaction":
+        raise ValueError("Invalid unsigned transaction file format")
+
+    result, = await simulate_transactions(network, [base64.b64decode(tx_data["data"])])
+    _annotate(tx_data, result, summary)
+
+    _write_atomic(filepath, [json.dumps(tx_data, indent=2)])
+    summary.files += 1
+    return summary
+
+
+async def preflight_path(network: AsyncSolanaNetwork, path: str) -> PreflightSummary:
+    """
+    Simulate an unsigned bundle, an unsigned_*.json file, or every one of
+    them in a directory (files are processed concurrently)
+    """
+    started = time.monotonic()
+    summary = PreflightSummary()
+    path = Path(path)
+    if path.is_dir():
+        targets = sorted(path.glob("unsigned_*.json")) + sorted(path.glob("unsigned_bundle_*.jsonl"))
+    else:
+        targets = [path]
+
+    async def run(target: Path):
+        try:
+            if target.suffix == ".jsonl":
+                await preflight_bundle(network, str(target), summary)
+            else:
+                await preflight_file(network, str(target), summary)
+        except Exception as e:
+            print_warning(f"Skipping {target.name}: {sanitize_error(e)}")
+
+    await asyncio.gather(*(run(target) for target in targets))
+    summary.elapsed = time.monotonic() - started
+    return summary
+
+
+def run_preflight(path: str, rpc_url: str = None) -> Optional[PreflightSummary]:
+    """Blocking preflight of `path` with a summary printed"""
+    async def run() -> PreflightSummary:
+        async with AsyncSolanaNetwork(rpc_url) as network:
+            return await preflight_path(network, path)
+
+    try:
+        summary = asyncio.run(run())
+    except Exception as e:
+        print_error(f"Preflight simulation failed: {sanitize_error(e)}")
+        return None
+
+    if summary.simulated:
+        print_success(f"Simulated {summary.simulated} transaction(s) in {summary.elapsed:.2f}s")
+    if summary.failed:
+        print_warning(f"{summary.failed} transaction(s) fail in simulation - the signer will skip them")
+    if summary.unavailable:
+        print_info(f"{summary.unavailable} transaction(s) could not be simulated")
+    return summary
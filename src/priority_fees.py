@@ -0,0 +1,245 @@
+"""
+Priority Fee Oracle - Compute-budget instructions sized from live fee data
+
+getRecentPrioritizationFees reports, for each of the last ~150 slots, the
+lowest priority fee that landed while write-locking the given accounts.
+The oracle turns those samples into p50/p75/p90 prices and keeps them for
+a few slots, so a burst of transfers costs one lookup.
+
+The compute-unit limit comes from simulating the transaction once per
+instruction shape (same programs, account counts and instruction tags)
+and adding a margin; later transfers of the same shape reuse the cached
+figure. A tight limit matters because the priority fee is charged on the
+requested limit, not on the units actually used.
+
+B - Love U 3000
+"""
+
+import base64
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from src.blockhash_cache import SLOT_DURATION_SECONDS
+from src.network import SolanaNetwork, endpoints_key
+from src.rpc_pool import RpcPool
+from src.ui import print_warning
+from src.wire_inspector import (
+    ASSOCIATED_TOKEN_PROGRAM,
+    COMPUTE_BUDGET_PROGRAM,
+    SYSTEM_PROGRAM,
+    TOKEN_2022_PROGRAM,
+    TOKEN_PROGRAM,
+)
+
+
+# Opt-in priority levels and the fee percentile each one pays
+PRIORITY_LEVELS = {"p50": 50, "p75": 75, "p90": 90}
+
+# Hard per-transaction compute ceiling enforced by the runtime
+MAX_COMPUTE_UNIT_LIMIT = 1_400_000
+
+# Headroom added on top of simulated compute units
+COMPUTE_UNIT_MARGIN = 0.10
+MIN_COMPUTE_UNIT_HEADROOM = 1_000
+
+# Instruction discriminator width per program; the bytes after it are
+# arguments (amounts, decimals) that do not change the compute cost
+DISCRIMINATOR_BYTES = {
+    SYSTEM_PROGRAM: 4,
+    TOKEN_PROGRAM: 1,
+    TOKEN_2022_PROGRAM: 1,
+    ASSOCIATED_TOKEN_PROGRAM: 1,
+    COMPUTE_BUDGET_PROGRAM: 1,
+}
+# Anything else is assumed to use Anchor's 8-byte discriminator
+DEFAULT_DISCRIMINATOR_BYTES = 8
+
+
+@dataclass
+class FeeSample:
+    """Priority fee percentiles for one set of writable accounts"""
+    percentiles: Dict[int, int]  # percentile -> micro-lamports per CU
+    fetched_at: float
+
+    def age_slots(self, now: float = None) -> float:
+        return ((now if now is not None else time.monotonic()) - self.fetched_at) / SLOT_DURATION_SECONDS
+
+
+def fee_percentiles(fees: Sequence[int], percentiles: Sequence[int] = tuple(PRIORITY_LEVELS.values())) -> Dict[int, int]:
+    """Nearest-rank percentiles of per-slot fees (0 when there are no samples)"""
+    ordered = sorted(fees)
+    if not ordered:
+        return {p: 0 for p in percentiles}
+    return {p: ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)] for p in percentiles}
+
+
+def compute_unit_limit(units_consumed: int) -> int:
+    """Compute-unit limit for a simulated usage: units plus margin, capped"""
+    headroom = max(math.ceil(units_consumed * COMPUTE_UNIT_MARGIN), MIN_COMPUTE_UNIT_HEADROOM)
+    return min(units_consumed + headroom, MAX_COMPUTE_UNIT_LIMIT)
+
+
+def writable_accounts(instructions: Sequence[Instruction], payer: Pubkey) -> List[str]:
+    """Accounts the transaction write-locks, fee payer first"""
+    accounts = [str(payer)]
+    for ix in instructions:
+        accounts.extend(str(meta.pubkey) for meta in ix.accounts if meta.is_writable)
+    return list(dict.fromkeys(accounts))
+
+
+def instruction_shape(instructions: Sequence[Instruction]) -> Tuple:
+    """Cache key for compute usage: program, account count and discriminator per instruction"""
+    shape = []
+    for ix in instructions:
+        program = str(ix.program_id)
+        width = DISCRIMINATOR_BYTES.get(program, DEFAULT_DISCRIMINATOR_BYTES)
+        shape.append((program, len(ix.accounts), bytes(ix.data[:width])))
+    return tuple(shape)
+
+
+class PriorityFeeOracle:
+    """
+    Priority fee and compute-unit estimates for transaction builders
+
+    Args:
+        network: SolanaNetwork used for lookups (a private one is created if omitted)
+        cache_slots: Reuse fee percentiles for this many slots
+        compute_cache_seconds: Reuse a simulated compute figure this long
+    """
+
+    def __init__(
+        self,
+        network: SolanaNetwork = None,
+        cache_slots: int = 10,
+        compute_cache_seconds: float = 600.0
+    ):
+        self.network = network or SolanaNetwork()
+        self.cache_slots = cache_slots
+        self.compute_cache_seconds = compute_cache_seconds
+
+        self.fee_lookups = 0
+        self.simulations = 0
+
+        self._fees: Dict[frozenset, FeeSample] = {}
+        self._compute_units: Dict[Tuple, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_fee_percentiles(self, accounts: Sequence[str]) -> Optional[Dict[int, int]]:
+        """
+        p50/p75/p90 priority fees (micro-lamports per CU) for the accounts
+
+        Returns:
+            Mapping of percentile to fee, or None if the lookup failed
+        """
+        key = frozenset(accounts)
+        with self._lock:
+            sample = self._fees.get(key)
+            if sample is not None and sample.age_slots() < self.cache_slots:
+                return sample.percentiles
+
+        result = self.network.get_recent_prioritization_fees(sorted(key))
+        if result is None:
+            return None
+        percentiles = fee_percentiles([entry.get("prioritizationFee", 0) for entry in result])
+        with self._lock:
+            self.fee_lookups += 1
+            self._fees[key] = FeeSample(percentiles, time.monotonic())
+        return percentiles
+
+    def get_priority_fee(self, accounts: Sequence[str], priority: str) -> Optional[int]:
+        """Compute-unit price for a priority level ("p50", "p75" or "p90")"""
+        if priority not in PRIORITY_LEVELS:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of {', '.join(PRIORITY_LEVELS)}")
+        percentiles = self.get_fee_percentiles(accounts)
+        if percentiles is None:
+            return None
+        return percentiles[PRIORITY_LEVELS[priority]]
+
+    def get_compute_unit_limit(
+        self,
+        instructions: Sequence[Instruction],
+        payer: Pubkey,
+        blockhash: Hash
+    ) -> Optional[int]:
+        """
+        Compute-unit limit for a transaction, from a cached simulation
+
+        The simulated transaction carries the compute-budget instructions
+        (at the maximum limit) so their own cost is included.
+
+        Returns:
+            Simulated units plus margin, or None if simulation failed
+        """
+        shape = instruction_shape(instructions)
+        with self._lock:
+            cached = self._compute_units.get(shape)
+            if cached is not None and time.monotonic() - cached[1] < self.compute_cache_seconds:
+                return cached[0]
+
+        probe = [set_compute_unit_limit(MAX_COMPUTE_UNIT_LIMIT), set_compute_unit_price(0), *instructions]
+        tx = Transaction.new_unsigned(Message.new_with_blockhash(probe, payer, blockhash))
+        result = self.network.simulate_transaction(base64.b64encode(bytes(tx)).decode())
+        if result is None:
+            return None
+        if result.get("err") is not None or not result.get("unitsConsumed"):
+            print_warning(f"Simulation did not succeed: {result.get('err')}")
+            return None
+
+        limit = compute_unit_limit(result["unitsConsumed"])
+        with self._lock:
+            self.simulations += 1
+            self._compute_units[shape] = (limit, time.monotonic())
+        return limit
+
+    def with_compute_budget(
+        self,
+        instructions: Sequence[Instruction],
+        payer: Pubkey,
+        blockhash: Hash,
+        priority: str
+    ) -> List[Instruction]:
+        """
+        Prepend compute-unit limit and price instructions
+
+        If the fee lookup fails the transaction is built without a price;
+        if simulation fails the runtime default limit is left in place.
+        """
+        instructions = list(instructions)
+        price = self.get_priority_fee(writable_accounts(instructions, payer), priority)
+        if price is None:
+            print_warning("Priority fee unavailable - building without a priority fee")
+            return instructions
+
+        budget = []
+        limit = self.get_compute_unit_limit(instructions, payer, blockhash)
+        if limit is None:
+            print_warning("Compute units unknown - using the runtime default limit")
+        else:
+            budget.append(set_compute_unit_limit(limit))
+        budget.append(set_compute_unit_price(price))
+        return budget + instructions
+
+
+_shared_oracles: Dict[str, PriorityFeeOracle] = {}
+_shared_lock = threading.Lock()
+
+
+def get_fee_oracle(rpc_url: str = None, pool: RpcPool = None) -> PriorityFeeOracle:
+    """Get the process-wide fee oracle for an RPC URL or pool (default: the SOLANA_RPC_URLS pool)"""
+    key = endpoints_key(rpc_url, pool)
+    with _shared_lock:
+        oracle = _shared_oracles.get(key)
+        if oracle is None:
+            oracle = PriorityFeeOracle(SolanaNetwork(rpc_url, pool=pool))
+            _shared_oracles[key] = oracle
+        return oracle
@@ -6,17 +6,22 @@ Evaluates whether a transaction should be signed based on:
 - Proof validity (private mode)
 - Transfer limits and destination allowlists
 - Replay protection
+- What the unsigned transaction bytes actually do
 
 Each mode has different requirements:
   PUBLIC:  Standard validation (amount, destination, format)
   PRIVATE: Full ZK proof chain + standard validation + proof binding
 """
 
+import base64
+import binascii
 import enum
 import time
 from dataclasses import dataclass, field
 from typing import List, Optional, Set
 
+from config import INFRASTRUCTURE_FEE_WALLET
+from src.wire_inspector import DecodedInstruction, WireFormatError, inspect_transaction
 from src.zk.types import (
     ProofBundle,
     TransactionMode,
@@ -71,6 +76,22 @@ class PolicyEvaluation:
         return "\n".join(lines)
 
 
+def _undeclared_label(ix: DecodedInstruction) -> Optional[str]:
+    """Label for an instruction a SOL transfer envelope cannot account for, else None.
+
+    The envelope declares one SOL transfer, so any token instruction
+    (transfer, approve, closeAccount, ...), any program the inspector does
+    not know and any instruction it could not decode is undeclared.
+    """
+    if ix.program in ("spl-token", "token-2022"):
+        return f"{ix.program} {ix.kind}"
+    if ix.program == "unknown":
+        return f"program {ix.program_id[:8]}…"
+    if ix.kind == "unknown":
+        return f"undecoded {ix.program} instruction"
+    return None
+
+
 class SigningPolicyEngine:
     """Evaluates signing policy for a transfer envelope.
 
@@ -122,7 +143,10 @@ class SigningPolicyEngine:
         # 5. Replay protection
         checks.append(self._check_replay(envelope))
 
-        # 6. Private-mode-only checks
+        # 6. Decoded transaction matches the envelope
+        checks.append(self._check_wire_contents(envelope))
+
+        # 7. Private-mode-only checks
         if mode == TransactionMode.PRIVATE:
             if envelope.proof_bundle is None:
                 checks.append(PolicyCheck(
@@ -205,6 +229,39 @@ class SigningPolicyEngine:
         return PolicyCheck(name="replay", result=PolicyCheckResult.PASS,
                            detail="Nonce is fresh")
 
+    def _check_wire_contents(self, envelope: TransferEnvelope) -> PolicyCheck:
+        """Hold the declared amount and recipient to what the bytes really do."""
+        tx = envelope.transaction
+        try:
+            decoded = inspect_transaction(base64.b64decode(tx.unsigned_tx_b64, validate=True))
+        except (binascii.Error, ValueError, WireFormatError) as e:
+            # Never sign bytes that could not be read
+            return PolicyCheck(name="wire_contents", result=PolicyCheckResult.FAIL,
+                               detail=f"Transaction bytes not decodable: {e}")
+
+        issues = []
+        lamports_out = decoded.lamports_out(tx.from_pubkey)
+        if lamports_out > self.max_transfer_lamports:
+            issues.append(f"moves {lamports_out} lamports, over limit {self.max_transfer_lamports}")
+        to_recipient = sum(lamports for source, destination, lamports in decoded.sol_transfers
+                           if source == tx.from_pubkey and destination == tx.to_pubkey)
+        if to_recipient != tx.amount_lamports:
+            issues.append(f"sends {to_recipient} lamports to recipient, envelope declares {tx.amount_lamports}")
+        if self.require_destination_allowlist:
+            destinations = {destination for _, destination, _ in decoded.sol_transfers}
+            destinations.discard(INFRASTRUCTURE_FEE_WALLET)
+            unknown = sorted(d for d in destinations if d not in self.allowed_destinations)
+            if unknown:
+                issues.append(f"pays {len(unknown)} address(es) not in allowlist ({unknown[0][:8]}…)")
+        undeclared = sorted({_undeclared_label(ix) for ix in decoded.instructions} - {None})
+        if undeclared:
+            issues.append(f"carries instructions the envelope does not declare ({', '.join(undeclared)})")
+        if issues:
+            return PolicyCheck(name="wire_contents", result=PolicyCheckResult.FAIL,
+                               detail="Transaction " + "; ".join(issues))
+        return PolicyCheck(name="wire_contents", result=PolicyCheckResult.PASS,
+                           detail=f"{len(decoded.instructions)} instruction(s) match the envelope")
+
     def _check_proof_completeness(self, bundle: ProofBundle) -> List[PolicyCheck]:
         checks = []
         if bundle.ownership_proof is not None:
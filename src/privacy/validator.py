@@ -12,7 +12,7 @@ This is the top-level API that the CLI should call.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from src.zk.types import (
     ProofBundle,
@@ -262,6 +262,26 @@ class PrivacyValidator:
             ValidationResult
         """
         vr, summary = self._engine.validate_envelope(envelope)
+        return self._received_result(envelope, vr, summary)
+
+    def verify_envelopes(self, envelopes: List[TransferEnvelope]) -> List[ValidationResult]:
+        """Verify a batch of received envelopes (e.g. the whole inbox).
+
+        Range proofs are batch-verified by the engine; each envelope still
+        gets its own policy evaluation and ValidationResult.
+        """
+        return [
+            self._received_result(envelope, vr, summary)
+            for envelope, (vr, summary) in zip(envelopes, self._engine.validate_envelopes(envelopes))
+        ]
+
+    def _received_result(
+        self,
+        envelope: TransferEnvelope,
+        vr: VerificationResult,
+        summary: SigningSummary,
+    ) -> ValidationResult:
+        """Combine engine validation with policy evaluation for a received envelope."""
         evaluation = self._policy_engine.evaluate(envelope)
 
         approved = vr.valid and evaluation.approved
@@ -6,9 +6,10 @@ B - Love U 3000
 """
 
 import httpx
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from decimal import Decimal
 
+from src.portfolio import PortfolioSnapshot
 from src.ui import print_success, print_error, print_info, print_warning
 
 
@@ -206,19 +207,23 @@ class PythPriceClient:
 
     def get_portfolio_value(
         self,
-        holdings: Dict[str, float]
+        holdings: Union[Dict[str, float], PortfolioSnapshot]
     ) -> Optional[Dict[str, Any]]:
         """
         Calculate total portfolio value in USD
 
         Args:
             holdings: Dictionary mapping token symbols to amounts
-                     e.g., {"SOL": 10.5, "USDC": 1000}
+                     e.g., {"SOL": 10.5, "USDC": 1000}, or a
+                     PortfolioSnapshot (valued by its totals)
 
         Returns:
             Portfolio valuation data or None on error
         """
         try:
+            if isinstance(holdings, PortfolioSnapshot):
+                holdings = holdings.totals()
+
             # Get all prices
             symbols = list(holdings.keys())
             prices = self.get_multiple_prices(symbols)
@@ -0,0 +1,429 @@
+"""
+RPC Endpoint Pool - Latency-aware routing and failover across JSON-RPC nodes
+
+Every endpoint keeps an EWMA of its response latency and of its error rate.
+Reads go to the best-scoring healthy endpoint; if it has not answered by
+its own latency percentile (p90 by default), the same request is hedged to
+the next endpoint and whichever answers first wins. Transport failures
+(timeouts, 429/5xx, connection errors) put an endpoint in an exponentially
+growing cooldown and fail the request over to the next one.
+
+Writes (sendTransaction, eth_sendRawTransaction) are broadcast to several
+endpoints at once. A signed transaction is idempotent, so sending it to
+more nodes only improves the chance it reaches a leader quickly.
+
+RpcPool serves the blocking clients from a small thread pool;
+AsyncRpcPool does the same with asyncio tasks.
+
+B - Love U 3000
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, Sequence, Union
+
+import httpx
+
+
+# Methods that submit a signed transaction; broadcast instead of routed
+WRITE_METHODS = frozenset({"sendTransaction", "eth_sendRawTransaction"})
+
+# EWMA smoothing factor for latency and error rate
+EWMA_ALPHA = 0.3
+
+# Score multiplier per unit of error rate (an endpoint failing half its
+# requests looks 6x slower than its latency alone)
+ERROR_PENALTY = 10.0
+
+# Latency samples kept per endpoint for the hedge percentile
+LATENCY_WINDOW = 64
+
+# Below this many samples the hedge delay falls back to initial_hedge_delay
+MIN_HEDGE_SAMPLES = 5
+
+# Cooldown after a failure doubles per consecutive failure up to the max
+BASE_COOLDOWN_SECONDS = 1.0
+MAX_COOLDOWN_SECONDS = 60.0
+
+Payload = Union[dict, List[dict]]
+
+
+@dataclass
+class Endpoint:
+    """One RPC node and its health statistics"""
+    url: str
+    latency_ewma: Optional[float] = None  # seconds; None until first success
+    error_ewma: float = 0.0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def healthy(self, now: float = None) -> bool:
+        return (now if now is not None else time.monotonic()) >= self.cooldown_until
+
+    def score(self) -> float:
+        """Lower is better; untried endpoints score 0 so they get probed"""
+        return (self.latency_ewma or 0.0) * (1.0 + ERROR_PENALTY * self.error_ewma)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        if len(self.samples) < MIN_HEDGE_SAMPLES:
+            return None
+        cut = min(max(int(percentile * 100), 1), 99)
+        return statistics.quantiles(self.samples, n=100, method="inclusive")[cut - 1]
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.samples.append(latency)
+        self.latency_ewma = latency if self.latency_ewma is None else (
+            EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.latency_ewma
+        )
+        self.error_ewma *= 1 - EWMA_ALPHA
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record_failure(self, now: float = None):
+        self.requests += 1
+        self.failures += 1
+        self.error_ewma = EWMA_ALPHA + (1 - EWMA_ALPHA) * self.error_ewma
+        self.consecutive_failures += 1
+        cooldown = min(BASE_COOLDOWN_SECONDS * 2 ** (self.consecutive_failures - 1), MAX_COOLDOWN_SECONDS)
+        self.cooldown_until = (now if now is not None else time.monotonic()) + cooldown
+
+
+def is_write(payload: Payload) -> bool:
+    """True if the payload (single call or batch) submits a transaction"""
+    calls = payload if isinstance(payload, list) else [payload]
+    return any(call.get("method") in WRITE_METHODS for call in calls)
+
+
+def _accepted(body) -> bool:
+    """True if a node accepted at least one call of the payload"""
+    if isinstance(body, list):
+        return any(isinstance(item, dict) and "error" not in item for item in body)
+    return isinstance(body, dict) and "error" not in body
+
+
+class _PoolBase:
+    """Endpoint bookkeeping shared by the blocking and asyncio pools"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        hedge_percentile: float = 0.9,
+        initial_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 5.0,
+        broadcast_fanout: int = 3
+    ):
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            raise ValueError("RPC pool needs at least one endpoint URL")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.broadcast_fanout = broadcast_fanout
+        self._lock = threading.Lock()
+
+    @property
+    def primary_url(self) -> str:
+        return self.endpoints[0].url
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def ranked(self) -> List[Endpoint]:
+        """Healthy endpoints by score, then cooling-down ones by readiness"""
+        now = time.monotonic()
+        with self._lock:
+            return sorted(
+                self.endpoints,
+                key=lambda ep: (not ep.healthy(now), ep.cooldown_until if not ep.healthy(now) else ep.score()),
+            )
+
+    def hedge_delay(self, endpoint: Endpoint) -> float:
+        """Seconds to wait on an endpoint before hedging to the next one"""
+        with self._lock:
+            delay = endpoint.latency_percentile(self.hedge_percentile)
+        if delay is None:
+            delay = self.initial_hedge_delay
+        return min(max(delay, self.min_hedge_delay), self.max_hedge_delay)
+
+    def _record(self, endpoint: Endpoint, latency: Optional[float]):
+        with self._lock:
+            if latency is None:
+                endpoint.record_failure()
+            else:
+                endpoint.record_success(latency)
+
+    def stats(self) -> List[dict]:
+        """Per-endpoint health for display, best first"""
+        now = time.monotonic()
+        return [
+            {
+                "url": ep.url,
+                "latency_ms": round(ep.latency_ewma * 1000, 1) if ep.latency_ewma is not None else None,
+                "error_rate": round(ep.error_ewma, 3),
+                "healthy": ep.healthy(now),
+                "requests": ep.requests,
+                "failures": ep.failures,
+            }
+            for ep in self.ranked()
+        ]
+
+
+class RpcPool(_PoolBase):
+    """
+    Blocking JSON-RPC pool
+
+    Usage:
+        pool = RpcPool(["https://a.example", "https://b.example"])
+        body = pool.post({"jsonrpc": "2.0", "id": 1, "method": "getSlot", "params": []})
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport = None,
+        **kwargs
+    ):
+        super().__init__(urls, **kwargs)
+        self.client = httpx.Client(timeout=timeout, transport=transport)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self.endpoints)), thread_name_prefix="rpc-pool"
+        )
+
+    def _timed_post(self, endpoint: Endpoint, payload: Payload) -> object:
+        started = time.monotonic()
+        try:
+            response = self.client.post(
+                endpoint.url,
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            body = response.json()
+        except Exception:
+            self._record(endpoint, None)
+            raise
+        self._record(endpoint, time.monotonic() - started)
+        return body
+
+    def post(self, payload: Payload) -> object:
+        """Send a JSON-RPC payload: broadcast writes, route and hedge reads"""
+        if is_write(payload):
+            return self.broadcast(payload)
+        return self.request(payload)
+
+    def request(self, payload: Payload) -> object:
+        """
+        Send a read to the best endpoint, hedging once and failing over
+
+        Raises the last transport error if every endpoint failed.
+        """
+        candidates = self.ranked()
+        if len(candidates) == 1:
+            return self._timed_post(candidates[0], payload)
+        pending = {}
+        launched = 0
+        hedged = False
+        last_error: Optional[Exception] = None
+
+        def launch():
+            nonlocal launched
+            endpoint = candidates[launched]
+            pending[self._executor.submit(self._timed_post, endpoint, payload)] = endpoint
+            launched += 1
+
+        launch()
+        hedge_at = time.monotonic() + self.hedge_delay(candidates[0])
+        while pending:
+            timeout = None
+            if not hedged and launched < len(candidates):
+                timeout = max(0.0, hedge_at - time.monotonic())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                launch()
+                continue
+            for future in done:
+                pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+            if not pending and launched < len(candidates):
+                launch()
+        raise last_error
+
+    def broadcast(self, payload: Payload) -> object:
+        """
+        Send a write to the best broadcast_fanout endpoints at once
+
+        Returns the first accepted response without waiting for the rest;
+        if no node accepts it, the first node's answer (usually the reason).
+        """
+        futures = [
+            self._executor.submit(self._timed_post, endpoint, payload)
+            for endpoint in self.ranked()[:self.broadcast_fanout]
+        ]
+        rejected = None
+        last_error: Optional[Exception] = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    body = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if _accepted(body):
+                    return body
+                rejected = rejected or body
+        if rejected is not None:
+            return rejected
+        raise last_error
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+
+class AsyncRpcPool(_PoolBase):
+    """asyncio JSON-RPC pool; same routing as RpcPool, losers are cancelled"""
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        timeout: float = 30.0,
+        limits: httpx.Limits = None,
+        transport: httpx.AsyncBaseTransport = None,
+        **kwargs
+    ):
+        super().__init__(urls, **kwargs)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits or httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            transport=transport
+        )
+        self._background = set()
+
+    async def _timed_post(self, endpoint: Endpoint, payload: Payload) -> object:
+        started = time.monotonic()
+        try:
+            response = await self.client.post(
+                endpoint.url,
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            body = response.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._record(endpoint, None)
+            raise
+        self._record(endpoint, time.monotonic() - started)
+        return body
+
+    async def post(self, payload: Payload) -> object:
+        """Send a JSON-RPC payload: broadcast writes, route and hedge reads"""
+        if is_write(payload):
+            return await self.broadcast(payload)
+        return await self.request(payload)
+
+    async def request(self, payload: Payload) -> object:
+        """
+        Send a read to the best endpoint, hedging once and failing over
+
+        Raises the last transport error if every endpoint failed.
+        """
+        candidates = self.ranked()
+        pending = set()
+        launched = 0
+        hedged = False
+        last_error: Optional[Exception] = None
+
+        def launch():
+            nonlocal launched
+            pending.add(asyncio.ensure_future(self._timed_post(candidates[launched], payload)))
+            launched += 1
+
+        launch()
+        hedge_at = time.monotonic() + self.hedge_delay(candidates[0])
+        try:
+            while pending:
+                timeout = None
+                if not hedged and launched < len(candidates):
+                    timeout = max(0.0, hedge_at - time.monotonic())
+                done, pending = await asyncio.wait(pending, timeout=timeout,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    launch()
+                    continue
+                for task in done:
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        last_error = e
+                if not pending and launched < len(candidates):
+                    launch()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def broadcast(self, payload: Payload) -> object:
+        """
+        Send a write to the best broadcast_fanout endpoints at once
+
+        Returns the first accepted response; the other sends keep running
+        in the background until close().
+        """
+        pending = {
+            asyncio.ensure_future(self._timed_post(endpoint, payload))
+            for endpoint in self.ranked()[:self.broadcast_fanout]
+        }
+        rejected = None
+        last_error: Optional[Exception] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    body = task.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if _accepted(body):
+                    self._background.update(pending)
+                    for task in pending:
+                        task.add_done_callback(self._finish_background)
+                    return body
+                rejected = rejected or body
+        if rejected is not None:
+            return rejected
+        raise last_error
+
+    def _finish_background(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled():
+            task.exception()  # retrieved so asyncio does not log it
+
+    async def close(self, grace: float = 2.0):
+        if self._background:
+            await asyncio.wait(set(self._background), timeout=grace)
+            for task in self._background:
+                task.cancel()
+        await self.client.aclose()
@@ -12,21 +12,23 @@ B - Love U 3000
 import json
 import base64
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple, List
 from dataclasses import dataclass
 
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.hash import Hash
 from solders.instruction import Instruction, AccountMeta
-from solders.transaction import Transaction
-from solders.message import Message
+from solders.transaction import VersionedTransaction
 from solders.system_program import create_account, CreateAccountParams
 
 from config import LAMPORTS_PER_SOL
 from config import sanitize_error
 from src.ui import print_success, print_error, print_info, print_warning
 
+if TYPE_CHECKING:
+    from src.lookup_tables import LookupTable
+
 
 # SPL Token Program IDs
 TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
@@ -86,31 +88,32 @@ def get_associated_token_address(wallet: Pubkey, mint: Pubkey) -> Pubkey:
         bytes(TOKEN_PROGRAM_ID),
         bytes(mint)
     ]
-
-    # Find program derived address
-    # This is a simplified version - in production use the proper PDA derivation
-    import hashlib
-
-    combined = b''.join(seeds) + bytes(ASSOCIATED_TOKEN_PROGRAM_ID) + b"ProgramDerivedAddress"
-
-    for bump in range(255, -1, -1):
-        try:
-            seed_with_bump = combined + bytes([bump])
-            hash_result = hashlib.sha256(seed_with_bump).digest()
-            # Check if it's a valid point on the curve (simplified)
-            return Pubkey.from_bytes(hash_result)
-        except Exception:
-            continue
-
-    raise ValueError("Could not find valid PDA")
+    address, _bump = Pubkey.find_program_address(seeds, ASSOCIATED_TOKEN_PROGRAM_ID)
+    return address
 
 
 class TokenTransferManager:
     """Manage SPL token transfers"""
 
-    def __init__(self):
+    def __init__(self, rpc_url: str = None, blockhash_provider=None, fee_oracle=None):
+        self.rpc_url = rpc_url
         self.unsigned_tx: Optional[bytes] = None
         self.signed_tx: Optional[bytes] = None
+        self.blockhash_provider = blockhash_provider
+        self.fee_oracle = fee_oracle
+
+    def _resolve_blockhash(self, recent_blockhash: Optional[str]) -> Optional[str]:
+        """Use the given blockhash, or take one from the shared prefetch cache"""
+        if recent_blockhash:
+            return recent_blockhash
+        if self.blockhash_provider is None:
+            from src.blockhash_cache import get_blockhash_provider
+            self.blockhash_provider = get_blockhash_provider(self.rpc_url)
+        result = self.blockhash_provider.get_blockhash()
+        if not result:
+            print_error("Failed to get blockhash from network")
+            return None
+        return result[0]
 
     def create_token_transfer_instruction(
         self,
@@ -166,11 +169,25 @@ class TokenTransferManager:
         mint_address: str,
         amount: float,
         decimals: int,
-        recent_blockhash: str,
-        create_dest_ata: bool = False
+        recent_blockhash: Optional[str] = None,
+        create_dest_ata: bool = False,
+        priority: Optional[str] = None,
+        lookup_tables: Optional[Sequence["LookupTable"]] = None
     ) -> Optional[bytes]:
-        """Create unsigned SPL token transfer transaction"""
+        """
+        Create unsigned SPL token transfer transaction
+
+        Args:
+            priority: Optional "p50", "p75" or "p90" to prepend compute-budget
+                instructions priced at that percentile of recent fees
+            lookup_tables: Optional address lookup tables; the transaction is
+                then built as a v0 message
+        """
         try:
+            recent_blockhash = self._resolve_blockhash(recent_blockhash)
+            if recent_blockhash is None:
+                return None
+
             from_pk = Pubkey.from_string(from_wallet)
             to_pk = Pubkey.from_string(to_wallet)
             mint_pk = Pubkey.from_string(mint_address)
@@ -196,11 +213,21 @@ class TokenTransferManager:
             )
             instructions.append(transfer_ix)
 
-            # Build message and transaction
-            message = Message.new_with_blockhash(instructions, from_pk, blockhash)
-            tx = Transaction.new_unsigned(message)
-
-            self.unsigned_tx = bytes(tx)
+            # Compute budget (opt-in priority fee)
+            if priority:
+                if self.fee_oracle is None:
+                    from src.priority_fees import get_fee_oracle
+                    self.fee_oracle = get_fee_oracle(self.rpc_url)
+                instructions = self.fee_oracle.with_compute_budget(
+                    instructions, from_pk, blockhash, priority
+                )
+
+            # Build message and transaction (v0 when lookup tables are given)
+            from src.batch_builder import compile_unsigned_transaction
+            self.unsigned_tx = compile_unsigned_transaction(
+                instructions, from_pk, blockhash,
+                [table.account() for table in lookup_tables] if lookup_tables is not None else None
+            )
 
             print_success(f"Created unsigned token transfer")
             print_info(f"From: {from_wallet}")
@@ -217,8 +244,8 @@ class TokenTransferManager:
     def sign_transaction(self, unsigned_tx_bytes: bytes, keypair: Keypair) -> Optional[bytes]:
         """Sign token transfer transaction"""
         try:
-            tx = Transaction.from_bytes(unsigned_tx_bytes)
-            tx.sign([keypair], tx.message.recent_blockhash)
+            tx = VersionedTransaction.from_bytes(unsigned_tx_bytes)
+            tx = VersionedTransaction(tx.message, [keypair])
 
             self.signed_tx = bytes(tx)
             print_success("Token transaction signed successfully")
@@ -7,19 +7,25 @@ B - Love U 3000
 import json
 import base64
 import sys
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
 
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.hash import Hash
 from solders.system_program import transfer, TransferParams
-from solders.transaction import Transaction
-from solders.message import Message
+from solders.transaction import VersionedTransaction
+from solders.message import MessageV0, to_bytes_versioned
 
 from config import LAMPORTS_PER_SOL, INFRASTRUCTURE_FEE_PERCENTAGE, INFRASTRUCTURE_FEE_WALLET, sanitize_error
 from src.ui import print_success, print_error, print_info, print_warning, console
 
+if TYPE_CHECKING:
+    from src.batch_builder import BatchBuildSummary
+    from src.durable_nonce import NonceAccount, NonceReservations
+    from src.lookup_tables import LookupTable
+
 # Import Rust signer (REQUIRED)
 # NOTE: sys.path manipulation is intentional here.  python_signer_example.py
 # lives in the project root while this module lives in src/.  A standard
@@ -40,9 +46,11 @@ except ImportError as e:
 
 
 class TransactionManager:
-    def __init__(self):
+    def __init__(self, blockhash_provider=None, fee_oracle=None):
         self.unsigned_tx: Optional[bytes] = None
         self.signed_tx: Optional[bytes] = None
+        self.blockhash_provider = blockhash_provider
+        self.fee_oracle = fee_oracle
         
         # Initialize Rust signer (REQUIRED)
         try:
@@ -62,14 +70,58 @@ class TransactionManager:
         """Calculate 1% infrastructure fee in SOL"""
         return amount_sol * INFRASTRUCTURE_FEE_PERCENTAGE
     
+    def _resolve_blockhash(self, recent_blockhash: Optional[str]) -> Optional[str]:
+        """Use the given blockhash, or take one from the shared prefetch cache"""
+        if recent_blockhash:
+            return recent_blockhash
+        if self.blockhash_provider is None:
+            from src.blockhash_cache import get_blockhash_provider
+            self.blockhash_provider = get_blockhash_provider()
+        result = self.blockhash_provider.get_blockhash()
+        if not result:
+            print_error("Failed to get blockhash from network")
+            return None
+        return result[0]
+    
+    def _with_compute_budget(self, instructions: list, payer: Pubkey, blockhash: Hash, priority: str) -> list:
+        """Prepend compute-unit limit/price instructions for a priority level"""
+        if self.fee_oracle is None:
+            from src.priority_fees import get_fee_oracle
+            self.fee_oracle = get_fee_oracle()
+        return self.fee_oracle.with_compute_budget(instructions, payer, blockhash, priority)
+    
     def create_transfer_transaction(
         self,
         from_pubkey: str,
         to_pubkey: str,
         amount_sol: float,
-        recent_blockhash: str
+        recent_blockhash: Optional[str] = None,
+        priority: Optional[str] = None,
+        nonce: Optional["NonceAccount"] = None,
+        lookup_tables: Optional[Sequence["LookupTable"]] = None
     ) -> Optional[bytes]:
+        """
+        Build an unsigned SOL transfer (plus infrastructure fee)
+        
+        Args:
+            priority: Optional "p50", "p75" or "p90" to prepend compute-budget
+                instructions priced at that percentile of recent fees
+            nonce: Optional durable nonce account (authorized to the sender);
+                the transaction then advances it instead of using a recent
+                blockhash and does not expire
+            lookup_tables: Optional address lookup tables; the transaction is
+                then built as a v0 message referencing their accounts by index
+        """
         try:
+            if nonce is not None:
+                if nonce.authority != from_pubkey:
+                    print_error("Nonce account is not authorized to the sending wallet")
+                    return None
+                recent_blockhash = nonce.nonce
+            recent_blockhash = self._resolve_blockhash(recent_blockhash)
+            if recent_blockhash is None:
+                return None
+            
             from_pk = Pubkey.from_string(from_pubkey)
             to_pk = Pubkey.from_string(to_pubkey)
             infra_pk = Pubkey.from_string(INFRASTRUCTURE_FEE_WALLET)
@@ -115,19 +167,28 @@ class TransactionManager:
             if infra_fee_lamports > 0:
                 print_info(f"  Infrastructure fee: {infra_fee_sol:.9f} SOL ({infra_fee_lamports} lamports)")
             
-            message = Message.new_with_blockhash(
+            # 3. Compute budget (opt-in priority fee)
+            if priority:
+                instructions = self._with_compute_budget(instructions, from_pk, blockhash, priority)
+            
+            # 4. Durable nonce: AdvanceNonceAccount must be the first instruction
+            if nonce is not None:
+                instructions.insert(0, nonce.advance_instruction())
+            
+            from src.batch_builder import compile_unsigned_transaction
+            tx = VersionedTransaction.from_bytes(compile_unsigned_transaction(
                 instructions,
                 from_pk,
-                blockhash
-            )
+                blockhash,
+                [table.account() for table in lookup_tables] if lookup_tables is not None else None
+            ))
+            message = tx.message
             
             # Debug: Verify message
-            print_info(f"Message created:")
+            print_info(f"Message created{' (v0)' if isinstance(message, MessageV0) else ''}:")
             print_info(f"  Num instructions: {len(message.instructions)}")
             print_info(f"  Num accounts: {len(message.account_keys)}")
             
-            tx = Transaction.new_unsigned(message)
-            
             # Debug: Verify transaction
             print_info(f"Transaction created:")
             print_info(f"  Message instructions: {len(tx.message.instructions)}")
@@ -148,6 +209,98 @@ class TransactionManager:
             print_error(f"Failed to create transaction: {sanitize_error(e)}")
             return None
     
+    def create_batch_transfer_transactions(
+        self,
+        from_pubkey: str,
+        rows: Iterable,
+        output_path: str,
+        recent_blockhash: Optional[str] = None,
+        max_transfers_per_tx: Optional[int] = None,
+        nonce_accounts: Optional[Sequence["NonceAccount"]] = None,
+        lookup_tables: Optional[Sequence["LookupTable"]] = None,
+        nonce_reservations: Optional["NonceReservations"] = None
+    ) -> Optional["BatchBuildSummary"]:
+        """
+        Build a payout run into a bundle of dense unsigned transactions
+
+        Args:
+            from_pubkey: Paying wallet (fee payer and signer)
+            rows: Iterable of (recipient, amount_sol) or (line, recipient, amount_sol),
+                e.g. from read_payout_rows() over a CSV or JSONL file
+            output_path: Bundle file to stream the unsigned transactions into
+            recent_blockhash: Optional blockhash (defaults to the shared prefetch cache)
+            max_transfers_per_tx: Optional cap below the packet-size limit
+            nonce_accounts: Optional durable nonce accounts, one per transaction;
+                the bundle then stays valid until it is broadcast
+            lookup_tables: Optional address lookup tables holding the recipients;
+                transactions are then v0 and carry far more transfers each
+            nonce_reservations: Registry of nonce accounts held by bundles not
+                broadcast yet (defaults to the local one); nonces it holds are
+                refused, and the ones this bundle uses are added to it
+
+        Returns:
+            BatchBuildSummary with counts and throughput, or None on failure
+        """
+        from src.batch_builder import (
+            BatchBuildSummary, validate_rows, pack_transfer_transactions, write_unsigned_bundle
+        )
+        
+        if nonce_accounts is not None:
+            from src.durable_nonce import NonceReservations
+            if any(nonce.authority != from_pubkey for nonce in nonce_accounts):
+                print_error("Nonce account is not authorized to the sending wallet")
+                return None
+            nonce_reservations = nonce_reservations or NonceReservations()
+            _, reserved = nonce_reservations.split(from_pubkey, nonce_accounts)
+            if reserved:
+                print_error(f"{len(reserved)} nonce account(s) are held by a bundle that has not "
+                            f"been broadcast yet; a second bundle on them would fail")
+                return None
+            recent_blockhash = None
+        else:
+            recent_blockhash = self._resolve_blockhash(recent_blockhash)
+            if recent_blockhash is None:
+                return None
+        
+        summary = BatchBuildSummary(bundle_path=output_path)
+        started = time.perf_counter()
+        try:
+            packed = pack_transfer_transactions(
+                from_pubkey,
+                validate_rows(rows, summary.skipped),
+                recent_blockhash,
+                max_transfers_per_tx=max_transfers_per_tx,
+                nonces=nonce_accounts,
+                lookup_tables=[table.account() for table in lookup_tables] if lookup_tables is not None else None
+            )
+            write_unsigned_bundle(output_path, from_pubkey, recent_blockhash, packed, summary,
+                                  durable_nonce=nonce_accounts is not None)
+        except Exception as e:
+            print_error(f"Failed to build payout batch: {sanitize_error(e)}")
+            return None
+        summary.elapsed = time.perf_counter() - started
+        if nonce_accounts is not None:
+            used = set(summary.nonce_accounts)
+            nonce_reservations.reserve(from_pubkey, [n for n in nonce_accounts if n.address in used],
+                                       summary.bundle_path)
+        
+        print_success(f"Built {summary.transactions} unsigned transaction(s) "
+                      f"for {summary.transfers} transfer(s)")
+        print_info(f"Bundle: {summary.bundle_path}")
+        print_info(f"Total: {summary.total_lamports / LAMPORTS_PER_SOL:.9f} SOL")
+        if summary.fee_lamports > 0:
+            print_info(f"Infrastructure Fee: {summary.fee_lamports / LAMPORTS_PER_SOL:.9f} SOL")
+        print_info(f"Throughput: {summary.transfers_per_second:,.0f} transfers/s "
+                   f"({summary.elapsed:.2f}s)")
+        if summary.skipped:
+            print_warning(f"Skipped {len(summary.skipped)} invalid row(s):")
+            for line, reason in summary.skipped[:10]:
+                print_warning(f"  line {line}: {reason}")
+            if len(summary.skipped) > 10:
+                print_warning(f"  ... and {len(summary.skipped) - 10} more")
+        
+        return summary
+    
     def sign_transaction_secure(self, unsigned_tx_bytes: bytes, encrypted_container: dict, password: str) -> Optional[bytes]:
         """Sign transaction using Rust secure signer (keys never in Python memory)"""
         if not RUST_SIGNER_AVAILABLE or self.rust_signer is None:
@@ -179,9 +332,9 @@ class TransactionManager:
             print_info("  Step 1: Encrypted container received")
             print_success("    ✓ Private key: ENCRYPTED (not in Python memory)")
             
-            # Parse the unsigned transaction to get the message
-            tx = Transaction.from_bytes(unsigned_tx_bytes)
-            message_bytes = bytes(tx.message)
+            # Parse the unsigned transaction (legacy or v0) to get the message
+            tx = VersionedTransaction.from_bytes(unsigned_tx_bytes)
+            message_bytes = to_bytes_versioned(tx.message)
             
             print_info("  Step 2: Transaction message prepared")
             print_success("    ✓ Message size: {} bytes".format(len(message_bytes)))
@@ -206,7 +359,7 @@ class TransactionManager:
             # Now properly add the signature to the transaction using solders
             from solders.signature import Signature
             sig = Signature.from_bytes(signature)
-            tx.signatures = [sig]
+            tx = VersionedTransaction.populate(tx.message, [sig])
             
             self.signed_tx = bytes(tx)
             
@@ -231,6 +384,74 @@ class TransactionManager:
                 print_warning("Incorrect password or corrupted wallet")
             return None
     
+    def sign_transactions_secure(
+        self,
+        unsigned_txs: Sequence[bytes],
+        encrypted_container: dict,
+        password: str,
+        ttl_seconds: int = 300
+    ) -> List[Optional[bytes]]:
+        """
+        Sign many transactions with a single key derivation
+
+        Opens a Rust signing session (Argon2id runs once, the key stays in
+        Rust locked memory), signs every message in one call, and closes the
+        session so the key is zeroized before returning.
+
+        Returns:
+            Signed transaction bytes in input order; None for entries that
+            could not be parsed or are not paid for by this wallet
+        """
+        results: List[Optional[bytes]] = [None] * len(unsigned_txs)
+        if not unsigned_txs:
+            return results
+
+        if not getattr(self.rust_signer, "supports_sessions", False):
+            print_warning("Signer library has no session support - signing one at a time")
+            print_info("Rebuild for bulk signing: cd secure_signer && cargo build --release --features ffi")
+            return [self.sign_transaction_secure(tx, encrypted_container, password) for tx in unsigned_txs]
+
+        parsed: List[Optional[VersionedTransaction]] = []
+        for index, tx_bytes in enumerate(unsigned_txs):
+            try:
+                parsed.append(VersionedTransaction.from_bytes(tx_bytes))
+            except Exception as e:
+                print_error(f"Transaction {index}: invalid format ({sanitize_error(e)})")
+                parsed.append(None)
+
+        start = time.perf_counter()
+        try:
+            with self.rust_signer.open_session(encrypted_container, password, ttl_seconds) as session:
+                print_success("Key decrypted once into Rust locked memory")
+                signer = Pubkey.from_string(session.public_key)
+
+                to_sign = []
+                for index, tx in enumerate(parsed):
+                    if tx is None:
+                        continue
+                    if tx.message.header.num_required_signatures != 1 or tx.message.account_keys[0] != signer:
+                        print_warning(f"Transaction {index}: not a single-signer transaction from this wallet, skipped")
+                        continue
+                    to_sign.append(index)
+
+                signatures = session.sign_messages([to_bytes_versioned(parsed[i].message) for i in to_sign])
+        except Exception as e:
+            err_str = str(e)
+            print_error(f"Failed to sign transactions: {sanitize_error(e)}")
+            if "Decryption failed" in err_str:
+                print_warning("Incorrect password or corrupted wallet")
+            return results
+
+        from solders.signature import Signature
+        for index, signature in zip(to_sign, signatures):
+            tx = VersionedTransaction.populate(parsed[index].message, [Signature.from_bytes(signature)])
+            results[index] = bytes(tx)
+
+        elapsed = time.perf_counter() - start
+        print_success(f"Signed {len(to_sign)} of {len(unsigned_txs)} transaction(s) in {elapsed:.2f}s")
+        print_success("Session closed - key ZEROIZED in Rust memory")
+        return results
+
     def sign_transaction(self, unsigned_tx_bytes: bytes, keypair: Keypair) -> Optional[bytes]:
         """DISABLED: Insecure signing not allowed. Use sign_transaction_secure() only."""
         print_error("SECURITY ERROR: Insecure Python-based signing is disabled!")
@@ -277,6 +498,9 @@ class TransactionManager:
             self.unsigned_tx = tx_bytes
             
             print_success(f"Loaded unsigned transaction from: {filepath}")
+            simulation = tx_data.get("simulation")
+            if isinstance(simulation, dict) and simulation.get("ok") is False:
+                print_warning(f"This transaction failed preflight simulation: {simulation.get('err')}")
             return tx_bytes
         except Exception as e:
             from config import sanitize_error
@@ -336,35 +560,18 @@ class TransactionManager:
         return base64.b64encode(self.signed_tx).decode('utf-8')
     
     def decode_transaction_info(self, tx_bytes: bytes) -> Optional[dict]:
+        """
+        Summarize a legacy or v0 transaction, including the SOL and token
+        amounts its System/SPL instructions move (see src.wire_inspector)
+        """
+        from src.wire_inspector import WireFormatError, inspect_transaction
         try:
-            tx = Transaction.from_bytes(tx_bytes)
-
-            info = {
-                "signatures": len(tx.signatures),
-                "is_signed": len(tx.signatures) > 0 and tx.signatures[0] != bytes(64),
-                "num_instructions": len(tx.message.instructions),
-                "recent_blockhash": str(tx.message.recent_blockhash),
-                "fee_payer": str(tx.message.account_keys[0]) if tx.message.account_keys else None
-            }
-
-            return info
-        except Exception:
-            # Try versioned transaction format (e.g. Jupiter swaps)
-            try:
-                from solders.transaction import VersionedTransaction
-                vtx = VersionedTransaction.from_bytes(tx_bytes)
-
-                info = {
-                    "signatures": len(vtx.signatures),
-                    "is_signed": len(vtx.signatures) > 0 and vtx.signatures[0] != bytes(64),
-                    "num_instructions": len(vtx.message.instructions),
-                    "recent_blockhash": str(vtx.message.recent_blockhash),
-                    "fee_payer": str(vtx.message.account_keys[0]) if vtx.message.account_keys else None,
-                    "versioned": True
-                }
+            inspected = inspect_transaction(tx_bytes)
+        except WireFormatError as e:
+            print_error(f"Failed to decode transaction: {e}")
+            return None
 
-                return info
-            except Exception as e:
-                from config import sanitize_error
-                print_error(f"Failed to decode transaction: {sanitize_error(e)}")
-                return None
+        info = inspected.to_dict()
+        if inspected.version != "legacy":
+            info["versioned"] = True
+        return info
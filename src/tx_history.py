@@ -0,0 +1,400 @@
+"""
+Transaction History Ledger - Local, incremental per-wallet transaction index
+
+Each wallet gets its own SQLite file. Signatures are synced with
+getSignaturesForAddress cursors: new activity is read from the tip down to
+the newest stored signature (`until`), and older history is backfilled
+page by page from the oldest stored one (`before`), so an interrupted sync
+resumes where it stopped. Only finalized signatures are synced, and
+finalized transactions never change, so every getTransaction body is
+fetched once and kept for good.
+
+History views, search and CSV export then run on the local copy.
+
+B - Love U 3000
+"""
+
+import asyncio
+import csv
+import datetime
+import json
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import IO, Iterator, List, Optional, Union
+from urllib.parse import urlsplit
+
+from config import HISTORY_DIR, LAMPORTS_PER_SOL, SOLANA_RPC_URL
+from src.network import AsyncSolanaNetwork, MAX_SIGNATURES_PER_PAGE
+
+
+# Bodies fetched (and committed) per round of fill_transactions
+BODY_FETCH_CHUNK = 500
+
+CSV_COLUMNS = ["signature", "slot", "block_time", "status", "fee_sol", "memo"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    signature TEXT PRIMARY KEY,
+    slot INTEGER NOT NULL,
+    block_time INTEGER,
+    err TEXT,
+    memo TEXT
+);
+CREATE INDEX IF NOT EXISTS signatures_by_slot ON signatures (slot DESC);
+CREATE TABLE IF NOT EXISTS transactions (
+    signature TEXT PRIMARY KEY,
+    fee INTEGER,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    """What one sync added to the ledger"""
+    new_signatures: int = 0
+    new_transactions: int = 0
+    backfill_complete: bool = False
+    ok: bool = True  # False if an RPC call failed; the next sync resumes
+
+
+def default_ledger_path(wallet: str, rpc_url: str = None) -> str:
+    """Ledger file for a wallet, one directory per RPC host (cluster)"""
+    host = urlsplit(rpc_url or SOLANA_RPC_URL).netloc or "default"
+    return os.path.join(HISTORY_DIR, re.sub(r"[^A-Za-z0-9._-]", "_", host), f"{wallet}.sqlite")
+
+
+class TransactionLedger:
+    """
+    On-disk transaction history for one wallet
+
+    Usage:
+        with TransactionLedger(address, rpc_url=url) as ledger:
+            ledger.sync_blocking()
+            rows = ledger.recent(50)
+    """
+
+    def __init__(self, wallet: str, path: Optional[str] = None, rpc_url: str = None):
+        self.wallet = wallet
+        # None syncs through the SOLANA_RPC_URLS pool
+        self.rpc_url = rpc_url
+        self.path = path or default_ledger_path(wallet, rpc_url)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        self.db.close()
+
+    # ── Sync state ──────────────────────────────────────────
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: Optional[str]):
+        self.db.execute(
+            "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def backfill_complete(self) -> bool:
+        return self._get_state("backfill_complete") == "1"
+
+    def _store_page(self, page: List[dict]) -> int:
+        before = self.db.total_changes
+        self.db.executemany(
+            "INSERT OR IGNORE INTO signatures (signature, slot, block_time, err, memo) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    info["signature"],
+                    info.get("slot", 0),
+                    info.get("blockTime"),
+                    json.dumps(info["err"]) if info.get("err") is not None else None,
+                    info.get("memo"),
+                )
+                for info in page
+            ],
+        )
+        return self.db.total_changes - before
+
+    # ── Sync ────────────────────────────────────────────────
+
+    async def sync(
+        self,
+        network: AsyncSolanaNetwork,
+        max_backfill_pages: Optional[int] = None,
+        fetch_bodies: bool = True,
+        page_size: int = MAX_SIGNATURES_PER_PAGE
+    ) -> SyncResult:
+        """
+        Bring the ledger up to date
+
+        Args:
+            network: Async RPC client
+            max_backfill_pages: Cap on older-history pages read this call
+                (None: backfill to the wallet's first transaction)
+            fetch_bodies: Also fetch every transaction body not cached yet
+            page_size: Signatures per getSignaturesForAddress page
+
+        Returns:
+            SyncResult with counts of what was added
+        """
+        result = SyncResult()
+
+        # New activity: tip down to the newest signature already stored.
+        # A wallet that was empty when backfilled has no newest cursor yet,
+        # so its head sync reads from the tip with no lower bound.
+        newest = self._get_state("newest")
+        if newest or self.backfill_complete:
+            added = await self._sync_head(network, newest, page_size)
+            if added is None:
+                result.ok = False
+            else:
+                result.new_signatures += added
+
+        # Older history: continue the backfill from the oldest stored signature
+        pages = 0
+        while result.ok and not self.backfill_complete:
+            if max_backfill_pages is not None and pages >= max_backfill_pages:
+                break
+            page = await network.get_signatures_for_address(
+                self.wallet, before=self._get_state("oldest"), limit=page_size
+            )
+            if page is None:
+                result.ok = False
+                break
+            pages += 1
+            with self.db:
+                result.new_signatures += self._store_page(page)
+                if page:
+                    if not self._get_state("newest"):
+                        self._set_state("newest", page[0]["signature"])
+                    self._set_state("oldest", page[-1]["signature"])
+                if len(page) < page_size:
+                    self._set_state("backfill_complete", "1")
+        result.backfill_complete = self.backfill_complete
+
+        if fetch_bodies and result.ok:
+            fetched = await self.fill_transactions(network)
+            result.new_transactions = fetched
+        return result
+
+    async def _sync_head(self, network: AsyncSolanaNetwork, newest: Optional[str],
+                         page_size: int) -> Optional[int]:
+        """
+        Read pages from the tip until `newest` is reached (or the first
+        transaction, when nothing is stored yet)
+
+        The newest cursor only moves once the gap is fully read, so an
+        interrupted head sync is simply redone.
+        """
+        added = 0
+        before = None
+        head = None
+        while True:
+            page = await network.get_signatures_for_address(
+                self.wallet, before=before, until=newest, limit=page_size
+            )
+            if page is None:
+                return None
+            with self.db:
+                added += self._store_page(page)
+            if page:
+                head = head or page[0]["signature"]
+                before = page[-1]["signature"]
+            if len(page) < page_size:
+                break
+        if head:
+            with self.db:
+                self._set_state("newest", head)
+        return added
+
+    async def fill_transactions(self, network: AsyncSolanaNetwork,
+                                limit: Optional[int] = None) -> int:
+        """
+        Fetch and cache transaction bodies not stored yet, newest first
+
+        Bodies go out BODY_FETCH_CHUNK at a time as concurrent JSON-RPC
+        batches; each chunk is committed before the next starts.
+
+        Returns:
+            Number of bodies stored
+        """
+        stored = 0
+        while limit is None or stored < limit:
+            chunk = BODY_FETCH_CHUNK if limit is None else min(BODY_FETCH_CHUNK, limit - stored)
+            missing = [row[0] for row in self.db.execute(
+                "SELECT s.signature FROM signatures s "
+                "LEFT JOIN transactions t ON t.signature = s.signature "
+                "WHERE t.signature IS NULL ORDER BY s.slot DESC LIMIT ?",
+                (chunk,),
+            )]
+            if not missing:
+                break
+            bodies = await network.get_transactions(missing)
+            rows = [
+                (sig, (body.get("meta") or {}).get("fee"), json.dumps(body, separators=(",", ":")))
+                for sig, body in bodies.items() if body
+            ]
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO transactions (signature, fee, body) VALUES (?, ?, ?)",
+                    rows,
+                )
+            stored += len(rows)
+            if len(rows) < len(missing):
+                # Some bodies are unavailable right now; retry them next sync
+                break
+        return stored
+
+    def sync_blocking(self, **kwargs) -> SyncResult:
+        """Run sync() with a fresh RPC client for self.rpc_url (or the SOLANA_RPC_URLS pool)"""
+        async def run() -> SyncResult:
+            async with AsyncSolanaNetwork(self.rpc_url) as network:
+                return await self.sync(network, **kwargs)
+        return asyncio.run(run())
+
+    # ── Queries ─────────────────────────────────────────────
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    @staticmethod
+    def _signature_info(row) -> dict:
+        signature, slot, block_time, err, memo = row
+        return {
+            "signature": signature,
+            "slot": slot,
+            "blockTime": block_time,
+            "err": json.loads(err) if err else None,
+            "memo": memo,
+            "confirmationStatus": "finalized",
+        }
+
+    def recent(self, limit: int = 50, offset: int = 0) -> List[dict]:
+        """
+        Newest signatures first, shaped like getSignaturesForAddress results
+        """
+        rows = self.db.execute(
+            "SELECT signature, slot, block_time, err, memo FROM signatures "
+            "ORDER BY slot DESC, rowid LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+        return [self._signature_info(row) for row in rows]
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        failed: Optional[bool] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: int = 100
+    ) -> List[dict]:
+        """
+        Search the ledger
+
+        Args:
+            text: Signature prefix, memo substring, or any address that
+                appears in a cached transaction body
+            failed: Only failed (True) or only successful (False) transactions
+            since / until: Unix block time bounds (inclusive)
+            limit: Maximum rows returned
+
+        Returns:
+            Matching signature infos, newest first
+        """
+        clauses, params = [], []
+        if text:
+            clauses.append(
+                "(s.signature LIKE ? OR s.memo LIKE ? OR s.signature IN "
+                "(SELECT signature FROM transactions WHERE instr(body, ?) > 0))"
+            )
+            params += [text + "%", f"%{text}%", text]
+        if failed is not None:
+            clauses.append("s.err IS NOT NULL" if failed else "s.err IS NULL")
+        if since is not None:
+            clauses.append("s.block_time >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("s.block_time <= ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.db.execute(
+            "SELECT s.signature, s.slot, s.block_time, s.err, s.memo FROM signatures s "
+            f"{where} ORDER BY s.slot DESC, s.rowid LIMIT ?",
+            (*params, limit),
+        )
+        return [self._signature_info(row) for row in rows]
+
+    def get_transaction(self, signature: str) -> Optional[dict]:
+        """Cached transaction body, or None if it has not been fetched"""
+        row = self.db.execute(
+            "SELECT body FROM transactions WHERE signature = ?", (signature,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_transaction(self, signature: str, body: dict):
+        """Cache a transaction body fetched elsewhere (must be finalized)"""
+        with self.db:
+            self.db.execute(
+                "INSERT OR IGNORE INTO transactions (signature, fee, body) VALUES (?, ?, ?)",
+                (signature, (body.get("meta") or {}).get("fee"),
+                 json.dumps(body, separators=(",", ":"))),
+            )
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """Every ledger row for export, newest first, streamed from disk"""
+        return self.db.execute(
+            "SELECT s.signature, s.slot, s.block_time, s.err, t.fee, s.memo "
+            "FROM signatures s LEFT JOIN transactions t ON t.signature = s.signature "
+            "ORDER BY s.slot DESC, s.rowid"
+        )
+
+    def export_csv(self, dest: Union[str, IO[str]]) -> int:
+        """
+        Write the whole ledger as CSV (CSV_COLUMNS)
+
+        Returns:
+            Number of transactions written
+        """
+        if isinstance(dest, str):
+            with open(dest, "w", newline="") as f:
+                return self.export_csv(f)
+
+        writer = csv.writer(dest)
+        writer.writerow(CSV_COLUMNS)
+        written = 0
+        for signature, slot, block_time, err, fee, memo in self.iter_rows():
+            when = (
+                datetime.datetime.fromtimestamp(block_time, datetime.timezone.utc).isoformat()
+                if block_time else ""
+            )
+            writer.writerow([
+                signature,
+                slot,
+                when,
+                "failed" if err else "success",
+                f"{fee / LAMPORTS_PER_SOL:.9f}" if fee is not None else "",
+                memo or "",
+            ])
+            written += 1
+        return written
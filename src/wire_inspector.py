@@ -0,0 +1,494 @@
+"""
+Wire Inspector - Decode Solana transactions straight from their wire bytes
+
+Reads legacy and v0 transactions from a memoryview in a single pass: the
+version prefix decides the layout, keys and instruction data stay views
+into the original buffer, and base58 is only produced for the accounts an
+instruction actually names. System, SPL Token (and Token-2022), Associated
+Token Account and ComputeBudget instructions are decoded into amounts and
+destinations, so the offline review screen and the signing policy see
+what a transaction really moves, not what its metadata claims.
+
+iter_inbox() streams a whole inbox (single files and bundles) and hands
+each transaction's bytes and decoded form to the caller together, so
+nothing is parsed twice on the way to the signer.
+
+B - Love U 3000
+"""
+
+import base64
+import json
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import base58
+
+from config import sanitize_error
+from src.batch_builder import BUNDLE_TYPE, iter_bundle_transactions
+
+
+SYSTEM_PROGRAM = "11111111111111111111111111111111"
+TOKEN_PROGRAM = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+ASSOCIATED_TOKEN_PROGRAM = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+COMPUTE_BUDGET_PROGRAM = "ComputeBudget111111111111111111111111111111"
+
+# Program id bytes -> short name; memoryview slices hash and compare like bytes
+_PROGRAMS = {
+    base58.b58decode(SYSTEM_PROGRAM): "system",
+    base58.b58decode(TOKEN_PROGRAM): "spl-token",
+    base58.b58decode(TOKEN_2022_PROGRAM): "token-2022",
+    base58.b58decode(ASSOCIATED_TOKEN_PROGRAM): "associated-token",
+    base58.b58decode(COMPUTE_BUDGET_PROGRAM): "compute-budget",
+}
+
+# Runtime default compute-unit limit per instruction when none is requested
+DEFAULT_COMPUTE_UNITS_PER_INSTRUCTION = 200_000
+MAX_COMPUTE_UNIT_LIMIT = 1_400_000
+
+_EMPTY_SIGNATURE = bytes(64)
+
+
+class WireFormatError(ValueError):
+    """The bytes are not a well-formed transaction"""
+
+
+class _Reader:
+    """Cursor over a memoryview; slices are views, not copies"""
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: memoryview):
+        self.buf = buf
+        self.pos = 0
+
+    def take(self, n: int) -> memoryview:
+        end = self.pos + n
+        if end > len(self.buf):
+            raise WireFormatError(f"Truncated transaction: needed {n} bytes at offset {self.pos}")
+        view = self.buf[self.pos:end]
+        self.pos = end
+        return view
+
+    def u8(self) -> int:
+        return self.take(1)[0]
+
+    def compact_u16(self) -> int:
+        value = 0
+        for shift in (0, 7, 14):
+            byte = self.u8()
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+        raise WireFormatError("Malformed compact-u16 length")
+
+
+@dataclass
+class DecodedInstruction:
+    """One instruction, decoded where the program is known"""
+    program: str  # system / spl-token / token-2022 / associated-token / compute-budget / unknown
+    kind: str     # e.g. "transfer", "transferChecked", "setComputeUnitPrice"; "unknown" if undecoded
+    program_id: str
+    accounts: List[str]
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {"program": self.program, "kind": self.kind, "program_id": self.program_id,
+                "accounts": self.accounts, "info": self.info}
+
+
+@dataclass
+class InspectedTransaction:
+    """A transaction as read from its wire bytes"""
+    version: Union[str, int]  # "legacy" or 0
+    signatures: List[str]
+    signed: List[bool]
+    num_required_signatures: int
+    account_keys: List[str]   # static keys
+    recent_blockhash: str
+    instructions: List[DecodedInstruction]
+    address_table_lookups: List[dict]
+    size: int
+
+    @property
+    def fee_payer(self) -> Optional[str]:
+        return self.account_keys[0] if self.account_keys else None
+
+    @property
+    def is_signed(self) -> bool:
+        return bool(self.signed) and all(self.signed)
+
+    @property
+    def num_accounts(self) -> int:
+        return len(self.account_keys) + sum(
+            len(lookup["writable"]) + len(lookup["readonly"]) for lookup in self.address_table_lookups
+        )
+
+    def _kinds(self, program: str, kinds: Sequence[str]) -> List[DecodedInstruction]:
+        return [ix for ix in self.instructions if ix.program == program and ix.kind in kinds]
+
+    @property
+    def sol_transfers(self) -> List[Tuple[str, str, int]]:
+        """(source, destination, lamports) for every lamport-moving System instruction"""
+        return [(ix.info["source"], ix.info["destination"], ix.info["lamports"])
+                for ix in self._kinds("system", ("transfer", "transferWithSeed", "createAccount",
+                                                 "createAccountWithSeed"))]
+
+    @property
+    def token_transfers(self) -> List[dict]:
+        """Token movements: source, destination, amount, plus mint/decimals when checked"""
+        transfers = []
+        for program in ("spl-token", "token-2022"):
+            for ix in self._kinds(program, ("transfer", "transferChecked")):
+                transfers.append({k: ix.info.get(k) for k in
+                                  ("source", "destination", "authority", "amount", "mint", "decimals")})
+        return transfers
+
+    def lamports_out(self, source: Optional[str] = None) -> int:
+        """Lamports moved by System instructions (from `source`, default the fee payer)"""
+        source = source or self.fee_payer
+        return sum(lamports for src, _, lamports in self.sol_transfers if src == source)
+
+    @property
+    def compute_unit_limit(self) -> Optional[int]:
+        limits = self._kinds("compute-budget", ("setComputeUnitLimit",))
+        return limits[-1].info["units"] if limits else None
+
+    @property
+    def compute_unit_price(self) -> int:
+        prices = self._kinds("compute-budget", ("setComputeUnitPrice",))
+        return prices[-1].info["micro_lamports"] if prices else 0
+
+    @property
+    def priority_fee_lamports(self) -> int:
+        """Maximum priority fee: price x requested (or default) compute units"""
+        limit = self.compute_unit_limit
+        if limit is None:
+            non_budget = sum(1 for ix in self.instructions if ix.program != "compute-budget")
+            limit = min(non_budget * DEFAULT_COMPUTE_UNITS_PER_INSTRUCTION, MAX_COMPUTE_UNIT_LIMIT)
+        return -(-self.compute_unit_price * limit // 1_000_000)
+
+    @property
+    def nonce_account(self) -> Optional[str]:
+        """Durable nonce advanced by the first instruction, if any"""
+        if self.instructions and self.instructions[0].program == "system" \
+                and self.instructions[0].kind == "advanceNonce":
+            return self.instructions[0].info["nonce_account"]
+        return None
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "signatures": len(self.signatures),
+            "is_signed": self.is_signed,
+            "fee_payer": self.fee_payer,
+            "recent_blockhash": self.recent_blockhash,
+            "num_instructions": len(self.instructions),
+            "num_accounts": self.num_accounts,
+            "sol_transfers": [
+                {"source": s, "destination": d, "lamports": l} for s, d, l in self.sol_transfers
+            ],
+            "token_transfers": self.token_transfers,
+            "compute_unit_limit": self.compute_unit_limit,
+            "compute_unit_price": self.compute_unit_price,
+            "nonce_account": self.nonce_account,
+            "address_table_lookups": self.address_table_lookups,
+            "instructions": [ix.to_dict() for ix in self.instructions],
+            "size": self.size,
+        }
+
+
+# ── Instruction decoders ────────────────────────────────────
+# Each takes (data view, resolved account names) and returns (kind, info).
+
+def _u64(data: memoryview, offset: int) -> int:
+    return struct.unpack_from("<Q", data, offset)[0]
+
+
+def _pubkey_at(data: memoryview, offset: int) -> str:
+    return base58.b58encode(bytes(data[offset:offset + 32])).decode()
+
+
+def _decode_system(data: memoryview, accounts: List[str]) -> Tuple[str, dict]:
+    tag = struct.unpack_from("<I", data, 0)[0]
+    if tag == 2:
+        return "transfer", {"source": accounts[0], "destination": accounts[1], "lamports": _u64(data, 4)}
+    if tag == 0:
+        return "createAccount", {"source": accounts[0], "destination": accounts[1], "lamports": _u64(data, 4),
+                                 "space": _u64(data, 12), "owner": _pubkey_at(data, 20)}
+    if tag == 3:
+        seed_len = _u64(data, 36)
+        offset = 44 + seed_len
+        return "createAccountWithSeed", {
+            "source": accounts[0], "destination": accounts[1],
+            "seed": bytes(data[44:offset]).decode("utf-8", "replace"),
+            "lamports": _u64(data, offset), "space": _u64(data, offset + 8),
+            "owner": _pubkey_at(data, offset + 16),
+        }
+    if tag == 4:
+        return "advanceNonce", {"nonce_account": accounts[0], "authority": accounts[2]}
+    if tag == 6:
+        return "initializeNonce", {"nonce_account": accounts[0], "authority": _pubkey_at(data, 4)}
+    if tag == 11:
+        return "transferWithSeed", {"source": accounts[0], "destination": accounts[2],
+                                    "lamports": _u64(data, 4)}
+    return "unknown", {"tag": tag}
+
+
+def _decode_token(data: memoryview, accounts: List[str]) -> Tuple[str, dict]:
+    tag = data[0]
+    if tag == 3:
+        return "transfer", {"source": accounts[0], "destination": accounts[1], "authority": accounts[2],
+                            "amount": _u64(data, 1)}
+    if tag == 12:
+        return "transferChecked", {"source": accounts[0], "mint": accounts[1], "destination": accounts[2],
+                                   "authority": accounts[3], "amount": _u64(data, 1), "decimals": data[9]}
+    if tag == 4:
+        return "approve", {"source": accounts[0], "delegate": accounts[1], "authority": accounts[2],
+                           "amount": _u64(data, 1)}
+    if tag == 7:
+        return "mintTo", {"mint": accounts[0], "destination": accounts[1], "amount": _u64(data, 1)}
+    if tag == 8:
+        return "burn", {"source": accounts[0], "mint": accounts[1], "amount": _u64(data, 1)}
+    if tag == 9:
+        return "closeAccount", {"source": accounts[0], "destination": accounts[1], "authority": accounts[2]}
+    return "unknown", {"tag": tag}
+
+
+def _decode_associated_token(data: memoryview, accounts: List[str]) -> Tuple[str, dict]:
+    tag = data[0] if len(data) else 0
+    if tag in (0, 1):
+        return ("create" if tag == 0 else "createIdempotent"), {
+            "payer": accounts[0], "account": accounts[1], "wallet": accounts[2], "mint": accounts[3],
+        }
+    return "unknown", {"tag": tag}
+
+
+def _decode_compute_budget(data: memoryview, accounts: List[str]) -> Tuple[str, dict]:
+    tag = data[0]
+    if tag == 2:
+        return "setComputeUnitLimit", {"units": struct.unpack_from("<I", data, 1)[0]}
+    if tag == 3:
+        return "setComputeUnitPrice", {"micro_lamports": _u64(data, 1)}
+    if tag == 1:
+        return "requestHeapFrame", {"bytes": struct.unpack_from("<I", data, 1)[0]}
+    if tag == 4:
+        return "setLoadedAccountsDataSizeLimit", {"bytes": struct.unpack_from("<I", data, 1)[0]}
+    return "unknown", {"tag": tag}
+
+
+_DECODERS = {
+    "system": _decode_system,
+    "spl-token": _decode_token,
+    "token-2022": _decode_token,
+    "associated-token": _decode_associated_token,
+    "compute-budget": _decode_compute_budget,
+}
+
+
+# ── Transaction parser ──────────────────────────────────────
+
+def inspect_transaction(
+    raw: Union[bytes, bytearray, memoryview],
+    lookup_tables: Optional[Mapping[str, Sequence[str]]] = None
+) -> InspectedTransaction:
+    """
+    Decode a serialized legacy or v0 transaction without copying it
+
+    Args:
+        raw: Wire bytes (signatures + message)
+        lookup_tables: Optional table address -> addresses, to name accounts
+            a v0 message loads from tables; otherwise they are shown as
+            "<table>#<index>"
+
+    Raises:
+        WireFormatError: The bytes are truncated or malformed
+    """
+    buf = memoryview(raw).toreadonly()
+    reader = _Reader(buf)
+
+    num_signatures = reader.compact_u16()
+    signature_views = [reader.take(64) for _ in range(num_signatures)]
+
+    prefix = reader.buf[reader.pos] if reader.pos < len(buf) else None
+    if prefix is None:
+        raise WireFormatError("Truncated transaction: no message")
+    if prefix & 0x80:
+        version: Union[str, int] = prefix & 0x7F
+        if version != 0:
+            raise WireFormatError(f"Unsupported transaction version {version}")
+        reader.pos += 1
+    else:
+        version = "legacy"
+
+    num_required, _readonly_signed, _readonly_unsigned = reader.take(3)
+    key_views = [reader.take(32) for _ in range(reader.compact_u16())]
+    blockhash = reader.take(32)
+
+    raw_instructions = []
+    for _ in range(reader.compact_u16()):
+        program_index = reader.u8()
+        account_indexes = reader.take(reader.compact_u16())
+        data = reader.take(reader.compact_u16())
+        raw_instructions.append((program_index, account_indexes, data))
+
+    lookups = []
+    if version == 0:
+        for _ in range(reader.compact_u16()):
+            table = base58.b58encode(bytes(reader.take(32))).decode()
+            writable = list(reader.take(reader.compact_u16()))
+            readonly = list(reader.take(reader.compact_u16()))
+            lookups.append({"table": table, "writable": writable, "readonly": readonly})
+
+    if reader.pos != len(buf):
+        raise WireFormatError(f"{len(buf) - reader.pos} trailing byte(s) after the message")
+    if num_required > len(key_views) or num_signatures != num_required:
+        raise WireFormatError("Signature count does not match the message header")
+
+    # Loaded accounts follow the static keys: all writable, then all readonly
+    loaded: List[str] = []
+    for section in ("writable", "readonly"):
+        for lookup in lookups:
+            addresses = (lookup_tables or {}).get(lookup["table"])
+            for index in lookup[section]:
+                if addresses is not None and index < len(addresses):
+                    loaded.append(addresses[index])
+                else:
+                    loaded.append(f"{lookup['table']}#{index}")
+
+    names: Dict[int, str] = {}
+
+    def name(index: int) -> str:
+        if index not in names:
+            if index < len(key_views):
+                names[index] = base58.b58encode(bytes(key_views[index])).decode()
+            elif index - len(key_views) < len(loaded):
+                names[index] = loaded[index - len(key_views)]
+            else:
+                raise WireFormatError(f"Account index {index} out of range")
+        return names[index]
+
+    instructions = []
+    for program_index, account_indexes, data in raw_instructions:
+        if program_index >= len(key_views):
+            raise WireFormatError("Program id must be a static account key")
+        program = _PROGRAMS.get(key_views[program_index], "unknown")
+        accounts = [name(index) for index in account_indexes]
+        kind, info = "unknown", {}
+        decoder = _DECODERS.get(program)
+        if decoder is not None:
+            try:
+                kind, info = decoder(data, accounts)
+            except (IndexError, struct.error):
+                kind, info = "unknown", {"malformed": True}
+        instructions.append(DecodedInstruction(
+            program=program, kind=kind, program_id=name(program_index), accounts=accounts, info=info
+        ))
+
+    return InspectedTransaction(
+        version=version,
+        signatures=[base58.b58encode(bytes(view)).decode() for view in signature_views],
+        signed=[view != _EMPTY_SIGNATURE for view in signature_views],
+        num_required_signatures=num_required,
+        account_keys=[name(i) for i in range(len(key_views))],
+        recent_blockhash=base58.b58encode(bytes(blockhash)).decode(),
+        instructions=instructions,
+        address_table_lookups=lookups,
+        size=len(buf),
+    )
+
+
+# ── Inbox streaming ─────────────────────────────────────────
+
+@dataclass
+class InboxItem:
+    """One transaction from the inbox: its record, bytes and decoded form"""
+    path: Path
+    index: Optional[int]  # position in a bundle; None for a single-transaction file
+    record: dict
+    tx_bytes: bytes
+    inspected: Optional[InspectedTransaction] = None
+    error: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.path.name if self.index is None else f"{self.path.name}#{self.index}"
+
+
+def _inspect_item(item: InboxItem, lookup_tables) -> InboxItem:
+    try:
+        item.inspected = inspect_transaction(item.tx_bytes, lookup_tables)
+    except WireFormatError as e:
+        item.error = str(e)
+    return item
+
+
+def iter_inbox(
+    inbox_dir: str,
+    lookup_tables: Optional[Mapping[str, Sequence[str]]] = None
+) -> Iterator[InboxItem]:
+    """
+    Stream every unsigned transaction in an inbox, decoded
+
+    Single unsigned_*.json files come first, then unsigned_bundle_*.jsonl
+    bundles line by line, so memory stays flat however large the bundles
+    are. Files that cannot be read yield one item with `error` set.
+    """
+    inbox = Path(inbox_dir)
+    if not inbox.is_dir():
+        return
+
+    for path in sorted(inbox.glob("unsigned_*.json")):
+        try:
+            with open(path, "r") as f:
+                record = json.load(f)
+            if record.get("type") != "unsigned_transaction":
+                raise ValueError("not an unsigned transaction")
+            tx_bytes = base64.b64decode(record["data"])
+        except Exception as e:
+            yield InboxItem(path=path, index=None, record={}, tx_bytes=b"", error=sanitize_error(e))
+            continue
+        yield _inspect_item(InboxItem(path=path, index=None, record=record, tx_bytes=tx_bytes), lookup_tables)
+
+    for path in sorted(inbox.glob("unsigned_bundle_*.jsonl")):
+        try:
+            for entry in iter_bundle_transactions(str(path), BUNDLE_TYPE):
+                tx_bytes = entry.pop("tx_bytes")
+                yield _inspect_item(
+                    InboxItem(path=path, index=entry.get("index"), record=entry, tx_bytes=tx_bytes),
+                    lookup_tables,
+                )
+        except Exception as e:
+            yield InboxItem(path=path, index=None, record={}, tx_bytes=b"", error=sanitize_error(e))
+
+
+@dataclass
+class InboxSummary:
+    """Totals over inspected inbox transactions, for the review screen"""
+    transactions: int = 0
+    undecodable: int = 0
+    lamports_out: int = 0
+    priority_fee_lamports: int = 0
+    destinations: Dict[str, int] = field(default_factory=dict)  # address -> lamports
+    token_amounts: Dict[str, int] = field(default_factory=dict)  # mint (or source account) -> raw amount
+    unknown_programs: Dict[str, int] = field(default_factory=dict)  # program id -> instruction count
+
+    def add(self, item: InboxItem):
+        self.transactions += 1
+        tx = item.inspected
+        if tx is None:
+            self.undecodable += 1
+            return
+        self.priority_fee_lamports += tx.priority_fee_lamports
+        for source, destination, lamports in tx.sol_transfers:
+            if source == tx.fee_payer:
+                self.lamports_out += lamports
+                self.destinations[destination] = self.destinations.get(destination, 0) + lamports
+        for transfer in tx.token_transfers:
+            key = transfer["mint"] or transfer["source"]
+            self.token_amounts[key] = self.token_amounts.get(key, 0) + transfer["amount"]
+        for ix in tx.instructions:
+            if ix.program == "unknown":
+                self.unknown_programs[ix.program_id] = self.unknown_programs.get(ix.program_id, 0) + 1
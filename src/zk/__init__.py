@@ -10,11 +10,16 @@ from src.zk.types import (
     TransactionMode,
     OwnershipProof,
     RangeProof,
+    AggregatedRangeProof,
     PolicyProof,
     ProofBundle,
+    ProofBatchResult,
+    ProofStageTimings,
     TransferEnvelope,
     SigningSummary,
     VerificationResult,
+    ENVELOPE_VERSION,
+    ENVELOPE_VERSION_AGGREGATED,
 )
 
 __all__ = [
@@ -22,9 +27,14 @@ __all__ = [
     "TransactionMode",
     "OwnershipProof",
     "RangeProof",
+    "AggregatedRangeProof",
     "PolicyProof",
     "ProofBundle",
+    "ProofBatchResult",
+    "ProofStageTimings",
     "TransferEnvelope",
     "SigningSummary",
     "VerificationResult",
+    "ENVELOPE_VERSION",
+    "ENVELOPE_VERSION_AGGREGATED",
 ]
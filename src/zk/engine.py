@@ -8,6 +8,9 @@ and provides a pure-Python fallback for testing.
 Architecture:
 - Production: All proof generation/verification happens in Rust via FFI
 - Fallback: Pure Python using hashlib (for testing when Rust lib is not compiled)
+- Proofs cross the FFI boundary as raw 32-byte points/scalars when the
+  library exports the binary (`*_bin`) functions; JSON is kept for
+  envelopes, which are what gets written to USB
 
 SECURITY: The Rust implementation should ALWAYS be preferred for production use.
 The Python fallback uses hash-based commitments which are computationally binding
@@ -21,9 +24,15 @@ import hmac as hmac_mod
 import secrets
 import base64
 import sys
-from ctypes import CDLL, c_char_p, c_void_p, cast, string_at
+import time
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import (
+    CDLL, c_char_p, c_int32, c_size_t, c_uint32, c_uint64, c_void_p,
+    cast, create_string_buffer, string_at,
+)
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from itertools import repeat
+from typing import Optional, Tuple, List, Dict, Any, Sequence, Union
 from datetime import datetime, timezone
 
 from src.zk.types import (
@@ -31,24 +40,45 @@ from src.zk.types import (
     TransactionContext,
     OwnershipProof,
     RangeProof,
+    AggregatedRangeProof,
     BitProof,
     PolicyProof,
     ProofBundle,
+    ProofBatchResult,
+    ProofStageTimings,
     TransferEnvelope,
     SigningSummary,
     VerificationCheck,
     VerificationResult,
+    OWNERSHIP_PROOF_SIZE,
+    ENVELOPE_VERSION,
+    aggregated_range_proof_size,
+    envelope_version_for,
+    range_proof_type_for_version,
+    range_proof_size,
 )
 
 # Domain separation constants (must match Rust: coldstar_zk/src/domain.rs)
 DOMAIN_OWNERSHIP_PROOF = b"coldstar.zk.ownership.v1"
 DOMAIN_RANGE_PROOF = b"coldstar.zk.range.v1"
+DOMAIN_AGGREGATED_RANGE_PROOF = b"coldstar.zk.range.aggregated.v1"
 DOMAIN_POLICY_PROOF = b"coldstar.zk.policy.v1"
 DOMAIN_BINDING = b"coldstar.zk.binding.v1"
 DOMAIN_ENVELOPE_HMAC = b"coldstar.zk.envelope.hmac.v1"
 DOMAIN_TX_CONTEXT = b"coldstar.zk.tx.context.v1"
 DOMAIN_NONCE = b"coldstar.zk.nonce.v1"
 
+# Status codes of the binary FFI functions (must match Rust: coldstar_zk/src/ffi.rs)
+ZK_BIN_OK = 0
+ZK_BIN_INVALID_PROOF = 5
+ZK_BIN_ERRORS = {
+    1: "null pointer",
+    2: "malformed proof buffer",
+    3: "invalid input",
+    4: "wrong output buffer size",
+    5: "proof did not verify",
+}
+
 
 class ZkProofEngine:
     """
@@ -63,6 +93,7 @@ class ZkProofEngine:
     def __init__(self):
         self._rust_lib = None
         self._using_rust = False
+        self._rust_binary = False
         self._seen_nonces = set()
         self._max_transfer_lamports = 0  # 0 = no limit
         self._allowed_destinations = set()
@@ -71,6 +102,7 @@ class ZkProofEngine:
         try:
             self._rust_lib = self._load_rust_lib()
             self._using_rust = True
+            self._rust_binary = hasattr(self._rust_lib, "coldstar_zk_prove_range_bin")
         except (FileNotFoundError, OSError) as e:
             # Fall back to pure Python
             self._using_rust = False
@@ -108,6 +140,31 @@ class ZkProofEngine:
                 lib.coldstar_zk_version.restype = c_void_p
                 lib.coldstar_zk_free_string.restype = None
                 lib.coldstar_zk_free_string.argtypes = [c_void_p]
+                if hasattr(lib, "coldstar_zk_prove_range_bin"):
+                    # Binary convention: raw buffers in, status code out
+                    lib.coldstar_zk_prove_ownership_bin.restype = c_int32
+                    lib.coldstar_zk_prove_ownership_bin.argtypes = [
+                        c_char_p, c_char_p, c_size_t, c_void_p, c_size_t]
+                    lib.coldstar_zk_verify_ownership_bin.restype = c_int32
+                    lib.coldstar_zk_verify_ownership_bin.argtypes = [
+                        c_char_p, c_size_t, c_char_p, c_size_t]
+                    lib.coldstar_zk_prove_range_bin.restype = c_int32
+                    lib.coldstar_zk_prove_range_bin.argtypes = [
+                        c_uint64, c_uint32, c_char_p, c_size_t, c_void_p, c_size_t]
+                    lib.coldstar_zk_verify_range_bin.restype = c_int32
+                    lib.coldstar_zk_verify_range_bin.argtypes = [
+                        c_char_p, c_size_t, c_char_p, c_size_t]
+                if hasattr(lib, "coldstar_zk_verify_ranges_bin"):
+                    lib.coldstar_zk_verify_ranges_bin.restype = c_int32
+                    lib.coldstar_zk_verify_ranges_bin.argtypes = [
+                        c_char_p, c_size_t, c_size_t, c_void_p, c_size_t]
+                if hasattr(lib, "coldstar_zk_prove_aggregated_range_bin"):
+                    lib.coldstar_zk_prove_aggregated_range_bin.restype = c_int32
+                    lib.coldstar_zk_prove_aggregated_range_bin.argtypes = [
+                        c_uint64, c_uint32, c_char_p, c_size_t, c_void_p, c_size_t]
+                    lib.coldstar_zk_verify_aggregated_range_bin.restype = c_int32
+                    lib.coldstar_zk_verify_aggregated_range_bin.argtypes = [
+                        c_char_p, c_size_t, c_char_p, c_size_t]
                 return lib
 
         raise FileNotFoundError(
@@ -136,6 +193,34 @@ class ZkProofEngine:
 
         return json.loads(result_str)
 
+    @property
+    def using_binary_ffi(self) -> bool:
+        """Whether proofs cross the FFI boundary as raw bytes instead of JSON."""
+        return self._rust_binary
+
+    def _prove_ownership_binary(self, secret_key: bytes, context_data: bytes) -> OwnershipProof:
+        out = create_string_buffer(OWNERSHIP_PROOF_SIZE)
+        code = self._rust_lib.coldstar_zk_prove_ownership_bin(
+            secret_key, context_data, len(context_data), out, OWNERSHIP_PROOF_SIZE)
+        if code != ZK_BIN_OK:
+            raise RuntimeError(f"Ownership proof failed: {ZK_BIN_ERRORS.get(code, code)}")
+        return OwnershipProof.from_bytes(out.raw)
+
+    def _prove_range_binary(self, value: int, num_bits: int, context_data: bytes) -> RangeProof:
+        if not 1 <= num_bits <= 64:
+            raise RuntimeError(f"Range proof failed: num_bits must be in [1, 64], got {num_bits}")
+        size = range_proof_size(num_bits)
+        out = create_string_buffer(size)
+        code = self._rust_lib.coldstar_zk_prove_range_bin(
+            value, num_bits, context_data, len(context_data), out, size)
+        if code != ZK_BIN_OK:
+            raise RuntimeError(f"Range proof failed: {ZK_BIN_ERRORS.get(code, code)}")
+        return RangeProof.from_bytes(out.raw)
+
+    def _verify_binary(self, func_name: str, proof_bytes: bytes, context_data: bytes) -> bool:
+        func = getattr(self._rust_lib, func_name)
+        return func(proof_bytes, len(proof_bytes), context_data, len(context_data)) == ZK_BIN_OK
+
     # ========================================================================
     # Nonce Generation
     # ========================================================================
@@ -176,7 +261,12 @@ class ZkProofEngine:
         Returns:
             OwnershipProof
         """
-        if self._using_rust:
+        if self._rust_binary:
+            secret_key = bytes.fromhex(secret_key_hex)
+            if len(secret_key) != 32:
+                raise RuntimeError(f"Ownership proof failed: secret key must be 32 bytes, got {len(secret_key)}")
+            return self._prove_ownership_binary(secret_key, context_data)
+        elif self._using_rust:
             result = self._call_rust("coldstar_zk_prove_ownership", {
                 "secret_key_hex": secret_key_hex,
                 "context_data_hex": context_data.hex(),
@@ -192,7 +282,13 @@ class ZkProofEngine:
 
         Returns True if the proof is valid, False otherwise.
         """
-        if self._using_rust:
+        if self._rust_binary:
+            try:
+                proof_bytes = proof.to_bytes()
+            except ValueError:
+                return False
+            return self._verify_binary("coldstar_zk_verify_ownership_bin", proof_bytes, context_data)
+        elif self._using_rust:
             result = self._call_rust("coldstar_zk_verify_ownership", {
                 "proof": proof.to_dict(),
                 "context_data_hex": context_data.hex(),
@@ -271,7 +367,9 @@ class ZkProofEngine:
         Returns:
             RangeProof
         """
-        if self._using_rust:
+        if self._rust_binary:
+            return self._prove_range_binary(value, num_bits, context_data)
+        elif self._using_rust:
             result = self._call_rust("coldstar_zk_prove_range", {
                 "value": value,
                 "num_bits": num_bits,
@@ -283,12 +381,20 @@ class ZkProofEngine:
         else:
             return self._prove_range_python(value, num_bits, context_data)
 
-    def verify_range(self, proof: RangeProof, context_data: bytes) -> bool:
-        """Verify a range proof.
+    def verify_range(self, proof: Union[RangeProof, AggregatedRangeProof], context_data: bytes) -> bool:
+        """Verify a range proof of either type.
 
         Returns True if the proof is valid.
         """
-        if self._using_rust:
+        if isinstance(proof, AggregatedRangeProof):
+            return self.verify_aggregated_range(proof, context_data)
+        if self._rust_binary:
+            try:
+                proof_bytes = proof.to_bytes()
+            except ValueError:
+                return False
+            return self._verify_binary("coldstar_zk_verify_range_bin", proof_bytes, context_data)
+        elif self._using_rust:
             result = self._call_rust("coldstar_zk_verify_range", {
                 "proof": proof.to_dict(),
                 "context_data_hex": context_data.hex(),
@@ -299,6 +405,65 @@ class ZkProofEngine:
         else:
             return self._verify_range_python(proof, context_data)
 
+    def verify_ranges(
+        self, items: Sequence[Tuple[Union[RangeProof, AggregatedRangeProof], bytes]],
+    ) -> List[bool]:
+        """Verify many range proofs at once.
+
+        With the Rust library the whole batch of bit-decomposition proofs
+        crosses the FFI boundary in one call: every bit OR-proof is checked
+        and the per-proof consistency equations are folded into a single
+        random-linear-combination multiscalar check. Proofs are only
+        re-checked one at a time when that combined check fails, to find the
+        culprit. Aggregated proofs are verified one at a time.
+
+        Args:
+            items: (proof, context_data) pairs
+
+        Returns:
+            One bool per item, in input order
+        """
+        if not items:
+            return []
+        if not (self._rust_binary and hasattr(self._rust_lib, "coldstar_zk_verify_ranges_bin")):
+            return [self.verify_range(proof, context_data) for proof, context_data in items]
+
+        valid = [False] * len(items)
+        batched = []
+        for index, (proof, context_data) in enumerate(items):
+            if isinstance(proof, AggregatedRangeProof):
+                valid[index] = self.verify_aggregated_range(proof, context_data)
+            else:
+                batched.append(index)
+        if batched:
+            results = self._verify_ranges_binary([items[index] for index in batched])
+            for index, ok in zip(batched, results):
+                valid[index] = ok
+        return valid
+
+    def _verify_ranges_binary(self, items: Sequence[Tuple[RangeProof, bytes]]) -> List[bool]:
+        valid = [False] * len(items)
+        positions = []
+        records = []
+        for index, (proof, context_data) in enumerate(items):
+            try:
+                proof_bytes = proof.to_bytes()
+            except ValueError:
+                continue
+            positions.append(index)
+            records += [len(context_data).to_bytes(4, "little"), context_data, proof_bytes]
+
+        if positions:
+            packed = b"".join(records)
+            results = create_string_buffer(len(positions))
+            code = self._rust_lib.coldstar_zk_verify_ranges_bin(
+                packed, len(packed), len(positions), results, len(positions))
+            # Any other status means the buffer was rejected as a whole
+            if code in (ZK_BIN_OK, ZK_BIN_INVALID_PROOF):
+                for index, status in zip(positions, results.raw):
+                    valid[index] = status == ZK_BIN_OK
+        return valid
+
     def _prove_range_python(self, value: int, num_bits: int, context_data: bytes) -> RangeProof:
         """Pure Python fallback for range proof (hash-based)."""
         if num_bits < 1 or num_bits > 64:
@@ -326,6 +491,8 @@ class ZkProofEngine:
             s0 = hashlib.sha256(DOMAIN_RANGE_PROOF + b":s0:" + bit_blinding + e0).digest()
             e1 = hashlib.sha256(DOMAIN_RANGE_PROOF + b":e1:" + bit_commit + secrets.token_bytes(16)).digest()
             s1 = hashlib.sha256(DOMAIN_RANGE_PROOF + b":s1:" + bit_blinding + e1).digest()
+            r0 = hashlib.sha256(DOMAIN_RANGE_PROOF + b":r0:" + bit_commit + s0).digest()
+            r1 = hashlib.sha256(DOMAIN_RANGE_PROOF + b":r1:" + bit_commit + s1).digest()
 
             bit_proofs.append(BitProof(
                 commitment=bit_commit.hex(),
@@ -333,6 +500,8 @@ class ZkProofEngine:
                 s0=s0.hex(),
                 e1=e1.hex(),
                 s1=s1.hex(),
+                r0=r0.hex(),
+                r1=r1.hex(),
             ))
 
         context_hash = hashlib.sha256(
@@ -365,6 +534,114 @@ class ZkProofEngine:
 
         return proof.context_hash == expected_context_hash
 
+    # ========================================================================
+    # Aggregated Range Proof
+    # ========================================================================
+
+    def prove_aggregated_range(self, value: int, num_bits: int, context_data: bytes) -> AggregatedRangeProof:
+        """Generate a logarithmic-size range proof that value ∈ [0, 2^num_bits).
+
+        Args:
+            value: The value to prove is in range
+            num_bits: Number of bits; must be a power of two up to 64
+            context_data: Context data for binding
+
+        Returns:
+            AggregatedRangeProof with log2(num_bits) inner-product rounds
+        """
+        if self._rust_binary and hasattr(self._rust_lib, "coldstar_zk_prove_aggregated_range_bin"):
+            try:
+                size = aggregated_range_proof_size(num_bits)
+            except ValueError as e:
+                raise RuntimeError(f"Aggregated range proof failed: {e}") from None
+            out = create_string_buffer(size)
+            code = self._rust_lib.coldstar_zk_prove_aggregated_range_bin(
+                value, num_bits, context_data, len(context_data), out, size)
+            if code != ZK_BIN_OK:
+                raise RuntimeError(f"Aggregated range proof failed: {ZK_BIN_ERRORS.get(code, code)}")
+            return AggregatedRangeProof.from_bytes(out.raw)
+        elif self._using_rust:
+            raise RuntimeError(
+                "The loaded coldstar_zk library predates aggregated range proofs. Rebuild it with:\n"
+                "  cd coldstar_zk && cargo build --release"
+            )
+        else:
+            return self._prove_aggregated_range_python(value, num_bits, context_data)
+
+    def verify_aggregated_range(self, proof: AggregatedRangeProof, context_data: bytes) -> bool:
+        """Verify an aggregated range proof.
+
+        Returns True if the proof is valid.
+        """
+        if self._rust_binary and hasattr(self._rust_lib, "coldstar_zk_verify_aggregated_range_bin"):
+            try:
+                proof_bytes = proof.to_bytes()
+            except ValueError:
+                return False
+            return self._verify_binary("coldstar_zk_verify_aggregated_range_bin", proof_bytes, context_data)
+        elif self._using_rust:
+            return False
+        else:
+            return self._verify_aggregated_range_python(proof, context_data)
+
+    def _prove_aggregated_range_python(self, value: int, num_bits: int,
+                                       context_data: bytes) -> AggregatedRangeProof:
+        """Pure Python fallback for aggregated range proof (hash-based)."""
+        if num_bits < 1 or num_bits > 64 or num_bits & (num_bits - 1):
+            raise ValueError(f"num_bits must be a power of two in [1, 64], got {num_bits}")
+        rounds = num_bits.bit_length() - 1
+        if value < 0 or (num_bits < 64 and value >= (1 << num_bits)):
+            raise ValueError(f"Value {value} does not fit in {num_bits} bits")
+
+        blinding = secrets.token_bytes(32)
+        value_commitment = hashlib.sha256(
+            DOMAIN_AGGREGATED_RANGE_PROOF + b":commit:" + value.to_bytes(8, "little") + blinding
+        ).digest()
+
+        def element(label: bytes) -> str:
+            return hashlib.sha256(
+                DOMAIN_AGGREGATED_RANGE_PROOF + b":" + label + b":" + value_commitment + secrets.token_bytes(16)
+            ).hexdigest()
+
+        context_hash = hashlib.sha256(
+            DOMAIN_AGGREGATED_RANGE_PROOF + context_data + num_bits.to_bytes(8, "little") + value_commitment
+        ).hexdigest()
+
+        return AggregatedRangeProof(
+            value_commitment=value_commitment.hex(),
+            num_bits=num_bits,
+            commitment_a=element(b"A"),
+            commitment_s=element(b"S"),
+            commitment_t1=element(b"T1"),
+            commitment_t2=element(b"T2"),
+            tau_x=element(b"tau_x"),
+            mu=element(b"mu"),
+            t_hat=element(b"t_hat"),
+            ipa_l=[element(b"L") for _ in range(rounds)],
+            ipa_r=[element(b"R") for _ in range(rounds)],
+            ipa_a=element(b"a"),
+            ipa_b=element(b"b"),
+            context_hash=context_hash,
+        )
+
+    def _verify_aggregated_range_python(self, proof: AggregatedRangeProof, context_data: bytes) -> bool:
+        """Pure Python fallback for aggregated range proof verification.
+
+        NOTE: The Python fallback only verifies structural consistency,
+        not cryptographic soundness. Use Rust for real verification.
+        """
+        try:
+            proof.to_bytes()
+        except ValueError:
+            return False
+
+        value_commitment = bytes.fromhex(proof.value_commitment)
+        expected_context_hash = hashlib.sha256(
+            DOMAIN_AGGREGATED_RANGE_PROOF + context_data + proof.num_bits.to_bytes(8, "little") + value_commitment
+        ).hexdigest()
+
+        return proof.context_hash == expected_context_hash
+
     # ========================================================================
     # Policy Proof
     # ========================================================================
@@ -471,7 +748,7 @@ class ZkProofEngine:
             raise ValueError(f"Expected public mode, got {tx_context.mode.value}")
 
         envelope = TransferEnvelope(
-            version="1.0.0",
+            version=ENVELOPE_VERSION,
             mode=TransactionMode.PUBLIC,
             created_at=tx_context.created_at,
             transaction=tx_context,
@@ -490,7 +767,7 @@ class ZkProofEngine:
             raise ValueError("Proof bundle must have a binding")
 
         envelope = TransferEnvelope(
-            version="1.0.0",
+            version=envelope_version_for(proof_bundle.range_proof),
             mode=TransactionMode.PRIVATE,
             created_at=tx_context.created_at,
             transaction=tx_context,
@@ -510,6 +787,11 @@ class ZkProofEngine:
 
         Returns (valid, error_message).
         """
+        try:
+            range_proof_cls = range_proof_type_for_version(envelope.version)
+        except ValueError as e:
+            return False, str(e)
+
         if envelope.mode != envelope.transaction.mode:
             return False, f"Mode mismatch: envelope={envelope.mode.value}, tx={envelope.transaction.mode.value}"
 
@@ -519,6 +801,9 @@ class ZkProofEngine:
         elif envelope.mode == TransactionMode.PRIVATE:
             if envelope.proof_bundle is None:
                 return False, "Private envelope must contain proof bundle"
+            range_proof = envelope.proof_bundle.range_proof
+            if range_proof is not None and not isinstance(range_proof, range_proof_cls):
+                return False, f"Range proof type does not match envelope version {envelope.version}"
 
         return True, ""
 
@@ -563,11 +848,41 @@ class ZkProofEngine:
     # Full Validation Pipeline
     # ========================================================================
 
-    def validate_envelope(self, envelope: TransferEnvelope) -> Tuple[VerificationResult, SigningSummary]:
+    def validate_envelopes(
+        self, envelopes: Sequence[TransferEnvelope],
+    ) -> List[Tuple[VerificationResult, SigningSummary]]:
+        """Validate a batch of envelopes, e.g. everything in the inbox.
+
+        The range proofs of all private envelopes are verified together with
+        verify_ranges(); every other check runs per envelope, in order, exactly
+        as validate_envelope() does.
+        """
+        pending = [
+            (index, env) for index, env in enumerate(envelopes)
+            if env.mode == TransactionMode.PRIVATE and env.proof_bundle and env.proof_bundle.range_proof
+        ]
+        verified = self.verify_ranges([
+            (env.proof_bundle.range_proof, self.compute_tx_context_hash(env.transaction))
+            for _, env in pending
+        ])
+        range_results = {index: ok for (index, _), ok in zip(pending, verified)}
+        return [
+            self.validate_envelope(env, range_verified=range_results.get(index))
+            for index, env in enumerate(envelopes)
+        ]
+
+    def validate_envelope(
+        self, envelope: TransferEnvelope, range_verified: Optional[bool] = None,
+    ) -> Tuple[VerificationResult, SigningSummary]:
         """Validate a transfer envelope — the main entry point for the offline signer.
 
         Runs all checks: integrity, structure, policy, proofs (for private mode).
 
+        Args:
+            envelope: The envelope to validate
+            range_verified: Range proof result already computed by a batch
+                verification (see validate_envelopes); verified here if None
+
         Returns:
             (VerificationResult, SigningSummary)
         """
@@ -658,7 +973,9 @@ class ZkProofEngine:
 
                 # Check 9: Range proof
                 if bundle.range_proof:
-                    range_ok = self.verify_range(bundle.range_proof, ctx_hash)
+                    range_ok = range_verified
+                    if range_ok is None:
+                        range_ok = self.verify_range(bundle.range_proof, ctx_hash)
                     checks.append(VerificationCheck(
                         name="Range proof",
                         passed=range_ok,
@@ -725,6 +1042,7 @@ class ZkProofEngine:
         include_range_proof: bool = True,
         range_bits: int = 64,
         policy_constraints: Optional[List[Dict[str, Any]]] = None,
+        envelope_version: str = ENVELOPE_VERSION,
     ) -> ProofBundle:
         """Generate a complete proof bundle for a private transaction.
 
@@ -736,27 +1054,128 @@ class ZkProofEngine:
             include_range_proof: Whether to include a range proof
             range_bits: Number of bits for range proof
             policy_constraints: List of policy constraints to prove
+            envelope_version: Envelope version the bundle is meant for; it
+                decides the range proof type (1.1.0 for aggregated proofs)
 
         Returns:
             A ProofBundle with all proofs and binding
         """
         if tx_context.mode != TransactionMode.PRIVATE:
             raise ValueError("Proof bundle can only be generated for private transactions")
+        range_proof_type_for_version(envelope_version)
 
-        ctx_hash = self.compute_tx_context_hash(tx_context)
-        nonce = self.generate_nonce()
+        bundle, _ = self._build_proof_bundle(
+            tx_context, secret_key_hex, self.generate_nonce(),
+            include_range_proof, range_bits, policy_constraints, envelope_version,
+        )
+        return bundle
+
+    def generate_proof_bundles(
+        self,
+        contexts: Sequence[TransactionContext],
+        secret_key_hex: str,
+        include_range_proof: bool = True,
+        range_bits: int = 64,
+        policy_constraints: Optional[List[Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None,
+        envelope_version: str = ENVELOPE_VERSION,
+    ) -> ProofBatchResult:
+        """Generate proof bundles for a batch of private transactions in parallel.
+
+        Bundles are built across a process pool; each worker loads its own
+        engine (and Rust library) once and reuses it for its share of the
+        batch. Nonces are drawn here, in the calling process, and handed to
+        the workers, so every bundle carries exactly the nonce and binding
+        the serial path would produce for it.
+
+        Args:
+            contexts: Private transaction contexts
+            secret_key_hex: The 32-byte secret key (hex)
+            include_range_proof: Whether to include range proofs
+            range_bits: Number of bits for range proofs
+            policy_constraints: Policy constraints proved for every transaction
+            max_workers: Process count (default: CPU count); 1 runs in-process
+            envelope_version: Envelope version the bundles are meant for
+
+        Returns:
+            ProofBatchResult with bundles in input order and per-stage timings
+        """
+        contexts = list(contexts)
+        for tx_context in contexts:
+            if tx_context.mode != TransactionMode.PRIVATE:
+                raise ValueError("Proof bundle can only be generated for private transactions")
+        range_proof_type_for_version(envelope_version)
+
+        nonces = [self.generate_nonce() for _ in contexts]
+        if len(set(nonces)) != len(nonces):
+            raise RuntimeError("Nonce collision in proof batch")
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(contexts)))
+        start = time.perf_counter()
+
+        if workers == 1:
+            results = [
+                self._build_proof_bundle(
+                    tx_context, secret_key_hex, nonce,
+                    include_range_proof, range_bits, policy_constraints, envelope_version,
+                )
+                for tx_context, nonce in zip(contexts, nonces)
+            ]
+        else:
+            import multiprocessing
+            # spawn: workers must not inherit the parent's threads or loaded library state
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(
+                    _build_proof_bundle_in_worker,
+                    contexts, nonces,
+                    repeat(secret_key_hex), repeat(include_range_proof),
+                    repeat(range_bits), repeat(policy_constraints), repeat(envelope_version),
+                    chunksize=max(1, len(contexts) // (workers * 4)),
+                ))
+
+        return ProofBatchResult(
+            bundles=[bundle for bundle, _ in results],
+            timings=[timings for _, timings in results],
+            wall_time=time.perf_counter() - start,
+            workers=workers,
+        )
+
+    def _build_proof_bundle(
+        self,
+        tx_context: TransactionContext,
+        secret_key_hex: str,
+        nonce: str,
+        include_range_proof: bool,
+        range_bits: int,
+        policy_constraints: Optional[List[Dict[str, Any]]],
+        envelope_version: str = ENVELOPE_VERSION,
+    ) -> Tuple[ProofBundle, ProofStageTimings]:
+        """Build one proof bundle with a given nonce, timing each stage."""
+        timings = ProofStageTimings()
 
         # 1. Ownership proof
+        t0 = time.perf_counter()
+        ctx_hash = self.compute_tx_context_hash(tx_context)
         ownership_proof = self.prove_ownership(secret_key_hex, ctx_hash)
+        timings.ownership = time.perf_counter() - t0
 
         # 2. Range proof (optional)
+        t0 = time.perf_counter()
         range_proof = None
         if include_range_proof:
-            range_proof = self.prove_range(
-                tx_context.amount_lamports, range_bits, ctx_hash
-            )
+            if range_proof_type_for_version(envelope_version) is AggregatedRangeProof:
+                range_proof = self.prove_aggregated_range(
+                    tx_context.amount_lamports, range_bits, ctx_hash
+                )
+            else:
+                range_proof = self.prove_range(
+                    tx_context.amount_lamports, range_bits, ctx_hash
+                )
+        timings.range = time.perf_counter() - t0
 
         # 3. Policy proofs
+        t0 = time.perf_counter()
         policy_proofs = []
         if policy_constraints:
             for pc in policy_constraints:
@@ -767,8 +1186,10 @@ class ZkProofEngine:
                     context_data=ctx_hash,
                 )
                 policy_proofs.append(pp)
+        timings.policy = time.perf_counter() - t0
 
         # 4. Create bundle (binding computed next)
+        t0 = time.perf_counter()
         bundle = ProofBundle(
             ownership_proof=ownership_proof,
             range_proof=range_proof,
@@ -780,5 +1201,28 @@ class ZkProofEngine:
 
         # 5. Compute binding
         bundle.binding = self.compute_binding(tx_context, bundle)
-
-        return bundle
+        timings.binding = time.perf_counter() - t0
+
+        return bundle, timings
+
+
+# Per-process engine for generate_proof_bundles workers
+_worker_engine: Optional[ZkProofEngine] = None
+
+
+def _build_proof_bundle_in_worker(
+    tx_context: TransactionContext,
+    nonce: str,
+    secret_key_hex: str,
+    include_range_proof: bool,
+    range_bits: int,
+    policy_constraints: Optional[List[Dict[str, Any]]],
+    envelope_version: str,
+) -> Tuple[ProofBundle, ProofStageTimings]:
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = ZkProofEngine()
+    return _worker_engine._build_proof_bundle(
+        tx_context, secret_key_hex, nonce,
+        include_range_proof, range_bits, policy_constraints, envelope_version,
+    )
@@ -8,10 +8,53 @@ transaction contexts, and transfer envelopes.
 
 import json
 import enum
+import struct
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, timezone
 
+# Binary FFI layout (must match Rust: coldstar_zk/src/ffi.rs)
+ELEMENT_SIZE = 32
+OWNERSHIP_PROOF_SIZE = 5 * ELEMENT_SIZE
+BIT_PROOF_SIZE = 7 * ELEMENT_SIZE
+RANGE_PROOF_HEADER_SIZE = 4 + 2 * ELEMENT_SIZE
+MAX_RANGE_BITS = 64
+AGGREGATED_RANGE_PROOF_HEADER_SIZE = 4 + 11 * ELEMENT_SIZE
+
+# Envelope versions (must match Rust: coldstar_zk/src/envelope.rs)
+ENVELOPE_VERSION = "1.0.0"             # bit-decomposition RangeProof
+ENVELOPE_VERSION_AGGREGATED = "1.1.0"  # logarithmic-size AggregatedRangeProof
+
+
+def range_proof_size(num_bits: int) -> int:
+    """Size of a binary-encoded range proof over num_bits bits."""
+    return RANGE_PROOF_HEADER_SIZE + num_bits * BIT_PROOF_SIZE
+
+
+def aggregated_range_proof_size(num_bits: int) -> int:
+    """Size of a binary-encoded aggregated range proof over num_bits bits."""
+    return AGGREGATED_RANGE_PROOF_HEADER_SIZE + 2 * _log2(num_bits) * ELEMENT_SIZE
+
+
+def _log2(num_bits: int) -> int:
+    if num_bits < 1 or num_bits > MAX_RANGE_BITS or num_bits & (num_bits - 1):
+        raise ValueError(f"num_bits must be a power of two in [1, {MAX_RANGE_BITS}], got {num_bits}")
+    return num_bits.bit_length() - 1
+
+
+def _element(hex_str: str, name: str) -> bytes:
+    raw = bytes.fromhex(hex_str)
+    if len(raw) != ELEMENT_SIZE:
+        raise ValueError(f"{name} must be {ELEMENT_SIZE} bytes, got {len(raw)}")
+    return raw
+
+
+def _hex_elements(buf, offset: int, count: int) -> List[str]:
+    return [
+        bytes(buf[offset + i * ELEMENT_SIZE:offset + (i + 1) * ELEMENT_SIZE]).hex()
+        for i in range(count)
+    ]
+
 
 class TransactionMode(enum.Enum):
     """Transaction mode — explicitly chosen by the user before signing.
@@ -52,6 +95,19 @@ class OwnershipProof:
     def from_dict(cls, d: Dict[str, Any]) -> "OwnershipProof":
         return cls(**d)
 
+    def to_bytes(self) -> bytes:
+        """Encode as five raw 32-byte elements (binary FFI layout)."""
+        return b"".join(
+            _element(getattr(self, name), name)
+            for name in ("public_key", "commitment_r", "challenge", "response", "context_hash")
+        )
+
+    @classmethod
+    def from_bytes(cls, data) -> "OwnershipProof":
+        if len(data) != OWNERSHIP_PROOF_SIZE:
+            raise ValueError(f"Ownership proof must be {OWNERSHIP_PROOF_SIZE} bytes, got {len(data)}")
+        return cls(*_hex_elements(data, 0, 5))
+
 
 @dataclass
 class BitProof:
@@ -61,6 +117,8 @@ class BitProof:
     s0: str          # hex
     e1: str          # hex
     s1: str          # hex
+    r0: str = ""     # hex, branch 0 announcement R0
+    r1: str = ""     # hex, branch 1 announcement R1
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -93,6 +151,144 @@ class RangeProof:
             context_hash=d["context_hash"],
         )
 
+    def to_bytes(self) -> bytes:
+        """Encode in the binary FFI layout.
+
+        [u32 LE num_bits] || value_commitment || context_hash || bit proofs,
+        each bit proof being commitment || e0 || s0 || e1 || s1 || R0 || R1.
+        """
+        if len(self.bit_proofs) != self.num_bits or not 0 <= self.num_bits <= MAX_RANGE_BITS:
+            raise ValueError(f"Range proof has {len(self.bit_proofs)} bit proofs for {self.num_bits} bits")
+        parts = [
+            struct.pack("<I", self.num_bits),
+            _element(self.value_commitment, "value_commitment"),
+            _element(self.context_hash, "context_hash"),
+        ]
+        for bp in self.bit_proofs:
+            parts += [_element(bp.commitment, "commitment"), _element(bp.e0, "e0"),
+                      _element(bp.s0, "s0"), _element(bp.e1, "e1"), _element(bp.s1, "s1"),
+                      _element(bp.r0, "r0"), _element(bp.r1, "r1")]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "RangeProof":
+        if len(data) < RANGE_PROOF_HEADER_SIZE:
+            raise ValueError("Range proof buffer too short")
+        (num_bits,) = struct.unpack_from("<I", data, 0)
+        if num_bits > MAX_RANGE_BITS or len(data) != range_proof_size(num_bits):
+            raise ValueError(f"Range proof buffer of {len(data)} bytes does not hold {num_bits} bit proofs")
+        value_commitment, context_hash = _hex_elements(data, 4, 2)
+        elements = _hex_elements(data, RANGE_PROOF_HEADER_SIZE, 7 * num_bits)
+        bit_proofs = [BitProof(*elements[i:i + 7]) for i in range(0, len(elements), 7)]
+        return cls(
+            value_commitment=value_commitment,
+            num_bits=num_bits,
+            bit_proofs=bit_proofs,
+            context_hash=context_hash,
+        )
+
+
+@dataclass
+class AggregatedRangeProof:
+    """Bulletproofs-style range proof that a committed value lies in [0, 2^n).
+
+    Its size grows with log2(n): the bit vector is folded by an
+    inner-product argument into log2(n) (L, R) point pairs.
+    """
+    value_commitment: str  # hex
+    num_bits: int
+    commitment_a: str      # hex
+    commitment_s: str      # hex
+    commitment_t1: str     # hex
+    commitment_t2: str     # hex
+    tau_x: str             # hex
+    mu: str                # hex
+    t_hat: str             # hex
+    ipa_l: List[str]       # hex, one per folding round
+    ipa_r: List[str]       # hex, one per folding round
+    ipa_a: str             # hex
+    ipa_b: str             # hex
+    context_hash: str      # hex
+
+    _FIXED_FIELDS = ("value_commitment", "context_hash", "commitment_a", "commitment_s",
+                     "commitment_t1", "commitment_t2", "tau_x", "mu", "t_hat", "ipa_a", "ipa_b")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "AggregatedRangeProof":
+        return cls(**d)
+
+    def to_bytes(self) -> bytes:
+        """Encode in the binary FFI layout.
+
+        [u32 LE num_bits] || value_commitment || context_hash || A || S || T1
+        || T2 || tau_x || mu || t_hat || ipa_a || ipa_b || L points || R points.
+        """
+        rounds = _log2(self.num_bits)
+        if len(self.ipa_l) != rounds or len(self.ipa_r) != rounds:
+            raise ValueError(f"Aggregated range proof has {len(self.ipa_l)}/{len(self.ipa_r)} "
+                             f"rounds for {self.num_bits} bits")
+        parts = [struct.pack("<I", self.num_bits)]
+        parts += [_element(getattr(self, name), name) for name in self._FIXED_FIELDS]
+        parts += [_element(point, "ipa_l") for point in self.ipa_l]
+        parts += [_element(point, "ipa_r") for point in self.ipa_r]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "AggregatedRangeProof":
+        if len(data) < AGGREGATED_RANGE_PROOF_HEADER_SIZE:
+            raise ValueError("Aggregated range proof buffer too short")
+        (num_bits,) = struct.unpack_from("<I", data, 0)
+        rounds = _log2(num_bits)
+        if len(data) != aggregated_range_proof_size(num_bits):
+            raise ValueError(f"Aggregated range proof buffer of {len(data)} bytes "
+                             f"does not match {num_bits} bits")
+        fields = dict(zip(cls._FIXED_FIELDS, _hex_elements(data, 4, len(cls._FIXED_FIELDS))))
+        points = _hex_elements(data, AGGREGATED_RANGE_PROOF_HEADER_SIZE, 2 * rounds)
+        return cls(num_bits=num_bits, ipa_l=points[:rounds], ipa_r=points[rounds:], **fields)
+
+
+# Range proof type each envelope version carries
+RANGE_PROOF_TYPES = {
+    ENVELOPE_VERSION: RangeProof,
+    ENVELOPE_VERSION_AGGREGATED: AggregatedRangeProof,
+}
+
+
+def range_proof_type_for_version(version: str) -> type:
+    """The range proof class an envelope version carries.
+
+    Raises ValueError for versions this library cannot read.
+    """
+    try:
+        return RANGE_PROOF_TYPES[version]
+    except KeyError:
+        raise ValueError(f"Unsupported envelope version: {version}") from None
+
+
+def range_proof_from_dict(d: Dict[str, Any]) -> Union[RangeProof, AggregatedRangeProof]:
+    """Parse either range proof type from its dict form.
+
+    The type is read off the fields present, as the Rust side does; whether
+    it is the type the envelope version allows is checked at validation.
+    """
+    if "bit_proofs" in d:
+        return RangeProof.from_dict(d)
+    return AggregatedRangeProof.from_dict(d)
+
+
+def envelope_version_for(range_proof: Optional[Any]) -> str:
+    """The envelope version needed to carry a range proof.
+
+    Envelopes without a range proof are written as 1.0.0, which every
+    signer understands.
+    """
+    if isinstance(range_proof, AggregatedRangeProof):
+        return ENVELOPE_VERSION_AGGREGATED
+    return ENVELOPE_VERSION
+
 
 @dataclass
 class PolicyProof:
@@ -115,7 +311,7 @@ class PolicyProof:
 class ProofBundle:
     """Bundle of all proofs for a private transaction."""
     ownership_proof: OwnershipProof
-    range_proof: Optional[RangeProof]
+    range_proof: Optional[Union[RangeProof, AggregatedRangeProof]]
     policy_proofs: List[PolicyProof]
     binding: str       # hex
     nonce: str         # hex
@@ -135,7 +331,7 @@ class ProofBundle:
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "ProofBundle":
         ownership = OwnershipProof.from_dict(d["ownership_proof"])
-        range_proof = RangeProof.from_dict(d["range_proof"]) if d.get("range_proof") else None
+        range_proof = range_proof_from_dict(d["range_proof"]) if d.get("range_proof") else None
         policy_proofs = [PolicyProof.from_dict(pp) for pp in d.get("policy_proofs", [])]
         return cls(
             ownership_proof=ownership,
@@ -311,3 +507,40 @@ class SigningSummary:
             "proofs_verified_count": self.proofs_verified_count,
             "warnings": self.warnings,
         }
+
+
+@dataclass
+class ProofStageTimings:
+    """Seconds spent in each stage of generating one proof bundle."""
+    ownership: float = 0.0
+    range: float = 0.0
+    policy: float = 0.0
+    binding: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.ownership + self.range + self.policy + self.binding
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["total"] = self.total
+        return d
+
+
+@dataclass
+class ProofBatchResult:
+    """Proof bundles for a batch of transactions, in input order."""
+    bundles: List[ProofBundle]
+    timings: List[ProofStageTimings]
+    wall_time: float
+    workers: int
+
+    def stage_totals(self) -> Dict[str, float]:
+        """Stage times summed over every bundle (CPU-side, not wall clock)."""
+        totals = ProofStageTimings()
+        for t in self.timings:
+            totals.ownership += t.ownership
+            totals.range += t.range
+            totals.policy += t.policy
+            totals.binding += t.binding
+        return totals.to_dict()
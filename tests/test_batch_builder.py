@@ -0,0 +1,177 @@
+"""
+Tests for the batch payout builder and bundle format.
+"""
+
+import json
+
+import pytest
+from solders.keypair import Keypair
+from solders.transaction import Transaction
+
+from src.batch_builder import (
+    PACKET_DATA_SIZE,
+    SIGNED_BUNDLE_TYPE,
+    BatchBuildSummary,
+    iter_bundle_transactions,
+    pack_transfer_transactions,
+    read_bundle_header,
+    read_payout_rows,
+    to_lamports,
+    validate_rows,
+    write_signed_bundle,
+    write_unsigned_bundle,
+)
+
+BLOCKHASH = "11111111111111111111111111111111"
+FEE_WALLET = "Cak1aAwxM2jTdu7AtdaHbqAc3Dfafts7KdsHNrtXN5rT"
+
+
+@pytest.fixture
+def payer():
+    return str(Keypair().pubkey())
+
+
+def _recipients(n):
+    return [str(Keypair().pubkey()) for _ in range(n)]
+
+
+class TestAmounts:
+    def test_exact_conversion(self):
+        assert to_lamports("1.005") == 1_005_000_000
+        assert to_lamports(0.29) == 290_000_000
+
+    def test_rejects_sub_lamport(self):
+        with pytest.raises(ValueError, match="9 decimal places"):
+            to_lamports("0.0000000001")
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            to_lamports("abc")
+        with pytest.raises(ValueError):
+            to_lamports("inf")
+
+
+class TestRowInput:
+    def test_csv_with_header(self, tmp_path):
+        a, b = _recipients(2)
+        path = tmp_path / "payroll.csv"
+        path.write_text(f"recipient,amount\n{a},1.5\n# comment\n{b}, 0.25\n")
+        assert list(read_payout_rows(str(path))) == [(2, a, "1.5"), (4, b, "0.25")]
+
+    def test_jsonl(self, tmp_path):
+        a, = _recipients(1)
+        path = tmp_path / "payroll.jsonl"
+        path.write_text(json.dumps({"recipient": a, "amount": "2"}) + "\n\n")
+        assert list(read_payout_rows(str(path))) == [(1, a, "2")]
+
+    def test_jsonl_broken_lines_are_skipped(self, tmp_path):
+        a, b = _recipients(2)
+        path = tmp_path / "payroll.jsonl"
+        path.write_text("\n".join([
+            json.dumps({"recipient": a, "amount": "1"}),
+            '{"recipient": "truncated',
+            json.dumps([a, "1"]),
+            "42",
+            json.dumps({"recipient": b, "amount": "0.5"}),
+        ]) + "\n")
+        skipped = []
+
+        rows = list(validate_rows(read_payout_rows(str(path)), skipped))
+
+        assert [(r.line, r.recipient) for r in rows] == [(1, a), (5, b)]
+        assert [line for line, _ in skipped] == [2, 3, 4]
+
+    def test_invalid_rows_are_skipped(self):
+        a, = _recipients(1)
+        skipped = []
+        rows = list(validate_rows([(1, a, "1"), (2, "not-a-key", "1"), (3, a, "0")], skipped))
+        assert [r.line for r in rows] == [1]
+        assert [line for line, _ in skipped] == [2, 3]
+
+
+class TestPacking:
+    def test_packs_to_packet_limit(self, payer):
+        rows = list(validate_rows([(r, "0.01") for r in _recipients(100)]))
+        packed = list(pack_transfer_transactions(payer, rows, BLOCKHASH, fee_wallet=FEE_WALLET))
+
+        assert sum(len(p.recipients) for p in packed) == 100
+        assert len(packed) < 10
+        for ptx in packed:
+            assert len(ptx.tx_bytes) <= PACKET_DATA_SIZE
+        # Every transaction but the last is full: one more recipient would not fit
+        assert all(len(p.recipients) == len(packed[0].recipients) for p in packed[:-1])
+
+    def test_fee_instruction_included(self, payer):
+        rows = list(validate_rows([(r, "1") for r in _recipients(3)]))
+        ptx, = pack_transfer_transactions(payer, rows, BLOCKHASH,
+                                          fee_percentage=0.01, fee_wallet=FEE_WALLET)
+        tx = Transaction.from_bytes(ptx.tx_bytes)
+        assert len(tx.message.instructions) == 4
+        assert ptx.fee_lamports == 3 * 10_000_000
+        assert FEE_WALLET in [str(k) for k in tx.message.account_keys]
+
+    def test_no_fee_instruction_without_fee(self, payer):
+        rows = list(validate_rows([(r, "1") for r in _recipients(3)]))
+        ptx, = pack_transfer_transactions(payer, rows, BLOCKHASH,
+                                          fee_percentage=0, fee_wallet=FEE_WALLET)
+        assert len(Transaction.from_bytes(ptx.tx_bytes).message.instructions) == 3
+        assert ptx.fee_lamports == 0
+
+    def test_max_transfers_cap(self, payer):
+        rows = list(validate_rows([(r, "1") for r in _recipients(7)]))
+        packed = list(pack_transfer_transactions(payer, rows, BLOCKHASH,
+                                                 fee_wallet=FEE_WALLET, max_transfers_per_tx=3))
+        assert [len(p.recipients) for p in packed] == [3, 3, 1]
+
+
+class TestBundle:
+    def test_roundtrip(self, payer, tmp_path):
+        rows = list(validate_rows([(r, "0.5") for r in _recipients(50)]))
+        packed = pack_transfer_transactions(payer, rows, BLOCKHASH, fee_wallet=FEE_WALLET)
+        path = tmp_path / "outbox" / "unsigned_bundle.jsonl"
+
+        summary = write_unsigned_bundle(str(path), payer, BLOCKHASH, packed)
+
+        assert isinstance(summary, BatchBuildSummary)
+        assert summary.transfers == 50
+        assert summary.total_lamports == 25_000_000_000
+        header = read_bundle_header(str(path))
+        assert header["from"] == payer
+        entries = list(iter_bundle_transactions(str(path)))
+        assert len(entries) == summary.transactions
+        assert [e["index"] for e in entries] == list(range(len(entries)))
+        tx = Transaction.from_bytes(entries[0]["tx_bytes"])
+        assert str(tx.message.account_keys[0]) == payer
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "unsigned_tx.json"
+        path.write_text(json.dumps({"type": "unsigned_transaction", "data": ""}))
+        with pytest.raises(ValueError, match="Not a transaction bundle"):
+            read_bundle_header(str(path))
+
+    def test_signed_bundle_roundtrip(self, tmp_path):
+        signer = Keypair()
+        payer = str(signer.pubkey())
+        rows = list(validate_rows([(r, "0.1") for r in _recipients(30)]))
+        path = tmp_path / "unsigned_bundle.jsonl"
+        write_unsigned_bundle(str(path), payer, BLOCKHASH,
+                              pack_transfer_transactions(payer, rows, BLOCKHASH, fee_wallet=FEE_WALLET))
+
+        entries = list(iter_bundle_transactions(str(path)))
+        for entry in entries:
+            tx = Transaction.from_bytes(entry["tx_bytes"])
+            tx.signatures = [signer.sign_message(bytes(tx.message))]
+            entry["tx_bytes"] = bytes(tx)
+        signed_path = tmp_path / "signed_bundle.jsonl"
+        assert write_signed_bundle(str(signed_path), read_bundle_header(str(path)), entries) == len(entries)
+
+        header = read_bundle_header(str(signed_path), SIGNED_BUNDLE_TYPE)
+        assert header["from"] == payer
+        signed = list(iter_bundle_transactions(str(signed_path), SIGNED_BUNDLE_TYPE))
+        assert [e["recipients"] for e in signed] == [e["recipients"] for e in entries]
+        for entry in signed:
+            tx = Transaction.from_bytes(entry["tx_bytes"])
+            assert str(tx.signatures[0]) == entry["signature"]
+            tx.verify()
+        with pytest.raises(ValueError, match="Not a transaction bundle"):
+            read_bundle_header(str(signed_path))
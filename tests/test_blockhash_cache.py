@@ -0,0 +1,154 @@
+"""
+Tests for the shared blockhash prefetch cache.
+"""
+
+import time
+
+from src.blockhash_cache import (
+    BLOCKHASH_VALID_BLOCKS,
+    FINALIZED_LAG_BLOCKS,
+    SLOT_DURATION_SECONDS,
+    BlockhashProvider,
+    get_blockhash_provider,
+)
+from src.rpc_pool import RpcPool
+
+
+class FakeNetwork:
+    """Stands in for SolanaNetwork; each fetch returns a new hash.
+
+    `height` is the finalized block height; the tip runs FINALIZED_LAG_BLOCKS ahead.
+    """
+
+    def __init__(self, height=1_000, online=True):
+        self.height = height
+        self.online = online
+        self.blockhash_calls = 0
+        self.height_calls = 0
+
+    def get_latest_blockhash(self):
+        if not self.online:
+            return None
+        self.blockhash_calls += 1
+        return f"hash{self.blockhash_calls}", self.height + BLOCKHASH_VALID_BLOCKS
+
+    def get_block_height(self, commitment=None):
+        self.height_calls += 1
+        if not self.online:
+            return None
+        return self.height if commitment in (None, "finalized") else self.height + FINALIZED_LAG_BLOCKS
+
+
+def _age(provider, seconds):
+    """Pretend the cached hash was anchored `seconds` ago."""
+    provider._cached.anchored_at -= seconds
+
+
+class TestBlockhashProvider:
+    def test_burst_served_from_cache(self):
+        net = FakeNetwork()
+        provider = BlockhashProvider(net, prefetch_interval=60)
+        try:
+            results = [provider.get_blockhash() for _ in range(100)]
+        finally:
+            provider.stop()
+
+        assert net.blockhash_calls == 1
+        assert all(r == ("hash1", 1_000 + BLOCKHASH_VALID_BLOCKS) for r in results)
+        assert provider.stats == {"hits": 99, "misses": 1, "refreshes": 1}
+
+    def test_refresh_near_expiry(self):
+        net = FakeNetwork()
+        provider = BlockhashProvider(net, refresh_margin=60, prefetch_interval=60)
+        try:
+            provider.get_blockhash()
+            # Advance the estimate until fewer than 60 blocks remain
+            _age(provider, 100 * SLOT_DURATION_SECONDS)
+            blockhash, _ = provider.get_blockhash()
+        finally:
+            provider.stop()
+
+        assert blockhash == "hash2"
+        assert provider.misses == 2
+
+    def test_still_fresh_before_margin(self):
+        net = FakeNetwork()
+        provider = BlockhashProvider(net, refresh_margin=60, prefetch_interval=60)
+        try:
+            provider.get_blockhash()
+            _age(provider, 20 * SLOT_DURATION_SECONDS)
+            blockhash, _ = provider.get_blockhash()
+        finally:
+            provider.stop()
+
+        assert blockhash == "hash1"
+        assert provider.hits == 1
+
+    def test_offline_returns_none(self):
+        provider = BlockhashProvider(FakeNetwork(online=False), prefetch_interval=60)
+        try:
+            assert provider.get_blockhash() is None
+        finally:
+            provider.stop()
+
+    def test_blocks_remaining(self):
+        net = FakeNetwork(height=500)
+        provider = BlockhashProvider(net, prefetch_interval=60)
+        assert provider.blocks_remaining(600) is None
+        try:
+            provider.get_blockhash()
+            provider._reanchor()
+            assert provider.blocks_remaining(600) == 100 - FINALIZED_LAG_BLOCKS
+        finally:
+            provider.stop()
+
+    def test_reanchor_keeps_tip_estimate(self):
+        net = FakeNetwork()
+        provider = BlockhashProvider(net, prefetch_interval=60)
+        try:
+            provider.get_blockhash()
+            before = provider._cached.blocks_remaining()
+            _age(provider, 10 * SLOT_DURATION_SECONDS)
+            net.height += 10
+            provider._reanchor()
+            after = provider._cached.blocks_remaining()
+        finally:
+            provider.stop()
+
+        assert before == BLOCKHASH_VALID_BLOCKS - FINALIZED_LAG_BLOCKS
+        assert after == before - 10
+
+    def test_background_prefetch_refreshes_before_expiry(self):
+        net = FakeNetwork()
+        provider = BlockhashProvider(net, refresh_margin=60, prefetch_interval=0.02)
+        try:
+            provider.get_blockhash()
+            # Chain moves on: the re-anchor sees the hash is close to expiry
+            net.height += 120
+            deadline = time.monotonic() + 2
+            while net.blockhash_calls < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            blockhash, _ = provider.get_blockhash()
+        finally:
+            provider.stop()
+
+        assert net.height_calls >= 1
+        assert blockhash == "hash2"
+        assert provider.misses == 1
+
+
+def test_shared_provider_per_url():
+    a = get_blockhash_provider("http://a.test")
+    b = get_blockhash_provider("http://b.test")
+    assert a is get_blockhash_provider("http://a.test")
+    assert a is not b
+
+
+def test_shared_provider_uses_whole_pool():
+    pool = RpcPool(["http://a.test", "http://b.test"])
+    provider = get_blockhash_provider(pool=pool)
+    assert provider.network.pool is pool
+    same_urls = RpcPool(["http://a.test", "http://b.test"])
+    assert provider is get_blockhash_provider(pool=same_urls)
+    same_urls.close()
+    assert provider is not get_blockhash_provider("http://a.test")
@@ -0,0 +1,211 @@
+"""
+Tests for the concurrent outbox broadcaster.
+
+A stub cluster behind httpx.MockTransport lands each transaction only
+after a given number of sends, so rebroadcasting, expiry and preflight
+handling can be checked without a validator.
+"""
+
+import asyncio
+import base64
+import json
+import struct
+import time
+
+import httpx
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from src.batch_builder import write_signed_bundle
+from src.broadcaster import (
+    CONFIRMED,
+    EXPIRED,
+    FAILED,
+    PENDING,
+    OutboxBroadcaster,
+    RateLimiter,
+    _item_from_bytes,
+    load_signed_transactions,
+)
+from src.durable_nonce import NonceAccount
+from src.network import AsyncSolanaNetwork
+
+
+def _signed_tx(blockhash=None, signed=True, nonce_account=None):
+    payer = Keypair()
+    blockhash = blockhash or Hash.new_unique()
+    instructions = [transfer(TransferParams(from_pubkey=payer.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))]
+    if nonce_account:
+        instructions.insert(0, NonceAccount(nonce_account, str(payer.pubkey()), str(blockhash), 5000)
+                            .advance_instruction())
+    message = Message.new_with_blockhash(instructions, payer.pubkey(), blockhash)
+    tx = Transaction.new_unsigned(message)
+    if signed:
+        tx.sign([payer], blockhash)
+    return tx
+
+
+class StubCluster:
+    """Lands a transaction after `lands_after` sends; records every send."""
+
+    def __init__(self, lands_after=1):
+        self.lands_after = lands_after
+        self.sends = {}
+        self.landed = set()
+        self.expired_blockhashes = set()
+        self.preflight_errors = {}
+        self.nonces = {}  # nonce account -> current nonce value
+
+    def _answer(self, call):
+        method, params = call["method"], call["params"]
+        if method == "sendTransaction":
+            tx = Transaction.from_bytes(base64.b64decode(params[0]))
+            sig = str(tx.signatures[0])
+            if not params[1]["skipPreflight"] and sig in self.preflight_errors:
+                return {"jsonrpc": "2.0", "id": call["id"], "error": {
+                    "code": -32002, "message": "Transaction simulation failed",
+                    "data": {"err": self.preflight_errors[sig]}}}
+            self.sends[sig] = self.sends.get(sig, 0) + 1
+            if self.sends[sig] >= self.lands_after and str(tx.message.recent_blockhash) not in self.expired_blockhashes:
+                self.landed.add(sig)
+            result = sig
+        elif method == "getSignatureStatuses":
+            result = {"context": {"slot": 1}, "value": [
+                {"slot": 7, "confirmations": 0, "err": None, "confirmationStatus": "confirmed"}
+                if sig in self.landed else None for sig in params[0]]}
+        elif method == "isBlockhashValid":
+            result = {"context": {"slot": 1}, "value": params[0] not in self.expired_blockhashes}
+        elif method == "getMultipleAccounts":
+            result = {"context": {"slot": 1}, "value": [self._nonce_account(a) for a in params[0]]}
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "nope"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def _nonce_account(self, address):
+        data = (struct.pack("<II", 1, 1) + bytes(32)
+                + bytes(Hash.from_string(self.nonces[address])) + struct.pack("<Q", 5000))
+        return {"owner": "11111111111111111111111111111111", "lamports": 1,
+                "data": [base64.b64encode(data).decode(), "base64"]}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _items(txs):
+    return [_item_from_bytes(bytes(tx), "test", i) for i, tx in enumerate(txs)]
+
+
+def _run(cluster, items, **kwargs):
+    kwargs.setdefault("rebroadcast_interval", 0.05)
+    kwargs.setdefault("max_duration", 10.0)
+
+    async def run():
+        async with AsyncSolanaNetwork(rpc_url="http://rpc.test",
+                                      transport=httpx.MockTransport(cluster)) as network:
+            broadcaster = OutboxBroadcaster(network, use_websocket=False, **kwargs)
+            return await broadcaster.run(items)
+    return asyncio.run(run())
+
+
+class TestBroadcaster:
+    def test_rebroadcasts_until_landed(self, tmp_path):
+        cluster = StubCluster(lands_after=3)
+        txs = [_signed_tx() for _ in range(20)]
+        ledger = tmp_path / "ledger.jsonl"
+
+        report = _run(cluster, _items(txs), ledger_path=str(ledger))
+
+        assert report.confirmed == 20
+        assert all(count >= 3 for count in cluster.sends.values())
+        records = [json.loads(line) for line in ledger.read_text().splitlines()]
+        assert len(records) == 20
+        assert {r["status"] for r in records} == {CONFIRMED}
+        assert all(r["sends"] >= 3 and r["slot"] == 7 for r in records)
+
+    def test_preflight_failure_is_not_resent(self):
+        cluster = StubCluster()
+        bad = _signed_tx()
+        cluster.preflight_errors[str(bad.signatures[0])] = {"InstructionError": [0, {"Custom": 1}]}
+
+        report = _run(cluster, _items([bad, _signed_tx()]))
+
+        failed = next(item for item in report.items if item.status == FAILED)
+        assert failed.sends == 1
+        assert failed.err == {"InstructionError": [0, {"Custom": 1}]}
+        assert report.confirmed == 1
+
+    def test_expired_blockhash_stops_rebroadcast(self):
+        cluster = StubCluster(lands_after=10**6)
+        blockhash = Hash.new_unique()
+        cluster.expired_blockhashes.add(str(blockhash))
+
+        report = _run(cluster, _items([_signed_tx(blockhash)]), expiry_check_interval=0.1)
+
+        item = report.items[0]
+        assert item.status == EXPIRED
+        assert 1 < item.sends < 10
+        assert report.elapsed < 2.0
+
+    def test_durable_nonce_outlives_blockhash_until_advanced(self):
+        cluster = StubCluster(lands_after=10**6)
+        nonce_value = Hash.new_unique()
+        nonce_account = str(Keypair().pubkey())
+        cluster.expired_blockhashes.add(str(nonce_value))  # a nonce is never a live blockhash
+        cluster.nonces[nonce_account] = str(nonce_value)
+        item, = _items([_signed_tx(nonce_value, nonce_account=nonce_account)])
+        assert item.nonce_account == nonce_account
+
+        report = _run(cluster, [item], expiry_check_interval=0.1, max_duration=0.5)
+        assert item.status != EXPIRED and item.sends > 3
+
+        cluster.nonces[nonce_account] = str(Hash.new_unique())
+        item.status = PENDING
+        report = _run(cluster, [item], expiry_check_interval=0.1)
+        assert item.status == EXPIRED
+        assert item.err == "NonceAdvanced"
+        assert report.elapsed < 2.0
+
+    def test_already_landed_is_not_sent(self):
+        cluster = StubCluster()
+        tx = _signed_tx()
+        cluster.landed.add(str(tx.signatures[0]))
+
+        report = _run(cluster, _items([tx]))
+
+        assert report.confirmed == 1
+        assert report.sends == 0
+
+    def test_rate_limit(self):
+        async def run():
+            limiter = RateLimiter(20, burst=1)
+            started = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire()
+            return time.monotonic() - started
+
+        assert asyncio.run(run()) >= 0.18
+
+
+class TestLoadOutbox:
+    def test_loads_files_and_bundles(self, tmp_path):
+        single, in_bundle = _signed_tx(), _signed_tx()
+        (tmp_path / "signed_tx.json").write_text(json.dumps({
+            "type": "signed_transaction", "data": base64.b64encode(bytes(single)).decode()}))
+        write_signed_bundle(str(tmp_path / "signed_bundle_1.jsonl"), {"from": "x"}, [
+            {"index": 0, "tx_bytes": bytes(in_bundle)},
+            {"index": 1, "tx_bytes": bytes(single)},  # duplicate, loaded once
+        ])
+        (tmp_path / "signed_unsigned.json").write_text(json.dumps({
+            "type": "signed_transaction",
+            "data": base64.b64encode(bytes(_signed_tx(signed=False))).decode()}))
+        (tmp_path / "signed_garbage.json").write_text("not json")
+
+        items = load_signed_transactions(str(tmp_path))
+
+        assert {item.signature for item in items} == {str(single.signatures[0]), str(in_bundle.signatures[0])}
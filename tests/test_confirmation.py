@@ -0,0 +1,185 @@
+"""
+Tests for the batched confirmation engine.
+
+Runs a local websocket stub for the signatureSubscribe path and an
+httpx MockTransport for the getSignatureStatuses polling path.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import websockets
+
+from src.confirmation import ConfirmationEngine, derive_ws_url
+from src.network import AsyncSolanaNetwork
+
+
+class PollStub:
+    """getSignatureStatuses responder; statuses can be changed mid-test."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.calls = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls = body if isinstance(body, list) else [body]
+        replies = []
+        for call in calls:
+            sigs = call["params"][0]
+            self.calls.append(list(sigs))
+            replies.append({"jsonrpc": "2.0", "id": call["id"], "result": {
+                "context": {"slot": 10},
+                "value": [self.statuses.get(s) for s in sigs],
+            }})
+        return httpx.Response(200, json=replies if isinstance(body, list) else replies[0])
+
+
+class WsStub:
+    """signatureSubscribe server that notifies when told a signature landed."""
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.subscribed = []
+        self._subs = {}
+        self._conn = None
+
+    async def handler(self, ws, *args):
+        self._conn = ws
+        async for raw in ws:
+            msg = json.loads(raw)
+            sub_id = len(self.subscribed) + 100
+            sig = msg["params"][0]
+            self.subscribed.append(sig)
+            self._subs[sig] = sub_id
+            await ws.send(json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": sub_id}))
+
+    async def land(self, sig):
+        await self._conn.send(json.dumps({
+            "jsonrpc": "2.0",
+            "method": "signatureNotification",
+            "params": {
+                "subscription": self._subs[sig],
+                "result": {"context": {"slot": 42}, "value": {"err": self.errors.get(sig)}},
+            },
+        }))
+
+
+def _network(stub):
+    return AsyncSolanaNetwork(rpc_url="http://rpc.test", transport=httpx.MockTransport(stub))
+
+
+def test_derive_ws_url():
+    assert derive_ws_url("https://api.devnet.solana.com") == "wss://api.devnet.solana.com"
+    assert derive_ws_url("http://127.0.0.1:8899") == "ws://127.0.0.1:8900"
+
+
+class TestWebsocketFeed:
+    def test_notifications_resolve_signatures(self):
+        poll = PollStub()
+        ws_stub = WsStub(errors={"sigB": {"InstructionError": [0, "Custom"]}})
+
+        async def go():
+            async with websockets.serve(ws_stub.handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                async with _network(poll) as net:
+                    engine = ConfirmationEngine(net, ws_url=f"ws://127.0.0.1:{port}",
+                                                max_poll_interval=30.0)
+                    async with engine:
+                        waiter = asyncio.create_task(engine.wait(["sigA", "sigB"], timeout=5))
+                        while len(ws_stub.subscribed) < 2:
+                            await asyncio.sleep(0.01)
+                        assert engine.websocket_connected
+                        await ws_stub.land("sigA")
+                        await ws_stub.land("sigB")
+                        return await waiter
+
+        results = asyncio.run(go())
+        assert results["sigA"].confirmed is True
+        assert results["sigA"].source == "websocket"
+        assert results["sigA"].slot == 42
+        assert results["sigB"].confirmed is False
+        assert results["sigB"].err == {"InstructionError": [0, "Custom"]}
+
+    def test_already_landed_caught_by_poll(self):
+        poll = PollStub()
+        poll.statuses["sigA"] = {"confirmationStatus": "finalized", "err": None, "slot": 7}
+        ws_stub = WsStub()
+
+        async def go():
+            async with websockets.serve(ws_stub.handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                async with _network(poll) as net:
+                    engine = ConfirmationEngine(net, ws_url=f"ws://127.0.0.1:{port}")
+                    async with engine:
+                        return await engine.wait(["sigA"], timeout=5)
+
+        result = asyncio.run(go())["sigA"]
+        assert result.confirmed is True
+        assert result.source == "poll"
+
+
+class TestBatchPolling:
+    def test_polls_all_pending_in_one_call(self):
+        poll = PollStub()
+        sigs = [f"sig{i}" for i in range(20)]
+
+        async def go():
+            async with _network(poll) as net:
+                engine = ConfirmationEngine(net, use_websocket=False,
+                                            min_poll_interval=0.01, max_poll_interval=0.05)
+                async with engine:
+                    waiter = asyncio.create_task(engine.wait(sigs, timeout=5))
+                    await asyncio.sleep(0.05)
+                    for i, sig in enumerate(sigs):
+                        status = "confirmed" if i % 2 else "processed"
+                        poll.statuses[sig] = {"confirmationStatus": status, "err": None}
+                    await asyncio.sleep(0.1)
+                    for sig in sigs:
+                        poll.statuses[sig] = {"confirmationStatus": "finalized", "err": None}
+                    return await waiter
+
+        results = asyncio.run(go())
+        assert all(r.confirmed for r in results.values())
+        assert set(poll.calls[0]) == set(sigs)
+        # Confirmed signatures drop out of later polls
+        assert any(len(call) == 10 for call in poll.calls)
+
+    def test_falls_back_when_websocket_unreachable(self):
+        poll = PollStub()
+        poll.statuses["sigA"] = {"confirmationStatus": "confirmed", "err": None}
+
+        async def go():
+            async with _network(poll) as net:
+                engine = ConfirmationEngine(net, ws_url="ws://127.0.0.1:1",
+                                            min_poll_interval=0.01)
+                async with engine:
+                    return await engine.wait(["sigA"], timeout=5)
+
+        assert asyncio.run(go())["sigA"].confirmed is True
+
+    def test_backoff_grows_while_idle(self):
+        poll = PollStub()
+
+        async def go():
+            async with _network(poll) as net:
+                engine = ConfirmationEngine(net, use_websocket=False, min_poll_interval=0.01,
+                                            max_poll_interval=0.08, backoff_factor=2.0)
+                async with engine:
+                    return await engine.wait(["sigA"], timeout=0.4)
+
+        result = asyncio.run(go())["sigA"]
+        assert result.confirmed is False
+        assert result.source == "timeout"
+        # Without backoff a 10ms interval would poll ~40 times in 400ms
+        assert len(poll.calls) < 15
+
+    def test_invalid_commitment(self):
+        async def go():
+            async with _network(PollStub()) as net:
+                ConfirmationEngine(net, commitment="rooted")
+
+        with pytest.raises(ValueError, match="Invalid commitment"):
+            asyncio.run(go())
@@ -0,0 +1,184 @@
+"""
+Tests for durable-nonce accounts and nonce-mode transaction packing.
+"""
+
+import asyncio
+import base64
+import json
+import struct
+
+import httpx
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import Transaction
+
+from src.batch_builder import (
+    PACKET_DATA_SIZE,
+    SYSTEM_PROGRAM_ID,
+    PayoutRow,
+    iter_bundle_transactions,
+    pack_transfer_transactions,
+    read_bundle_header,
+    write_unsigned_bundle,
+)
+from src.durable_nonce import (
+    NONCE_ACCOUNT_SIZE,
+    NonceAccount,
+    NonceReservations,
+    decode_nonce_account,
+    derive_nonce_address,
+    nonce_account_of,
+    pack_create_nonce_transactions,
+    scan_nonce_accounts,
+)
+from src.network import AsyncSolanaNetwork
+from src.transaction import TransactionManager
+
+WALLET = str(Keypair().pubkey())
+
+
+def _nonce_data(authority, nonce, state=1, fee=5000):
+    return (struct.pack("<II", 1, state) + bytes(Pubkey.from_string(authority))
+            + bytes(nonce) + struct.pack("<Q", fee))
+
+
+def _nonce(index):
+    return NonceAccount(address=derive_nonce_address(WALLET, index), authority=WALLET,
+                        nonce=str(Hash.new_unique()), lamports_per_signature=5000)
+
+
+def _rows(count):
+    return [PayoutRow(recipient=str(Keypair().pubkey()), lamports=1000 + i) for i in range(count)]
+
+
+class TestNonceAccounts:
+    def test_decode(self):
+        value = Hash.new_unique()
+        data = _nonce_data(WALLET, value)
+        assert len(data) == NONCE_ACCOUNT_SIZE
+
+        nonce = decode_nonce_account("addr", data)
+
+        assert (nonce.authority, nonce.nonce, nonce.lamports_per_signature) == (WALLET, str(value), 5000)
+        assert decode_nonce_account("addr", _nonce_data(WALLET, value, state=0)) is None
+        assert decode_nonce_account("addr", data[:-1]) is None
+
+    def test_create_needs_only_wallet_signature(self):
+        indexes = list(range(12))
+        packed = pack_create_nonce_transactions(WALLET, indexes, 1_447_680, str(Hash.new_unique()))
+
+        created = [address for ptx in packed for address, _ in ptx.recipients]
+        assert created == [derive_nonce_address(WALLET, i) for i in indexes]
+        for ptx in packed:
+            tx = Transaction.from_bytes(ptx.tx_bytes)
+            assert len(ptx.tx_bytes) <= PACKET_DATA_SIZE
+            assert tx.message.header.num_required_signatures == 1
+            assert tx.message.account_keys[0] == Pubkey.from_string(WALLET)
+
+    def test_scan_finds_nonces_and_free_indexes(self):
+        existing = {derive_nonce_address(WALLET, i): _nonce_data(WALLET, Hash.new_unique()) for i in (0, 2)}
+        foreign = derive_nonce_address(WALLET, 1)  # funded, but not a nonce account
+
+        def stub(request):
+            calls = json.loads(request.content)
+            answers = []
+            for call in calls if isinstance(calls, list) else [calls]:
+                values = []
+                for address in call["params"][0]:
+                    if address in existing:
+                        values.append({"owner": str(SYSTEM_PROGRAM_ID), "lamports": 1,
+                                       "data": [base64.b64encode(existing[address]).decode(), "base64"]})
+                    elif address == foreign:
+                        values.append({"owner": str(SYSTEM_PROGRAM_ID), "lamports": 1, "data": ["", "base64"]})
+                    else:
+                        values.append(None)
+                answers.append({"jsonrpc": "2.0", "id": call["id"],
+                                "result": {"context": {"slot": 1}, "value": values}})
+            return httpx.Response(200, json=answers if isinstance(calls, list) else answers[0])
+
+        async def run():
+            async with AsyncSolanaNetwork(rpc_url="http://rpc.test",
+                                          transport=httpx.MockTransport(stub)) as network:
+                return await scan_nonce_accounts(network, WALLET, limit=5)
+
+        nonces, free = asyncio.run(run())
+
+        assert sorted(n.address for n in nonces) == sorted(existing)
+        assert free == [3, 4]
+
+
+class TestNoncePacking:
+    def test_each_transaction_advances_its_own_nonce(self, tmp_path):
+        nonces = [_nonce(i) for i in range(10)]
+        packed = list(pack_transfer_transactions(WALLET, _rows(60), "unused", nonces=nonces))
+
+        assert len(packed) > 1
+        for ptx, nonce in zip(packed, nonces):
+            tx = Transaction.from_bytes(ptx.tx_bytes)
+            assert len(ptx.tx_bytes) <= PACKET_DATA_SIZE
+            assert str(tx.message.recent_blockhash) == nonce.nonce
+            assert nonce_account_of(tx.message) == nonce.address == ptx.nonce_account
+        assert sum(len(ptx.recipients) for ptx in packed) == 60
+
+        bundle = tmp_path / "unsigned_bundle_1.jsonl"
+        write_unsigned_bundle(str(bundle), WALLET, None, packed, durable_nonce=True)
+        assert read_bundle_header(str(bundle))["durable_nonce"] is True
+        assert [e["nonce_account"] for e in iter_bundle_transactions(str(bundle))] == \
+            [n.address for n in nonces[:len(packed)]]
+
+    def test_blockhash_transactions_are_not_nonce(self):
+        ptx, = pack_transfer_transactions(WALLET, _rows(3), str(Hash.new_unique()))
+        assert ptx.nonce_account is None
+        assert nonce_account_of(Transaction.from_bytes(ptx.tx_bytes).message) is None
+
+    def test_too_few_nonces(self):
+        with pytest.raises(ValueError, match="nonce"):
+            list(pack_transfer_transactions(WALLET, _rows(60), "unused", nonces=[_nonce(0)]))
+
+    def test_too_few_nonces_leaves_no_bundle(self, tmp_path):
+        bundle = tmp_path / "unsigned_bundle_1.jsonl"
+        packed = pack_transfer_transactions(WALLET, _rows(60), "unused", nonces=[_nonce(0)])
+
+        with pytest.raises(ValueError, match="nonce"):
+            write_unsigned_bundle(str(bundle), WALLET, None, packed, durable_nonce=True)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+def _manager():
+    manager = TransactionManager.__new__(TransactionManager)
+    manager.blockhash_provider = None
+    return manager
+
+
+class TestNonceReservations:
+    def test_reservation_lapses_when_nonce_advances(self, tmp_path):
+        reservations = NonceReservations(str(tmp_path / "reservations.json"))
+        nonces = [_nonce(i) for i in range(3)]
+        reservations.reserve(WALLET, nonces[:2], "bundle_a.jsonl")
+
+        available, reserved = reservations.split(WALLET, nonces)
+        assert (available, reserved) == (nonces[2:], nonces[:2])
+
+        # The first bundle transaction landed: its nonce moved on
+        advanced = NonceAccount(nonces[0].address, WALLET, str(Hash.new_unique()), 5000)
+        available, reserved = reservations.split(WALLET, [advanced] + nonces[1:])
+
+        assert [n.address for n in available] == [nonces[0].address, nonces[2].address]
+        assert reservations.held(WALLET) == {nonces[1].address: "bundle_a.jsonl"}
+
+    def test_second_bundle_refuses_held_nonces(self, tmp_path):
+        reservations = NonceReservations(str(tmp_path / "reservations.json"))
+        nonces = [_nonce(i) for i in range(4)]
+        rows = [(row.recipient, "0.001") for row in _rows(30)]
+
+        first = _manager().create_batch_transfer_transactions(
+            WALLET, rows, str(tmp_path / "a.jsonl"), nonce_accounts=nonces, nonce_reservations=reservations)
+        second = _manager().create_batch_transfer_transactions(
+            WALLET, rows, str(tmp_path / "b.jsonl"), nonce_accounts=nonces, nonce_reservations=reservations)
+
+        assert first.nonce_accounts == [n.address for n in nonces[:first.transactions]]
+        assert set(reservations.held(WALLET)) == set(first.nonce_accounts)
+        assert second is None and not (tmp_path / "b.jsonl").exists()
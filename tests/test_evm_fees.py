@@ -0,0 +1,141 @@
+"""
+Tests for the eth_feeHistory fee oracle and its use in transfer contexts.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from src.evm_fees import (
+    BASE_BLOCK_TIME_SECONDS,
+    MIN_PRIORITY_FEE_WEI,
+    BaseFeeOracle,
+    max_base_fee_after,
+    next_base_fee,
+)
+from src.evm_network import BaseNetwork
+from src.rpc_pool import RpcPool
+
+SENDER = "0x" + "11" * 20
+GWEI = 10 ** 9
+
+
+def _fee_history(base_fees, ratios, rewards, oldest=100):
+    return {
+        "oldestBlock": hex(oldest),
+        "baseFeePerGas": [hex(b) for b in base_fees],
+        "gasUsedRatio": ratios,
+        "reward": [[hex(r) for r in row] for row in rewards],
+    }
+
+
+class StubFeeNode:
+    """Answers eth_feeHistory plus the transfer reads, recording requests."""
+
+    def __init__(self, history):
+        self.history = history
+        self.http_requests = []
+
+    def _answer(self, call):
+        results = {
+            "eth_feeHistory": self.history,
+            "eth_getTransactionCount": "0x3",
+            "eth_estimateGas": hex(21_000),
+            "eth_getBalance": hex(10 ** 18),
+        }
+        if call["method"] not in results:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": results[call["method"]]}
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.http_requests.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _network(node):
+    return BaseNetwork(pool=RpcPool(["http://base.test"], transport=httpx.MockTransport(node)))
+
+
+HISTORY = _fee_history(
+    base_fees=[GWEI // 100] * 4 + [GWEI // 100],
+    ratios=[0.1, 0.2, 0.9, 1.0],
+    rewards=[[1_000, 2_000_000, 9_000_000], [1_000, 3_000_000, 1_000_000_000],
+             [1_000, 2_500_000, 8_000_000], [1_000, 2_000_000, 7_000_000]],
+)
+
+
+class TestBaseFeeFormula:
+    def test_target_usage_keeps_fee(self):
+        assert next_base_fee(1_000_000, 1 / 6) == 1_000_000
+
+    def test_full_and_empty_blocks(self):
+        # Base: elasticity 6, denominator 250 -> +2% when full, -0.4% when empty
+        assert next_base_fee(1_000_000, 1.0) == 1_020_000
+        assert next_base_fee(1_000_000, 0.0) == 996_000
+        # Ethereum mainnet parameters: +12.5% / -12.5%
+        assert next_base_fee(1_000_000, 1.0, elasticity=2, denominator=8) == 1_125_000
+        assert next_base_fee(1_000_000, 0.0, elasticity=2, denominator=8) == 875_000
+
+    def test_growth_horizon(self):
+        assert max_base_fee_after(1_000_000, 0) == 1_000_000
+        assert max_base_fee_after(1_000_000, 2) == next_base_fee(1_020_000, 1.0)
+
+
+class TestBaseFeeOracle:
+    def test_profiles(self):
+        oracle = BaseFeeOracle(_network(StubFeeNode(HISTORY)))
+
+        slow, normal, fast = (oracle.estimate(p) for p in ("slow", "normal", "fast"))
+
+        assert normal.base_fee == next_base_fee(GWEI // 100, 1.0) == slow.base_fee
+        assert normal.block_number == 103
+        assert slow.max_priority_fee == MIN_PRIORITY_FEE_WEI  # rewards below the floor
+        assert normal.max_priority_fee == 2_250_000  # median, not the 1 gwei outlier
+        assert fast.max_priority_fee == 8_500_000
+        assert slow.max_fee_per_gas < normal.max_fee_per_gas < fast.max_fee_per_gas
+        assert normal.max_fee_per_gas < 2 * normal.base_fee + normal.max_priority_fee
+        with pytest.raises(ValueError):
+            oracle.estimate("instant")
+
+    def test_offline_keeps_double_base_fee(self):
+        oracle = BaseFeeOracle(_network(StubFeeNode(HISTORY)))
+
+        for profile in ("slow", "normal", "fast"):
+            online = oracle.estimate(profile)
+            offline = oracle.estimate(profile, offline=True)
+            assert offline.max_fee_per_gas == max(
+                online.max_fee_per_gas, 2 * online.base_fee + online.max_priority_fee
+            )
+        assert oracle.estimate("normal", offline=True).max_fee_per_gas > oracle.estimate("normal").max_fee_per_gas
+
+    def test_sample_cached_per_block(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("src.evm_fees.time.monotonic", lambda: clock[0])
+        node = StubFeeNode(HISTORY)
+        oracle = BaseFeeOracle(_network(node))
+
+        oracle.estimate("fast")
+        oracle.estimate("slow")
+        clock[0] += BASE_BLOCK_TIME_SECONDS
+        oracle.estimate("normal")
+
+        assert len(node.http_requests) == 2
+
+    def test_transfer_context_joins_batch_only_when_stale(self):
+        node = StubFeeNode(HISTORY)
+        network = _network(node)
+        oracle = BaseFeeOracle(network)
+
+        first = network.prepare_transfer_context(SENDER, {"to": SENDER}, fee_oracle=oracle)
+        second = network.prepare_transfer_context(SENDER, {"to": SENDER}, fee_oracle=oracle, fee_profile="fast")
+
+        assert len(node.http_requests) == 2
+        assert [c["method"] for c in node.http_requests[0]][-1] == "eth_feeHistory"
+        assert "eth_feeHistory" not in [c["method"] for c in node.http_requests[1]]
+        assert first.max_fee_per_gas == oracle.estimate("normal").max_fee_per_gas
+        assert second.max_fee_per_gas == oracle.estimate("fast").max_fee_per_gas
+        assert (first.nonce, first.gas_limit) == (3, 21_000)
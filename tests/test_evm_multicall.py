@@ -0,0 +1,142 @@
+"""
+Tests for Multicall3-aggregated ERC-20 balance scanning.
+
+A local EVM JSON-RPC stub executes aggregate3 against an in-memory token
+ledger, decoding the calldata independently of the code under test.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from src.evm_multicall import (
+    MULTICALL3_ADDRESS,
+    decode_aggregate3,
+    encode_aggregate3,
+    plan_balance_chunks,
+)
+from src.evm_network import AsyncBaseNetwork, BaseNetwork
+from src.rpc_pool import RpcPool
+
+TOKENS = ["0x" + f"{i:040x}" for i in range(1, 6)]
+WALLETS = ["0x" + f"{1000 + i:040x}" for i in range(40)]
+REVERTING = TOKENS[2]
+
+
+def _ledger():
+    return {(t, w): (i + 1) * 10 ** 6 + j for i, t in enumerate(TOKENS) for j, w in enumerate(WALLETS)}
+
+
+def _abi_result(results):
+    """Encode (bool, bytes)[] the way Multicall3 returns it"""
+    word = lambda v: v.to_bytes(32, "big")
+    tuples = []
+    for success, data in results:
+        padded = data + b"\x00" * (-len(data) % 32)
+        tuples.append(word(int(success)) + word(64) + word(len(data)) + padded)
+    offsets, position = [], 32 * len(tuples)
+    for item in tuples:
+        offsets.append(word(position))
+        position += len(item)
+    return word(32) + word(len(tuples)) + b"".join(offsets) + b"".join(tuples)
+
+
+class StubEvmNode:
+    """Executes aggregate3 over balanceOf calls against a ledger."""
+
+    def __init__(self, ledger):
+        self.ledger = ledger
+        self.http_requests = []
+        self.eth_calls = []
+
+    def _aggregate3(self, data):
+        assert data[:4].hex() == "82ad56cb"
+        args = data[4:]
+        word = lambda off: int.from_bytes(args[off:off + 32], "big")
+        base = word(0)
+        count = word(base)
+        results = []
+        for i in range(count):
+            start = base + 32 + word(base + 32 + 32 * i)
+            target = "0x" + args[start + 12:start + 32].hex()
+            assert word(start + 32) == 1  # allowFailure
+            call_start = start + word(start + 64)
+            call = args[call_start + 32:call_start + 32 + word(call_start)]
+            assert call[:4].hex() == "70a08231"
+            wallet = "0x" + call[16:36].hex()
+            if target == REVERTING:
+                results.append((False, b""))
+            else:
+                results.append((True, self.ledger.get((target, wallet), 0).to_bytes(32, "big")))
+        return results
+
+    def _answer(self, call):
+        tx, _block = call["params"]
+        assert tx["to"] == MULTICALL3_ADDRESS
+        self.eth_calls.append(tx)
+        results = self._aggregate3(bytes.fromhex(tx["data"][2:]))
+        return {"jsonrpc": "2.0", "id": call["id"], "result": "0x" + _abi_result(results).hex()}
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        self.http_requests.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in reversed(body)])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _expected(ledger, token, wallet):
+    return None if token == REVERTING else ledger[(token, wallet)]
+
+
+class TestAbi:
+    def test_round_trip_against_reference_encoding(self):
+        calls = [(TOKENS[0], b"\x01\x02\x03"), (TOKENS[1], b"")]
+        data = encode_aggregate3(calls)
+
+        assert data[:4].hex() == "82ad56cb"
+        assert len(data[4:]) % 32 == 0
+        results = [(True, b"\xff" * 32), (False, b"revert")]
+        assert decode_aggregate3(_abi_result(results)) == results
+
+    def test_chunks_respect_calldata_and_gas(self):
+        by_size = plan_balance_chunks(TOKENS, WALLETS, max_calldata=5_000)
+        by_gas = plan_balance_chunks(TOKENS, WALLETS, max_gas=50_000 + 30_000 * 7)
+
+        assert all(len(bytes.fromhex(c.params[0]["data"][2:])) <= 5_000 for c in by_size)
+        assert max(len(c.cells) for c in by_gas) == 7
+        assert sum(len(c.cells) for c in by_size) == len(TOKENS) * len(WALLETS)
+
+
+class TestBalanceMatrix:
+    def test_blocking_scan_matches_ledger(self):
+        ledger = _ledger()
+        node = StubEvmNode(ledger)
+        network = BaseNetwork(pool=RpcPool(["http://base.test"], transport=httpx.MockTransport(node)))
+
+        with network:
+            matrix = network.get_erc20_balance_matrix(TOKENS, WALLETS)
+
+        assert len(node.http_requests) == 1 and len(node.eth_calls) == 1  # 200 balances, one eth_call
+        for i, token in enumerate(TOKENS):
+            assert matrix.balances[i] == [_expected(ledger, token, w) for w in WALLETS]
+        assert matrix.get(TOKENS[0].upper().replace("0X", "0x"), WALLETS[3]) == 10 ** 6 + 3
+
+    def test_async_scan_splits_and_batches(self, monkeypatch):
+        monkeypatch.setattr("src.evm_network.plan_balance_chunks",
+                            lambda tokens, wallets: plan_balance_chunks(tokens, wallets, max_calldata=3_000))
+        ledger = _ledger()
+        node = StubEvmNode(ledger)
+
+        async def go():
+            async with AsyncBaseNetwork(rpc_url="http://base.test", transport=httpx.MockTransport(node)) as net:
+                return await net.get_erc20_balance_matrix(TOKENS, WALLETS)
+
+        matrix = asyncio.run(go())
+
+        assert len(node.eth_calls) > 10  # small chunks ...
+        assert len(node.http_requests) < len(node.eth_calls)  # ... batched per HTTP request
+        assert matrix.token_totals() == {
+            t: (0 if t == REVERTING else sum(ledger[(t, w)] for w in WALLETS)) for t in TOKENS
+        }
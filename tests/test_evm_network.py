@@ -0,0 +1,122 @@
+"""
+Tests for the Base JSON-RPC clients and batched transfer context.
+
+Uses an in-process httpx MockTransport standing in for an EVM node.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from src.evm_network import AsyncBaseNetwork, BaseNetwork
+from src.rpc_pool import RpcPool
+
+SENDER = "0x" + "11" * 20
+RECIPIENT = "0x" + "22" * 20
+
+
+class StubEvmRpc:
+    """Answers the reads a transfer needs and records every HTTP request."""
+
+    def __init__(self, batching=True, estimate_error=None):
+        self.batching = batching
+        self.estimate_error = estimate_error
+        self.http_requests = []
+
+    def _answer(self, call):
+        method = call["method"]
+        if method == "eth_estimateGas" and self.estimate_error:
+            return {"jsonrpc": "2.0", "id": call["id"],
+                    "error": {"code": 3, "message": self.estimate_error}}
+        results = {
+            "eth_getTransactionCount": hex(7),
+            "eth_getBlockByNumber": {"number": "0x10", "baseFeePerGas": hex(1_000_000)},
+            "eth_maxPriorityFeePerGas": hex(100_000),
+            "eth_estimateGas": hex(21_000),
+            "eth_getBalance": hex(10 ** 18),
+        }
+        if method not in results:
+            return {"jsonrpc": "2.0", "id": call["id"],
+                    "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": results[method]}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.http_requests.append(body)
+        if isinstance(body, list):
+            if not self.batching:
+                return httpx.Response(200, json={
+                    "jsonrpc": "2.0", "id": None,
+                    "error": {"code": -32600, "message": "Batch requests disabled"}})
+            return httpx.Response(200, json=[self._answer(c) for c in reversed(body)])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _async_network(stub, **kwargs):
+    return AsyncBaseNetwork(rpc_url="http://base.test", transport=httpx.MockTransport(stub), **kwargs)
+
+
+def _sync_network(stub):
+    return BaseNetwork(pool=RpcPool(["http://base.test"], transport=httpx.MockTransport(stub)))
+
+
+class TestTransferContext:
+    def test_one_round_trip(self):
+        stub = StubEvmRpc()
+
+        async def go():
+            async with _async_network(stub) as net:
+                return await net.prepare_transfer_context(SENDER, {"to": RECIPIENT, "value": hex(10 ** 15)})
+
+        ctx = asyncio.run(go())
+
+        assert len(stub.http_requests) == 1 and len(stub.http_requests[0]) == 6
+        assert (ctx.nonce, ctx.base_fee, ctx.max_priority_fee) == (7, 1_000_000, 100_000)
+        counts = [c["params"][1] for c in stub.http_requests[0] if c["method"] == "eth_getTransactionCount"]
+        assert counts == ["pending", "latest"] and ctx.mined_nonce == 7
+        assert (ctx.gas_limit, ctx.balance_wei) == (21_000, 10 ** 18)
+        assert ctx.max_fee_per_gas == 2_100_000
+        assert ctx.max_cost_wei(5) == 5 + 21_000 * 2_100_000
+        estimate, = [c for c in stub.http_requests[0] if c["method"] == "eth_estimateGas"]
+        assert estimate["params"][0]["from"] == SENDER
+
+    def test_blocking_client_batches_too(self):
+        stub = StubEvmRpc()
+        with _sync_network(stub) as net:
+            ctx = net.prepare_transfer_context(SENDER, {"to": RECIPIENT})
+
+        assert ctx.nonce == 7
+        assert len(stub.http_requests) == 1 and isinstance(stub.http_requests[0], list)
+
+    def test_failed_estimate_is_none(self):
+        stub = StubEvmRpc(estimate_error="execution reverted")
+        with _sync_network(stub) as net:
+            assert net.prepare_transfer_context(SENDER, {"to": RECIPIENT}) is None
+
+    def test_batching_disabled_node(self):
+        stub = StubEvmRpc(batching=False)
+
+        async def go():
+            async with _async_network(stub) as net:
+                return await net.prepare_transfer_context(SENDER, {"to": RECIPIENT})
+
+        assert asyncio.run(go()) is None
+
+
+class TestAsyncReads:
+    def test_single_reads_and_batch_split(self):
+        stub = StubEvmRpc()
+
+        async def go():
+            async with _async_network(stub, max_batch_size=2) as net:
+                nonce = await net.get_nonce(SENDER)
+                fee = await net.get_base_fee()
+                batch = await net._make_batch_request([("eth_getBalance", [SENDER, "latest"])] * 5)
+                return nonce, fee, batch
+
+        nonce, fee, batch = asyncio.run(go())
+
+        assert (nonce, fee) == (7, 1_000_000)
+        assert [int(r["result"], 16) for r in batch] == [10 ** 18] * 5
+        assert sorted(len(b) for b in stub.http_requests[2:]) == [1, 2, 2]
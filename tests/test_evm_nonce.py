@@ -0,0 +1,133 @@
+"""
+Tests for the local EVM nonce allocator.
+"""
+
+from src.evm_nonce import DROPPED, SENT, NonceAllocator
+
+ADDRESS = "0x" + "ab" * 20
+
+
+class FakeBaseNetwork:
+    """Chain state for one address: mined count, receipts and mempool."""
+
+    def __init__(self, count=5):
+        self.count = count
+        self.mined = set()
+        self.mempool = set()
+        self.nonce_lookups = 0
+        self.batches = []
+
+    def get_nonce(self, address, block="latest"):
+        self.nonce_lookups += 1
+        return self.count
+
+    def _make_batch_request(self, calls):
+        self.batches.append(calls)
+        responses = []
+        for method, params in calls:
+            if method == "eth_getTransactionCount":
+                result = hex(self.count)
+            elif method == "eth_getTransactionReceipt":
+                result = {"status": "0x1"} if params[0] in self.mined else None
+            else:
+                result = {"hash": params[0]} if params[0] in self.mempool else None
+            responses.append({"jsonrpc": "2.0", "id": len(responses), "result": result})
+        return responses
+
+
+def _sent(allocator, network, nonces):
+    for nonce in nonces:
+        allocator.mark_sent(ADDRESS, nonce, f"0xhash{nonce}")
+        network.mempool.add(f"0xhash{nonce}")
+
+
+class TestReserve:
+    def test_contiguous_ranges_one_lookup(self):
+        network = FakeBaseNetwork(count=5)
+        allocator = NonceAllocator(network)
+
+        first = allocator.reserve(ADDRESS, 3)
+        second = allocator.reserve(ADDRESS.upper().replace("0X", "0x"), 2)
+
+        assert (list(first), list(second)) == ([5, 6, 7], [8, 9])
+        assert network.nonce_lookups == 1
+
+    def test_caller_supplied_chain_nonce_skips_lookup(self):
+        network = FakeBaseNetwork()
+        allocator = NonceAllocator(network)
+
+        assert allocator.allocate(ADDRESS, chain_nonce=10, pending_nonce=12) == 12
+        assert allocator.allocate(ADDRESS, chain_nonce=10, pending_nonce=12) == 13
+        assert network.nonce_lookups == 0
+
+    def test_pending_count_does_not_confirm_sent(self):
+        network = FakeBaseNetwork(count=0)
+        allocator = NonceAllocator(network)
+        _sent(allocator, network, allocator.reserve(ADDRESS, 3))
+
+        # Our three are in the mempool: pending is 3, nothing mined yet
+        assert allocator.allocate(ADDRESS, chain_nonce=0, pending_nonce=3) == 3
+        assert [allocator.pending(ADDRESS)[n].status for n in range(3)] == [SENT] * 3
+
+    def test_reservation_held_until_released(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("src.evm_nonce.time.monotonic", lambda: clock[0])
+        allocator = NonceAllocator(FakeBaseNetwork(count=0))
+        allocator.reserve(ADDRESS, 2)
+
+        clock[0] += 7 * 24 * 3600
+        assert allocator.gaps(ADDRESS) == []
+        assert allocator.allocate(ADDRESS) == 2
+
+        allocator.release(ADDRESS, [0])
+        assert allocator.gaps(ADDRESS) == [0]
+
+    def test_release_rolls_back_top_and_leaves_lower_gaps(self):
+        allocator = NonceAllocator(FakeBaseNetwork(count=0))
+        allocator.reserve(ADDRESS, 4)
+
+        allocator.release(ADDRESS, [3])
+        allocator.release(ADDRESS, [1])
+
+        assert list(allocator.reserve(ADDRESS, 1)) == [3]
+        assert allocator.gaps(ADDRESS) == [1]
+        assert allocator.allocate(ADDRESS) == 1
+
+
+class TestRefresh:
+    def test_confirms_from_receipts_and_count(self):
+        network = FakeBaseNetwork(count=0)
+        allocator = NonceAllocator(network)
+        _sent(allocator, network, allocator.reserve(ADDRESS, 3))
+        network.count = 1
+        network.mined.update({"0xhash0", "0xhash1"})
+
+        report = allocator.refresh(ADDRESS)
+
+        assert report.chain_nonce == 1
+        assert report.confirmed == [0, 1]
+        assert report.gaps == []
+        assert len(network.batches) == 1  # count plus all receipts in one request
+        assert sorted(allocator.pending(ADDRESS)) == [1, 2]
+
+    def test_detects_dropped_and_refills_gap(self):
+        network = FakeBaseNetwork(count=0)
+        allocator = NonceAllocator(network, drop_after=0)
+        _sent(allocator, network, allocator.reserve(ADDRESS, 3))
+        network.mempool.discard("0xhash1")
+
+        report = allocator.refresh(ADDRESS)
+
+        assert report.dropped == [1] and report.gaps == [1]
+        assert allocator.pending(ADDRESS)[1].status == DROPPED
+        assert allocator.pending(ADDRESS)[2].status == SENT
+        assert allocator.claim_gaps(ADDRESS) == [1]
+        assert allocator.gaps(ADDRESS) == []
+
+    def test_recently_sent_is_not_dropped(self):
+        network = FakeBaseNetwork(count=0)
+        allocator = NonceAllocator(network, drop_after=60)
+        allocator.reserve(ADDRESS, 1)
+        allocator.mark_sent(ADDRESS, 0, "0xunseen")
+
+        assert allocator.refresh(ADDRESS).dropped == []
@@ -0,0 +1,137 @@
+"""
+Tests for the multi-hash Base receipt tracker.
+
+An httpx MockTransport plays a Base node whose blocks, receipts, nonces
+and mempool are advanced by the test.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from src.evm_network import AsyncBaseNetwork
+from src.evm_receipts import CONFIRMED, DROPPED, REPLACED, REVERTED, TIMEOUT, ReceiptTracker
+
+SENDER = "0x" + "aa" * 20
+
+
+class StubChain:
+    """Block height, receipts, sender nonce and mempool of a fake node."""
+
+    def __init__(self):
+        self.block = 100
+        self.receipts = {}
+        self.count = 0
+        self.mempool = set()
+        self.batches = []
+
+    def mine(self, *hashes, status=1):
+        self.block += 1
+        for tx_hash in hashes:
+            self.receipts[tx_hash] = {"transactionHash": tx_hash, "status": hex(status),
+                                      "blockNumber": hex(self.block)}
+            self.mempool.discard(tx_hash)
+
+    def _answer(self, call):
+        method, params = call["method"], call["params"]
+        if method == "eth_blockNumber":
+            result = hex(self.block)
+        elif method == "eth_getTransactionReceipt":
+            result = self.receipts.get(params[0])
+        elif method == "eth_getTransactionCount":
+            result = hex(self.count)
+        elif method == "eth_getTransactionByHash":
+            result = {"hash": params[0]} if params[0] in self.mempool else None
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def __call__(self, request):
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            self.batches.append([c["method"] for c in body])
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _network(chain):
+    return AsyncBaseNetwork(rpc_url="http://base.test", transport=httpx.MockTransport(chain))
+
+
+async def _advance(chain, blocks, delay=0.03):
+    for _ in range(blocks):
+        await asyncio.sleep(delay)
+        chain.block += 1
+
+
+class TestReceiptTracker:
+    def test_one_batch_per_block_for_many_hashes(self):
+        chain = StubChain()
+        hashes = [f"0x{i:064x}" for i in range(30)]
+
+        async def go():
+            async with _network(chain) as net:
+                async with ReceiptTracker(net, poll_interval=0.005) as tracker:
+                    waiter = asyncio.create_task(tracker.wait(hashes, timeout=5))
+                    await asyncio.sleep(0.05)
+                    chain.mine(*hashes[:20])
+                    await asyncio.sleep(0.05)
+                    chain.mine(*hashes[20:29], status=0)
+                    chain.mine(hashes[29])
+                    return await waiter, tracker.blocks_checked
+
+        results, checked = asyncio.run(go())
+
+        assert all(results[h].status == CONFIRMED for h in hashes[:20] + [hashes[29]])
+        assert all(results[h].status == REVERTED for h in hashes[20:29])
+        assert results[hashes[0]].block_number == 101
+        # Polling every 5ms over three blocks: one receipt batch per block, not per poll
+        assert checked == len(chain.batches) <= 4
+        assert chain.batches[0] == ["eth_getTransactionReceipt"] * 30
+        assert len(chain.batches[-1]) == 10  # resolved hashes drop out
+
+    def test_replaced_by_nonce(self):
+        chain = StubChain()
+        chain.count = 5
+
+        async def go():
+            async with _network(chain) as net:
+                async with ReceiptTracker(net, poll_interval=0.005) as tracker:
+                    waiter = asyncio.create_task(tracker.wait([("0xold", SENDER, 5)], timeout=5))
+                    await asyncio.sleep(0.03)
+                    chain.count = 6  # another transaction used nonce 5
+                    await _advance(chain, 3)
+                    return await waiter
+
+        result = asyncio.run(go())["0xold"]
+
+        assert result.status == REPLACED
+        assert chain.batches[0] == ["eth_getTransactionReceipt", "eth_getTransactionCount"]
+
+    def test_dropped_from_mempool(self):
+        chain = StubChain()
+        chain.mempool.add("0xgone")
+
+        async def go():
+            async with _network(chain) as net:
+                async with ReceiptTracker(net, poll_interval=0.005, drop_after_blocks=2) as tracker:
+                    waiter = asyncio.create_task(tracker.wait([("0xgone", SENDER, 0)], timeout=5))
+                    await _advance(chain, 2)
+                    chain.mempool.clear()
+                    await _advance(chain, 3)
+                    return await waiter
+
+        assert asyncio.run(go())["0xgone"].status == DROPPED
+
+    def test_timeout(self):
+        chain = StubChain()
+
+        async def go():
+            async with _network(chain) as net:
+                async with ReceiptTracker(net, poll_interval=0.005) as tracker:
+                    return await tracker.wait(["0xslow"], timeout=0.1)
+
+        result = asyncio.run(go())["0xslow"]
+        assert result.status == TIMEOUT and not result.confirmed
+        assert len(chain.batches) == 1  # the block never advanced
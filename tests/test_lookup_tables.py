@@ -0,0 +1,259 @@
+"""
+Tests for address lookup tables, v0 packing and v0 signing.
+"""
+
+import base64
+import json
+import struct
+from contextlib import contextmanager
+
+import pytest
+from solders.address_lookup_table_account import derive_lookup_table_address
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from config import INFRASTRUCTURE_FEE_WALLET
+from src.batch_builder import (
+    MAX_TX_ACCOUNT_LOCKS,
+    PACKET_DATA_SIZE,
+    PayoutRow,
+    pack_transfer_transactions,
+)
+from src.lookup_tables import (
+    ADDRESS_LOOKUP_TABLE_ID,
+    ACTIVE_SLOT,
+    MAX_EXTEND_ADDRESSES,
+    LookupTable,
+    LookupTableCache,
+    SLOT_HASHES_MAX_ENTRIES,
+    decode_lookup_table,
+    plan_lookup_tables,
+    recent_block_slots,
+)
+from src.transaction import TransactionManager
+
+WALLET = Keypair()
+
+
+def _rows(count):
+    return [PayoutRow(recipient=str(Pubkey.new_unique()), lamports=1000 + i) for i in range(count)]
+
+
+def _tables(rows):
+    addresses = [row.recipient for row in rows] + [INFRASTRUCTURE_FEE_WALLET]
+    return [LookupTable(address=str(Pubkey.new_unique()), authority=str(WALLET.pubkey()),
+                        addresses=addresses[start:start + 256])
+            for start in range(0, len(addresses), 256)]
+
+
+def _table_data(authority, addresses, deactivation_slot=ACTIVE_SLOT):
+    meta = struct.pack("<IQQB", 1, deactivation_slot, 42, 0) + b"\x01" + bytes(authority) + b"\x00\x00"
+    return meta + b"".join(bytes(a) for a in addresses)
+
+
+class FakeSigner:
+    """Stands in for the Rust signer: signs message bytes with a keypair."""
+
+    supports_sessions = True
+
+    def __init__(self, keypair):
+        self.keypair = keypair
+
+    def sign_transaction(self, container, password, message_bytes):
+        return bytes(self.keypair.sign_message(message_bytes)), None
+
+    @contextmanager
+    def open_session(self, container, password, ttl_seconds):
+        keypair = self.keypair
+
+        class Session:
+            public_key = str(keypair.pubkey())
+
+            def sign_messages(self, messages):
+                return [bytes(keypair.sign_message(m)) for m in messages]
+
+        yield Session()
+
+
+def _manager():
+    manager = TransactionManager.__new__(TransactionManager)
+    manager.rust_signer = FakeSigner(WALLET)
+    manager.signed_tx = None
+    return manager
+
+
+class TestV0Packing:
+    def test_tables_pack_more_transfers(self):
+        rows = _rows(600)
+        tables = [table.account() for table in _tables(rows)]
+        blockhash = str(Hash.new_unique())
+
+        legacy = list(pack_transfer_transactions(str(WALLET.pubkey()), rows, blockhash))
+        dense = list(pack_transfer_transactions(str(WALLET.pubkey()), rows, blockhash, lookup_tables=tables))
+
+        assert len(dense) * 2 < len(legacy)
+        assert [r for ptx in dense for r, _ in ptx.recipients] == [row.recipient for row in rows]
+        for ptx in dense:
+            message = VersionedTransaction.from_bytes(ptx.tx_bytes).message
+            assert isinstance(message, MessageV0)
+            assert len(ptx.tx_bytes) <= PACKET_DATA_SIZE
+            loaded = sum(len(bytes(l.writable_indexes)) for l in message.address_table_lookups)
+            assert len(message.account_keys) + loaded <= MAX_TX_ACCOUNT_LOCKS
+
+    def test_account_lock_limit(self):
+        rows = _rows(100)
+        tables = [table.account() for table in _tables(rows)]
+
+        dense = list(pack_transfer_transactions(str(WALLET.pubkey()), rows, str(Hash.new_unique()),
+                                                lookup_tables=tables, packet_size=10_000))
+
+        assert max(len(ptx.recipients) for ptx in dense) == MAX_TX_ACCOUNT_LOCKS - 3  # payer, system, fee
+
+    def test_secure_signing_handles_v0(self):
+        rows = _rows(40)
+        tables = [table.account() for table in _tables(rows)]
+        packed = list(pack_transfer_transactions(str(WALLET.pubkey()), rows, str(Hash.new_unique()),
+                                                 lookup_tables=tables))
+        manager = _manager()
+
+        bulk = manager.sign_transactions_secure([p.tx_bytes for p in packed], {}, "pw")
+        single = manager.sign_transaction_secure(packed[0].tx_bytes, {}, "pw")
+
+        assert bulk[0] == single
+        for signed in bulk:
+            tx = VersionedTransaction.from_bytes(signed)
+            assert isinstance(tx.message, MessageV0)
+            assert all(tx.verify_with_results())
+
+        info = manager.decode_transaction_info(single)
+        assert info["versioned"] and info["is_signed"]
+        assert info["num_accounts"] == 2 + 1 + len(rows)
+        assert len(info["address_table_lookups"][0]["writable"]) == len(rows) + 1
+        assert len(packed) == 1
+        assert sum(t["lamports"] for t in info["sol_transfers"]) == sum(r.lamports for r in rows) + packed[0].fee_lamports
+
+
+class TestLookupTablePlan:
+    def test_create_then_extend(self):
+        addresses = [str(Pubkey.new_unique()) for _ in range(300)]
+
+        plan = plan_lookup_tables(str(WALLET.pubkey()), addresses, [1000, 997], str(Hash.new_unique()))
+
+        assert plan.added == 300
+        assert len(plan.new_tables) == len(plan.create) == 2
+        assert len(set(plan.new_tables)) == 2
+        assert list(plan.creation_slots.values()) == [1000, 997]
+        # each creation carries the first chunk; the rest goes in extensions
+        expected = sum(-(-(n - MAX_EXTEND_ADDRESSES) // MAX_EXTEND_ADDRESSES) for n in (256, 44))
+        assert len(plan.extend) == expected
+        for ptx in plan.create + plan.extend:
+            tx = VersionedTransaction.from_bytes(ptx.tx_bytes)
+            assert len(ptx.tx_bytes) <= PACKET_DATA_SIZE
+            assert tx.message.header.num_required_signatures == 1
+
+    def test_tops_up_existing_and_skips_known(self):
+        known = [str(Pubkey.new_unique()) for _ in range(250)]
+        existing = LookupTable(address=str(Pubkey.new_unique()), authority=str(WALLET.pubkey()), addresses=known)
+        new = [str(Pubkey.new_unique()) for _ in range(6)]
+
+        plan = plan_lookup_tables(str(WALLET.pubkey()), known[:10] + new, [1000], str(Hash.new_unique()),
+                                  existing=[existing])
+
+        assert (plan.added, plan.new_tables, len(plan.extend)) == (6, [], 1)
+
+
+    def test_new_tables_use_block_slots_only(self):
+        # 1000 produced a block, 999 and 998 were skipped, 997 produced one
+        network = FakeNetwork({}, slot=1000, blocks=[997, 1000, 1000 - 150])
+        slots = recent_block_slots(network)
+        addresses = [str(Pubkey.new_unique()) for _ in range(513)]
+
+        assert slots == [1000, 997, 850]
+        assert network.block_ranges == [(850, 1000)]
+        plan = plan_lookup_tables(str(WALLET.pubkey()), addresses, slots, str(Hash.new_unique()))
+        assert plan.creation_slots == {
+            str(derive_lookup_table_address(WALLET.pubkey(), slot)[0]): slot for slot in (1000, 997, 850)
+        }
+        with pytest.raises(ValueError):
+            plan_lookup_tables(str(WALLET.pubkey()), addresses, [1000, 1000, 997], str(Hash.new_unique()))
+
+
+class FakeNetwork:
+    def __init__(self, accounts, slot=None, blocks=()):
+        self.accounts = accounts
+        self.requests = 0
+        self.slot = slot
+        self.blocks = list(blocks)
+        self.block_ranges = []
+
+    def get_slot(self, commitment="finalized"):
+        return self.slot
+
+    def get_blocks(self, start_slot, end_slot, commitment="finalized"):
+        self.block_ranges.append((start_slot, end_slot))
+        return [b for b in self.blocks if start_slot <= b <= end_slot]
+
+    def get_account_info(self, address):
+        self.requests += 1
+        data = self.accounts.get(address)
+        if data is None:
+            return None
+        return {"owner": str(ADDRESS_LOOKUP_TABLE_ID), "data": [base64.b64encode(data).decode(), "base64"]}
+
+
+class TestLookupTableCache:
+    def test_decode(self):
+        addresses = [Pubkey.new_unique() for _ in range(3)]
+        table = decode_lookup_table("t", _table_data(WALLET.pubkey(), addresses))
+
+        assert table.authority == str(WALLET.pubkey())
+        assert table.addresses == [str(a) for a in addresses]
+        assert table.active and table.last_extended_slot == 42
+
+    def test_registry_and_ttl(self, tmp_path):
+        live, closed = str(Pubkey.new_unique()), str(Pubkey.new_unique())
+        network = FakeNetwork({
+            live: _table_data(WALLET.pubkey(), [Pubkey.new_unique()]),
+            closed: _table_data(WALLET.pubkey(), [], deactivation_slot=7),
+        })
+        registry = tmp_path / "tables.json"
+        cache = LookupTableCache(network, registry_path=str(registry))
+        cache.remember(str(WALLET.pubkey()), [live, closed, str(Pubkey.new_unique())])
+
+        tables = cache.tables_for(str(WALLET.pubkey()))
+        cache.tables_for(str(WALLET.pubkey()))
+
+        assert [t.address for t in tables] == [live]
+        assert network.requests == 4  # the missing table is re-read; the others are cached
+        reopened = LookupTableCache(network, registry_path=str(registry))
+        assert len(reopened.known_tables(str(WALLET.pubkey()))) == 3
+
+    def test_pending_tables_registered_only_once_created(self, tmp_path):
+        landed, waiting, lost = (str(Pubkey.new_unique()) for _ in range(3))
+        network = FakeNetwork({}, slot=5000)
+        cache = LookupTableCache(network, registry_path=str(tmp_path / "tables.json"))
+        cache.remember_pending(str(WALLET.pubkey()), {landed: 4990, waiting: 4990,
+                                                      lost: 5000 - SLOT_HASHES_MAX_ENTRIES - 1})
+
+        assert cache.tables_for(str(WALLET.pubkey())) == []
+        assert set(cache.pending_tables(str(WALLET.pubkey()))) == {landed, waiting}
+
+        network.accounts[landed] = _table_data(WALLET.pubkey(), [Pubkey.new_unique()])
+        tables = cache.tables_for(str(WALLET.pubkey()))
+
+        assert [t.address for t in tables] == [landed]
+        assert cache.known_tables(str(WALLET.pubkey())) == [landed]
+        assert list(cache.pending_tables(str(WALLET.pubkey()))) == [waiting]
+
+    def test_reads_list_registry(self, tmp_path):
+        table = str(Pubkey.new_unique())
+        registry = tmp_path / "tables.json"
+        registry.write_text(json.dumps({str(WALLET.pubkey()): [table]}))
+
+        cache = LookupTableCache(FakeNetwork({}), registry_path=str(registry))
+
+        assert cache.known_tables(str(WALLET.pubkey())) == [table]
+        assert cache.pending_tables(str(WALLET.pubkey())) == {}
@@ -0,0 +1,172 @@
+"""
+Tests for the async Solana JSON-RPC transport.
+
+Uses an in-process httpx MockTransport that answers single and batch
+requests, so no network access is needed.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from src.network import AsyncSolanaNetwork, MAX_SIGNATURE_STATUSES, run_blocking
+
+
+class StubRpc:
+    """Minimal JSON-RPC responder that records every HTTP request."""
+
+    def __init__(self, balances=None, statuses=None, batching=True):
+        self.balances = balances or {}
+        self.statuses = statuses or {}
+        self.batching = batching
+        self.http_requests = []
+
+    def _answer(self, call):
+        method, params = call["method"], call["params"]
+        if method == "getBalance":
+            if params[0] not in self.balances:
+                return {"jsonrpc": "2.0", "id": call["id"],
+                        "error": {"code": -32602, "message": "Invalid param"}}
+            result = {"context": {"slot": 1}, "value": self.balances[params[0]]}
+        elif method == "getSignatureStatuses":
+            result = {"context": {"slot": 1},
+                      "value": [self.statuses.get(sig) for sig in params[0]]}
+        elif method == "getLatestBlockhash":
+            result = {"context": {"slot": 1},
+                      "value": {"blockhash": "hash1", "lastValidBlockHeight": 150}}
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"],
+                    "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.http_requests.append(body)
+        if isinstance(body, list):
+            if not self.batching:
+                return httpx.Response(200, json={
+                    "jsonrpc": "2.0", "id": None,
+                    "error": {"code": -32600, "message": "Batch requests disabled"}})
+            # Answer out of order to make sure responses are matched by id
+            return httpx.Response(200, json=[self._answer(c) for c in reversed(body)])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _network(stub, **kwargs):
+    return AsyncSolanaNetwork(
+        rpc_url="http://rpc.test", transport=httpx.MockTransport(stub), **kwargs
+    )
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncTransport:
+    def test_single_request(self):
+        stub = StubRpc(balances={"A": 2_000_000_000})
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_balance("A")
+
+        assert _run(go()) == 2.0
+        assert isinstance(stub.http_requests[0], dict)
+
+    def test_request_ids_are_unique(self):
+        stub = StubRpc()
+
+        async def go():
+            async with _network(stub) as net:
+                await net.get_latest_blockhash()
+                await net.get_latest_blockhash()
+                await net.get_balances(["A", "B", "C"])
+
+        _run(go())
+        ids = [stub.http_requests[0]["id"], stub.http_requests[1]["id"]]
+        ids += [call["id"] for call in stub.http_requests[2]]
+        assert len(ids) == len(set(ids)) == 5
+
+
+class TestBatching:
+    def test_get_balances_single_round_trip(self):
+        keys = [f"Vault{i}" for i in range(50)]
+        stub = StubRpc(balances={k: i * 1_000_000_000 for i, k in enumerate(keys)})
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_balances(keys)
+
+        balances = _run(go())
+        assert len(stub.http_requests) == 1
+        assert balances == {k: float(i) for i, k in enumerate(keys)}
+
+    def test_get_balances_splits_by_batch_size(self):
+        keys = [f"Vault{i}" for i in range(25)]
+        stub = StubRpc(balances={k: 0 for k in keys})
+
+        async def go():
+            async with _network(stub, max_batch_size=10) as net:
+                return await net.get_balances(keys)
+
+        balances = _run(go())
+        assert [len(b) for b in stub.http_requests] == [10, 10, 5]
+        assert set(balances) == set(keys)
+
+    def test_failed_lookup_is_none(self):
+        stub = StubRpc(balances={"A": 5})
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_balances(["A", "Missing"])
+
+        assert _run(go()) == {"A": 5 / 1_000_000_000, "Missing": None}
+
+    def test_batching_disabled_node(self):
+        stub = StubRpc(balances={"A": 5}, batching=False)
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_balances(["A", "B"])
+
+        assert _run(go()) == {"A": None, "B": None}
+
+    def test_signature_statuses_grouped(self):
+        sigs = [f"sig{i}" for i in range(MAX_SIGNATURE_STATUSES + 10)]
+        confirmed = {"confirmationStatus": "confirmed", "err": None}
+        stub = StubRpc(statuses={"sig0": confirmed, sigs[-1]: confirmed})
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_signature_statuses(sigs)
+
+        statuses = _run(go())
+        assert len(stub.http_requests) == 1
+        batch = stub.http_requests[0]
+        assert [len(call["params"][0]) for call in batch] == [MAX_SIGNATURE_STATUSES, 10]
+        assert statuses["sig0"] == confirmed
+        assert statuses[sigs[-1]] == confirmed
+        assert statuses["sig1"] is None
+
+    def test_empty_input(self):
+        stub = StubRpc()
+
+        async def go():
+            async with _network(stub) as net:
+                return await net.get_balances([])
+
+        assert _run(go()) == {}
+        assert stub.http_requests == []
+
+
+class TestRunBlocking:
+    def test_outside_loop(self):
+        assert run_blocking(lambda: asyncio.sleep(0, result=7)) == 7
+
+    def test_inside_running_loop(self):
+        async def caller():
+            # asyncio.run() would raise here; run_blocking hands off to a worker thread
+            return run_blocking(lambda: asyncio.sleep(0, result=7))
+
+        assert _run(caller()) == 7
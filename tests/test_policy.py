@@ -5,7 +5,19 @@ Tests individual checks, mode-specific evaluation,
 replay protection, and destination allowlists.
 """
 
+import base64
+import struct
+
 import pytest
+from solders.compute_budget import set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
 from src.privacy.policy import (
     PolicyCheck,
     PolicyCheckResult,
@@ -21,10 +33,28 @@ from src.zk.types import (
     TransactionMode,
     TransferEnvelope,
 )
+from src.token_transfer import TOKEN_PROGRAM_ID
+from src.wire_inspector import TOKEN_2022_PROGRAM
+
+
+SENDER_PK = str(Pubkey.new_unique())
+RECIP_PK = str(Pubkey.new_unique())
+ALLOWED_PK = str(Pubkey.new_unique())
+
 
+def _transfer_b64(sender, recipients):
+    instructions = [transfer(TransferParams(from_pubkey=sender, to_pubkey=to, lamports=lamports))
+                    for to, lamports in recipients]
+    message = Message.new_with_blockhash(instructions, sender, Hash.new_unique())
+    return base64.b64encode(bytes(Transaction.new_unsigned(message))).decode()
 
-def _make_ctx(mode=TransactionMode.PUBLIC, nonce="nonce1", from_pk="Sender11", to_pk="Recip11",
-              amount=1_000_000, fee=5000, blockhash="hash1", tx_b64="dHgx"):
+
+def _make_ctx(mode=TransactionMode.PUBLIC, nonce="nonce1", from_pk=SENDER_PK, to_pk=RECIP_PK,
+              amount=1_000_000, fee=5000, blockhash="hash1", tx_b64=None):
+    if tx_b64 is None:
+        # Unsigned bytes that do exactly what the context declares
+        tx_b64 = _transfer_b64(Pubkey.from_string(from_pk or SENDER_PK),
+                               [(Pubkey.from_string(to_pk or RECIP_PK), amount)])
     return TransactionContext(
         unsigned_tx_b64=tx_b64,
         from_pubkey=from_pk,
@@ -41,9 +71,10 @@ def _make_public_envelope(**overrides) -> TransferEnvelope:
     ctx_kwargs = {
         "mode": TransactionMode.PUBLIC,
         "nonce": overrides.pop("nonce", "uniquenonce123"),
-        "from_pk": overrides.pop("from_pk", "SenderPubkey1111"),
-        "to_pk": overrides.pop("to_pk", "RecipPubkey1111"),
+        "from_pk": overrides.pop("from_pk", SENDER_PK),
+        "to_pk": overrides.pop("to_pk", RECIP_PK),
         "amount": overrides.pop("amount", 1_000_000),
+        "tx_b64": overrides.pop("tx_b64", None),
     }
     ctx = _make_ctx(**ctx_kwargs)
     return TransferEnvelope(
@@ -60,8 +91,8 @@ def _make_private_envelope(binding="abcdef12345", **overrides) -> TransferEnvelo
     ctx_kwargs = {
         "mode": TransactionMode.PRIVATE,
         "nonce": overrides.pop("nonce", "uniquenonce456"),
-        "from_pk": overrides.pop("from_pk", "SenderPubkey1111"),
-        "to_pk": overrides.pop("to_pk", "RecipPubkey1111"),
+        "from_pk": overrides.pop("from_pk", SENDER_PK),
+        "to_pk": overrides.pop("to_pk", RECIP_PK),
         "amount": overrides.pop("amount", 1_000_000),
     }
     ctx = _make_ctx(**ctx_kwargs)
@@ -192,28 +223,141 @@ class TestDestinationAllowlist:
     def test_allowlist_enforced(self):
         engine = SigningPolicyEngine(
             require_destination_allowlist=True,
-            allowed_destinations={"AllowedAddr1111"},
+            allowed_destinations={ALLOWED_PK},
         )
-        env = _make_public_envelope(to_pk="AllowedAddr1111")
+        env = _make_public_envelope(to_pk=ALLOWED_PK)
         result = engine.evaluate(env)
         assert result.approved is True
 
     def test_allowlist_reject_unknown(self):
         engine = SigningPolicyEngine(
             require_destination_allowlist=True,
-            allowed_destinations={"AllowedAddr1111"},
+            allowed_destinations={ALLOWED_PK},
         )
-        env = _make_public_envelope(to_pk="UnknownAddr1111")
+        env = _make_public_envelope(to_pk=str(Pubkey.new_unique()))
         result = engine.evaluate(env)
         assert result.approved is False
 
     def test_allowlist_not_enforced(self):
         engine = SigningPolicyEngine(require_destination_allowlist=False)
-        env = _make_public_envelope(to_pk="AnyAddr1111")
+        env = _make_public_envelope(to_pk=str(Pubkey.new_unique()))
         result = engine.evaluate(env)
         assert result.approved is True
 
 
+# ── Decoded transaction contents ──────────────
+
+def _token_ix(program_id, tag, data, accounts):
+    return Instruction(program_id, bytes([tag]) + data,
+                       [AccountMeta(account, signer, True) for account, signer in accounts])
+
+
+class TestWireContents:
+    SENDER = Keypair().pubkey()
+    RECIPIENT = Pubkey.new_unique()
+
+    def _evaluate_b64(self, engine, tx_b64, amount=1_000_000):
+        env = _make_public_envelope(from_pk=str(self.SENDER), to_pk=str(self.RECIPIENT), amount=amount,
+                                    tx_b64=tx_b64)
+        result = engine.evaluate(env)
+        return result, next(c for c in result.checks if c.name == "wire_contents")
+
+    def _evaluate(self, engine, recipients, amount=1_000_000, extra=()):
+        instructions = [transfer(TransferParams(from_pubkey=self.SENDER, to_pubkey=to, lamports=lamports))
+                        for to, lamports in recipients] + list(extra)
+        message = Message.new_with_blockhash(instructions, self.SENDER, Hash.new_unique())
+        tx_b64 = base64.b64encode(bytes(Transaction.new_unsigned(message))).decode()
+        return self._evaluate_b64(engine, tx_b64, amount)
+
+    def test_matching_transaction(self):
+        result, check = self._evaluate(SigningPolicyEngine(), [(self.RECIPIENT, 1_000_000)])
+        assert result.approved is True
+        assert check.result == PolicyCheckResult.PASS
+
+    def test_compute_budget_allowed(self):
+        result, check = self._evaluate(SigningPolicyEngine(), [(self.RECIPIENT, 1_000_000)],
+                                       extra=[set_compute_unit_price(1_000)])
+        assert check.result == PolicyCheckResult.PASS
+
+    @pytest.mark.parametrize("tx_b64", ["dHgx", "not base64!", ""])
+    def test_reject_undecodable_bytes(self, tx_b64):
+        result, check = self._evaluate_b64(SigningPolicyEngine(), tx_b64)
+        assert result.approved is False
+        assert check.result == PolicyCheckResult.FAIL
+        assert "not decodable" in check.detail
+
+    def test_reject_missing_declared_transfer(self):
+        result, check = self._evaluate(SigningPolicyEngine(), [], extra=[set_compute_unit_price(1)])
+        assert result.approved is False
+        assert "sends 0 lamports" in check.detail
+
+    def test_reject_amount_mismatch(self):
+        result, check = self._evaluate(SigningPolicyEngine(), [(self.RECIPIENT, 9_000_000)])
+        assert result.approved is False
+        assert check.result == PolicyCheckResult.FAIL
+
+    def test_reject_hidden_destination(self):
+        engine = SigningPolicyEngine(require_destination_allowlist=True,
+                                     allowed_destinations={str(self.RECIPIENT)})
+        result, check = self._evaluate(engine, [(self.RECIPIENT, 1_000_000), (Pubkey.new_unique(), 5)])
+        assert result.approved is False
+        assert "allowlist" in check.detail
+
+    def test_reject_real_total_over_limit(self):
+        engine = SigningPolicyEngine(max_transfer_lamports=1_500_000)
+        result, check = self._evaluate(engine, [(self.RECIPIENT, 1_000_000), (self.RECIPIENT, 1_000_000)],
+                                       amount=2_000_000)
+        assert check.result == PolicyCheckResult.FAIL
+        assert "over limit" in check.detail
+
+    @pytest.mark.parametrize("program_id", [TOKEN_PROGRAM_ID, Pubkey.from_string(TOKEN_2022_PROGRAM)])
+    @pytest.mark.parametrize("kind, tag, data, roles", [
+        ("transfer", 3, struct.pack("<Q", 10 ** 9), ("source", "dest", "owner")),
+        ("transferChecked", 12, struct.pack("<QB", 10 ** 9, 6), ("source", "mint", "dest", "owner")),
+        ("approve", 4, struct.pack("<Q", 2 ** 64 - 1), ("source", "dest", "owner")),
+        ("closeAccount", 9, b"", ("source", "dest", "owner")),
+    ])
+    def test_reject_undeclared_token_instruction(self, program_id, kind, tag, data, roles):
+        accounts = [(self.SENDER, True) if role == "owner" else (Pubkey.new_unique(), False) for role in roles]
+        ix = _token_ix(program_id, tag, data, accounts)
+
+        # The declared SOL transfer is present and correct; the token instruction rides along
+        result, check = self._evaluate(SigningPolicyEngine(), [(self.RECIPIENT, 1_000_000)], extra=[ix])
+
+        assert result.approved is False
+        assert check.result == PolicyCheckResult.FAIL
+        assert f" {kind}" in check.detail and "does not declare" in check.detail
+
+    def test_reject_unknown_program(self):
+        program = Pubkey.new_unique()
+        ix = Instruction(program, b"\x01drain", [AccountMeta(self.SENDER, True, True)])
+
+        result, check = self._evaluate(SigningPolicyEngine(), [(self.RECIPIENT, 1_000_000)], extra=[ix])
+
+        assert result.approved is False
+        assert str(program)[:8] in check.detail
+
+
+    def test_cli_transfer_bytes_pass(self):
+        from coldstar_cli import blockhash_of, build_unsigned_transfer_b64
+
+        blockhash = str(Hash.new_unique())
+        tx_b64 = build_unsigned_transfer_b64(SENDER_PK, RECIP_PK, 1_000_000, blockhash)
+        assert blockhash_of(tx_b64) == blockhash
+
+        env = _make_public_envelope(tx_b64=tx_b64)
+        result = SigningPolicyEngine().evaluate(env)
+        check = next(c for c in result.checks if c.name == "wire_contents")
+        assert check.result == PolicyCheckResult.PASS
+
+    def test_cli_requires_unsigned_tx(self):
+        from coldstar_cli import build_parser
+
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["tx", "create", "--mode", "public", "--from-pubkey", SENDER_PK,
+                                       "--to-pubkey", RECIP_PK, "--amount-lamports", "1"])
+
+
 # ── Display ───────────────────────────────────
 
 class TestPolicyDisplay:
@@ -0,0 +1,171 @@
+"""
+Tests for the getMultipleAccounts portfolio fetcher.
+
+Account data is built locally in the SPL layouts and served by an httpx
+MockTransport, so no network access is needed.
+"""
+
+import asyncio
+import base64
+import json
+import struct
+
+import httpx
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from src.network import AsyncSolanaNetwork, MAX_MULTIPLE_ACCOUNTS
+from src.portfolio import (
+    MINT_SIZE,
+    PortfolioSnapshot,
+    TokenHolding,
+    VaultHoldings,
+    decode_mint_decimals,
+    decode_token_account,
+    fetch_portfolio,
+)
+from src.pyth_integration import PythPriceClient
+from src.token_transfer import KNOWN_TOKENS, TOKEN_PROGRAM_ID, get_associated_token_address
+
+USDC = KNOWN_TOKENS["USDC"].mint
+
+
+def _token_account_data(mint, owner, amount, state=1):
+    data = bytearray(165)
+    data[0:32] = bytes(Pubkey.from_string(mint))
+    data[32:64] = bytes(Pubkey.from_string(owner))
+    struct.pack_into("<Q", data, 64, amount)
+    data[108] = state
+    return bytes(data)
+
+
+def _mint_data(decimals):
+    data = bytearray(MINT_SIZE)
+    data[44] = decimals
+    data[45] = 1
+    return bytes(data)
+
+
+def _account(data=b"", lamports=0, owner="11111111111111111111111111111111"):
+    return {"data": [base64.b64encode(data).decode(), "base64"], "lamports": lamports,
+            "owner": owner, "executable": False, "rentEpoch": 0, "space": len(data)}
+
+
+class StubRpc:
+    """Answers getMultipleAccounts from a dict of accounts, recording each call."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.http_requests = []
+        self.calls = []
+
+    def _answer(self, call):
+        keys = call["params"][0]
+        self.calls.append(keys)
+        return {"jsonrpc": "2.0", "id": call["id"],
+                "result": {"context": {"slot": 1}, "value": [self.accounts.get(k) for k in keys]}}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.http_requests.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _fetch(stub, vaults, mints=None):
+    async def run():
+        async with AsyncSolanaNetwork(rpc_url="http://rpc.test",
+                                      transport=httpx.MockTransport(stub)) as network:
+            return await fetch_portfolio(network, vaults, mints)
+    return asyncio.run(run())
+
+
+def _ata(vault, mint):
+    return str(get_associated_token_address(Pubkey.from_string(vault), Pubkey.from_string(mint)))
+
+
+class TestDecoding:
+    def test_token_account(self):
+        owner = str(Keypair().pubkey())
+        decoded = decode_token_account(_token_account_data(USDC, owner, 1_500_000))
+        assert (decoded.mint, decoded.owner, decoded.amount) == (USDC, owner, 1_500_000)
+        assert decode_token_account(_token_account_data(USDC, owner, 1, state=0)) is None
+        assert decode_token_account(b"\x00" * 10) is None
+
+    def test_mint_decimals(self):
+        assert decode_mint_decimals(_mint_data(9)) == 9
+        assert decode_mint_decimals(b"\x00" * MINT_SIZE) is None
+
+    def test_associated_token_address_is_off_curve(self):
+        assert not Pubkey.from_string(_ata(str(Keypair().pubkey()), USDC)).is_on_curve()
+
+
+class TestFetchPortfolio:
+    def test_groups_keys_into_one_batch(self):
+        vaults = [str(Keypair().pubkey()) for _ in range(60)]
+        accounts = {v: _account(lamports=2_000_000_000) for v in vaults}
+        accounts[_ata(vaults[0], USDC)] = _account(
+            _token_account_data(USDC, vaults[0], 25_000_000), owner=str(TOKEN_PROGRAM_ID))
+        stub = StubRpc(accounts)
+
+        snapshot = _fetch(stub, vaults, mints=[USDC])
+
+        # 60 vaults + 60 token accounts -> two getMultipleAccounts calls, one HTTP request
+        assert [len(keys) for keys in stub.calls] == [MAX_MULTIPLE_ACCOUNTS, 20]
+        assert len(stub.http_requests) == 1
+        assert snapshot.complete
+        assert snapshot.vaults[0].tokens[0].amount == 25.0
+        assert snapshot.vaults[1].tokens == []
+        assert snapshot.totals() == {"SOL": 120.0, "USDC": 25.0}
+
+    def test_unknown_mint_decimals_read_from_chain(self):
+        vault = str(Keypair().pubkey())
+        mint = str(Keypair().pubkey())
+        stub = StubRpc({
+            vault: _account(lamports=1),
+            mint: _account(_mint_data(2), owner=str(TOKEN_PROGRAM_ID)),
+            _ata(vault, mint): _account(_token_account_data(mint, vault, 1234, state=2),
+                                        owner=str(TOKEN_PROGRAM_ID)),
+        })
+
+        holding, = _fetch(stub, [vault], mints=[mint]).vaults[0].tokens
+
+        assert (holding.decimals, holding.amount, holding.frozen) == (2, 12.34, True)
+
+    def test_foreign_owned_account_ignored(self):
+        vault = str(Keypair().pubkey())
+        stub = StubRpc({
+            vault: _account(lamports=1),
+            _ata(vault, USDC): _account(_token_account_data(USDC, vault, 5)),
+        })
+        assert _fetch(stub, [vault], mints=[USDC]).vaults[0].tokens == []
+
+    def test_failed_lookup_reported(self):
+        vault = str(Keypair().pubkey())
+
+        def failing(request):
+            return httpx.Response(200, json=[{"jsonrpc": "2.0", "id": c["id"],
+                                              "error": {"code": -32005, "message": "busy"}}
+                                             for c in json.loads(request.content)])
+
+        snapshot = _fetch(failing, [vault], mints=[USDC])
+        assert not snapshot.complete
+        assert vault in snapshot.failed
+
+
+class TestPortfolioValue:
+    def test_values_snapshot_totals(self, monkeypatch):
+        client = PythPriceClient()
+        monkeypatch.setattr(client, "get_multiple_prices", lambda symbols: {
+            "SOL/USD": {"price": 100.0}, "USDC/USD": {"price": 1.0}})
+        snapshot = PortfolioSnapshot(vaults=[VaultHoldings(
+            address="vault", lamports=2_000_000_000,
+            tokens=[TokenHolding(mint=USDC, symbol="USDC", decimals=6,
+                                 raw_amount=50_000_000, token_account="ata")],
+        )], fetched_at=0.0)
+
+        valuation = client.get_portfolio_value(snapshot)
+
+        assert valuation["total_usd"] == 250.0
+        assert valuation["breakdown"]["SOL"]["value_usd"] == 200.0
@@ -0,0 +1,116 @@
+"""
+Tests for batched preflight simulation of unsigned transactions.
+"""
+
+import asyncio
+import base64
+import json
+
+import httpx
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from src.batch_builder import PackedTransaction, iter_bundle_transactions, write_unsigned_bundle
+from src.network import AsyncSolanaNetwork
+from src.preflight import MAX_LOG_LINES, known_failing, preflight_path
+from src.priority_fees import compute_unit_limit
+
+PAYER = Keypair().pubkey()
+
+
+def _unsigned_tx(lamports):
+    message = Message.new_with_blockhash(
+        [transfer(TransferParams(from_pubkey=PAYER, to_pubkey=Keypair().pubkey(), lamports=lamports))],
+        PAYER, Hash.new_unique(),
+    )
+    return bytes(Transaction.new_unsigned(message))
+
+
+class StubSimulator:
+    """Fails any transfer of more than 1000 lamports; counts HTTP requests."""
+
+    def __init__(self):
+        self.http_requests = 0
+        self.options = []
+
+    def _answer(self, call):
+        params = call["params"]
+        self.options.append(params[1])
+        tx = Transaction.from_bytes(base64.b64decode(params[0]))
+        lamports = int.from_bytes(tx.message.instructions[0].data[4:12], "little")
+        if lamports > 1000:
+            value = {"err": {"InstructionError": [0, {"Custom": 1}]}, "unitsConsumed": 150,
+                     "logs": [f"log {i}" for i in range(80)]}
+        else:
+            value = {"err": None, "unitsConsumed": 150, "logs": ["Program 111 success"]}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": {"context": {"slot": 1}, "value": value}}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.http_requests += 1
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _preflight(stub, path):
+    async def run():
+        async with AsyncSolanaNetwork(rpc_url="http://rpc.test",
+                                      transport=httpx.MockTransport(stub)) as network:
+            return await preflight_path(network, str(path))
+    return asyncio.run(run())
+
+
+class TestPreflight:
+    def test_bundle_annotated_in_place(self, tmp_path):
+        bundle = tmp_path / "unsigned_bundle_1.jsonl"
+        amounts = [10, 5000, 20, 30]
+        write_unsigned_bundle(str(bundle), str(PAYER), "hash", [
+            PackedTransaction(tx_bytes=_unsigned_tx(a), recipients=[], fee_lamports=0) for a in amounts
+        ])
+        stub = StubSimulator()
+
+        summary = _preflight(stub, bundle)
+
+        assert (summary.simulated, summary.failed, summary.files) == (4, 1, 1)
+        assert stub.http_requests == 1
+        assert all(o["sigVerify"] is False and o["replaceRecentBlockhash"] for o in stub.options)
+
+        entries = list(iter_bundle_transactions(str(bundle)))
+        assert [known_failing(e) for e in entries] == [False, True, False, False]
+        assert entries[0]["simulation"]["units_consumed"] == 150
+        assert entries[0]["simulation"]["compute_unit_limit"] == compute_unit_limit(150)
+        assert len(entries[1]["simulation"]["logs"]) == MAX_LOG_LINES
+        assert entries[1]["simulation"]["logs"][-1] == "log 79"
+
+    def test_directory_with_single_files(self, tmp_path):
+        for name, lamports in (("unsigned_tx_1.json", 5), ("unsigned_tx_2.json", 9999)):
+            (tmp_path / name).write_text(json.dumps({
+                "type": "unsigned_transaction", "version": "1.0",
+                "data": base64.b64encode(_unsigned_tx(lamports)).decode()}))
+        (tmp_path / "unsigned_broken.json").write_text("{")
+
+        summary = _preflight(StubSimulator(), tmp_path)
+
+        assert (summary.simulated, summary.failed, summary.files) == (2, 1, 2)
+        ok = json.loads((tmp_path / "unsigned_tx_1.json").read_text())
+        bad = json.loads((tmp_path / "unsigned_tx_2.json").read_text())
+        assert not known_failing(ok) and ok["simulation"]["ok"]
+        assert known_failing(bad)
+        assert bad["simulation"]["err"] == {"InstructionError": [0, {"Custom": 1}]}
+
+    def test_rpc_failure_leaves_records_unannotated(self, tmp_path):
+        path = tmp_path / "unsigned_tx.json"
+        path.write_text(json.dumps({"type": "unsigned_transaction",
+                                    "data": base64.b64encode(_unsigned_tx(1)).decode()}))
+
+        def failing(request):
+            return httpx.Response(503)
+
+        summary = _preflight(failing, path)
+
+        assert (summary.simulated, summary.unavailable) == (0, 1)
+        assert "simulation" not in json.loads(path.read_text())
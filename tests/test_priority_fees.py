@@ -0,0 +1,135 @@
+"""
+Tests for the priority fee oracle and compute-budget aware token builder.
+"""
+
+import struct
+
+import pytest
+from solders.compute_budget import ID as COMPUTE_BUDGET_PROGRAM_ID
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.transaction import Transaction
+
+from src.blockhash_cache import SLOT_DURATION_SECONDS
+from src.priority_fees import (
+    MIN_COMPUTE_UNIT_HEADROOM,
+    PriorityFeeOracle,
+    fee_percentiles,
+)
+from src.token_transfer import KNOWN_TOKENS, TokenTransferManager
+
+BLOCKHASH = str(Hash.new_unique())
+
+
+class FakeNetwork:
+    """Stands in for SolanaNetwork; counts fee lookups and simulations."""
+
+    def __init__(self, fees=None, units=6_000, online=True):
+        self.fees = fees if fees is not None else list(range(0, 10_000, 100))
+        self.units = units
+        self.online = online
+        self.fee_calls = []
+        self.simulations = []
+
+    def get_recent_prioritization_fees(self, accounts):
+        if not self.online:
+            return None
+        self.fee_calls.append(accounts)
+        return [{"slot": i, "prioritizationFee": fee} for i, fee in enumerate(self.fees)]
+
+    def simulate_transaction(self, tx_base64):
+        if not self.online:
+            return None
+        self.simulations.append(tx_base64)
+        return {"err": None, "logs": [], "unitsConsumed": self.units}
+
+
+def _build(oracle, priority, create_dest_ata=False, amount=1.5):
+    manager = TokenTransferManager(fee_oracle=oracle)
+    tx_bytes = manager.create_token_transfer_transaction(
+        str(Keypair().pubkey()), str(Keypair().pubkey()), KNOWN_TOKENS["USDC"].mint,
+        amount, 6, recent_blockhash=BLOCKHASH, create_dest_ata=create_dest_ata, priority=priority,
+    )
+    return Transaction.from_bytes(tx_bytes).message
+
+
+def _budget(message):
+    """(limit, price) from the compute-budget instructions of a message"""
+    limit = price = None
+    for ix in message.instructions:
+        if message.account_keys[ix.program_id_index] != COMPUTE_BUDGET_PROGRAM_ID:
+            continue
+        if ix.data[0] == 2:
+            (limit,) = struct.unpack("<I", ix.data[1:5])
+        elif ix.data[0] == 3:
+            (price,) = struct.unpack("<Q", ix.data[1:9])
+    return limit, price
+
+
+class TestFeePercentiles:
+    def test_nearest_rank(self):
+        assert fee_percentiles(list(range(1, 101))) == {50: 50, 75: 75, 90: 90}
+
+    def test_no_samples(self):
+        assert fee_percentiles([]) == {50: 0, 75: 0, 90: 0}
+
+
+class TestPriorityFeeOracle:
+    def test_fees_cached_for_a_few_slots(self):
+        network = FakeNetwork()
+        oracle = PriorityFeeOracle(network, cache_slots=10)
+
+        assert oracle.get_priority_fee(["a", "b"], "p75") == 7_400
+        assert oracle.get_priority_fee(["b", "a"], "p90") == 8_900
+        assert len(network.fee_calls) == 1
+
+        sample = oracle._fees[frozenset(["a", "b"])]
+        sample.fetched_at -= 11 * SLOT_DURATION_SECONDS
+        oracle.get_priority_fee(["a", "b"], "p50")
+        assert len(network.fee_calls) == 2
+
+    def test_unknown_level_rejected(self):
+        with pytest.raises(ValueError):
+            PriorityFeeOracle(FakeNetwork()).get_priority_fee(["a"], "p99")
+
+
+class TestComputeBudgetBuilder:
+    def test_prepends_limit_and_price(self):
+        network = FakeNetwork(units=6_000)
+        message = _build(PriorityFeeOracle(network), "p90")
+
+        assert message.account_keys[message.instructions[0].program_id_index] == COMPUTE_BUDGET_PROGRAM_ID
+        assert _budget(message) == (6_000 + MIN_COMPUTE_UNIT_HEADROOM, 8_900)
+        # Fee lookup covers the payer and both token accounts
+        assert len(network.fee_calls[0]) == 3
+
+    def test_simulation_cached_per_shape(self):
+        network = FakeNetwork(units=40_000)
+        oracle = PriorityFeeOracle(network)
+
+        _build(oracle, "p50")
+        _build(oracle, "p75")
+        assert len(network.simulations) == 1
+        assert _budget(_build(oracle, "p50"))[0] == 44_000
+
+        _build(oracle, "p50", create_dest_ata=True)
+        assert len(network.simulations) == 2
+
+    def test_amount_does_not_change_shape(self):
+        network = FakeNetwork(units=40_000)
+        oracle = PriorityFeeOracle(network)
+
+        _build(oracle, "p50", amount=1.5)
+        _build(oracle, "p50", amount=250.75)
+        assert len(network.simulations) == 1
+
+    def test_no_priority_is_unchanged(self):
+        network = FakeNetwork()
+        message = _build(PriorityFeeOracle(network), None)
+        assert _budget(message) == (None, None)
+        assert network.fee_calls == [] and network.simulations == []
+
+    def test_offline_builds_without_budget(self):
+        message = _build(PriorityFeeOracle(FakeNetwork(online=False)), "p75")
+        assert _budget(message) == (None, None)
+        assert len(message.instructions) == 1
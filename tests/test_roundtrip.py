@@ -7,8 +7,15 @@ Simulates the full online → USB → offline flow:
   3. Offline signer: deserialize, verify proofs + policy, approve/reject
 """
 
+import base64
 import json
+
 import pytest
+from solders.hash import Hash
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
 
 from src.zk.engine import ZkProofEngine
 from src.zk.types import (
@@ -27,11 +34,18 @@ def secret_key_hex():
     return "ab" * 32
 
 
+SENDER = Pubkey.new_unique()
+RECIPIENT = Pubkey.new_unique()
+
+
 def _make_ctx(mode, nonce, amount=1_000_000):
+    # The offline policy decodes these bytes, so they must really be the declared transfer
+    ix = transfer(TransferParams(from_pubkey=SENDER, to_pubkey=RECIPIENT, lamports=amount))
+    message = Message.new_with_blockhash([ix], SENDER, Hash.new_unique())
     return TransactionContext(
-        unsigned_tx_b64="dHgx",
-        from_pubkey="SenderPubkey11111111111111111111111111111111",
-        to_pubkey="RecipPubkey11111111111111111111111111111111",
+        unsigned_tx_b64=base64.b64encode(bytes(Transaction.new_unsigned(message))).decode(),
+        from_pubkey=str(SENDER),
+        to_pubkey=str(RECIPIENT),
         amount_lamports=amount,
         fee_lamports=5000,
         recent_blockhash="blockhash123",
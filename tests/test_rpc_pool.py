@@ -0,0 +1,188 @@
+"""
+Tests for the RPC endpoint pool.
+
+Each endpoint is a real local HTTP server on 127.0.0.1 with configurable
+latency and failure injection, so routing, hedging and failover are
+exercised over actual sockets.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.network import AsyncSolanaNetwork, SolanaNetwork
+from src.rpc_pool import AsyncRpcPool, Endpoint, RpcPool, is_write
+
+
+class StubNode:
+    """JSON-RPC node answering getSlot/getBalance/sendTransaction with a delay."""
+
+    def __init__(self, name, delay=0.0, status=200):
+        self.name = name
+        self.delay = delay
+        self.status = status
+        self.methods = []
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                node.methods.append(body["method"])
+                time.sleep(node.delay)
+                if node.status != 200:
+                    self.send_response(node.status)
+                    self.end_headers()
+                    return
+                result = {"sendTransaction": "sig-" + node.name,
+                          "getBalance": {"context": {"slot": 1}, "value": 2_000_000_000}}
+                data = json.dumps({"jsonrpc": "2.0", "id": body["id"],
+                                   "result": result.get(body["method"], node.name)}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.server.block_on_close = False
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def nodes():
+    started = []
+
+    def start(*specs):
+        for name, delay, *status in specs:
+            started.append(StubNode(name, delay, *status))
+        return started
+
+    yield start
+    for node in started:
+        node.stop()
+
+
+def _call(method="getSlot", params=None):
+    return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+
+
+class TestEndpointScore:
+    def test_errors_penalize_score(self):
+        fast_flaky, slow_steady = Endpoint("a"), Endpoint("b")
+        fast_flaky.record_success(0.01)
+        fast_flaky.record_failure()
+        slow_steady.record_success(0.03)
+        assert fast_flaky.score() > slow_steady.score()
+        assert not fast_flaky.healthy()
+
+    def test_percentile_needs_samples(self):
+        ep = Endpoint("a")
+        for latency in (0.1, 0.1, 0.1, 0.1):
+            ep.record_success(latency)
+        assert ep.latency_percentile(0.9) is None
+        ep.record_success(1.0)
+        assert 0.1 < ep.latency_percentile(0.9) <= 1.0
+
+    def test_write_detection(self):
+        assert is_write(_call("sendTransaction"))
+        assert is_write([_call("getSlot"), _call("eth_sendRawTransaction")])
+        assert not is_write(_call("getBalance"))
+
+
+class TestRpcPool:
+    def test_routes_reads_to_fastest(self, nodes):
+        slow, fast = nodes(("slow", 0.15), ("fast", 0.0))
+        pool = RpcPool([slow.url, fast.url], initial_hedge_delay=5.0)
+        try:
+            # Untried endpoints are probed first, then the faster one wins
+            answers = [pool.post(_call())["result"] for _ in range(6)]
+            assert answers[-3:] == ["fast"] * 3
+            assert pool.stats()[0]["url"] == fast.url
+        finally:
+            pool.close()
+
+    def test_hedges_slow_primary(self, nodes):
+        slow, fast = nodes(("slow", 1.0), ("fast", 0.0))
+        pool = RpcPool([slow.url, fast.url], initial_hedge_delay=0.1)
+        try:
+            started = time.monotonic()
+            assert pool.post(_call())["result"] == "fast"
+            assert time.monotonic() - started < 0.8
+            assert slow.methods == ["getSlot"] and fast.methods == ["getSlot"]
+        finally:
+            pool.close()
+
+    def test_fails_over_and_cools_down(self, nodes):
+        broken, healthy = nodes(("broken", 0.0, 503), ("healthy", 0.0))
+        pool = RpcPool([broken.url, healthy.url])
+        try:
+            assert pool.post(_call())["result"] == "healthy"
+            assert pool.post(_call())["result"] == "healthy"
+            # The broken node is in cooldown and not tried again
+            assert len(broken.methods) == 1
+            assert not pool.stats()[-1]["healthy"]
+        finally:
+            pool.close()
+
+    def test_all_endpoints_down_raises(self, nodes):
+        a, b = nodes(("a", 0.0, 500), ("b", 0.0, 429))
+        pool = RpcPool([a.url, b.url])
+        try:
+            with pytest.raises(Exception):
+                pool.post(_call())
+        finally:
+            pool.close()
+
+    def test_broadcasts_writes(self, nodes):
+        a, b, c = nodes(("a", 0.0), ("b", 0.3), ("c", 0.0, 503))
+        pool = RpcPool([a.url, b.url, c.url])
+        try:
+            started = time.monotonic()
+            assert pool.post(_call("sendTransaction", ["tx"]))["result"].startswith("sig-")
+            assert time.monotonic() - started < 0.25
+            time.sleep(0.4)
+            assert [n.methods for n in (a, b, c)] == [["sendTransaction"]] * 3
+        finally:
+            pool.close()
+
+    def test_solana_network_uses_pool(self, nodes):
+        broken, healthy = nodes(("broken", 0.0, 502), ("healthy", 0.0))
+        network = SolanaNetwork(pool=RpcPool([broken.url, healthy.url]))
+        try:
+            assert network.get_balance("addr") == 2.0
+            assert network.rpc_url == broken.url
+        finally:
+            network.close()
+
+
+class TestAsyncRpcPool:
+    def test_hedge_and_broadcast(self, nodes):
+        slow, fast = nodes(("slow", 1.0), ("fast", 0.0))
+
+        async def run():
+            pool = AsyncRpcPool([slow.url, fast.url], initial_hedge_delay=0.1)
+            async with AsyncSolanaNetwork(pool=pool) as network:
+                started = time.monotonic()
+                balance = await network.get_balance("addr")
+                elapsed = time.monotonic() - started
+                signature = await network.send_transaction("dHg=")
+            return balance, elapsed, signature
+
+        balance, elapsed, signature = asyncio.run(run())
+        assert balance == 2.0
+        assert elapsed < 0.8
+        assert signature == "sig-fast"
+        assert "sendTransaction" in slow.methods
@@ -0,0 +1,185 @@
+"""
+Tests for the local transaction-history ledger.
+
+A stub RPC serves getSignaturesForAddress pages (honoring before/until/limit
+like a real node) and getTransaction bodies from an in-memory chain.
+"""
+
+import asyncio
+import csv
+import io
+import json
+
+import httpx
+
+from src.network import AsyncSolanaNetwork
+from src.tx_history import TransactionLedger
+
+
+class StubChain:
+    """In-memory history for one address; signatures newest first."""
+
+    def __init__(self, count):
+        self.signatures = []
+        self.history_requests = []
+        self.fetched_bodies = []
+        for _ in range(count):
+            self.add()
+
+    def add(self, memo=None, failed=False):
+        n = len(self.signatures)
+        self.signatures.insert(0, {
+            "signature": f"sig{n:05d}", "slot": 100 + n, "blockTime": 1_700_000_000 + n,
+            "err": {"InstructionError": [0, "Custom"]} if failed else None,
+            "memo": memo, "confirmationStatus": "finalized",
+        })
+
+    def _page(self, options):
+        sigs = [s["signature"] for s in self.signatures]
+        start = sigs.index(options["before"]) + 1 if "before" in options else 0
+        stop = sigs.index(options["until"]) if "until" in options else len(sigs)
+        return self.signatures[start:stop][:options["limit"]]
+
+    def _answer(self, call):
+        if call["method"] == "getSignaturesForAddress":
+            self.history_requests.append(call["params"][1])
+            result = self._page(call["params"][1])
+        else:
+            sig = call["params"][0]
+            self.fetched_bodies.append(sig)
+            result = {"slot": 1, "meta": {"fee": 5000, "err": None},
+                      "transaction": {"message": {"accountKeys": [{"pubkey": f"key-of-{sig}"}]}}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(c) for c in body])
+        return httpx.Response(200, json=self._answer(body))
+
+
+def _sync(ledger, chain, **kwargs):
+    async def run():
+        async with AsyncSolanaNetwork(rpc_url="http://rpc.test",
+                                      transport=httpx.MockTransport(chain)) as network:
+            return await ledger.sync(network, **kwargs)
+    return asyncio.run(run())
+
+
+def _ledger(tmp_path):
+    return TransactionLedger("wallet", path=str(tmp_path / "wallet.sqlite"))
+
+
+class TestSync:
+    def test_initial_sync_pages_to_first_transaction(self, tmp_path):
+        chain = StubChain(25)
+        with _ledger(tmp_path) as ledger:
+            result = _sync(ledger, chain, page_size=10)
+
+            assert (result.ok, result.new_signatures, result.backfill_complete) == (True, 25, True)
+            assert [r["signature"] for r in ledger.recent(3)] == ["sig00024", "sig00023", "sig00022"]
+            assert ledger.count() == 25
+            assert result.new_transactions == 25
+
+    def test_incremental_sync_reads_only_new_signatures(self, tmp_path):
+        chain = StubChain(5)
+        with _ledger(tmp_path) as ledger:
+            _sync(ledger, chain)
+            chain.add()
+            chain.add()
+            chain.history_requests.clear()
+            chain.fetched_bodies.clear()
+
+            result = _sync(ledger, chain)
+
+            assert result.new_signatures == 2
+            assert chain.history_requests[0]["until"] == "sig00004"
+            assert sorted(chain.fetched_bodies) == ["sig00005", "sig00006"]
+            assert ledger.recent(1)[0]["signature"] == "sig00006"
+
+    def test_wallet_empty_at_first_sync_picks_up_later_activity(self, tmp_path):
+        chain = StubChain(0)
+        with _ledger(tmp_path) as ledger:
+            first = _sync(ledger, chain, page_size=2)
+            for _ in range(3):
+                chain.add()
+
+            result = _sync(ledger, chain, page_size=2)
+            chain.add()
+            again = _sync(ledger, chain, page_size=2)
+
+            assert (first.new_signatures, first.backfill_complete) == (0, True)
+            assert result.new_signatures == 3 and ledger.count() == 4
+            assert again.new_signatures == 1
+            assert chain.history_requests[-1]["until"] == "sig00002"
+            assert ledger.recent(1)[0]["signature"] == "sig00003"
+
+    def test_backfill_resumes_across_runs(self, tmp_path):
+        chain = StubChain(30)
+        with _ledger(tmp_path) as ledger:
+            first = _sync(ledger, chain, page_size=10, max_backfill_pages=1, fetch_bodies=False)
+            assert (first.new_signatures, first.backfill_complete) == (10, False)
+
+        # Reopen from disk: cursors survive
+        with _ledger(tmp_path) as ledger:
+            chain.history_requests.clear()
+            second = _sync(ledger, chain, page_size=10, fetch_bodies=False)
+
+            # Head check first (nothing new), then backfill from the oldest stored
+            assert chain.history_requests[0]["until"] == "sig00029"
+            assert chain.history_requests[1]["before"] == "sig00020"
+            assert (second.new_signatures, second.backfill_complete) == (20, True)
+            assert ledger.count() == 30
+
+    def test_failed_rpc_keeps_cursor(self, tmp_path):
+        chain = StubChain(3)
+        with _ledger(tmp_path) as ledger:
+            def failing(request):
+                return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1,
+                                                 "error": {"code": -32005, "message": "busy"}})
+            assert not _sync(ledger, failing).ok
+            assert ledger.count() == 0
+            assert _sync(ledger, chain).new_signatures == 3
+
+    def test_bodies_cached_once(self, tmp_path):
+        chain = StubChain(4)
+        with _ledger(tmp_path) as ledger:
+            _sync(ledger, chain)
+            chain.fetched_bodies.clear()
+            _sync(ledger, chain)
+
+            assert chain.fetched_bodies == []
+            assert ledger.get_transaction("sig00002")["meta"]["fee"] == 5000
+
+
+class TestQueries:
+    def _populated(self, tmp_path):
+        chain = StubChain(3)
+        chain.add(memo="rent for march")
+        chain.add(failed=True)
+        ledger = _ledger(tmp_path)
+        _sync(ledger, chain)
+        return ledger
+
+    def test_search(self, tmp_path):
+        with self._populated(tmp_path) as ledger:
+            assert [r["signature"] for r in ledger.search("march")] == ["sig00003"]
+            assert [r["signature"] for r in ledger.search("sig0000")][:2] == ["sig00004", "sig00003"]
+            assert [r["signature"] for r in ledger.search("key-of-sig00001")] == ["sig00001"]
+            assert [r["signature"] for r in ledger.search(failed=True)] == ["sig00004"]
+            assert len(ledger.search(since=1_700_000_003)) == 2
+
+    def test_recent_pagination(self, tmp_path):
+        with self._populated(tmp_path) as ledger:
+            assert [r["signature"] for r in ledger.recent(2, offset=2)] == ["sig00002", "sig00001"]
+
+    def test_export_csv(self, tmp_path):
+        with self._populated(tmp_path) as ledger:
+            out = io.StringIO()
+            assert ledger.export_csv(out) == 5
+
+            rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+            assert rows[0]["status"] == "failed"
+            assert rows[1]["memo"] == "rent for march"
+            assert rows[1]["fee_sol"] == "0.000005000"
+            assert rows[1]["block_time"].startswith("2023-11-14T")
@@ -0,0 +1,126 @@
+"""
+Tests for the wire-format transaction inspector and inbox streaming.
+"""
+
+import base64
+import json
+import struct
+
+import pytest
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message, MessageV0, to_bytes_versioned
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction, VersionedTransaction
+
+from src.batch_builder import PayoutRow, pack_transfer_transactions, write_unsigned_bundle
+from src.durable_nonce import NonceAccount, derive_nonce_address, with_advance_nonce
+from src.lookup_tables import LookupTable
+from src.token_transfer import TOKEN_PROGRAM_ID, get_associated_token_address
+from src.wire_inspector import InboxSummary, WireFormatError, inspect_transaction, iter_inbox
+
+SIGNER = Keypair()
+WALLET = SIGNER.pubkey()
+
+
+def _transfer(to, lamports):
+    return transfer(TransferParams(from_pubkey=WALLET, to_pubkey=to, lamports=lamports))
+
+
+def _legacy(instructions, blockhash=None):
+    message = Message.new_with_blockhash(instructions, WALLET, blockhash or Hash.new_unique())
+    return bytes(Transaction.new_unsigned(message))
+
+
+class TestInspectTransaction:
+    def test_legacy_sol_transfers(self):
+        a, b = Pubkey.new_unique(), Pubkey.new_unique()
+        blockhash = Hash.new_unique()
+
+        tx = inspect_transaction(_legacy([_transfer(a, 10), _transfer(b, 25)], blockhash))
+
+        assert tx.version == "legacy" and not tx.is_signed
+        assert tx.fee_payer == str(WALLET) and tx.recent_blockhash == str(blockhash)
+        assert tx.sol_transfers == [(str(WALLET), str(a), 10), (str(WALLET), str(b), 25)]
+        assert tx.lamports_out() == 35
+        assert tx.nonce_account is None
+
+    def test_compute_budget_and_nonce(self):
+        nonce = NonceAccount(address=derive_nonce_address(str(WALLET), 0), authority=str(WALLET),
+                             nonce=str(Hash.new_unique()), lamports_per_signature=5000)
+        instructions = with_advance_nonce([set_compute_unit_limit(2_000_000), set_compute_unit_price(3_000),
+                                           _transfer(Pubkey.new_unique(), 1)], nonce)
+
+        tx = inspect_transaction(_legacy(instructions, Hash.from_string(nonce.nonce)))
+
+        assert tx.nonce_account == nonce.address
+        assert (tx.compute_unit_limit, tx.compute_unit_price) == (2_000_000, 3_000)
+        assert tx.priority_fee_lamports == 6_000  # 2M CU at 3000 micro-lamports
+
+    def test_token_transfer(self):
+        mint = Pubkey.new_unique()
+        source, dest = get_associated_token_address(WALLET, mint), Pubkey.new_unique()
+        checked = Instruction(TOKEN_PROGRAM_ID, struct.pack("<BQB", 12, 1_500, 6), [
+            AccountMeta(source, False, True), AccountMeta(mint, False, False),
+            AccountMeta(dest, False, True), AccountMeta(WALLET, True, False),
+        ])
+
+        tx = inspect_transaction(_legacy([checked]))
+
+        transfer_, = tx.token_transfers
+        assert (transfer_["source"], transfer_["destination"], transfer_["mint"]) == (str(source), str(dest), str(mint))
+        assert (transfer_["amount"], transfer_["decimals"]) == (1_500, 6)
+
+    def test_v0_resolves_lookup_tables(self):
+        recipients = [Pubkey.new_unique() for _ in range(5)]
+        table = LookupTable(address=str(Pubkey.new_unique()), authority=str(WALLET),
+                            addresses=[str(r) for r in recipients])
+        message = MessageV0.try_compile(WALLET, [_transfer(r, 7) for r in recipients],
+                                        [table.account()], Hash.new_unique())
+        raw = bytes(VersionedTransaction.populate(message, [SIGNER.sign_message(to_bytes_versioned(message))]))
+
+        unresolved = inspect_transaction(raw)
+        resolved = inspect_transaction(raw, {table.address: table.addresses})
+
+        assert resolved.version == 0 and resolved.is_signed
+        assert len(resolved.address_table_lookups[0]["writable"]) == 5
+        assert [d for _, d, _ in resolved.sol_transfers] == [str(r) for r in recipients]
+        assert all(d.startswith(f"{table.address}#") for _, d, _ in unresolved.sol_transfers)
+
+    def test_unknown_program_and_truncation(self):
+        other = Instruction(Pubkey.new_unique(), b"\x01\x02", [AccountMeta(WALLET, True, True)])
+        raw = _legacy([other])
+
+        assert inspect_transaction(raw).instructions[0].program == "unknown"
+        with pytest.raises(WireFormatError):
+            inspect_transaction(raw[:-3])
+        with pytest.raises(WireFormatError):
+            inspect_transaction(b"tx1")
+
+
+class TestIterInbox:
+    def test_streams_singles_and_bundles(self, tmp_path):
+        single = _legacy([_transfer(Pubkey.new_unique(), 100)])
+        (tmp_path / "unsigned_tx_1.json").write_text(json.dumps(
+            {"type": "unsigned_transaction", "data": base64.b64encode(single).decode()}))
+        (tmp_path / "unsigned_tx_2.json").write_text("{not json")
+        rows = [PayoutRow(recipient=str(Pubkey.new_unique()), lamports=1_000) for _ in range(30)]
+        packed = list(pack_transfer_transactions(str(WALLET), rows, str(Hash.new_unique())))
+        write_unsigned_bundle(str(tmp_path / "unsigned_bundle_1.jsonl"), str(WALLET), None, packed)
+
+        items = list(iter_inbox(str(tmp_path)))
+        summary = InboxSummary()
+        for item in items:
+            if item.inspected is not None:
+                summary.add(item)
+
+        assert [item.label for item in items[:2]] == ["unsigned_tx_1.json", "unsigned_tx_2.json"]
+        assert items[1].error and items[1].inspected is None
+        assert [item.tx_bytes for item in items[2:]] == [p.tx_bytes for p in packed]
+        assert all("tx_bytes" not in item.record for item in items)
+        assert summary.transactions == 1 + len(packed)
+        assert summary.lamports_out == 100 + 30_000 + sum(p.fee_lamports for p in packed)
+        assert len(summary.destinations) == 31 + (1 if any(p.fee_lamports for p in packed) else 0)
@@ -23,8 +23,15 @@ Audit scope
 12. PrivacyValidator orchestration layer
 """
 
+import base64
 import secrets
+
 import pytest
+from solders.hash import Hash
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
 
 from src.zk.types import (
     BitProof,
@@ -49,14 +56,28 @@ from src.privacy.validator import PrivacyValidator
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SENDER = str(Pubkey.new_unique())
+_RECEIVER = str(Pubkey.new_unique())
+
+
+def _transfer_b64(from_pubkey: str, to_pubkey: str, amount: int) -> str:
+    """Unsigned bytes of the transfer a context declares (the policy decodes them)"""
+    sender = Pubkey.from_string(from_pubkey)
+    ix = transfer(TransferParams(from_pubkey=sender, to_pubkey=Pubkey.from_string(to_pubkey),
+                                 lamports=amount))
+    message = Message.new_with_blockhash([ix], sender, Hash.new_unique())
+    return base64.b64encode(bytes(Transaction.new_unsigned(message))).decode()
+
+
 def _make_tx_context(
     mode: TransactionMode = TransactionMode.PUBLIC,
     amount: int = 1_000_000,
-    to_pubkey: str = "ReceiverPubkey111111111111111111111111111111",
-    from_pubkey: str = "SenderPubkey1111111111111111111111111111111",
+    to_pubkey: str = _RECEIVER,
+    from_pubkey: str = _SENDER,
 ) -> TransactionContext:
+    # A context with a missing address still needs decodable bytes to reach the structure check
     return TransactionContext(
-        unsigned_tx_b64="dGVzdHR4Ynl0ZXM=",  # base64 "testtxbytes"
+        unsigned_tx_b64=_transfer_b64(from_pubkey or _SENDER, to_pubkey or _RECEIVER, amount),
         from_pubkey=from_pubkey,
         to_pubkey=to_pubkey,
         amount_lamports=amount,
@@ -554,8 +575,8 @@ class TestProofBinding:
     def test_binding_fails_for_different_recipient(self):
         """SECURITY: Proof generated for recipient A must not bind to recipient B."""
         engine = _make_engine()
-        recipient_a = "Recipient1111111111111111111111111111111111"
-        recipient_b = "Recipient2222222222222222222222222222222222"
+        recipient_a = str(Pubkey.new_unique())
+        recipient_b = str(Pubkey.new_unique())
         ctx = _make_tx_context(mode=TransactionMode.PRIVATE, to_pubkey=recipient_a)
         bundle = engine.generate_proof_bundle(ctx, _SECRET_KEY_HEX)
 
@@ -695,7 +716,7 @@ class TestPolicyEngine:
         assert amt_check.result == PolicyCheckResult.FAIL
 
     def test_destination_in_allowlist_passes(self):
-        allowed = "AllowedRecipient111111111111111111111111111"
+        allowed = str(Pubkey.new_unique())
         engine = _make_engine()
         policy = SigningPolicyEngine(
             allowed_destinations={allowed},
@@ -711,10 +732,10 @@ class TestPolicyEngine:
         """SECURITY: Transfers to non-allowlisted addresses must be blocked."""
         engine = _make_engine()
         policy = SigningPolicyEngine(
-            allowed_destinations={"AllowedOnly1111111111111111111111111111111"},
+            allowed_destinations={str(Pubkey.new_unique())},
             require_destination_allowlist=True,
         )
-        ctx = _make_tx_context(to_pubkey="UnknownRecipient1111111111111111111111111")
+        ctx = _make_tx_context(to_pubkey=str(Pubkey.new_unique()))
         env = engine.build_public_envelope(ctx)
         result = policy.evaluate(env)
         assert result.approved is False
@@ -736,7 +757,7 @@ class TestPolicyEngine:
     def test_no_allowlist_enforcement_skipped(self):
         engine = _make_engine()
         policy = SigningPolicyEngine(require_destination_allowlist=False)
-        ctx = _make_tx_context(to_pubkey="AnyAddress1111111111111111111111111111111")
+        ctx = _make_tx_context(to_pubkey=str(Pubkey.new_unique()))
         env = engine.build_public_envelope(ctx)
         result = policy.evaluate(env)
         dest_check = next(c for c in result.checks if c.name == "destination")
@@ -779,7 +800,7 @@ class TestPolicyEngine:
         assert policy.evaluate(env).approved is True
 
     def test_add_remove_allowed_destination(self):
-        addr = "DynamicRecipient111111111111111111111111111"
+        addr = str(Pubkey.new_unique())
         engine = _make_engine()
         policy = SigningPolicyEngine(require_destination_allowlist=True)
         policy.add_allowed_destination(addr)
@@ -10,10 +10,18 @@ import pytest
 
 from src.zk.engine import ZkProofEngine
 from src.zk.types import (
+    ENVELOPE_VERSION,
+    ENVELOPE_VERSION_AGGREGATED,
+    OWNERSHIP_PROOF_SIZE,
+    AggregatedRangeProof,
+    OwnershipProof,
     ProofBundle,
+    RangeProof,
     TransactionContext,
     TransactionMode,
     TransferEnvelope,
+    aggregated_range_proof_size,
+    range_proof_size,
 )
 
 
@@ -118,6 +126,54 @@ class TestProofGeneration:
         assert bundle2.ownership_proof.public_key == bundle.ownership_proof.public_key
 
 
+class TestBatchProofGeneration:
+    def _contexts(self, n):
+        return [_make_ctx(nonce=f"txnonce{i}", amount=1_000 * (i + 1)) for i in range(n)]
+
+    def test_parallel_bundles_match_serial_semantics(self, engine, secret_key_hex):
+        contexts = self._contexts(4)
+        nonces = iter(["aa" * 32, "bb" * 32, "cc" * 32, "dd" * 32])
+        engine.generate_nonce = lambda: next(nonces)
+
+        result = engine.generate_proof_bundles(
+            contexts, secret_key_hex,
+            policy_constraints=[{"policy_id": "max_amount", "satisfied": True}],
+            max_workers=2,
+        )
+
+        assert result.workers == 2
+        assert [b.nonce for b in result.bundles] == ["aa" * 32, "bb" * 32, "cc" * 32, "dd" * 32]
+        for ctx, bundle in zip(contexts, result.bundles):
+            assert bundle.binding == engine.compute_binding(ctx, bundle)
+            assert engine.verify_binding(ctx, bundle)
+            ctx_hash = engine.compute_tx_context_hash(ctx)
+            assert engine.verify_ownership(bundle.ownership_proof, ctx_hash)
+            assert engine.verify_range(bundle.range_proof, ctx_hash)
+            assert len(bundle.policy_proofs) == 1
+
+    def test_serial_fallback_reports_timings(self, engine, secret_key_hex):
+        result = engine.generate_proof_bundles(self._contexts(3), secret_key_hex, max_workers=1)
+        assert result.workers == 1
+        assert len(result.timings) == 3
+        assert all(t.range > 0 and t.total >= t.range for t in result.timings)
+        totals = result.stage_totals()
+        assert set(totals) == {"ownership", "range", "policy", "binding", "total"}
+        assert len({b.nonce for b in result.bundles}) == 3
+
+    def test_rejects_public_context(self, engine, secret_key_hex):
+        contexts = self._contexts(1) + [_make_ctx(mode=TransactionMode.PUBLIC)]
+        with pytest.raises(ValueError, match="private transactions"):
+            engine.generate_proof_bundles(contexts, secret_key_hex)
+
+    def test_unsatisfied_policy_propagates(self, engine, secret_key_hex):
+        with pytest.raises(ValueError, match="not satisfied"):
+            engine.generate_proof_bundles(
+                self._contexts(2), secret_key_hex,
+                policy_constraints=[{"policy_id": "p", "satisfied": False}],
+                max_workers=2,
+            )
+
+
 # ── Ownership proof ───────────────────────────
 
 class TestOwnershipProof:
@@ -159,6 +215,107 @@ class TestRangeProof:
             assert engine.verify_range(proof, b"ctx") is True
 
 
+class TestBatchRangeVerification:
+    def test_verify_ranges_reports_each_proof(self, engine):
+        proofs = [engine.prove_range(v, 16, b"ctx") for v in (1, 2, 3)]
+        items = [(proofs[0], b"ctx"), (proofs[1], b"other"), (proofs[2], b"ctx")]
+        assert engine.verify_ranges(items) == [True, False, True]
+        assert engine.verify_ranges([]) == []
+
+    def test_validate_envelopes_matches_single(self, engine, secret_key_hex):
+        envelopes = []
+        for i in range(3):
+            ctx = _make_ctx(nonce=f"batch_env{i}", amount=1_000 + i)
+            envelopes.append(engine.build_private_envelope(ctx, engine.generate_proof_bundle(ctx, secret_key_hex)))
+        envelopes.append(engine.build_public_envelope(_make_ctx(mode=TransactionMode.PUBLIC)))
+        envelopes[1].proof_bundle.range_proof.context_hash = "00" * 32
+
+        results = engine.validate_envelopes(envelopes)
+
+        assert [vr.valid for vr, _ in results] == [True, False, True, True]
+        failed = [c.name for c in results[1][0].checks if not c.passed]
+        assert "Range proof" in failed
+
+
+class TestAggregatedRangeProof:
+    def test_prove_and_verify(self, engine):
+        proof = engine.prove_aggregated_range(1_000_000, 64, b"ctx")
+        assert len(proof.ipa_l) == len(proof.ipa_r) == 6
+        assert engine.verify_aggregated_range(proof, b"ctx") is True
+        assert engine.verify_range(proof, b"other") is False
+        with pytest.raises((ValueError, RuntimeError)):
+            engine.prove_aggregated_range(1, 48, b"ctx")
+
+    def test_binary_roundtrip(self, engine):
+        proof = engine.prove_aggregated_range(1000, 16, b"ctx")
+        raw = proof.to_bytes()
+        assert len(raw) == aggregated_range_proof_size(16) < range_proof_size(16)
+        assert AggregatedRangeProof.from_bytes(raw) == proof
+        with pytest.raises(ValueError):
+            AggregatedRangeProof.from_bytes(raw[:-1])
+
+    def test_envelope_version_follows_proof_type(self, engine, secret_key_hex):
+        ctx = _make_ctx(nonce="aggregated_env")
+        bundle = engine.generate_proof_bundle(ctx, secret_key_hex, envelope_version=ENVELOPE_VERSION_AGGREGATED)
+        env = engine.build_private_envelope(ctx, bundle)
+        assert env.version == ENVELOPE_VERSION_AGGREGATED
+
+        env2 = TransferEnvelope.from_json(env.to_json())
+        assert isinstance(env2.proof_bundle.range_proof, AggregatedRangeProof)
+        vr, _ = engine.validate_envelope(env2)
+        assert vr.valid is True
+
+        env2.version = ENVELOPE_VERSION
+        valid, err = engine.validate_envelope_structure(env2)
+        assert valid is False and "does not match" in err
+
+    def test_unknown_version_rejected(self, engine, secret_key_hex):
+        env = engine.build_public_envelope(_make_ctx(mode=TransactionMode.PUBLIC))
+        env.version = "9.9.9"
+        assert engine.validate_envelope_structure(env)[0] is False
+        with pytest.raises(ValueError):
+            engine.generate_proof_bundle(_make_ctx(), secret_key_hex, envelope_version="9.9.9")
+
+    def test_verify_ranges_mixes_proof_types(self, engine):
+        items = [
+            (engine.prove_range(5, 8, b"ctx"), b"ctx"),
+            (engine.prove_aggregated_range(5, 8, b"ctx"), b"ctx"),
+            (engine.prove_aggregated_range(5, 8, b"ctx"), b"other"),
+        ]
+        assert engine.verify_ranges(items) == [True, True, False]
+
+
+class TestBinaryProofEncoding:
+    def test_range_proof_roundtrip(self, engine):
+        proof = engine.prove_range(1000, 16, b"ctx")
+        raw = proof.to_bytes()
+        assert len(raw) == range_proof_size(16)
+        assert raw[:4] == (16).to_bytes(4, "little")
+        assert RangeProof.from_bytes(raw) == proof
+        assert RangeProof.from_bytes(memoryview(raw)) == proof
+
+    def test_ownership_proof_roundtrip(self, engine, secret_key_hex):
+        proof = engine.prove_ownership(secret_key_hex, b"ctx")
+        raw = proof.to_bytes()
+        assert len(raw) == OWNERSHIP_PROOF_SIZE
+        assert OwnershipProof.from_bytes(raw) == proof
+
+    def test_rejects_malformed_buffers(self, engine):
+        raw = engine.prove_range(7, 8, b"ctx").to_bytes()
+        with pytest.raises(ValueError):
+            RangeProof.from_bytes(raw[:-1])
+        with pytest.raises(ValueError):
+            RangeProof.from_bytes((65).to_bytes(4, "little") + raw[4:])
+        with pytest.raises(ValueError):
+            OwnershipProof.from_bytes(b"\x00" * (OWNERSHIP_PROOF_SIZE - 1))
+
+    def test_rejects_non_element_fields(self, engine):
+        proof = engine.prove_range(7, 8, b"ctx")
+        proof.bit_proofs[0].e0 = "abcd"
+        with pytest.raises(ValueError, match="e0"):
+            proof.to_bytes()
+
+
 # ── Full validation pipeline ──────────────────
 
 class TestFullPipeline:
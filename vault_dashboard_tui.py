@@ -15,9 +15,22 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import asyncio
 
+from src.portfolio import PortfolioSnapshot
+from src.token_transfer import KNOWN_TOKENS
+
+
+# Icon and color per symbol in the portfolio panel
+TOKEN_STYLES = {
+    "SOL": ("◎", "magenta"),
+    "USDC": ("◉", "cyan"),
+    "USDT": ("◉", "green"),
+    "BTC": ("฿", "yellow"),
+    "RAY": ("⚡", "yellow"),
+}
+
 
 class StatusBar(Static):
     """Top status bar showing vault info"""
@@ -52,7 +65,8 @@ class StatusBar(Static):
 class PortfolioPanel(Static):
     """Left panel showing portfolio tokens"""
 
-    def __init__(self):
+    def __init__(self, snapshot: Optional[PortfolioSnapshot] = None,
+                 valuation: Optional[Dict[str, Any]] = None):
         super().__init__()
         self.tokens = [
             {"symbol": "SOL", "icon": "◎", "amount": 3.2546, "value": 476.80, "color": "magenta", "rep_tier": 5},
@@ -63,6 +77,48 @@ class PortfolioPanel(Static):
             {"symbol": "Unknown Token", "icon": "⚠", "amount": 10.000, "value": 0.00, "color": "red", "rep_tier": 1},
         ]
         self.selected_index = 1  # USDC selected
+        if snapshot is not None:
+            self.tokens = self.tokens_from_snapshot(snapshot, valuation)
+            self.selected_index = 0
+
+    @staticmethod
+    def tokens_from_snapshot(snapshot: PortfolioSnapshot,
+                             valuation: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """
+        Build panel rows from a portfolio snapshot
+
+        Args:
+            snapshot: Balances from src.portfolio.fetch_portfolio
+            valuation: Result of PythPriceClient.get_portfolio_value for the
+                       same snapshot; values are 0 without it
+        """
+        breakdown = (valuation or {}).get("breakdown", {})
+        known_symbols = set(KNOWN_TOKENS)
+        tokens = []
+        for symbol, amount in snapshot.totals().items():
+            icon, color = TOKEN_STYLES.get(symbol, ("◆", "cyan"))
+            if symbol == "SOL":
+                rep_tier = 5
+            elif symbol in known_symbols:
+                rep_tier = 4
+            else:
+                icon, color, rep_tier = "⚠", "red", 1
+            tokens.append({
+                "symbol": symbol,
+                "icon": icon,
+                "amount": amount,
+                "value": breakdown.get(symbol, {}).get("value_usd", 0.0),
+                "color": color,
+                "rep_tier": rep_tier,
+            })
+        return tokens
+
+    def update_portfolio(self, snapshot: PortfolioSnapshot,
+                         valuation: Optional[Dict[str, Any]] = None) -> None:
+        """Replace the rows with a fresh snapshot and redraw"""
+        self.tokens = self.tokens_from_snapshot(snapshot, valuation)
+        self.selected_index = min(self.selected_index, max(len(self.tokens) - 1, 0))
+        self.refresh()
 
     def render(self) -> RenderableType:
         # Reputation tier display mapping